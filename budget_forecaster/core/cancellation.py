@@ -0,0 +1,29 @@
+"""Cooperative cancellation of long computations."""
+from typing import Protocol
+
+from budget_forecaster.exceptions import ComputationCancelledError
+
+
+class CancellationToken(Protocol):  # pylint: disable=too-few-public-methods
+    """Tells a long computation whether its result is still wanted.
+
+    Textual workers follow this protocol, so a computation running in a
+    thread worker can be given the worker itself.
+    """
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether the computation should stop."""
+
+
+def raise_if_cancelled(cancellation: CancellationToken | None) -> None:
+    """Stop a computation between two of its steps if it was cancelled.
+
+    Args:
+        cancellation: The token of the computation, if it can be cancelled.
+
+    Raises:
+        ComputationCancelledError: If the computation was cancelled.
+    """
+    if cancellation is not None and cancellation.is_cancelled:
+        raise ComputationCancelledError()
@@ -0,0 +1,40 @@
+"""Helpers to spread independent computations over worker processes."""
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Sequence, TypeVar
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+def map_in_processes(
+    function: Callable[[_Item], _Result],
+    items: Sequence[_Item],
+    max_workers: int | None = 1,
+) -> list[_Result]:
+    """Apply a function to each item, optionally in a process pool.
+
+    Args:
+        function: A picklable function, e.g. a module-level function or a
+            functools.partial of one binding the inputs shared by all items.
+        items: The picklable items to apply the function to.
+        max_workers: Number of worker processes, None for one per CPU.
+            Items are computed in the current process with 1.
+
+    Returns:
+        The results, in the order of the items.
+    """
+    if max_workers == 1 or len(items) <= 1:
+        return [function(item) for item in items]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(items))
+    # Spawned workers don't inherit the threads of the TUI; the function and
+    # its bound inputs are sent to each worker once, with a single chunk each
+    with ProcessPoolExecutor(
+        workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(
+            executor.map(function, items, chunksize=math.ceil(len(items) / workers))
+        )
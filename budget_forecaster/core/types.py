@@ -41,6 +41,15 @@ class MatcherKey(NamedTuple):
     target_id: TargetId
 
 
+class TargetVersion(NamedTuple):
+    """Version counters of a link target, bumped by the database on each change."""
+
+    definition: int
+    """Incremented when the planned operation or budget itself is modified."""
+    links: int
+    """Incremented when a link to the target is created, modified or deleted."""
+
+
 # Import progress callback type aliases
 ImportProgressCurrent = int
 """Current progress count (number of files processed)."""
@@ -70,6 +79,19 @@ class ImportStats(NamedTuple):
     """Number of duplicate operations that were already in the database."""
 
 
+class BalanceResolution(enum.StrEnum):
+    """Resolution of the balance evolution of an account analysis report."""
+
+    DAILY = enum.auto()
+    """One row per day."""
+
+    WEEKLY = enum.auto()
+    """One row per week, ending on Sunday."""
+
+    MONTHLY = enum.auto()
+    """One row per calendar month."""
+
+
 class BudgetColumn(enum.StrEnum):
     """Column names for the per-category monthly budget forecast DataFrame.
 
@@ -0,0 +1,77 @@
+"""Module for the Scenario class."""
+from typing import Iterable, Iterator, NamedTuple, TypeVar, cast
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.types import LinkType, MatcherKey
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+
+_Target = TypeVar("_Target", PlannedOperation, Budget)
+
+
+def _target_key(target: PlannedOperation | Budget) -> MatcherKey:
+    if target.id is None:
+        raise ValueError(f"Target must have an ID to be removed or modified: {target}")
+    if isinstance(target, PlannedOperation):
+        return MatcherKey(LinkType.PLANNED_OPERATION, target.id)
+    return MatcherKey(LinkType.BUDGET, target.id)
+
+
+def scale_amount(target: _Target, factor: float) -> _Target:
+    """Return a copy of a target with its amount multiplied by a factor.
+
+    Args:
+        target: The planned operation or budget to scale.
+        factor: The factor to apply, e.g. 1.1 to raise the amount by 10%.
+
+    Returns:
+        The scaled target, with the same ID.
+    """
+    return target.replace(amount=Amount(target.amount * factor, target.currency))
+
+
+class Scenario(NamedTuple):
+    """A named what-if overlay on a forecast.
+
+    A scenario adds, removes and modifies targets of a forecast without
+    touching the stored ones. A modified target replaces the target of the
+    forecast with the same type and ID. Removals and modifications of targets
+    that are not part of the forecast are ignored.
+    """
+
+    name: str
+    added: tuple[PlannedOperation | Budget, ...] = ()
+    removed: frozenset[MatcherKey] = frozenset()
+    modified: tuple[PlannedOperation | Budget, ...] = ()
+
+    def _overlay(self, targets: Iterable[_Target]) -> Iterator[_Target]:
+        replacements = {_target_key(target): target for target in self.modified}
+        for target in targets:
+            if (key := _target_key(target)) in self.removed:
+                continue
+            # Keys include the target type, so the replacement has the same type
+            yield cast(_Target, replacements.get(key, target))
+
+    def apply(self, forecast: Forecast) -> Forecast:
+        """Apply the overlay to a forecast.
+
+        Args:
+            forecast: The forecast loaded from the database.
+
+        Returns:
+            The forecast of the scenario.
+
+        Raises:
+            ValueError: If a modified target has no ID.
+        """
+        return Forecast(
+            (
+                *self._overlay(forecast.operations),
+                *(op for op in self.added if isinstance(op, PlannedOperation)),
+            ),
+            (
+                *self._overlay(forecast.budgets),
+                *(budget for budget in self.added if isinstance(budget, Budget)),
+            ),
+        )
@@ -34,6 +34,13 @@ class PersistenceError(BudgetForecasterError):
     """A database operation failed unexpectedly."""
 
 
+class ComputationCancelledError(BudgetForecasterError):
+    """A computation was stopped because its result is no longer wanted."""
+
+    def __init__(self) -> None:
+        super().__init__("Computation cancelled")
+
+
 class BackupError(BudgetForecasterError):
     """A backup operation failed."""
 
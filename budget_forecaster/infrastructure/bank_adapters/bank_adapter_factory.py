@@ -1,5 +1,4 @@
 """Module for the BankAdapterFactory class."""
-# pylint: disable=unused-import
 import inspect
 import pathlib
 from typing import Generator
@@ -8,12 +7,21 @@ from budget_forecaster.exceptions import UnsupportedExportError
 from budget_forecaster.infrastructure.bank_adapters.bank_adapter import (
     BankAdapterInterface,
 )
-from budget_forecaster.infrastructure.bank_adapters.bnp_paribas.bnp_paribas_bank_adapter import (
-    BnpParibasBankAdapter,  # noqa: F401
-)
-from budget_forecaster.infrastructure.bank_adapters.swile.swile_bank_adapter import (
-    SwileBankAdapter,  # noqa: F401
-)
+
+
+def _import_bank_adapters() -> None:
+    """Import the bank adapters, so they are found as subclasses.
+
+    They are imported when the first export is read rather than at startup,
+    as most sessions do not import anything.
+    """
+    # pylint: disable=import-outside-toplevel,unused-import
+    from budget_forecaster.infrastructure.bank_adapters.bnp_paribas import (  # noqa: F401
+        bnp_paribas_bank_adapter,
+    )
+    from budget_forecaster.infrastructure.bank_adapters.swile import (  # noqa: F401
+        swile_bank_adapter,
+    )
 
 
 class BankAdapterFactory:  # pylint: disable=too-few-public-methods
@@ -34,6 +42,7 @@ class BankAdapterFactory:  # pylint: disable=too-few-public-methods
     @staticmethod
     def create_bank_adapter(bank_export: pathlib.Path) -> BankAdapterInterface:
         """Create a bank adapter."""
+        _import_bank_adapters()
         for adapter in BankAdapterFactory.__get_concrete_bank_adapters_recursive(
             BankAdapterInterface  # type: ignore
         ):
@@ -47,15 +47,30 @@ class Config:  # pylint: disable=too-few-public-methods,too-many-instance-attrib
         self.database_path = Path("budget.db")
         # Backup config
         self.backup = BackupConfig()
-        # Import config (default to user's download directory)
-        self.inbox_path = _get_user_download_dir()
+        # Import config (default to user's download directory, looked up on
+        # first use as it runs a subprocess)
+        self._inbox_path: Path | None = None
         self.inbox_exclude_patterns: list[str] = []
         self.inbox_include_patterns: list[str] = []
+        # Days before the earliest imported operation whose unlinked
+        # operations are linked again after an import, 0 to disable
+        self.link_lookback_days = 7
         # Logging config (native Python logging dictConfig format)
         self.logging_config: dict[str, Any] | None = None
         # i18n config
         self.language: str = "en"
 
+    @property
+    def inbox_path(self) -> Path:
+        """Inbox folder, the user's download directory unless configured."""
+        if self._inbox_path is None:
+            self._inbox_path = _get_user_download_dir()
+        return self._inbox_path
+
+    @inbox_path.setter
+    def inbox_path(self, value: Path) -> None:
+        self._inbox_path = value
+
     def _parse_yaml(self, yaml_path: Path) -> None:
         """Parse a YAML configuration file."""
         with open(yaml_path, encoding="utf-8") as file:
@@ -71,6 +86,8 @@ class Config:  # pylint: disable=too-few-public-methods,too-many-instance-attrib
                 self.inbox_exclude_patterns = config["inbox_exclude_patterns"] or []
             if "inbox_include_patterns" in config:
                 self.inbox_include_patterns = config["inbox_include_patterns"] or []
+            if "link_lookback_days" in config:
+                self.link_lookback_days = config["link_lookback_days"] or 0
             # Parse backup config
             if "backup" in config:
                 backup_cfg = config["backup"]
@@ -8,7 +8,13 @@ combines them all.
 from abc import ABC, abstractmethod
 from typing import Self
 
-from budget_forecaster.core.types import LinkType, OperationId, TargetId
+from budget_forecaster.core.types import (
+    LinkType,
+    MatcherKey,
+    OperationId,
+    TargetId,
+    TargetVersion,
+)
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
@@ -320,6 +326,38 @@ class RepositoryInterface(
         Closes the repository.
         """
 
+    # Target versions
+
+    @abstractmethod
+    def get_target_versions(self) -> dict[MatcherKey, TargetVersion]:
+        """Get the version counters of all planned operations and budgets.
+
+        Counters are bumped on every change of a target or of its links, so
+        caches can detect which targets changed since they were built.
+
+        Returns:
+            The versions of each existing target.
+        """
+
+    # Target accounts
+
+    @abstractmethod
+    def get_target_accounts(self) -> dict[MatcherKey, str]:
+        """Get the account each assigned planned operation or budget belongs to.
+
+        Returns:
+            The account name of each target assigned to an account.
+        """
+
+    @abstractmethod
+    def set_target_account(self, key: MatcherKey, account_name: str | None) -> None:
+        """Assign a planned operation or budget to an account.
+
+        Args:
+            key: The type and ID of the target.
+            account_name: Name of the account, or None to remove the assignment.
+        """
+
     # Settings
 
     @abstractmethod
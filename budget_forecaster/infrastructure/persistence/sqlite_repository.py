@@ -1,11 +1,12 @@
 """SQLite repository for account data persistence."""
 
 # pylint: disable=too-many-arguments,too-many-positional-arguments
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,too-many-lines
 
 import json
 import logging
 import sqlite3
+import threading
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Callable, Iterable, Self
@@ -20,7 +21,14 @@ from budget_forecaster.core.date_range import (
     RecurringDay,
     SingleDay,
 )
-from budget_forecaster.core.types import Category, LinkType, OperationId, TargetId
+from budget_forecaster.core.types import (
+    Category,
+    LinkType,
+    MatcherKey,
+    OperationId,
+    TargetId,
+    TargetVersion,
+)
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
@@ -39,7 +47,7 @@ from budget_forecaster.infrastructure.persistence.repository_interface import (
 logger = logging.getLogger(__name__)
 
 # Current schema version
-CURRENT_SCHEMA_VERSION = 7
+CURRENT_SCHEMA_VERSION = 9
 
 # Base schema (version 0 -> 1)
 SCHEMA_V1 = """
@@ -223,6 +231,105 @@ INSERT OR IGNORE INTO settings (key, value) VALUES ('expense_breakdown_threshold
 """
 
 
+# Schema migration v7 -> v8: add target version counters, maintained by triggers
+# so that caches built from targets and their links can detect what changed
+SCHEMA_V8 = """
+CREATE TABLE IF NOT EXISTS target_versions (
+    target_type TEXT NOT NULL,
+    target_id INTEGER NOT NULL,
+    definition_version INTEGER NOT NULL DEFAULT 1,
+    links_version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (target_type, target_id)
+);
+
+INSERT INTO target_versions (target_type, target_id)
+    SELECT 'planned_operation', id FROM planned_operations;
+INSERT INTO target_versions (target_type, target_id)
+    SELECT 'budget', id FROM budgets;
+
+CREATE TRIGGER IF NOT EXISTS planned_operations_inserted
+AFTER INSERT ON planned_operations BEGIN
+    INSERT INTO target_versions (target_type, target_id)
+        VALUES ('planned_operation', NEW.id)
+        ON CONFLICT (target_type, target_id)
+        DO UPDATE SET definition_version = definition_version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS planned_operations_updated
+AFTER UPDATE ON planned_operations BEGIN
+    UPDATE target_versions SET definition_version = definition_version + 1
+        WHERE target_type = 'planned_operation' AND target_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS planned_operations_deleted
+AFTER DELETE ON planned_operations BEGIN
+    DELETE FROM target_versions
+        WHERE target_type = 'planned_operation' AND target_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS budgets_inserted
+AFTER INSERT ON budgets BEGIN
+    INSERT INTO target_versions (target_type, target_id)
+        VALUES ('budget', NEW.id)
+        ON CONFLICT (target_type, target_id)
+        DO UPDATE SET definition_version = definition_version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS budgets_updated
+AFTER UPDATE ON budgets BEGIN
+    UPDATE target_versions SET definition_version = definition_version + 1
+        WHERE target_type = 'budget' AND target_id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS budgets_deleted
+AFTER DELETE ON budgets BEGIN
+    DELETE FROM target_versions WHERE target_type = 'budget' AND target_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS operation_links_inserted
+AFTER INSERT ON operation_links BEGIN
+    UPDATE target_versions SET links_version = links_version + 1
+        WHERE target_type = NEW.target_type AND target_id = NEW.target_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS operation_links_updated
+AFTER UPDATE ON operation_links BEGIN
+    UPDATE target_versions SET links_version = links_version + 1
+        WHERE (target_type = OLD.target_type AND target_id = OLD.target_id)
+           OR (target_type = NEW.target_type AND target_id = NEW.target_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS operation_links_deleted
+AFTER DELETE ON operation_links BEGIN
+    UPDATE target_versions SET links_version = links_version + 1
+        WHERE target_type = OLD.target_type AND target_id = OLD.target_id;
+END;
+"""
+
+
+# Schema migration v8 -> v9: add the optional account of each target, removed
+# with the target
+SCHEMA_V9 = """
+CREATE TABLE IF NOT EXISTS target_accounts (
+    target_type TEXT NOT NULL,
+    target_id INTEGER NOT NULL,
+    account_name TEXT NOT NULL,
+    PRIMARY KEY (target_type, target_id)
+);
+
+CREATE TRIGGER IF NOT EXISTS planned_operations_account_deleted
+AFTER DELETE ON planned_operations BEGIN
+    DELETE FROM target_accounts
+        WHERE target_type = 'planned_operation' AND target_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS budgets_account_deleted
+AFTER DELETE ON budgets BEGIN
+    DELETE FROM target_accounts WHERE target_type = 'budget' AND target_id = OLD.id;
+END;
+"""
+
+
 class SqliteRepository(RepositoryInterface):
     """Repository for persisting account data in SQLite."""
 
@@ -236,18 +343,33 @@ class SqliteRepository(RepositoryInterface):
         5: (4, _migrate_v5),
         6: (5, SCHEMA_V6),
         7: (6, SCHEMA_V7),
+        8: (7, SCHEMA_V8),
+        9: (8, SCHEMA_V9),
     }
 
     def __init__(self, db_path: Path) -> None:
         self._db_path = db_path
-        self._connection: sqlite3.Connection | None = None
+        # Reports are computed in worker threads: each thread gets its own
+        # connection, as a connection must not be shared between threads
+        self._connections: dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create a database connection."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(self._db_path)
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        """Get or create the database connection of the current thread."""
+        thread = threading.current_thread()
+        with self._connections_lock:
+            if (connection := self._connections.get(thread)) is None:
+                self._close_finished_threads_connections()
+                # Connections are closed by close(), possibly from another thread
+                connection = sqlite3.connect(self._db_path, check_same_thread=False)
+                connection.row_factory = sqlite3.Row
+                self._connections[thread] = connection
+        return connection
+
+    def _close_finished_threads_connections(self) -> None:
+        """Close the connections of the worker threads that have finished."""
+        for thread in [thread for thread in self._connections if not thread.is_alive()]:
+            self._connections.pop(thread).close()
 
     def _get_schema_version(self) -> int:
         """Get the current schema version from the database."""
@@ -297,10 +419,11 @@ class SqliteRepository(RepositoryInterface):
         logger.info("Database schema is at version %d", CURRENT_SCHEMA_VERSION)
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        """Close the database connections of all threads."""
+        with self._connections_lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
 
     def __enter__(self) -> Self:
         """Enter the context manager."""
@@ -955,6 +1078,58 @@ class SqliteRepository(RepositoryInterface):
         )
         conn.commit()
 
+    # Target version methods
+
+    def get_target_versions(self) -> dict[MatcherKey, TargetVersion]:
+        """Get the version counters of all planned operations and budgets."""
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """SELECT target_type, target_id, definition_version, links_version
+               FROM target_versions"""
+        )
+        return {
+            MatcherKey(LinkType(row["target_type"]), row["target_id"]): TargetVersion(
+                row["definition_version"], row["links_version"]
+            )
+            for row in cursor.fetchall()
+        }
+
+    # Target accounts methods
+
+    def get_target_accounts(self) -> dict[MatcherKey, str]:
+        """Get the account each assigned planned operation or budget belongs to."""
+        conn = self._get_connection()
+        cursor = conn.execute(
+            "SELECT target_type, target_id, account_name FROM target_accounts"
+        )
+        return {
+            MatcherKey(LinkType(row["target_type"]), row["target_id"]): row[
+                "account_name"
+            ]
+            for row in cursor.fetchall()
+        }
+
+    def set_target_account(self, key: MatcherKey, account_name: str | None) -> None:
+        """Assign a planned operation or budget to an account.
+
+        Args:
+            key: The type and ID of the target.
+            account_name: Name of the account, or None to remove the assignment.
+        """
+        conn = self._get_connection()
+        if account_name is None:
+            conn.execute(
+                "DELETE FROM target_accounts WHERE target_type = ? AND target_id = ?",
+                (key.link_type, key.target_id),
+            )
+        else:
+            conn.execute(
+                """INSERT OR REPLACE INTO target_accounts
+                   (target_type, target_id, account_name) VALUES (?, ?, ?)""",
+                (key.link_type, key.target_id, account_name),
+            )
+        conn.commit()
+
     # Settings methods
 
     def get_setting(self, key: str) -> str | None:
@@ -4,8 +4,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from budget_forecaster.tui.app import run_app
-
 
 def _create_default_config(config_path: Path) -> None:
     """Create a default configuration file from the template."""
@@ -47,6 +45,11 @@ def main() -> None:
         print("Please edit it to customize your settings, then run again.")
         sys.exit(0)
 
+    # The TUI pulls in pandas and textual, which --help does not need
+    from budget_forecaster.tui.app import (  # pylint: disable=import-outside-toplevel
+        run_app,
+    )
+
     run_app(config_path)
 
 
@@ -9,7 +9,6 @@ from types import TracebackType
 from typing import Any
 
 import pandas as pd
-from matplotlib import pyplot as plt
 
 from budget_forecaster.core.types import BudgetColumn, Category
 from budget_forecaster.i18n import _
@@ -18,6 +17,11 @@ from budget_forecaster.services.account.account_analysis_report import (
 )
 
 
+def _lowest_balances(balance_evolution: pd.DataFrame) -> pd.Series:
+    """Lowest balance of each row, kept apart by weekly and monthly resolutions."""
+    return balance_evolution.get("Min. Balance", balance_evolution["Balance"])
+
+
 class AccountAnalysisRenderer(abc.ABC):
     """
     Abstract base class for account analysis renderers.
@@ -170,7 +174,7 @@ class AccountAnalysisRendererExcel(AccountAnalysisRenderer):
         # add the minimum balance of the subsequent months
         # to do so, we reverse the dataframe, compute the cumulative minimum and reverse it back
         balance_evolution_with_margin["Margin"] = (
-            balance_evolution["Balance"].iloc[::-1].expanding().min().iloc[::-1]
+            _lowest_balances(balance_evolution).iloc[::-1].expanding().min().iloc[::-1]
         )
         # remove margin values before balance date as they are not relevant
         balance_evolution_with_margin.loc[
@@ -190,11 +194,11 @@ class AccountAnalysisRendererExcel(AccountAnalysisRenderer):
         """
         balance_evolution_per_month = AccountAnalysisRendererExcel._add_safe_margin(
             balance_date, balance_evolution
-        )
+        )[["Balance", "Margin"]]
         balance_evolution_per_month = balance_evolution_per_month.resample("MS").first()
-        balance_evolution_per_month["Min. Balance"] = balance_evolution.resample(
-            "MS"
-        ).min()
+        balance_evolution_per_month["Min. Balance"] = (
+            _lowest_balances(balance_evolution).resample("MS").min()
+        )
         balance_evolution_per_month = balance_evolution_per_month.round(2)
 
         return balance_evolution_per_month
@@ -207,10 +211,13 @@ class AccountAnalysisRendererExcel(AccountAnalysisRenderer):
         Return the path of the saved plot.
         """
 
+        # matplotlib is slow to import and only needed by the Excel export
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         balance_evolution_with_stats = self._add_safe_margin(
             balance_date, balance_evolution
         )
-        ax = balance_evolution_with_stats.plot(figsize=(15, 10))
+        ax = balance_evolution_with_stats[["Balance", "Margin"]].plot(figsize=(15, 10))
         ax.set_yticks(range(0, int(balance_evolution_with_stats["Balance"].max()), 250))
         ax.set_xticks(
             [date for date in balance_evolution_with_stats.index if date.day == 1]
@@ -346,6 +353,8 @@ class AccountAnalysisRendererExcel(AccountAnalysisRenderer):
             cat.display_name if isinstance(cat, Category) else str(cat)
             for cat in filtered_expenses.index
         ]
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
         plt.figure(figsize=(15, 10))
         plt.pie(
             filtered_expenses["Total"],
@@ -4,10 +4,15 @@ from typing import NamedTuple
 
 import pandas as pd
 
+from budget_forecaster.core.types import BalanceResolution
+
 
 class AccountAnalysisReport(NamedTuple):
     """
     A class to represent an account analysis report.
+
+    Despite its name, balance_evolution_per_day has one row per bucket of the
+    resolution; weekly and monthly ones have a Min. Balance column as well.
     """
 
     balance_date: date
@@ -18,3 +23,4 @@ class AccountAnalysisReport(NamedTuple):
     balance_evolution_per_day: pd.DataFrame
     budget_forecast: pd.DataFrame
     budget_statistics: pd.DataFrame
+    resolution: BalanceResolution = BalanceResolution.DAILY
@@ -5,11 +5,15 @@ from collections import defaultdict
 from datetime import date, timedelta
 from typing import NamedTuple
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from budget_forecaster.core.cancellation import CancellationToken, raise_if_cancelled
 from budget_forecaster.core.date_range import RecurringDateRange
 from budget_forecaster.core.types import (
+    BalanceResolution,
     BudgetColumn,
     BudgetId,
     Category,
@@ -24,17 +28,45 @@ from budget_forecaster.services.account.account_analysis_report import (
     AccountAnalysisReport,
 )
 from budget_forecaster.services.account.account_forecaster import AccountForecaster
+from budget_forecaster.services.account.balance_index import BalanceIndex
+from budget_forecaster.services.account.balance_projection import (
+    build_balance_projection,
+    project_daily_balances,
+    reduce_to_buckets,
+)
 from budget_forecaster.services.forecast.forecast_actualizer import ForecastActualizer
+from budget_forecaster.services.operation.monthly_rollup import compute_monthly_rollup
 from budget_forecaster.services.operation.operations_categorizer import (
-    categorize_operations,
+    OperationsCategorizer,
 )
 
 logger = logging.getLogger(__name__)
 
-# Type aliases for the budget data accumulator
-_MonthColumns = dict[BudgetColumn, float]
-_CategoryMonths = dict[date, _MonthColumns]
-_BudgetData = dict[Category, _CategoryMonths]
+# Last day of each bucket of the coarse balance resolutions
+_BUCKET_FREQUENCIES = {
+    BalanceResolution.WEEKLY: "W-SUN",
+    BalanceResolution.MONTHLY: "ME",
+}
+_CATEGORY_INDEX = {category: index for index, category in enumerate(Category)}
+# Columns of the budget cube: the output columns but Forecast, plus _Unrealized
+_CUBE_COLUMNS = (
+    BudgetColumn.TOTAL_PLANNED,
+    BudgetColumn.PLANNED_FROM_OPS,
+    BudgetColumn.PLANNED_FROM_BUDGETS,
+    BudgetColumn.ACTUAL,
+    BudgetColumn.UNREALIZED_INTERNAL,
+)
+_CUBE_COLUMN_INDEX = {column: index for index, column in enumerate(_CUBE_COLUMNS)}
+# Output columns of each month, in label order
+_OUTPUT_COLUMNS = sorted(
+    (
+        BudgetColumn.TOTAL_PLANNED,
+        BudgetColumn.PLANNED_FROM_OPS,
+        BudgetColumn.PLANNED_FROM_BUDGETS,
+        BudgetColumn.ACTUAL,
+        BudgetColumn.FORECAST,
+    )
+)
 
 
 class _LinkIndexes(NamedTuple):
@@ -45,16 +77,88 @@ class _LinkIndexes(NamedTuple):
     budget_linked_amounts: defaultdict[tuple[BudgetId, date], float]
 
 
-def _increment(
-    budget_data: _BudgetData,
-    category: Category,
-    month: date,
-    column: BudgetColumn,
-    amount: float,
-) -> None:
-    """Increment a value in the budget data accumulator."""
-    budget_data.setdefault(category, {}).setdefault(month, {}).setdefault(column, 0.0)
-    budget_data[category][month][column] += amount
+def _month_number(month: date) -> int:
+    """Number of months since year 0, used as month index."""
+    return month.year * 12 + month.month - 1
+
+
+class _BudgetCube:
+    """Category × month × column accumulator of the budget forecast.
+
+    Increments are buffered as integer (category, month, column) indexes and
+    scatter-added at once into a preallocated array when the DataFrame is built.
+    """
+
+    def __init__(self) -> None:
+        self._categories: list[int] = []
+        self._months: list[int] = []
+        self._columns: list[int] = []
+        self._amounts: list[float] = []
+
+    def add(
+        self, category: Category, month: date, column: BudgetColumn, amount: float
+    ) -> None:
+        """Add an amount to a cell."""
+        self._categories.append(_CATEGORY_INDEX[category])
+        self._months.append(_month_number(month))
+        self._columns.append(_CUBE_COLUMN_INDEX[column])
+        self._amounts.append(amount)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build the budget forecast DataFrame.
+
+        Rows are the categories with at least one increment, sorted, followed by
+        a Total row; columns are (month, column) for each month with at least
+        one increment. Forecast is computed as Actual + _Unrealized.
+        """
+        categories = np.array(self._categories, dtype=np.int64)
+        months = np.array(self._months, dtype=np.int64)
+        first_month = int(months.min()) if months.size else 0
+        months -= first_month
+        n_months = int(months.max()) + 1 if months.size else 0
+
+        values = np.zeros((len(_CATEGORY_INDEX), n_months, len(_CUBE_COLUMNS)))
+        np.add.at(
+            values,
+            (categories, months, np.array(self._columns, dtype=np.int64)),
+            np.array(self._amounts, dtype=np.float64),
+        )
+        filled = np.zeros((len(_CATEGORY_INDEX), n_months), dtype=bool)
+        filled[categories, months] = True
+
+        # Only keep the categories and months that received an increment
+        category_list = list(_CATEGORY_INDEX)
+        row_indexes = sorted(
+            np.flatnonzero(filled.any(axis=1)), key=lambda i: category_list[i]
+        )
+        month_indexes = np.flatnonzero(filled.any(axis=0))
+        values = values[row_indexes][:, month_indexes]
+
+        output: dict[BudgetColumn, npt.NDArray[np.float64]] = {
+            column: values[:, :, index] for column, index in _CUBE_COLUMN_INDEX.items()
+        }
+        output[BudgetColumn.FORECAST] = output[BudgetColumn.ACTUAL] + output.pop(
+            BudgetColumn.UNREALIZED_INTERNAL
+        )
+        table = np.stack([output[column] for column in _OUTPUT_COLUMNS], axis=2)
+        table = table.reshape(
+            len(row_indexes), len(month_indexes) * len(_OUTPUT_COLUMNS)
+        )
+        table = np.vstack([table, table.sum(axis=0)])
+
+        month_labels = pd.to_datetime(
+            [
+                date((first_month + index) // 12, (first_month + index) % 12 + 1, 1)
+                for index in month_indexes.tolist()
+            ]
+        )
+        return pd.DataFrame(
+            np.round(table).astype(int),
+            index=pd.Index(
+                [category_list[i] for i in row_indexes] + ["Total"], name="Category"
+            ),
+            columns=pd.MultiIndex.from_product([month_labels, _OUTPUT_COLUMNS]),
+        )
 
 
 class AccountAnalyzer:
@@ -65,28 +169,72 @@ class AccountAnalyzer:
         account: Account,
         forecast: Forecast,
         operation_links: tuple[OperationLink, ...] = (),
+        actualizer: ForecastActualizer | None = None,
+        categorizer: OperationsCategorizer | None = None,
+        balance_index: BalanceIndex | None = None,
     ) -> None:
+        """Initialize the analyzer.
+
+        Args:
+            account: The account to analyze.
+            forecast: The forecast to apply after the balance date.
+            operation_links: Links between operations and forecast targets.
+            actualizer: A long-lived actualizer already synchronized with the
+                account and links, reused to benefit from its memoization.
+                A fresh one is built when omitted.
+            categorizer: A long-lived categorizer, reused so that only the
+                operations affected by a change are categorized again.
+                A fresh one is built when omitted.
+            balance_index: A long-lived balance index already synchronized
+                with the account, used for balances before the balance date.
+                Built on first use when omitted.
+        """
+        categorizer = categorizer or OperationsCategorizer()
         self._account = account._replace(
-            operations=categorize_operations(account.operations, forecast)
+            operations=categorizer(account.operations, forecast)
         )
         self._forecast = forecast
         self._operation_links = operation_links
+        self._actualizer = actualizer or ForecastActualizer(
+            self._account, self._operation_links
+        )
+        self._balance_index = balance_index
 
-    def compute_report(self, start_date: date, end_date: date) -> AccountAnalysisReport:
+    def compute_report(
+        self,
+        start_date: date,
+        end_date: date,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        cancellation: CancellationToken | None = None,
+    ) -> AccountAnalysisReport:
         """
         Compute an account analysis report between two dates.
+
+        The cancellation token is checked between the parts of the report.
+
+        Raises:
+            ComputationCancelledError: If the computation was cancelled.
         """
+        operations = self.compute_operations(start_date, end_date)
+        raise_if_cancelled(cancellation)
+        forecast = self.compute_forecast(start_date, end_date)
+        raise_if_cancelled(cancellation)
+        balance_evolution = self.compute_balance_evolution(
+            start_date, end_date, resolution
+        )
+        raise_if_cancelled(cancellation)
+        budget_forecast = self.compute_budget_forecast(start_date, end_date)
+        raise_if_cancelled(cancellation)
         return AccountAnalysisReport(
             balance_date=self._account.balance_date,
             start_date=start_date,
             end_date=end_date,
-            operations=self.compute_operations(start_date, end_date),
-            forecast=self.compute_forecast(start_date, end_date),
-            balance_evolution_per_day=self.compute_balance_evolution_per_day(
-                start_date, end_date
-            ),
-            budget_forecast=self.compute_budget_forecast(start_date, end_date),
+            operations=operations,
+            forecast=forecast,
+            balance_evolution_per_day=balance_evolution,
+            budget_forecast=budget_forecast,
             budget_statistics=self.compute_budget_statistics(start_date, end_date),
+            resolution=resolution,
         )
 
     def compute_operations(self, start_date: date, end_date: date) -> pd.DataFrame:
@@ -179,20 +327,28 @@ class AccountAnalyzer:
                 f"start_date must be <= end_date, got {start_date} > {end_date}"
             )
 
-        actualized_forecast = ForecastActualizer(self._account, self._operation_links)(
-            self._forecast
-        )
+        actualized_forecast = self._actualizer(self._forecast)
         account_forecaster = AccountForecaster(self._account, actualized_forecast)
+        balance_date = self._account.balance_date
+
+        if start_date <= balance_date:
+            if self._balance_index is None:
+                self._balance_index = BalanceIndex(self._account)
+            current_balance = self._balance_index.balance_at(start_date)
+        else:
+            current_balance = account_forecaster(start_date).balance
+        # Only the operations between the two dates are used below
+        operations = (
+            account_forecaster(end_date).operations
+            if end_date > balance_date
+            else self._account.operations
+        )
 
-        initial_state = account_forecaster(start_date)
-        final_state = account_forecaster(end_date)
-
-        current_balance = initial_state.balance
         balance_evolution: list[float] = [current_balance]
         dates = pd.date_range(start_date, end_date, freq="D")
 
         amount_by_date: defaultdict[date, float] = defaultdict(float)
-        for operation in final_state.operations:
+        for operation in operations:
             amount_by_date[operation.operation_date] += operation.amount
 
         for ts in dates[1:]:
@@ -203,6 +359,50 @@ class AccountAnalyzer:
         df.set_index("Date", inplace=True)
         return df
 
+    def compute_balance_evolution(
+        self,
+        start_date: date,
+        end_date: date,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+    ) -> pd.DataFrame:
+        """Compute the balance of the account between two dates at a resolution.
+
+        The daily balance evolution has one row per day. The weekly and
+        monthly ones have one row per week (ending on Sunday) or month, indexed
+        by its last day clipped to end_date, with the balance at that day and
+        the lowest balance of the bucket in a Min. Balance column.
+
+        Args:
+            start_date: First date of the balance evolution.
+            end_date: Last date of the balance evolution.
+            resolution: The resolution of the rows.
+
+        Returns:
+            The balance evolution, indexed by date.
+        """
+        if resolution == BalanceResolution.DAILY:
+            return self.compute_balance_evolution_per_day(start_date, end_date)
+
+        if self._balance_index is None:
+            self._balance_index = BalanceIndex(self._account)
+        buckets = reduce_to_buckets(
+            project_daily_balances(
+                build_balance_projection(
+                    self._account,
+                    self._actualizer(self._forecast),
+                    start_date,
+                    end_date,
+                    self._balance_index,
+                )
+            ),
+            start_date,
+            resolution,
+        )
+        return pd.DataFrame(
+            {"Balance": buckets.balances, "Min. Balance": buckets.lowest_balances},
+            index=buckets.dates,
+        )
+
     def compute_budget_forecast(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Compute per-category monthly budget forecast with link-aware attribution.
 
@@ -210,20 +410,19 @@ class AccountAnalyzer:
         column_name is a BudgetColumn value: TotalPlanned, PlannedFromOps,
         PlannedFromBudgets, Actual, Forecast.
         """
-        budget_data: _BudgetData = {}
+        budget_cube = _BudgetCube()
         months = pd.date_range(
             start_date.replace(day=1), end_date.replace(day=1), freq="MS"
         )
         link_indexes = self._build_link_indexes()
         self._fill_actual(
-            budget_data, start_date, end_date, link_indexes.op_to_linked_month
+            budget_cube, start_date, end_date, link_indexes.op_to_linked_month
         )
-        self._fill_planned_operations(budget_data, months)
-        self._fill_planned_budgets(budget_data, months)
-        self._fill_unrealized_operations(budget_data, months, link_indexes)
-        self._fill_unrealized_budgets(budget_data, months, link_indexes)
-        self._finalize_projected(budget_data)
-        return self._build_budget_forecast_df(budget_data)
+        self._fill_planned_operations(budget_cube, months)
+        self._fill_planned_budgets(budget_cube, months)
+        self._fill_unrealized_operations(budget_cube, months, link_indexes)
+        self._fill_unrealized_budgets(budget_cube, months, link_indexes)
+        return budget_cube.to_dataframe()
 
     def _build_link_indexes(self) -> _LinkIndexes:
         """Build indexes from operation links for link-aware attribution."""
@@ -253,7 +452,7 @@ class AccountAnalyzer:
 
     def _fill_actual(
         self,
-        budget_data: _BudgetData,
+        budget_cube: _BudgetCube,
         start_date: date,
         end_date: date,
         op_to_linked_month: dict[OperationId, date],
@@ -268,8 +467,7 @@ class AccountAnalyzer:
             month = op_to_linked_month.get(
                 operation.unique_id, operation.operation_date.replace(day=1)
             )
-            _increment(
-                budget_data,
+            budget_cube.add(
                 operation.category,
                 month,
                 BudgetColumn.ACTUAL,
@@ -277,7 +475,7 @@ class AccountAnalyzer:
             )
 
     def _fill_planned_operations(
-        self, budget_data: _BudgetData, months: pd.DatetimeIndex
+        self, budget_cube: _BudgetCube, months: pd.DatetimeIndex
     ) -> None:
         """Fill TotalPlanned and PlannedFromOps for planned operations."""
         for ts in months:
@@ -286,15 +484,13 @@ class AccountAnalyzer:
 
             for planned_op in self._forecast.operations:
                 if amount := planned_op.amount_on_period(month_start, month_end):
-                    _increment(
-                        budget_data,
+                    budget_cube.add(
                         planned_op.category,
                         month_start,
                         BudgetColumn.TOTAL_PLANNED,
                         amount,
                     )
-                    _increment(
-                        budget_data,
+                    budget_cube.add(
                         planned_op.category,
                         month_start,
                         BudgetColumn.PLANNED_FROM_OPS,
@@ -302,7 +498,7 @@ class AccountAnalyzer:
                     )
 
     def _fill_planned_budgets(
-        self, budget_data: _BudgetData, months: pd.DatetimeIndex
+        self, budget_cube: _BudgetCube, months: pd.DatetimeIndex
     ) -> None:
         """Fill TotalPlanned and PlannedFromBudgets for budgets."""
         for ts in months:
@@ -311,15 +507,13 @@ class AccountAnalyzer:
 
             for budget in self._forecast.budgets:
                 if amount := budget.amount_on_period(month_start, month_end):
-                    _increment(
-                        budget_data,
+                    budget_cube.add(
                         budget.category,
                         month_start,
                         BudgetColumn.TOTAL_PLANNED,
                         amount,
                     )
-                    _increment(
-                        budget_data,
+                    budget_cube.add(
                         budget.category,
                         month_start,
                         BudgetColumn.PLANNED_FROM_BUDGETS,
@@ -328,7 +522,7 @@ class AccountAnalyzer:
 
     def _fill_unrealized_operations(
         self,
-        budget_data: _BudgetData,
+        budget_cube: _BudgetCube,
         months: pd.DatetimeIndex,
         link_indexes: _LinkIndexes,
     ) -> None:
@@ -351,8 +545,7 @@ class AccountAnalyzer:
                     if date_range.is_future(month_end):
                         break
                     if date_range.start_date not in realized:
-                        _increment(
-                            budget_data,
+                        budget_cube.add(
                             planned_op.category,
                             month_start,
                             BudgetColumn.UNREALIZED_INTERNAL,
@@ -361,7 +554,7 @@ class AccountAnalyzer:
 
     def _fill_unrealized_budgets(
         self,
-        budget_data: _BudgetData,
+        budget_cube: _BudgetCube,
         months: pd.DatetimeIndex,
         link_indexes: _LinkIndexes,
     ) -> None:
@@ -380,62 +573,13 @@ class AccountAnalyzer:
                 remaining = max(0.0, abs(budget_amount) - consumed)
                 # Preserve the sign: expenses are negative, income is positive
                 if unrealized := -remaining if budget_amount < 0 else remaining:
-                    _increment(
-                        budget_data,
+                    budget_cube.add(
                         budget.category,
                         month_start,
                         BudgetColumn.UNREALIZED_INTERNAL,
                         unrealized,
                     )
 
-    @staticmethod
-    def _finalize_projected(budget_data: _BudgetData) -> None:
-        """Compute Forecast = Actual + _UNREALIZED, then drop _UNREALIZED."""
-        for category_months in budget_data.values():
-            for month_columns in category_months.values():
-                actual = month_columns.get(BudgetColumn.ACTUAL, 0.0)
-                unrealized = month_columns.pop(BudgetColumn.UNREALIZED_INTERNAL, 0.0)
-                month_columns[BudgetColumn.FORECAST] = actual + unrealized
-
-    @staticmethod
-    def _build_budget_forecast_df(budget_data: _BudgetData) -> pd.DataFrame:
-        """Build the final MultiIndex DataFrame from accumulated data."""
-        df = pd.DataFrame.from_dict(
-            {
-                (category, month): month_columns
-                for category, category_months in budget_data.items()
-                for month, month_columns in category_months.items()
-            },
-            orient="index",
-        )
-
-        column_order = [
-            BudgetColumn.TOTAL_PLANNED,
-            BudgetColumn.PLANNED_FROM_OPS,
-            BudgetColumn.PLANNED_FROM_BUDGETS,
-            BudgetColumn.ACTUAL,
-            BudgetColumn.FORECAST,
-        ]
-
-        df.index = pd.MultiIndex.from_tuples(df.index, names=["Category", "Month"])
-        df = df.reindex(columns=column_order, fill_value=0)
-        df = df.unstack(level=-1).fillna(0)  # type: ignore[assignment]
-        df.columns = df.columns.swaplevel(0, 1)  # type: ignore[attr-defined]
-        df.sort_index(axis=1, level=0, inplace=True)
-
-        # Convert month strings to Timestamps and sort
-        new_columns = [
-            (pd.to_datetime(col[0], format="%Y-%m-%d"), col[1]) for col in df.columns
-        ]
-        new_columns = sorted(new_columns, key=lambda x: (x[0], x[1]))
-        df.columns = pd.MultiIndex.from_tuples(new_columns)
-
-        df = df.sort_index()
-        df.loc["Total"] = df.sum(numeric_only=True, axis=0)
-        df = df.round(0).astype(int)
-
-        return df
-
     def compute_budget_statistics(
         self, start_date: date, end_date: date
     ) -> pd.DataFrame:
@@ -445,7 +589,6 @@ class AccountAnalyzer:
                 columns=["Category", "Total", "Monthly average"]
             ).set_index("Category")
 
-        expenses_per_category_dict: dict[Category, list[tuple[date, float]]] = {}
         analysis_start = max(
             min(operation.operation_date for operation in self._account.operations),
             start_date,
@@ -468,32 +611,11 @@ class AccountAnalyzer:
             else analysis_end
         )
 
-        all_months = pd.date_range(analysis_start, analysis_end, freq="MS")
-
-        for operation in self._account.operations:
-            if analysis_start <= operation.operation_date <= analysis_end:
-                expenses_per_category_dict.setdefault(operation.category, []).append(
-                    (operation.operation_date, operation.amount)
-                )
-        expenses_per_category = {}
-        for category, expenses in expenses_per_category_dict.items():
-            df = pd.DataFrame(expenses, columns=["Date", "Amount"])
-            df["Date"] = pd.to_datetime(df["Date"])
-            expenses_per_category[category] = df.set_index("Date")
-
+        rollup = compute_monthly_rollup(
+            self._account.operations, analysis_start, analysis_end
+        )
         df = pd.DataFrame(
-            {
-                "Category": list(expenses_per_category),
-                "Total": [df["Amount"].sum() for df in expenses_per_category.values()],
-                "Monthly average": [
-                    df.resample("MS")["Amount"]
-                    .sum()
-                    .reindex(all_months, fill_value=0.0)
-                    .mean()
-                    for df in expenses_per_category.values()
-                ],
-            }
+            {"Total": rollup.sum(axis=1), "Monthly average": rollup.mean(axis=1)}
         )
-        df.set_index("Category", inplace=True)
         df = df.round(2)
         return df
@@ -0,0 +1,222 @@
+"""Module to look up the past balances of an account."""
+import logging
+from collections.abc import Collection
+from datetime import date
+
+import numpy as np
+import numpy.typing as npt
+
+from budget_forecaster.core.types import OperationId
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+
+logger = logging.getLogger(__name__)
+
+# Date ordinal and amount of an indexed operation
+_Entry = tuple[int, float]
+
+
+def _entry(operation: HistoricOperation) -> _Entry:
+    return operation.operation_date.toordinal(), operation.amount
+
+
+def _remove_entries(
+    dates: npt.NDArray[np.int64],
+    amounts: npt.NDArray[np.float64],
+    removed: list[_Entry],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    """Remove one occurrence of each entry from the date-sorted arrays."""
+    kept = np.ones(len(dates), dtype=bool)
+    for removed_date, removed_amount in removed:
+        start = np.searchsorted(dates, removed_date, side="left")
+        end = np.searchsorted(dates, removed_date, side="right")
+        # Operations of the same date and amount are removed one at a time
+        matches = np.flatnonzero(
+            (amounts[start:end] == removed_amount) & kept[start:end]
+        )
+        kept[start + matches[0]] = False
+    return dates[kept], amounts[kept]
+
+
+class BalanceIndex:  # pylint: disable=too-many-instance-attributes
+    """Prefix-sum index of the balance of an account over time.
+
+    Operations are kept sorted by date with the cumulative sum of their
+    amounts, so the balance at any date up to the balance date is found with
+    a binary search. As in AccountForecaster, the balance at a past date is
+    the current balance minus the operations dated after it, up to the
+    balance date.
+
+    The index is meant to be long-lived: update() only merges the operations
+    added, edited or removed since the previous state of the account. When
+    the changed operations are reported with report_changes(), only those are
+    compared instead of all the operations of the account.
+    """
+
+    def __init__(self, account: Account) -> None:
+        self._operations: tuple[HistoricOperation, ...] = ()
+        self._entries: dict[OperationId, _Entry] = {}
+        # Position of each operation in the operations of the account
+        self._positions: dict[OperationId, int] = {}
+        # Operations reported as changed since the last update, None if the
+        # changes are unknown
+        self._changed_ids: frozenset[OperationId] | None = None
+        self._dates: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._amounts: npt.NDArray[np.float64] = np.empty(0, dtype=np.float64)
+        # _cumulative_amounts[i] is the sum of the i earliest operations
+        self._cumulative_amounts: npt.NDArray[np.float64] = np.zeros(1)
+        self._balance = account.balance
+        self._balance_date = account.balance_date
+        self.update(account)
+
+    @property
+    def balance_date(self) -> date:
+        """The date of the current balance of the account."""
+        return self._balance_date
+
+    def report_changes(self, operation_ids: Collection[OperationId]) -> None:
+        """Report operations whose date or amount may have changed.
+
+        The next update() only compares these operations, unless operations
+        were added or removed meanwhile. Operations of other accounts are
+        ignored.
+
+        Args:
+            operation_ids: IDs of the edited operations.
+        """
+        if not operation_ids:
+            return
+        # Replaced rather than modified, as update() may run in another thread
+        self._changed_ids = (self._changed_ids or frozenset()) | frozenset(
+            operation_ids
+        )
+
+    def forget_changes(self) -> None:
+        """Compare all operations on the next update(), e.g. after a reload."""
+        self._changed_ids = None
+
+    def update(self, account: Account) -> None:
+        """Synchronize the index with the current state of the account.
+
+        Args:
+            account: The account, possibly with new, edited or removed operations.
+        """
+        self._balance = account.balance
+        self._balance_date = account.balance_date
+
+        changed_ids, self._changed_ids = self._changed_ids, None
+        if (operations := account.operations) is self._operations:
+            return
+        changes = None
+        if changed_ids is not None and len(operations) == len(self._operations):
+            changes = self._reported_changes(operations, changed_ids)
+        if changes is None:
+            changes = self._all_changes(operations)
+        self._operations = operations
+        added, removed = changes
+        if added or removed:
+            self._merge(added, removed)
+
+    def _reported_changes(
+        self,
+        operations: tuple[HistoricOperation, ...],
+        changed_ids: frozenset[OperationId],
+    ) -> tuple[list[_Entry], list[_Entry]] | None:
+        """Get the entries added and removed by the reported changes.
+
+        Returns:
+            The added and removed entries, or None if the operations were
+            reordered and all of them must be compared.
+        """
+        entries: dict[OperationId, _Entry] = {}
+        for operation_id in changed_ids:
+            if (position := self._positions.get(operation_id)) is None:
+                continue
+            operation = operations[position]
+            if operation.unique_id != operation_id:
+                return None
+            if (entry := _entry(operation)) != self._entries[operation_id]:
+                entries[operation_id] = entry
+        removed = [self._entries[operation_id] for operation_id in entries]
+        self._entries.update(entries)
+        return list(entries.values()), removed
+
+    def _all_changes(
+        self, operations: tuple[HistoricOperation, ...]
+    ) -> tuple[list[_Entry], list[_Entry]]:
+        """Get the entries added and removed by comparing all operations."""
+        entries = {operation.unique_id: _entry(operation) for operation in operations}
+        added = [
+            entry for key, entry in entries.items() if self._entries.get(key) != entry
+        ]
+        removed = [
+            entry for key, entry in self._entries.items() if entries.get(key) != entry
+        ]
+        self._entries = entries
+        self._positions = {
+            operation.unique_id: position
+            for position, operation in enumerate(operations)
+        }
+        return added, removed
+
+    def _merge(self, added: list[_Entry], removed: list[_Entry]) -> None:
+        """Merge the added and removed entries into the sorted arrays."""
+        # Cumulative sums before the earliest changed date are kept
+        first_date = min(entry[0] for entry in (*added, *removed))
+        if len(removed) > len(self._entries) // 2:
+            # Cheaper to sort everything again than to remove entries
+            self._dates = np.empty(0, dtype=np.int64)
+            self._amounts = np.empty(0, dtype=np.float64)
+            self._cumulative_amounts = np.zeros(1)
+            added, removed, first_date = list(self._entries.values()), [], 0
+
+        dates, amounts = _remove_entries(self._dates, self._amounts, removed)
+        added.sort()
+        added_dates = np.array([entry[0] for entry in added], dtype=np.int64)
+        positions = np.searchsorted(dates, added_dates, side="right")
+        self._dates = np.insert(dates, positions, added_dates)
+        self._amounts = np.insert(
+            amounts,
+            positions,
+            np.array([entry[1] for entry in added], dtype=np.float64),
+        )
+
+        first = int(np.searchsorted(self._dates, first_date, side="left"))
+        self._cumulative_amounts = np.concatenate(
+            (
+                self._cumulative_amounts[: first + 1],
+                self._cumulative_amounts[first]
+                + np.cumsum(self._amounts[first:], dtype=np.float64),
+            )
+        )
+        logger.debug(
+            "Balance index updated with %d added and %d removed operations",
+            len(added),
+            len(removed),
+        )
+
+    def _amount_until(self, target_date: date) -> float:
+        """Sum the amounts of the operations dated on or before target_date."""
+        position = np.searchsorted(self._dates, target_date.toordinal(), side="right")
+        return float(self._cumulative_amounts[position])
+
+    def balance_at(self, target_date: date) -> float:
+        """Get the balance of the account at the end of a past date.
+
+        Args:
+            target_date: The date to get the balance at.
+
+        Returns:
+            The balance after the operations of target_date.
+
+        Raises:
+            ValueError: If target_date is after the balance date.
+        """
+        if target_date > self._balance_date:
+            raise ValueError(
+                f"target_date must be <= balance_date, "
+                f"got {target_date} > {self._balance_date}"
+            )
+        return self._balance - (
+            self._amount_until(self._balance_date) - self._amount_until(target_date)
+        )
@@ -0,0 +1,182 @@
+"""Module to project the daily balances of an account with arrays."""
+from datetime import date, timedelta
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from budget_forecaster.core.types import BalanceResolution
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.services.account.balance_index import BalanceIndex
+from budget_forecaster.services.account.forecast_iterations import (
+    ForecastIterations,
+    flatten_forecast,
+    project_daily_amounts,
+)
+
+# Last day of each bucket of the coarse balance resolutions
+_BUCKET_FREQUENCIES = {
+    BalanceResolution.WEEKLY: "W-SUN",
+    BalanceResolution.MONTHLY: "ME",
+}
+
+
+class BalanceProjection(NamedTuple):
+    """Inputs of the daily balance projection of an account, as arrays.
+
+    They hold no operation or forecast object, so projections can be sent to
+    worker processes.
+    """
+
+    balance: float
+    """Balance at the start date, or at the balance date if it is earlier."""
+    start_day: int
+    end_day: int
+    balance_day: int
+    operation_days: npt.NDArray[np.int64]
+    """Ordinals of the account operations after the start date."""
+    operation_amounts: npt.NDArray[np.float64]
+    iterations: ForecastIterations
+    """Iterations of the actualized forecast, flattened from the balance date."""
+
+
+def build_balance_projection(
+    account: Account,
+    actualized_forecast: Forecast,
+    start_date: date,
+    end_date: date,
+    balance_index: BalanceIndex,
+) -> BalanceProjection:
+    """Gather the inputs of the daily balance projection of an account.
+
+    Args:
+        account: The account to project.
+        actualized_forecast: The forecast, actualized for the account.
+        start_date: First date of the projection.
+        end_date: Last date of the projection.
+        balance_index: Balance index synchronized with the account.
+
+    Returns:
+        The inputs of the projection.
+
+    Raises:
+        ValueError: If start_date is after end_date.
+    """
+    if start_date > end_date:
+        raise ValueError(
+            f"start_date must be <= end_date, got {start_date} > {end_date}"
+        )
+
+    balance_date = account.balance_date
+    operations = [
+        operation
+        for operation in account.operations
+        if start_date < operation.operation_date <= end_date
+    ]
+    return BalanceProjection(
+        balance=(
+            balance_index.balance_at(start_date)
+            if start_date <= balance_date
+            else account.balance
+        ),
+        start_day=start_date.toordinal(),
+        end_day=end_date.toordinal(),
+        balance_day=balance_date.toordinal(),
+        operation_days=np.array(
+            [operation.operation_date.toordinal() for operation in operations],
+            dtype=np.int64,
+        ),
+        operation_amounts=np.array(
+            [operation.amount for operation in operations], dtype=np.float64
+        ),
+        iterations=flatten_forecast(actualized_forecast, balance_date, end_date),
+    )
+
+
+def project_daily_balances(projection: BalanceProjection) -> npt.NDArray[np.float64]:
+    """Project the balance of each day from the start date to the end date.
+
+    The balances are those of AccountAnalyzer.compute_balance_evolution_per_day,
+    but the projected amounts are summed per day from the flattened iterations
+    instead of being generated as operations.
+
+    Args:
+        projection: The inputs of the projection.
+
+    Returns:
+        The balance at the end of each day, the start date first.
+    """
+    balance = projection.balance
+    daily_changes = np.zeros(projection.end_day - projection.start_day + 1)
+    np.add.at(
+        daily_changes,
+        projection.operation_days - projection.start_day,
+        projection.operation_amounts,
+    )
+
+    if projection.end_day > projection.balance_day:
+        projected = project_daily_amounts(
+            projection.iterations, projection.balance_day, projection.end_day
+        )
+        # Index of the start date in the projected amounts
+        if (offset := projection.start_day - projection.balance_day) > 0:
+            balance += projected[: offset + 1].sum()
+            daily_changes[1:] += projected[offset + 1 :]
+        else:
+            daily_changes[-offset:] += projected
+
+    return balance + np.cumsum(daily_changes)
+
+
+class BucketBalances(NamedTuple):
+    """Balances reduced per bucket of a resolution."""
+
+    dates: pd.DatetimeIndex
+    """Last day of each bucket."""
+    balances: npt.NDArray[np.float64]
+    """Balance at the last day of each bucket."""
+    lowest_balances: npt.NDArray[np.float64]
+    """Lowest balance over the days of each bucket."""
+
+
+def reduce_to_buckets(
+    balances: npt.NDArray[np.float64], start_date: date, resolution: BalanceResolution
+) -> BucketBalances:
+    """Reduce daily balances to the buckets of a resolution.
+
+    Buckets are single days, weeks ending on Sunday or calendar months; the
+    last one is clipped to the last day of the balances.
+
+    Args:
+        balances: Balances of each day from start_date, along the first axis.
+        start_date: Date of the first balance.
+        resolution: The resolution of the buckets.
+
+    Returns:
+        The last day, last balance and lowest balance of each bucket.
+    """
+    last_day = len(balances) - 1
+    if resolution == BalanceResolution.DAILY:
+        last_days = list(range(last_day + 1))
+    else:
+        last_days = [
+            ts.date().toordinal() - start_date.toordinal()
+            for ts in pd.date_range(
+                start_date,
+                start_date + timedelta(days=last_day),
+                freq=_BUCKET_FREQUENCIES[resolution],
+            )
+        ]
+        if not last_days or last_days[-1] != last_day:
+            last_days.append(last_day)
+    first_days = [0, *(day + 1 for day in last_days[:-1])]
+
+    return BucketBalances(
+        dates=pd.DatetimeIndex(
+            [start_date + timedelta(days=day) for day in last_days], name="Date"
+        ),
+        balances=balances[last_days],
+        lowest_balances=np.minimum.reduceat(balances, first_days, axis=0),
+    )
@@ -0,0 +1,168 @@
+"""Module to measure the accuracy of forecasts against the account history."""
+import functools
+import logging
+import math
+from datetime import date
+from typing import NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.parallel import map_in_processes
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.services.account.balance_index import BalanceIndex
+from budget_forecaster.services.account.forecast_iterations import (
+    ForecastIterations,
+    flatten_forecast,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HORIZONS: tuple[int, ...] = (1, 3, 6, 12)
+
+
+class BacktestReport(NamedTuple):
+    """Forecast and actual balances of a backtest.
+
+    Both frames are indexed by origin date, with one column per horizon in
+    months. Horizons ending after the balance date have no actual balance.
+    """
+
+    forecast_balances: pd.DataFrame
+    actual_balances: pd.DataFrame
+
+    @property
+    def errors(self) -> pd.DataFrame:
+        """Forecast minus actual balance, per origin and horizon."""
+        return self.forecast_balances - self.actual_balances
+
+    @property
+    def mean_absolute_errors(self) -> pd.Series:
+        """Mean absolute error per horizon, over the origins where it is known."""
+        return self.errors.abs().mean()
+
+
+class _BacktestInputs(NamedTuple):
+    """Read-only inputs shared by all the origins of a backtest."""
+
+    balance_index: BalanceIndex
+    iterations: ForecastIterations
+    horizons: tuple[int, ...]
+
+
+def monthly_origins(balance_date: date, months: int) -> tuple[date, ...]:
+    """Get the first day of each of the months before the balance date.
+
+    Args:
+        balance_date: The date of the current balance.
+        months: Number of months to go back.
+
+    Returns:
+        The origins of a backtest, oldest first.
+    """
+    month_start = balance_date.replace(day=1)
+    return tuple(month_start - relativedelta(months=n) for n in range(months, 0, -1))
+
+
+def _backtest_origin(
+    inputs: _BacktestInputs, origin: date
+) -> tuple[list[float], list[float]]:
+    """Forecast the balance at each horizon from an origin, and get the actual one.
+
+    Returns:
+        The forecast and actual balances per horizon, the actual balance being
+        NaN after the balance date.
+    """
+    balance_index, iterations, horizons = inputs
+    origin_balance = balance_index.balance_at(origin)
+    # Projected operations start the day after the origin
+    first_days = np.maximum(iterations.start_dates, origin.toordinal() + 1)
+
+    forecast_balances: list[float] = []
+    actual_balances: list[float] = []
+    for horizon in horizons:
+        target_date = origin + relativedelta(months=horizon)
+        days = np.minimum(iterations.last_dates, target_date.toordinal()) - first_days
+        projected = float(iterations.daily_amounts @ np.clip(days + 1, 0, None))
+        forecast_balances.append(origin_balance + projected)
+        actual_balances.append(
+            balance_index.balance_at(target_date)
+            if target_date <= balance_index.balance_date
+            else math.nan
+        )
+    return forecast_balances, actual_balances
+
+
+class ForecastBacktester:  # pylint: disable=too-few-public-methods
+    """Measure the accuracy of a forecast by replaying the account from past dates.
+
+    From each origin, the balance of the account is read from a BalanceIndex,
+    projected forward with the forecast, and compared to the actual balance
+    at each horizon. The forecast is flattened once into arrays of iterations,
+    so origins are computed independently, optionally in a process pool.
+    """
+
+    def __init__(
+        self,
+        account: Account,
+        forecast: Forecast,
+        balance_index: BalanceIndex | None = None,
+    ) -> None:
+        """Initialize the backtester.
+
+        Args:
+            account: The account to replay.
+            forecast: The forecast to backtest.
+            balance_index: A balance index already synchronized with the
+                account. A fresh one is built when omitted.
+        """
+        self._balance_index = balance_index or BalanceIndex(account)
+        self._forecast = forecast
+
+    def __call__(
+        self,
+        origins: Sequence[date],
+        horizons: Sequence[int] = DEFAULT_HORIZONS,
+        max_workers: int | None = 1,
+    ) -> BacktestReport:
+        """Backtest the forecast from each origin.
+
+        Args:
+            origins: The past dates to forecast from.
+            horizons: Number of months to forecast ahead of each origin.
+            max_workers: Number of worker processes, None for one per CPU.
+                Origins are computed in the current process with 1.
+
+        Returns:
+            The forecast and actual balances per origin and horizon.
+        """
+        horizons = tuple(horizons)
+        columns = pd.Index(horizons, name="Horizon")
+        index = pd.Index(origins, name="Origin")
+        if not origins or not horizons:
+            empty = pd.DataFrame(index=index, columns=columns, dtype=float)
+            return BacktestReport(empty, empty.copy())
+
+        inputs = _BacktestInputs(
+            self._balance_index,
+            flatten_forecast(
+                self._forecast,
+                min(origins),
+                max(origins) + relativedelta(months=max(horizons)),
+            ),
+            horizons,
+        )
+        results = map_in_processes(
+            functools.partial(_backtest_origin, inputs), origins, max_workers
+        )
+        logger.info(
+            "Backtested %d origins over horizons %s", len(origins), list(horizons)
+        )
+
+        forecast_balances, actual_balances = zip(*results)
+        return BacktestReport(
+            pd.DataFrame(list(forecast_balances), index=index, columns=columns),
+            pd.DataFrame(list(actual_balances), index=index, columns=columns),
+        )
@@ -0,0 +1,82 @@
+"""Module to flatten the iterations of a forecast into arrays."""
+import itertools
+from datetime import date
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from budget_forecaster.domain.forecast.forecast import Forecast
+
+
+class ForecastIterations(NamedTuple):
+    """Iterations of a forecast, as flat arrays of date ordinals and amounts."""
+
+    start_dates: npt.NDArray[np.int64]
+    last_dates: npt.NDArray[np.int64]
+    daily_amounts: npt.NDArray[np.float64]
+
+
+def flatten_forecast(
+    forecast: Forecast, first_date: date, last_date: date
+) -> ForecastIterations:
+    """Flatten the iterations of the forecast between two dates.
+
+    Each iteration spreads its amount evenly over its days, as projected by
+    AccountForecaster from a balance date of first_date.
+
+    Args:
+        forecast: The forecast to flatten.
+        first_date: Iterations ending before this date are skipped.
+        last_date: Iterations starting after this date are skipped.
+
+    Returns:
+        The start date, last date and daily amount of each iteration.
+    """
+    start_dates: list[int] = []
+    last_dates: list[int] = []
+    daily_amounts: list[float] = []
+    for operation_range in itertools.chain(forecast.operations, forecast.budgets):
+        for dr in operation_range.date_range.iterate_over_date_ranges(first_date):
+            if dr.is_future(last_date):
+                break
+            if dr.is_expired(first_date):
+                continue
+            start_dates.append(dr.start_date.toordinal())
+            last_dates.append(dr.last_date.toordinal())
+            daily_amounts.append(operation_range.amount / dr.total_duration.days)
+    return ForecastIterations(
+        np.array(start_dates, dtype=np.int64),
+        np.array(last_dates, dtype=np.int64),
+        np.array(daily_amounts, dtype=np.float64),
+    )
+
+
+def project_daily_amounts(
+    iterations: ForecastIterations, balance_day: int, end_day: int
+) -> npt.NDArray[np.float64]:
+    """Sum the projected amounts of each day from the balance date to the end date.
+
+    Daily amounts are added at the first day of each iteration and removed
+    after its last day, so the amounts of the days are a cumulative sum.
+
+    Args:
+        iterations: The iterations flattened from the balance date.
+        balance_day: Ordinal of the balance date.
+        end_day: Ordinal of the last date, not before the balance date.
+
+    Returns:
+        The projected amount of each day, the balance date first. Projected
+        operations start the day after the balance date, so the first amount
+        is always zero.
+    """
+    first_days = np.maximum(iterations.start_dates, balance_day + 1) - balance_day
+    last_days = np.minimum(iterations.last_dates, end_day) - balance_day
+    projected = first_days <= last_days
+
+    daily_changes = np.zeros(end_day - balance_day + 2)
+    np.add.at(daily_changes, first_days[projected], iterations.daily_amounts[projected])
+    np.add.at(
+        daily_changes, last_days[projected] + 1, -iterations.daily_amounts[projected]
+    )
+    return np.cumsum(daily_changes[:-1])
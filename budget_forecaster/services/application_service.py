@@ -5,26 +5,34 @@ facade for the TUI, delegating orchestration logic to focused use cases
 while providing direct access to read-only service methods.
 """
 
+import heapq
+import itertools
 import logging
+from collections.abc import Collection, Iterator
 from datetime import date, timedelta
 from pathlib import Path
 from typing import NamedTuple
 
+import pandas as pd
 from dateutil.relativedelta import relativedelta
 
 from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.cancellation import CancellationToken
 from budget_forecaster.core.date_range import RecurringDay
 from budget_forecaster.core.types import (
+    BalanceResolution,
     BudgetId,
     Category,
     ImportProgressCallback,
     IterationDate,
     LinkType,
+    MatcherKey,
     OperationId,
     PlannedOperationId,
     TargetId,
 )
 from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_link import OperationLink
@@ -35,12 +43,20 @@ from budget_forecaster.infrastructure.persistence.persistent_account import (
 from budget_forecaster.services.account.account_analysis_report import (
     AccountAnalysisReport,
 )
+from budget_forecaster.services.account.forecast_backtester import BacktestReport
 from budget_forecaster.services.forecast.forecast_service import (
     CategoryDetail,
     ForecastService,
     MarginInfo,
     MonthlySummary,
 )
+from budget_forecaster.services.forecast.per_account_evaluator import (
+    PerAccountBalances,
+)
+from budget_forecaster.services.forecast.scenario_evaluator import (
+    BASELINE_SCENARIO,
+    ScenarioComparison,
+)
 from budget_forecaster.services.import_service import (
     ImportResult,
     ImportService,
@@ -61,6 +77,7 @@ from budget_forecaster.services.use_cases import (
     ManageLinksUseCase,
     ManageTargetsUseCase,
     MatcherCache,
+    RelinkResult,
 )
 
 logger = logging.getLogger(__name__)
@@ -76,45 +93,66 @@ class UpcomingIteration(NamedTuple):
     period: relativedelta | None
 
 
+def _iterations_of(
+    planned_operation: PlannedOperation, reference_date: date
+) -> Iterator[UpcomingIteration]:
+    """Yield the iterations of a planned operation from the reference date on."""
+    period = (
+        planned_operation.date_range.period
+        if isinstance(planned_operation.date_range, RecurringDay)
+        else None
+    )
+    # Recurring date ranges jump to the iteration index of from_date directly
+    for date_range in planned_operation.date_range.iterate_over_date_ranges(
+        from_date=reference_date
+    ):
+        if date_range.start_date >= reference_date:
+            yield UpcomingIteration(
+                iteration_date=date_range.start_date,
+                description=planned_operation.description,
+                amount=planned_operation.amount,
+                currency=planned_operation.currency,
+                period=period,
+            )
+
+
 def get_upcoming_iterations(
     planned_operations: tuple[PlannedOperation, ...],
     reference_date: date,
-    horizon_days: int = 30,
+    horizon_days: int | None = 30,
+    limit: int | None = None,
 ) -> tuple[UpcomingIteration, ...]:
     """Get upcoming iterations from planned operations within a time horizon.
 
+    The iterations of each planned operation are lazily merged on date with a
+    heap, so only the iterations up to the horizon or the limit are generated.
+    Iterations on the same date keep the order of the planned operations.
+
     Args:
         planned_operations: All planned operations.
         reference_date: The date to compute from (typically today).
-        horizon_days: Number of days ahead to look.
+        horizon_days: Number of days ahead to look, or None for no horizon.
+        limit: Maximum number of iterations to return, or None for no limit.
 
     Returns:
         Upcoming iterations sorted by date ascending.
-    """
-    cutoff = reference_date + timedelta(days=horizon_days)
-    iterations: list[UpcomingIteration] = []
 
-    for op in planned_operations:
-        period = (
-            op.date_range.period if isinstance(op.date_range, RecurringDay) else None
+    Raises:
+        ValueError: If neither a horizon nor a limit is given.
+    """
+    if horizon_days is None and limit is None:
+        raise ValueError("Either a horizon or a limit is required")
+
+    iterations: Iterator[UpcomingIteration] = heapq.merge(
+        *(_iterations_of(op, reference_date) for op in planned_operations),
+        key=lambda it: it.iteration_date,
+    )
+    if horizon_days is not None:
+        cutoff = reference_date + timedelta(days=horizon_days)
+        iterations = itertools.takewhile(
+            lambda it: it.iteration_date <= cutoff, iterations
         )
-        for date_range in op.date_range.iterate_over_date_ranges(
-            from_date=reference_date
-        ):
-            if date_range.start_date > cutoff:
-                break
-            if date_range.start_date >= reference_date:
-                iterations.append(
-                    UpcomingIteration(
-                        iteration_date=date_range.start_date,
-                        description=op.description,
-                        amount=op.amount,
-                        currency=op.currency,
-                        period=period,
-                    )
-                )
-
-    return tuple(sorted(iterations, key=lambda it: it.iteration_date))
+    return tuple(itertools.islice(iterations, limit))
 
 
 class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -130,13 +168,15 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
     Read-only methods are delegated directly to the underlying services.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         persistent_account: PersistentAccount,
         import_service: ImportService,
         operation_service: OperationService,
         forecast_service: ForecastService,
         operation_link_service: OperationLinkService,
+        *,
+        link_lookback: timedelta | None = None,
     ) -> None:
         """Initialize the application service.
 
@@ -146,12 +186,18 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
             operation_service: Service for operation CRUD.
             forecast_service: Service for forecast and target CRUD.
             operation_link_service: Service for link management.
+            link_lookback: If set, unlinked operations dated up to this long
+                before an import are linked again with the imported ones.
         """
         # Shared dependency
         matcher_cache = MatcherCache(forecast_service)
 
         self._import_uc = ImportUseCase(
-            import_service, persistent_account, operation_link_service, matcher_cache
+            import_service,
+            persistent_account,
+            operation_link_service,
+            matcher_cache,
+            link_lookback,
         )
         self._categorize_uc = CategorizeUseCase(
             operation_service, operation_link_service, matcher_cache
@@ -173,6 +219,14 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         self._import_service = import_service
         self._operation_link_service = operation_link_service
 
+        # Upcoming iterations per (reference date, horizon, limit) of a forecast
+        self._upcoming_forecast: Forecast | None = None
+        self._upcoming_iterations: dict[
+            tuple[date, int | None, int | None], tuple[UpcomingIteration, ...]
+        ] = {}
+        # What-if scenarios of the session, by name, never stored in the database
+        self._scenarios: dict[str, Scenario] = {}
+
     # -------------------------------------------------------------------------
     # Import operations (delegated to ImportUseCase)
     # -------------------------------------------------------------------------
@@ -230,6 +284,16 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         """Delete a budget and its links."""
         self._targets_uc.delete_budget(budget_id)
 
+    def relink_all_targets(self) -> RelinkResult:
+        """Recompute all automatic links with a globally optimal assignment.
+
+        The forecast report is discarded if a link changed.
+        """
+        result = self._targets_uc.relink_all_targets()
+        if result.operation_ids:
+            self._forecast_service.invalidate_report(result.operation_ids)
+        return result
+
     # -------------------------------------------------------------------------
     # Operation read methods (delegated to OperationService)
     # -------------------------------------------------------------------------
@@ -279,6 +343,17 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         """Get total amounts per category."""
         return self._operation_service.get_category_totals(filter_criteria)
 
+    def get_monthly_category_totals(
+        self,
+        date_from: date,
+        date_to: date,
+        filter_criteria: OperationFilter | None = None,
+    ) -> pd.DataFrame:
+        """Get total amounts per category and month over a period."""
+        return self._operation_service.get_monthly_category_totals(
+            date_from, date_to, filter_criteria
+        )
+
     # -------------------------------------------------------------------------
     # Link methods (delegated to ManageLinksUseCase / OperationLinkService)
     # -------------------------------------------------------------------------
@@ -324,8 +399,39 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         Returns:
             Upcoming iterations sorted by date ascending.
         """
-        planned_ops = self.get_all_planned_operations()
-        return get_upcoming_iterations(planned_ops, date.today(), horizon_days)
+        return self._get_planned_iterations(date.today(), horizon_days, None)
+
+    def get_next_planned_iterations(self, count: int) -> tuple[UpcomingIteration, ...]:
+        """Get the next iterations of planned operations, however far ahead.
+
+        Args:
+            count: Number of iterations to return.
+
+        Returns:
+            The first count upcoming iterations sorted by date ascending.
+        """
+        return self._get_planned_iterations(date.today(), None, count)
+
+    def _get_planned_iterations(
+        self, reference_date: date, horizon_days: int | None, limit: int | None
+    ) -> tuple[UpcomingIteration, ...]:
+        """Get upcoming iterations, cached until the forecast changes."""
+        if (
+            forecast := self._forecast_service.get_forecast()
+        ) is not self._upcoming_forecast:
+            self._upcoming_forecast = forecast
+            self._upcoming_iterations.clear()
+
+        key = (reference_date, horizon_days, limit)
+        if (iterations := self._upcoming_iterations.get(key)) is None:
+            planned_ops = tuple(
+                sorted(forecast.operations, key=lambda op: op.description.lower())
+            )
+            iterations = get_upcoming_iterations(
+                planned_ops, reference_date, horizon_days, limit
+            )
+            self._upcoming_iterations[key] = iterations
+        return iterations
 
     def get_all_budgets(self) -> tuple[Budget, ...]:
         """Get all budgets sorted alphabetically by description."""
@@ -350,9 +456,39 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         self,
         start_date: date | None = None,
         end_date: date | None = None,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        cancellation: CancellationToken | None = None,
     ) -> AccountAnalysisReport:
-        """Compute the forecast report."""
-        return self._forecast_uc.compute_report(start_date, end_date)
+        """Compute the forecast report, possibly in a worker thread."""
+        return self._forecast_uc.compute_report(
+            start_date, end_date, resolution, cancellation
+        )
+
+    def invalidate_report(
+        self, operation_ids: Collection[OperationId] | None = None
+    ) -> None:
+        """Discard the last computed report after operations or links changed."""
+        self._forecast_service.invalidate_report(operation_ids)
+
+    def reload_forecast(self) -> None:
+        """Reload the targets from the database and discard the last report."""
+        self._forecast_service.reload_forecast()
+
+    def load_cached_report(
+        self, resolution: BalanceResolution = BalanceResolution.DAILY
+    ) -> AccountAnalysisReport | None:
+        """Load the persisted forecast report if its data are still up to date."""
+        return self._forecast_uc.load_cached_report(resolution)
+
+    def is_report_window_current(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> bool:
+        """Check whether the current report covers the requested dates."""
+        return self._forecast_service.is_report_window_current(start_date, end_date)
+
+    def save_report_cache(self) -> None:
+        """Persist the last computed report for the next launch."""
+        self._forecast_service.save_report_cache()
 
     def get_balance_evolution_summary(
         self,
@@ -381,6 +517,105 @@ class ApplicationService:  # pylint: disable=too-many-instance-attributes,too-ma
         """Get category statistics from the report."""
         return self._forecast_service.get_category_statistics()
 
+    @property
+    def scenarios(self) -> tuple[Scenario, ...]:
+        """The what-if scenarios of the session, in order of addition."""
+        return tuple(self._scenarios.values())
+
+    def add_scenario(self, scenario: Scenario) -> None:
+        """Add a what-if scenario, replacing any scenario with the same name.
+
+        Args:
+            scenario: The scenario to add.
+
+        Raises:
+            ValueError: If the scenario is named like the baseline.
+        """
+        if scenario.name == BASELINE_SCENARIO:
+            raise ValueError(f"Scenario name is reserved: {scenario.name}")
+        self._scenarios.pop(scenario.name, None)
+        self._scenarios[scenario.name] = scenario
+
+    def remove_scenario(self, name: str) -> None:
+        """Remove a what-if scenario.
+
+        Args:
+            name: Name of the scenario to remove.
+        """
+        self._scenarios.pop(name, None)
+
+    def compare_scenarios(
+        self,
+        end_date: date | None = None,
+        max_workers: int | None = 1,
+        cancellation: CancellationToken | None = None,
+    ) -> ScenarioComparison:
+        """Compare the what-if scenarios of the session with the stored forecast.
+
+        Args:
+            end_date: Last date of the balance curves (default: 1 year from now).
+            max_workers: Number of worker processes, None for one per CPU.
+            cancellation: Token checked between the steps of the comparison.
+
+        Returns:
+            The balance curves and margins of the baseline and each scenario.
+        """
+        return self._forecast_uc.compare_scenarios(
+            self.scenarios, end_date, max_workers, cancellation
+        )
+
+    def compute_account_balances(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        max_workers: int | None = 1,
+    ) -> PerAccountBalances:
+        """Project the balance of each account from its share of the forecast.
+
+        Args:
+            start_date: First date of the balances (default: 4 months ago).
+            end_date: Last date of the balances (default: 1 year from now).
+            resolution: Resolution of the balance evolutions.
+            max_workers: Number of worker processes, None for one per CPU.
+
+        Returns:
+            The balance evolutions of each account and of the aggregated account.
+        """
+        return self._forecast_uc.compute_account_balances(
+            start_date, end_date, resolution, max_workers
+        )
+
+    def get_target_accounts(self) -> dict[MatcherKey, str]:
+        """Get the account each assigned planned operation or budget belongs to."""
+        return self._forecast_service.get_target_accounts()
+
+    def set_target_account(self, key: MatcherKey, account_name: str | None) -> None:
+        """Assign a planned operation or budget to one of the accounts.
+
+        Args:
+            key: The type and ID of the target.
+            account_name: Name of the account, or None for the first account.
+
+        Raises:
+            AccountNotFoundError: If no account has this name.
+        """
+        self._forecast_service.set_target_account(key, account_name)
+
+    def compute_backtest(
+        self, months: int = 36, max_workers: int | None = 1
+    ) -> BacktestReport:
+        """Backtest the forecast from the first day of each past month.
+
+        Args:
+            months: Number of past months to forecast from.
+            max_workers: Number of worker processes, None for one per CPU.
+
+        Returns:
+            The forecast and actual balances per origin and horizon.
+        """
+        return self._forecast_service.compute_backtest(months, max_workers=max_workers)
+
     @property
     def margin_threshold(self) -> float:
         """The margin threshold from settings."""
@@ -1,7 +1,7 @@
 """Module to actualize a forecast with actual data."""
 import logging
 from datetime import date, timedelta
-from typing import Final, Iterable
+from typing import Iterable, NamedTuple
 
 from dateutil.relativedelta import relativedelta
 
@@ -11,64 +11,182 @@ from budget_forecaster.core.types import (
     BudgetId,
     IterationDate,
     LinkType,
+    MatcherKey,
     OperationId,
     PlannedOperationId,
 )
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.forecast.forecast import Forecast
 from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 
 logger = logging.getLogger(__name__)
 
 
-class ForecastActualizer:  # pylint: disable=too-few-public-methods
-    """Actualize a forecast with actual data."""
+class _CacheKey(NamedTuple):
+    """Inputs a target's actualization depends on."""
+
+    target: PlannedOperation | Budget
+    approximation_date_range: timedelta
+    links_version: int
+    balance_date: date
+
+
+def _linked_operation_state(
+    operation: HistoricOperation | None,
+) -> tuple[date, float] | None:
+    """Return the operation fields the actualization depends on."""
+    if operation is None:
+        return None
+    return operation.operation_date, operation.amount
+
+
+class ForecastActualizer:  # pylint: disable=too-many-instance-attributes
+    """Actualize a forecast with actual data.
+
+    The actualizer is meant to be long-lived: its link and operation indexes
+    are updated incrementally through :meth:`update_account`,
+    :meth:`upsert_links`, :meth:`delete_links` and :meth:`sync_links`, and the
+    actualized result of each target is memoized. A target is only
+    re-actualized when the target itself, its links (or the linked
+    operations) or the balance date changed.
+    """
 
     def __init__(
         self,
         account: Account,
         operation_links: tuple[OperationLink, ...] = (),
     ) -> None:
-        self._account: Final = account
-        self._operation_links: Final = operation_links
-        # Internal indexes built from operation_links
+        self._account = account
+        # Internal indexes built from operation links
+        self._links: dict[OperationId, OperationLink] = {}
         self._linked_iterations: dict[PlannedOperationId, set[IterationDate]] = {}
         self._linked_op_ids: dict[tuple[BudgetId, IterationDate], set[OperationId]] = {}
-        # Map operation_id -> operation date for date lookups
-        self._operation_dates: dict[OperationId, date] = {
-            op.unique_id: op.operation_date for op in account.operations
+        # Map operation_id -> operation for date and amount lookups
+        self._operations: dict[OperationId, HistoricOperation] = {
+            op.unique_id: op for op in account.operations
         }
         # Map (planned_op_id, iteration_date) -> set of linked operation IDs
         self._planned_op_linked_ops: dict[
             tuple[PlannedOperationId, IterationDate], set[OperationId]
         ] = {}
-        self._build_indexes()
-
-    def _build_indexes(self) -> None:
-        """Build internal indexes from operation links for efficient lookups."""
-        for link in self._operation_links:
-            match link.target_type:
-                case LinkType.PLANNED_OPERATION:
-                    self._linked_iterations.setdefault(link.target_id, set()).add(
-                        link.iteration_date
-                    )
-                    # Also track which operations are linked to each iteration
-                    key = (link.target_id, link.iteration_date)
-                    self._planned_op_linked_ops.setdefault(key, set()).add(
-                        link.operation_unique_id
-                    )
-                case LinkType.BUDGET:
-                    key = (link.target_id, link.iteration_date)
-                    self._linked_op_ids.setdefault(key, set()).add(
-                        link.operation_unique_id
-                    )
-        logger.debug(
-            "Built indexes from %d links: %d planned op entries, %d budget entries",
-            len(self._operation_links),
-            len(self._linked_iterations),
-            len(self._linked_op_ids),
+        # Bumped each time the links of a target (or their operations) change
+        self._links_versions: dict[MatcherKey, int] = {}
+        # Memoized actualization results per target
+        self._planned_operations_cache: dict[
+            PlannedOperationId, tuple[_CacheKey, tuple[PlannedOperation, ...]]
+        ] = {}
+        self._budgets_cache: dict[BudgetId, tuple[_CacheKey, tuple[Budget, ...]]] = {}
+        self.upsert_links(operation_links)
+
+    @property
+    def account(self) -> Account:
+        """The account used as source of truth for actualization."""
+        return self._account
+
+    def _bump_links_version(self, key: MatcherKey) -> None:
+        self._links_versions[key] = self._links_versions.get(key, 0) + 1
+
+    def _index_link(self, link: OperationLink) -> None:
+        """Add a link to the internal indexes."""
+        self._links[link.operation_unique_id] = link
+        key = (link.target_id, link.iteration_date)
+        match link.target_type:
+            case LinkType.PLANNED_OPERATION:
+                self._linked_iterations.setdefault(link.target_id, set()).add(
+                    link.iteration_date
+                )
+                # Also track which operations are linked to each iteration
+                self._planned_op_linked_ops.setdefault(key, set()).add(
+                    link.operation_unique_id
+                )
+            case LinkType.BUDGET:
+                self._linked_op_ids.setdefault(key, set()).add(link.operation_unique_id)
+        self._bump_links_version(MatcherKey(link.target_type, link.target_id))
+
+    def _unindex_link(self, link: OperationLink) -> None:
+        """Remove a link from the internal indexes."""
+        del self._links[link.operation_unique_id]
+        key = (link.target_id, link.iteration_date)
+        match link.target_type:
+            case LinkType.PLANNED_OPERATION:
+                linked_ops = self._planned_op_linked_ops[key]
+                linked_ops.discard(link.operation_unique_id)
+                if not linked_ops:
+                    # Last link of this iteration: it is no longer linked
+                    del self._planned_op_linked_ops[key]
+                    self._linked_iterations[link.target_id].discard(link.iteration_date)
+            case LinkType.BUDGET:
+                linked_ops = self._linked_op_ids[key]
+                linked_ops.discard(link.operation_unique_id)
+                if not linked_ops:
+                    del self._linked_op_ids[key]
+        self._bump_links_version(MatcherKey(link.target_type, link.target_id))
+
+    def upsert_links(self, links: Iterable[OperationLink]) -> None:
+        """Add or replace links (an operation has at most one link).
+
+        Args:
+            links: The created or updated links.
+        """
+        for link in links:
+            if (existing := self._links.get(link.operation_unique_id)) is not None:
+                if existing == link:
+                    continue
+                self._unindex_link(existing)
+            self._index_link(link)
+
+    def delete_links(self, operation_ids: Iterable[OperationId]) -> None:
+        """Remove the links of the given operations, if any.
+
+        Args:
+            operation_ids: Unique IDs of the unlinked operations.
+        """
+        for operation_id in operation_ids:
+            if (existing := self._links.get(operation_id)) is not None:
+                self._unindex_link(existing)
+
+    def sync_links(self, operation_links: Iterable[OperationLink]) -> None:
+        """Replace the known links, updating only what changed.
+
+        Args:
+            operation_links: The complete set of current links.
+        """
+        new_links = {link.operation_unique_id: link for link in operation_links}
+        self.delete_links(
+            operation_id
+            for operation_id in tuple(self._links)
+            if operation_id not in new_links
+        )
+        self.upsert_links(new_links.values())
+
+    def update_account(self, account: Account) -> None:
+        """Replace the account, invalidating targets whose linked operations changed.
+
+        Args:
+            account: The new state of the account.
+        """
+        if account is self._account:
+            return
+        new_operations = {op.unique_id: op for op in account.operations}
+        for operation_id, link in self._links.items():
+            if _linked_operation_state(
+                self._operations.get(operation_id)
+            ) != _linked_operation_state(new_operations.get(operation_id)):
+                self._bump_links_version(MatcherKey(link.target_type, link.target_id))
+        self._account = account
+        self._operations = new_operations
+
+    def _cache_key(
+        self, key: MatcherKey, target: PlannedOperation | Budget
+    ) -> _CacheKey:
+        return _CacheKey(
+            target=target,
+            approximation_date_range=target.matcher.approximation_date_range,
+            links_version=self._links_versions.get(key, 0),
+            balance_date=self._account.balance_date,
         )
 
     def __call__(self, forecast: Forecast) -> Forecast:
@@ -197,8 +315,8 @@ class ForecastActualizer:  # pylint: disable=too-few-public-methods
         key = (planned_op_id, iteration_date)
         linked_op_ids = self._planned_op_linked_ops.get(key, set())
         for op_id in linked_op_ids:
-            op_date = self._operation_dates.get(op_id)
-            if op_date is not None and op_date <= balance_date:
+            operation = self._operations.get(op_id)
+            if operation is not None and operation.operation_date <= balance_date:
                 return True
 
         return False
@@ -249,33 +367,57 @@ class ForecastActualizer:  # pylint: disable=too-few-public-methods
             )
         )
 
+    def _actualize_planned_operation(
+        self, planned_operation: PlannedOperation
+    ) -> tuple[PlannedOperation, ...]:
+        """Actualize a single planned operation (postponed iterations included)."""
+        linked_iterations = self._get_linked_iterations(planned_operation)
+        # Check for late iterations (past iterations without links)
+        if late_iterations := self._get_late_iterations(
+            planned_operation, linked_iterations
+        ):
+            # Some iterations are late, postpone them to tomorrow
+            return self._handle_late_iterations(planned_operation, late_iterations)
+        # No late iterations, use link-based actualization
+        updated = self._actualize_planned_operation_with_links(
+            planned_operation, linked_iterations
+        )
+        return () if updated is None else (updated,)
+
     def _actualize_planned_operations(
         self, planned_operations: Iterable[PlannedOperation]
     ) -> tuple[PlannedOperation, ...]:
         actualized_planned_operations: list[PlannedOperation] = []
+        cache = self._planned_operations_cache
+        seen_ids: set[PlannedOperationId] = set()
 
         for planned_operation in sorted(
             planned_operations, key=lambda op: op.date_range.start_date
         ):
-            linked_iterations = self._get_linked_iterations(planned_operation)
-            # Check for late iterations (past iterations without links)
-            late_iterations = self._get_late_iterations(
-                planned_operation, linked_iterations
-            )
-            if late_iterations:
-                # Some iterations are late, postpone them to tomorrow
-                postponed = self._handle_late_iterations(
-                    planned_operation, late_iterations
+            if planned_operation.id is None:
+                actualized_planned_operations.extend(
+                    self._actualize_planned_operation(planned_operation)
                 )
-                actualized_planned_operations.extend(postponed)
-            else:
-                # No late iterations, use link-based actualization
-                updated = self._actualize_planned_operation_with_links(
-                    planned_operation, linked_iterations
+                continue
+
+            seen_ids.add(planned_operation.id)
+            cache_key = self._cache_key(
+                MatcherKey(LinkType.PLANNED_OPERATION, planned_operation.id),
+                planned_operation,
+            )
+            if (entry := cache.get(planned_operation.id)) is None or (
+                entry[0] != cache_key
+            ):
+                entry = (
+                    cache_key,
+                    self._actualize_planned_operation(planned_operation),
                 )
-                if updated is not None:
-                    actualized_planned_operations.append(updated)
+                cache[planned_operation.id] = entry
+            actualized_planned_operations.extend(entry[1])
 
+        # Drop results of targets no longer part of the forecast
+        for stale_id in cache.keys() - seen_ids:
+            del cache[stale_id]
         return tuple(actualized_planned_operations)
 
     def _compute_consumed_budget_amount(
@@ -298,12 +440,10 @@ class ForecastActualizer:  # pylint: disable=too-few-public-methods
             len(linked_op_ids),
         )
         updated_amount = budget.amount
-        operations_by_id = {op.unique_id: op for op in self._account.operations}
 
         for op_id in linked_op_ids:
-            if op_id not in operations_by_id:
+            if (operation := self._operations.get(op_id)) is None:
                 continue
-            operation = operations_by_id[op_id]
 
             # Skip if sign mismatch (positive budget expects positive operations)
             if operation.amount * updated_amount < 0.0:
@@ -339,49 +479,57 @@ class ForecastActualizer:  # pylint: disable=too-few-public-methods
             amount=Amount(updated_amount, budget.currency),
         )
 
+    def _actualize_budget(self, budget: Budget) -> tuple[Budget, ...]:
+        """Actualize a single budget into its current and next periods."""
+        balance_date = self._account.balance_date
+        if budget.date_range.is_expired(balance_date):
+            # the budget is obsolete, discard it
+            return ()
+
+        if (current_dr := budget.date_range.current_date_range(balance_date)) is None:
+            return (budget,) if budget.date_range.is_future(balance_date) else ()
+
+        updated_budgets: list[Budget] = []
+        # create a budget for the current period and update it
+        current_budget = budget.replace(date_range=current_dr)
+        iteration_date = current_dr.start_date
+
+        linked_op_ids = self._get_linked_operation_ids(current_budget, iteration_date)
+        new_budget = self._actualize_budget_with_links(current_budget, linked_op_ids)
+
+        if new_budget is not None:
+            updated_budgets.append(new_budget)
+
+        # update renewable budget to start after the current period
+        if (next_dr := budget.date_range.next_date_range(balance_date)) is not None:
+            # update renewable budget for the next period
+            updated_budgets.append(
+                budget.replace(
+                    date_range=budget.date_range.replace(start_date=next_dr.start_date)
+                )
+            )
+        return tuple(updated_budgets)
+
     def _actualize_budgets(self, budgets: Iterable[Budget]) -> tuple[Budget, ...]:
         updated_budgets: list[Budget] = []
+        cache = self._budgets_cache
+        seen_ids: set[BudgetId] = set()
 
         for budget in sorted(
             budgets, key=lambda b: (b.date_range.start_date, b.date_range.last_date)
         ):
-            balance_date = self._account.balance_date
-            if budget.date_range.is_expired(balance_date):
-                # the budget is obsolete, discard it
-                continue
-
-            if (
-                current_dr := budget.date_range.current_date_range(balance_date)
-            ) is not None:
-                # create a budget for the current period and update it
-                current_budget = budget.replace(date_range=current_dr)
-                iteration_date = current_dr.start_date
-
-                linked_op_ids = self._get_linked_operation_ids(
-                    current_budget, iteration_date
-                )
-                new_budget = self._actualize_budget_with_links(
-                    current_budget, linked_op_ids
-                )
-
-                if new_budget is not None:
-                    updated_budgets.append(new_budget)
-
-                # update renewable budget to start after the current period
-                if (
-                    next_dr := budget.date_range.next_date_range(balance_date)
-                ) is not None:
-                    # update renewable budget for the next period
-                    updated_budgets.append(
-                        budget.replace(
-                            date_range=budget.date_range.replace(
-                                start_date=next_dr.start_date
-                            )
-                        )
-                    )
+            if budget.id is None:
+                updated_budgets.extend(self._actualize_budget(budget))
                 continue
 
-            if budget.date_range.is_future(balance_date):
-                updated_budgets.append(budget)
+            seen_ids.add(budget.id)
+            cache_key = self._cache_key(MatcherKey(LinkType.BUDGET, budget.id), budget)
+            if (entry := cache.get(budget.id)) is None or entry[0] != cache_key:
+                entry = (cache_key, self._actualize_budget(budget))
+                cache[budget.id] = entry
+            updated_budgets.extend(entry[1])
 
+        # Drop results of targets no longer part of the forecast
+        for stale_id in cache.keys() - seen_ids:
+            del cache[stale_id]
         return tuple(updated_budgets)
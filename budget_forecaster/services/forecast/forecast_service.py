@@ -1,31 +1,56 @@
 """Service for forecast operations."""
 
+# pylint: disable=too-many-lines
+
 import enum
+import functools
 import logging
+import threading
+from collections import defaultdict
 from datetime import date, timedelta
-from typing import Any, NamedTuple, SupportsFloat, TypedDict, cast
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    NamedTuple,
+    Sequence,
+    SupportsFloat,
+    TypedDict,
+    cast,
+)
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from budget_forecaster.core.cancellation import CancellationToken, raise_if_cancelled
 from budget_forecaster.core.date_range import (
     DateRangeInterface,
     RecurringDateRange,
 )
 from budget_forecaster.core.types import (
+    BalanceResolution,
     BudgetColumn,
     BudgetId,
     Category,
     LinkType,
+    MatcherKey,
     OperationId,
     PlannedOperationId,
     TargetId,
 )
+from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.account.account_interface import AccountInterface
 from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.exceptions import (
+    AccountNotFoundError,
+    ComputationCancelledError,
+)
 from budget_forecaster.i18n import _
 from budget_forecaster.infrastructure.persistence.repository_interface import (
     RepositoryInterface,
@@ -34,6 +59,29 @@ from budget_forecaster.services.account.account_analysis_report import (
     AccountAnalysisReport,
 )
 from budget_forecaster.services.account.account_analyzer import AccountAnalyzer
+from budget_forecaster.services.account.balance_index import BalanceIndex
+from budget_forecaster.services.account.forecast_backtester import (
+    DEFAULT_HORIZONS,
+    BacktestReport,
+    ForecastBacktester,
+    monthly_origins,
+)
+from budget_forecaster.services.forecast.forecast_actualizer import ForecastActualizer
+from budget_forecaster.services.forecast.per_account_evaluator import (
+    PerAccountBalances,
+    PerAccountEvaluator,
+)
+from budget_forecaster.services.forecast.report_cache import (
+    ReportCache,
+    report_cache_key,
+)
+from budget_forecaster.services.forecast.scenario_evaluator import (
+    ScenarioComparison,
+    ScenarioEvaluator,
+)
+from budget_forecaster.services.operation.operations_categorizer import (
+    OperationsCategorizer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +172,92 @@ def _df_value(
     return 0.0
 
 
+def _build_monthly_summary(budget_forecast: pd.DataFrame) -> list[MonthlySummary]:
+    """Build the monthly summaries from a budget forecast DataFrame.
+
+    The frame is stacked to one row per (category, month) in a single pass, and
+    only rows with a non-zero planned, actual or forecast value are kept.
+    """
+    df = budget_forecast.drop(index="Total", errors="ignore")
+    if df.columns.empty:
+        return []
+
+    columns = [BudgetColumn.TOTAL_PLANNED, BudgetColumn.ACTUAL, BudgetColumn.FORECAST]
+    stacked = (
+        cast(pd.DataFrame, df.stack(level=0))
+        .reindex(columns=columns, fill_value=0)
+        .astype(float)
+    )
+    values = stacked.to_numpy()
+    non_zero = (values != 0).any(axis=1)
+    planned, actual, projected = values[non_zero].T
+    # Determine income vs expense from the first non-zero value.
+    # Priority matters: planned is user-defined (most reliable),
+    # actual may include partial refunds, projected is derived.
+    reference = np.where(
+        planned != 0, planned, np.where(actual != 0, actual, projected)
+    )
+
+    summaries = {
+        month: MonthlySummary(month=month, categories={})
+        for month in sorted({col[0] for col in df.columns})
+    }
+    for (category, month), *cell in zip(
+        stacked.index[non_zero],
+        planned.tolist(),
+        actual.tolist(),
+        projected.tolist(),
+        (reference > 0).tolist(),
+    ):
+        summaries[month]["categories"][str(category)] = CategoryBudget(
+            planned=cell[0], actual=cell[1], forecast=cell[2], is_income=cell[3]
+        )
+    return list(summaries.values())
+
+
+def _compute_margin(
+    df: pd.DataFrame, month: date, threshold: float
+) -> MarginInfo | None:
+    """Compute the available margin from a given month onward.
+
+    Args:
+        df: Daily balance evolution of the report.
+        month: First day of the selected month.
+        threshold: Minimum balance floor (in account currency).
+
+    Returns:
+        MarginInfo with margin details, or None if the report ends before.
+    """
+    month_str = month.strftime("%Y-%m-%d")
+
+    # Filter from month start onward
+    future_df = df.loc[df.index >= month_str]
+    if future_df.empty:
+        return None
+
+    balance_at_start = float(future_df["Balance"].iloc[0])
+
+    # For lowest balance, only consider today onward (past dips are irrelevant)
+    today_str = date.today().strftime("%Y-%m-%d")
+    from_str = max(month_str, today_str)
+    from_today_df = df.loc[df.index >= from_str]
+    if from_today_df.empty:
+        return None
+
+    balances = from_today_df["Balance"]
+    lowest_balance = float(balances.min())
+    lowest_idx = cast(pd.Timestamp, balances.idxmin())
+    lowest_date = lowest_idx.to_pydatetime().date()
+
+    return MarginInfo(
+        available_margin=lowest_balance - threshold,
+        balance_at_month_start=balance_at_start,
+        lowest_balance=lowest_balance,
+        lowest_balance_date=lowest_date,
+        threshold=threshold,
+    )
+
+
 def _ordinal(day: int) -> str:
     """Return the ordinal for a day number (translatable)."""
     if 11 <= day <= 13:
@@ -276,7 +410,134 @@ def _collect_budget_sources(
     return tuple(sources)
 
 
-class ForecastService:  # pylint: disable=too-many-public-methods
+_LinkEntry = tuple[date, OperationLink]
+
+
+class _CategoryDetailIndex:
+    """Drill-down index of the account operations and forecast sources.
+
+    On creation, operations are grouped by (category, attributed month), and
+    planned operations and budgets by category. The rows of a given category
+    and month are then only built on its first drill-down.
+    """
+
+    def __init__(
+        self,
+        report: AccountAnalysisReport | None,
+        forecast: Forecast,
+        operations: tuple[HistoricOperation, ...],
+        operation_links: tuple[OperationLink, ...],
+    ) -> None:
+        self._inputs = (report, forecast, operations, operation_links)
+        self._target_names = _build_target_name_index(forecast)
+
+        op_to_link = _build_link_index(operation_links)
+        self._operations_by_month: defaultdict[
+            tuple[Category, date], list[tuple[HistoricOperation, _LinkEntry | None]]
+        ] = defaultdict(list)
+        for op in operations:
+            link_entry = op_to_link.get(op.unique_id)
+            # Linked operations are attributed to the month of their iteration
+            month = (
+                link_entry[0]
+                if link_entry is not None
+                else op.operation_date.replace(day=1)
+            )
+            self._operations_by_month[(op.category, month)].append((op, link_entry))
+
+        self._planned_operations: defaultdict[
+            Category, list[PlannedOperation]
+        ] = defaultdict(list)
+        for planned_op in forecast.operations:
+            self._planned_operations[planned_op.category].append(planned_op)
+        self._budgets: defaultdict[Category, list[Budget]] = defaultdict(list)
+        for budget in forecast.budgets:
+            self._budgets[budget.category].append(budget)
+
+        self._planned_sources: dict[
+            tuple[Category, date], tuple[PlannedSourceDetail, ...]
+        ] = {}
+        self._attributed_operations: dict[
+            tuple[Category, date], tuple[AttributedOperationDetail, ...]
+        ] = {}
+
+    def is_built_from(
+        self,
+        report: AccountAnalysisReport | None,
+        forecast: Forecast,
+        operations: tuple[HistoricOperation, ...],
+        operation_links: tuple[OperationLink, ...],
+    ) -> bool:
+        """Check whether the index was built from the given inputs."""
+        built_report, built_forecast, built_operations, built_links = self._inputs
+        return (
+            built_report is report
+            and built_forecast is forecast
+            and built_operations is operations
+            and built_links == operation_links
+        )
+
+    def planned_sources(
+        self, category: Category, month_start: date, month_end: date
+    ) -> tuple[PlannedSourceDetail, ...]:
+        """Get the planned operation and budget sources of a category/month."""
+        key = (category, month_start)
+        if (sources := self._planned_sources.get(key)) is None:
+            op_sources = _collect_operation_sources(
+                tuple(self._planned_operations.get(category, ())),
+                category,
+                month_start,
+                month_end,
+            )
+            budget_sources = _collect_budget_sources(
+                tuple(self._budgets.get(category, ())),
+                category,
+                month_start,
+                month_end,
+            )
+            sources = tuple(
+                sorted(
+                    (*op_sources, *budget_sources),
+                    key=lambda s: (s["iteration_day"], s["description"]),
+                )
+            )
+            self._planned_sources[key] = sources
+        return sources
+
+    def attributed_operations(
+        self, category: Category, month_start: date, month_end: date
+    ) -> tuple[AttributedOperationDetail, ...]:
+        """Get the operations attributed to a category/month (link-aware)."""
+        key = (category, month_start)
+        if (operations := self._attributed_operations.get(key)) is None:
+            rows: list[AttributedOperationDetail] = []
+            for op, link_entry in self._operations_by_month.get(key, ()):
+                annotation = (
+                    _cross_month_annotation(op.operation_date, month_start, month_end)
+                    if link_entry is not None
+                    else ""
+                )
+                link_type, link_target_name = _resolve_link_info(
+                    link_entry, self._target_names
+                )
+                rows.append(
+                    AttributedOperationDetail(
+                        operation_id=op.unique_id,
+                        operation_date=op.operation_date,
+                        description=op.description,
+                        amount=op.amount,
+                        cross_month_annotation=annotation,
+                        link_type=link_type,
+                        link_target_name=link_target_name,
+                    )
+                )
+            rows.sort(key=lambda o: (o["operation_date"], o["description"]))
+            operations = tuple(rows)
+            self._attributed_operations[key] = operations
+        return operations
+
+
+class ForecastService:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """Service for generating and managing forecasts.
 
     This service handles forecast computation and CRUD operations for
@@ -288,17 +549,62 @@ class ForecastService:  # pylint: disable=too-many-public-methods
         self,
         account_provider: AccountInterface,
         repository: RepositoryInterface,
+        report_cache: ReportCache | None = None,
     ) -> None:
         """Initialize the forecast service.
 
         Args:
             account_provider: Provider for the account to forecast.
             repository: Repository for data persistence.
+            report_cache: Where computed reports are persisted, to be shown
+                on the next launch without computing them. Reports are not
+                persisted when omitted.
         """
         self._account_provider = account_provider
         self._repository = repository
-        self._forecast: Forecast | None = None
+        self._report_cache = report_cache
+        # Forecast with the definition versions of the targets it was loaded
+        # from, published together so that worker threads never see one
+        # without the other. Kept in memory until targets are changed through
+        # this service
+        self._loaded_forecast: tuple[Forecast, dict[MatcherKey, int]] | None = None
+        # Counts the target changes, so that a forecast loaded from outdated
+        # targets is never published
+        self._forecast_generation = 0
         self._report: AccountAnalysisReport | None = None
+        # Monthly summary of the report it was built from
+        self._monthly_summary: tuple[
+            AccountAnalysisReport, list[MonthlySummary]
+        ] | None = None
+        # Balance evolution summary of the report it was built from
+        self._balance_summary: tuple[
+            AccountAnalysisReport, list[tuple[date, float]]
+        ] | None = None
+        # Margins of the report they were computed from, by month, threshold
+        # and day of the computation
+        self._margins: tuple[
+            AccountAnalysisReport, dict[tuple[date, float, date], MarginInfo | None]
+        ] | None = None
+        # Drill-down index of the report, built on the first category detail
+        self._category_detail_index: _CategoryDetailIndex | None = None
+        # Kept across reports: only targets whose inputs changed are re-actualized
+        self._actualizer: ForecastActualizer | None = None
+        # Kept across reports: only operations affected by a change are recategorized
+        self._categorizer = OperationsCategorizer()
+        # Kept across reports, per account name: only changed operations are merged
+        self._balance_indexes: dict[str, BalanceIndex] = {}
+        self._aggregated_balance_index: BalanceIndex | None = None
+        # Computations may run in worker threads: the caches kept across
+        # reports are used by one computation at a time
+        self._compute_lock = threading.RLock()
+        # Guards the report, and counts its invalidations so that a report
+        # computed from outdated data is never published
+        self._report_lock = threading.Lock()
+        self._report_generation = 0
+        # Last computed report, with its cache key computed when it is saved
+        self._unsaved_report: tuple[
+            AccountAnalysisReport, Callable[[], str]
+        ] | None = None
 
     def load_forecast(self) -> Forecast:
         """Load forecast data from the database.
@@ -306,19 +612,57 @@ class ForecastService:  # pylint: disable=too-many-public-methods
         Returns:
             The loaded Forecast object.
         """
+        return self._load_forecast()[0]
+
+    def _load_forecast(self) -> tuple[Forecast, dict[MatcherKey, int]]:
+        """Load the forecast and the definition versions of its targets."""
         logger.info("Loading forecast from database")
 
+        generation = self._forecast_generation
+        versions = self._definition_versions()
         planned_operations = tuple(self._repository.get_all_planned_operations())
         budgets = tuple(self._repository.get_all_budgets())
 
-        self._forecast = Forecast(planned_operations, budgets)
+        loaded = (Forecast(planned_operations, budgets), versions)
+        with self._report_lock:
+            # A target changed meanwhile: the next access loads it again
+            if generation == self._forecast_generation:
+                self._loaded_forecast = loaded
         logger.info(
             "Loaded %d planned operations and %d budgets",
             len(planned_operations),
             len(budgets),
         )
 
-        return self._forecast
+        return loaded
+
+    def _get_loaded_forecast(self) -> tuple[Forecast, dict[MatcherKey, int]]:
+        """Get the forecast and its definition versions, loading them on first use."""
+        if (loaded := self._loaded_forecast) is None:
+            loaded = self._load_forecast()
+        return loaded
+
+    def get_forecast(self) -> Forecast:
+        """Get the cached forecast, loading it on first use.
+
+        The forecast is shared with the MatcherCache, so both only read targets
+        once per change. It is loaded again after targets are changed through
+        this service.
+
+        Returns:
+            The up-to-date Forecast object.
+        """
+        return self._get_loaded_forecast()[0]
+
+    def get_definition_versions(self) -> dict[MatcherKey, int]:
+        """Get the definition version counters of the targets of the forecast."""
+        return self._get_loaded_forecast()[1]
+
+    def _definition_versions(self) -> dict[MatcherKey, int]:
+        return {
+            key: version.definition
+            for key, version in self._repository.get_target_versions().items()
+        }
 
     def reload_forecast(self) -> Forecast:
         """Force reload forecast data from the database.
@@ -331,8 +675,37 @@ class ForecastService:  # pylint: disable=too-many-public-methods
 
     def _invalidate_cache(self) -> None:
         """Invalidate cached forecast and report data."""
-        self._forecast = None
-        self._report = None
+        with self._report_lock:
+            self._forecast_generation += 1
+            self._loaded_forecast = None
+        self.invalidate_report()
+
+    def invalidate_report(
+        self, operation_ids: Collection[OperationId] | None = None
+    ) -> None:
+        """Discard the last computed report after operations or links changed.
+
+        The forecast itself is kept, as its targets did not change. A report
+        being computed meanwhile is discarded when it completes.
+
+        Args:
+            operation_ids: IDs of the changed operations, so that the balance
+                indexes only compare these. None if they are not known, e.g.
+                after the accounts were reloaded.
+        """
+        for balance_index in (
+            self._aggregated_balance_index,
+            *self._balance_indexes.values(),
+        ):
+            if balance_index is None:
+                continue
+            if operation_ids is None:
+                balance_index.forget_changes()
+            else:
+                balance_index.report_changes(operation_ids)
+        with self._report_lock:
+            self._report_generation += 1
+            self._report = None
 
     # Budget CRUD methods
 
@@ -435,32 +808,346 @@ class ForecastService:  # pylint: disable=too-many-public-methods
         start_date: date | None = None,
         end_date: date | None = None,
         operation_links: tuple[OperationLink, ...] = (),
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        cancellation: CancellationToken | None = None,
     ) -> AccountAnalysisReport:
         """Compute the forecast report.
 
+        The report can be computed in a worker thread. It only becomes the
+        current report if it was neither cancelled nor invalidated while it
+        was computed.
+
         Args:
             start_date: Start date for the report (default: 4 months ago).
             end_date: End date for the report (default: 12 months from now).
             operation_links: Tuple of operation links to use for actualization.
+            resolution: Resolution of the balance evolution, weekly or monthly
+                for multi-year horizons.
+            cancellation: Token checked between the steps of the computation.
 
         Returns:
             The computed AccountAnalysisReport.
-        """
-        forecast = self._forecast or self.load_forecast()
 
+        Raises:
+            ComputationCancelledError: If the computation was cancelled, or
+                the report invalidated before it completed.
+        """
         if start_date is None:
             start_date = date.today() - relativedelta(months=4)
         if end_date is None:
             end_date = date.today() + relativedelta(months=12)
 
-        logger.info("Computing forecast report from %s to %s", start_date, end_date)
+        with self._compute_lock:
+            raise_if_cancelled(cancellation)
+            generation = self._report_generation
+            forecast, definition_versions = self._get_loaded_forecast()
+            logger.info("Computing forecast report from %s to %s", start_date, end_date)
+
+            account = self._account_provider.account
+            analyzer = AccountAnalyzer(
+                account,
+                forecast,
+                operation_links,
+                actualizer=self._get_actualizer(account, operation_links),
+                categorizer=self._categorizer,
+                balance_index=self._get_balance_index(),
+            )
+            report = analyzer.compute_report(
+                start_date, end_date, resolution, cancellation
+            )
 
-        analyzer = AccountAnalyzer(
-            self._account_provider.account, forecast, operation_links
+        with self._report_lock:
+            raise_if_cancelled(cancellation)
+            if generation != self._report_generation:
+                logger.info("Discarding a report computed from outdated data")
+                raise ComputationCancelledError()
+            self._report = report
+            if self._report_cache is not None:
+                self._unsaved_report = (
+                    report,
+                    functools.partial(
+                        report_cache_key,
+                        account,
+                        forecast,
+                        definition_versions,
+                        operation_links,
+                        resolution,
+                    ),
+                )
+        return report
+
+    def save_report_cache(self) -> None:
+        """Persist the last computed report, to be shown on the next launch.
+
+        Reports are only saved on demand, e.g. when the application exits,
+        so computations never wait for the cache to be written.
+        """
+        with self._report_lock:
+            unsaved, self._unsaved_report = self._unsaved_report, None
+        if unsaved is None or self._report_cache is None:
+            return
+        report, key = unsaved
+        self._report_cache.save(key(), report)
+
+    def load_cached_report(
+        self,
+        operation_links: tuple[OperationLink, ...] = (),
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+    ) -> AccountAnalysisReport | None:
+        """Load the persisted report if it was computed from the current data.
+
+        The report is used as if it had just been computed; a cache computed
+        from other data or resolution is ignored. The report may cover the
+        dates of an earlier day: is_report_window_current tells whether it
+        must be computed again for the requested dates.
+
+        Args:
+            operation_links: Tuple of operation links to use for actualization.
+            resolution: Resolution of the balance evolution.
+
+        Returns:
+            The cached report, or None if there is no valid one.
+        """
+        if self._report_cache is None:
+            return None
+
+        forecast, definition_versions = self._get_loaded_forecast()
+        key = report_cache_key(
+            self._account_provider.account,
+            forecast,
+            definition_versions,
+            operation_links,
+            resolution,
         )
-        self._report = analyzer.compute_report(start_date, end_date)
+        if (report := self._report_cache.load(key)) is not None:
+            with self._report_lock:
+                self._report = report
+                self._unsaved_report = None
+        return report
 
-        return self._report
+    def is_report_window_current(
+        self, start_date: date | None = None, end_date: date | None = None
+    ) -> bool:
+        """Check whether the current report covers the requested dates.
+
+        Args:
+            start_date: Start date for the report (default: 4 months ago).
+            end_date: End date for the report (default: 12 months from now).
+
+        Returns:
+            True if there is a report between these dates.
+        """
+        if start_date is None:
+            start_date = date.today() - relativedelta(months=4)
+        if end_date is None:
+            end_date = date.today() + relativedelta(months=12)
+        report = self._report
+        return (
+            report is not None
+            and report.start_date == start_date
+            and report.end_date == end_date
+        )
+
+    def _get_actualizer(
+        self, account: Account, operation_links: tuple[OperationLink, ...]
+    ) -> ForecastActualizer:
+        """Get the actualizer, synchronized with the account and links."""
+        if self._actualizer is None:
+            self._actualizer = ForecastActualizer(account, operation_links)
+        else:
+            self._actualizer.update_account(account)
+            self._actualizer.sync_links(operation_links)
+        return self._actualizer
+
+    def compare_scenarios(
+        self,
+        scenarios: Sequence[Scenario],
+        end_date: date | None = None,
+        operation_links: tuple[OperationLink, ...] = (),
+        max_workers: int | None = 1,
+        cancellation: CancellationToken | None = None,
+    ) -> ScenarioComparison:
+        """Compare what-if scenarios with the forecast stored in the database.
+
+        Scenarios are applied on top of the stored forecast, which is left
+        untouched. The comparison can be computed in a worker thread.
+
+        Args:
+            scenarios: The scenarios to evaluate.
+            end_date: Last date of the balance curves (default: 12 months
+                from now).
+            operation_links: Tuple of operation links to use for actualization.
+            max_workers: Number of worker processes, None for one per CPU.
+            cancellation: Token checked between the steps of the comparison.
+
+        Returns:
+            The balance curves and margins of the baseline and each scenario.
+
+        Raises:
+            ComputationCancelledError: If the comparison was cancelled.
+        """
+        if end_date is None:
+            end_date = date.today() + relativedelta(months=12)
+
+        with self._compute_lock:
+            raise_if_cancelled(cancellation)
+            account = self._account_provider.account
+            evaluator = ScenarioEvaluator(
+                account,
+                self.get_forecast(),
+                self._get_actualizer(account, operation_links),
+            )
+            return evaluator(
+                scenarios,
+                max(end_date, account.balance_date),
+                self.margin_threshold,
+                max_workers,
+                cancellation,
+            )
+
+    def compute_account_balances(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        operation_links: tuple[OperationLink, ...] = (),
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        max_workers: int | None = 1,
+    ) -> PerAccountBalances:
+        """Project the balance of each account from its share of the forecast.
+
+        Targets belong to the account they are assigned to, or to the first
+        account when they are not assigned.
+
+        Args:
+            start_date: First date of the balances (default: 4 months ago).
+            end_date: Last date of the balances (default: 12 months from now).
+            operation_links: Tuple of operation links to use for actualization.
+            resolution: Resolution of the balance evolutions.
+            max_workers: Number of worker processes, None for one per CPU.
+
+        Returns:
+            The balance evolutions of each account and of the aggregated account.
+        """
+        if start_date is None:
+            start_date = date.today() - relativedelta(months=4)
+        if end_date is None:
+            end_date = date.today() + relativedelta(months=12)
+
+        with self._compute_lock:
+            account = self._account_provider.account
+            accounts = self._account_provider.accounts
+            evaluator = PerAccountEvaluator(
+                account,
+                accounts,
+                self.get_forecast(),
+                self._repository.get_target_accounts(),
+                self._get_actualizer(account, operation_links),
+                {
+                    each.name: self._get_account_balance_index(
+                        each._replace(balance_date=account.balance_date)
+                    )
+                    for each in accounts
+                },
+            )
+            return evaluator(start_date, end_date, resolution, max_workers)
+
+    def get_target_accounts(self) -> dict[MatcherKey, str]:
+        """Get the account each assigned planned operation or budget belongs to.
+
+        Returns:
+            The account name of each target assigned to an account.
+        """
+        return self._repository.get_target_accounts()
+
+    def set_target_account(self, key: MatcherKey, account_name: str | None) -> None:
+        """Assign a planned operation or budget to one of the accounts.
+
+        Args:
+            key: The type and ID of the target.
+            account_name: Name of the account, or None for the first account.
+
+        Raises:
+            AccountNotFoundError: If no account has this name.
+        """
+        if account_name is not None and all(
+            account.name != account_name for account in self._account_provider.accounts
+        ):
+            raise AccountNotFoundError(account_name)
+        self._repository.set_target_account(key, account_name)
+
+    def compute_backtest(
+        self,
+        months: int = 36,
+        horizons: tuple[int, ...] = DEFAULT_HORIZONS,
+        max_workers: int | None = 1,
+    ) -> BacktestReport:
+        """Backtest the forecast from the first day of each past month.
+
+        Args:
+            months: Number of past months to forecast from.
+            horizons: Number of months to forecast ahead of each origin.
+            max_workers: Number of worker processes, None for one per CPU.
+
+        Returns:
+            The forecast and actual balances per origin and horizon.
+        """
+        with self._compute_lock:
+            account = self._account_provider.account
+            backtester = ForecastBacktester(
+                account, self.get_forecast(), self._get_balance_index()
+            )
+            return backtester(
+                monthly_origins(account.balance_date, months), horizons, max_workers
+            )
+
+    def get_balance_at(
+        self, target_date: date, account_name: str | None = None
+    ) -> float:
+        """Get the balance at the end of a date, before the balance date.
+
+        Args:
+            target_date: The date to get the balance at.
+            account_name: Name of one of the accounts, or None for the
+                aggregated account.
+
+        Returns:
+            The balance after the operations of target_date.
+
+        Raises:
+            AccountNotFoundError: If no account has this name.
+        """
+        with self._compute_lock:
+            if account_name is None:
+                return self._get_balance_index().balance_at(target_date)
+
+            account = next(
+                (
+                    account
+                    for account in self._account_provider.accounts
+                    if account.name == account_name
+                ),
+                None,
+            )
+            if account is None:
+                raise AccountNotFoundError(account_name)
+            return self._get_account_balance_index(account).balance_at(target_date)
+
+    def _get_account_balance_index(self, account: Account) -> BalanceIndex:
+        """Get the balance index of one of the accounts, synchronized with it."""
+        if (balance_index := self._balance_indexes.get(account.name)) is None:
+            balance_index = self._balance_indexes[account.name] = BalanceIndex(account)
+        else:
+            balance_index.update(account)
+        return balance_index
+
+    def _get_balance_index(self) -> BalanceIndex:
+        """Get the balance index of the aggregated account, synchronized with it."""
+        account = self._account_provider.account
+        if self._aggregated_balance_index is None:
+            self._aggregated_balance_index = BalanceIndex(account)
+        else:
+            self._aggregated_balance_index.update(account)
+        return self._aggregated_balance_index
 
     @property
     def report(self) -> AccountAnalysisReport | None:
@@ -490,104 +1177,80 @@ class ForecastService:  # pylint: disable=too-many-public-methods
     def get_balance_evolution_summary(self) -> list[tuple[date, float]]:
         """Get a summary of balance evolution for display.
 
+        The summary is built once per report.
+
         Returns:
             List of (date, balance) tuples sampled for display.
         """
-        if self._report is None:
+        if (report := self._report) is None:
             return []
 
-        df = self._report.balance_evolution_per_day
+        if self._balance_summary is not None and self._balance_summary[0] is report:
+            return self._balance_summary[1]
+
+        df = report.balance_evolution_per_day
         # Sample to reduce data points for display (weekly)
         sampled = df.resample("W").last()
 
-        return [
+        summary = [
             (d.to_pydatetime().date(), float(row["Balance"]))  # type: ignore[attr-defined]
             for d, row in sampled.iterrows()
         ]
+        self._balance_summary = (report, summary)
+        return summary
 
     def get_available_margin(self, month: date, threshold: float) -> MarginInfo | None:
         """Compute available margin from a given month onward.
 
         The margin is the lowest projected balance from the month's start
-        onward, minus the user-defined threshold.
+        onward, minus the user-defined threshold. Margins are computed once
+        per report and day, so they can be prepared before they are shown.
+
+        The margin needs the balance of each day: weekly and monthly reports,
+        which are only computed for exports and multi-year projections
+        through the API, have no margin.
 
         Args:
             month: First day of the selected month.
             threshold: Minimum balance floor (in account currency).
 
         Returns:
-            MarginInfo with margin details, or None if no report is available.
+            MarginInfo with margin details, or None if no daily report is
+            available.
         """
-        if self._report is None:
+        if (report := self._report) is None:
             return None
-
-        df = self._report.balance_evolution_per_day
-        month_str = month.strftime("%Y-%m-%d")
-
-        # Filter from month start onward
-        future_df = df.loc[df.index >= month_str]
-        if future_df.empty:
+        if report.resolution != BalanceResolution.DAILY:
             return None
 
-        balance_at_start = float(future_df["Balance"].iloc[0])
-
-        # For lowest balance, only consider today onward (past dips are irrelevant)
-        today_str = date.today().strftime("%Y-%m-%d")
-        from_str = max(month_str, today_str)
-        from_today_df = df.loc[df.index >= from_str]
-        if from_today_df.empty:
-            return None
-
-        balances = from_today_df["Balance"]
-        lowest_balance = float(balances.min())
-        lowest_idx = cast(pd.Timestamp, balances.idxmin())
-        lowest_date = lowest_idx.to_pydatetime().date()
-
-        return MarginInfo(
-            available_margin=lowest_balance - threshold,
-            balance_at_month_start=balance_at_start,
-            lowest_balance=lowest_balance,
-            lowest_balance_date=lowest_date,
-            threshold=threshold,
-        )
+        if self._margins is None or self._margins[0] is not report:
+            self._margins = (report, {})
+        margins = self._margins[1]
+        if (key := (month, threshold, date.today())) not in margins:
+            margins[key] = _compute_margin(
+                report.balance_evolution_per_day, month, threshold
+            )
+        return margins[key]
 
     def get_monthly_summary(self) -> list[MonthlySummary]:
         """Get monthly budget summary with link-aware attribution.
 
+        The summary is built once per report.
+
         Returns:
             List of monthly summaries with category breakdowns.
         """
         if self._report is None:
             return []
 
-        df = self._report.budget_forecast
-        summaries: list[MonthlySummary] = []
-
-        months = sorted({col[0] for col in df.columns})
-
-        for month in months:
-            categories: dict[str, CategoryBudget] = {}
-            for category in df.index:
-                if category == "Total":
-                    continue
-
-                planned = _df_value(df, month, category, BudgetColumn.TOTAL_PLANNED)
-                actual = _df_value(df, month, category, BudgetColumn.ACTUAL)
-                projected = _df_value(df, month, category, BudgetColumn.FORECAST)
-
-                if any((planned != 0, actual != 0, projected != 0)):
-                    # Determine income vs expense from the first non-zero value.
-                    # Priority matters: planned is user-defined (most reliable),
-                    # actual may include partial refunds, projected is derived.
-                    ref = planned or actual or projected
-                    categories[str(category)] = CategoryBudget(
-                        planned=planned,
-                        actual=actual,
-                        forecast=projected,
-                        is_income=ref > 0,
-                    )
-            summaries.append(MonthlySummary(month=month, categories=categories))
+        if (
+            self._monthly_summary is not None
+            and self._monthly_summary[0] is self._report
+        ):
+            return self._monthly_summary[1]
 
+        summaries = _build_monthly_summary(self._report.budget_forecast)
+        self._monthly_summary = (self._report, summaries)
         return summaries
 
     def get_category_statistics(self) -> list[tuple[str, float, float]]:
@@ -624,17 +1287,14 @@ class ForecastService:  # pylint: disable=too-many-public-methods
         Returns:
             Full category detail for the modal drill-down.
         """
-        forecast = self._forecast or self.load_forecast()
+        forecast = self.get_forecast()
         month_start = month.replace(day=1)
         month_end = month_start + relativedelta(months=1) - timedelta(days=1)
 
         cat = Category(category)
-        planned_sources = self._collect_planned_sources(
-            forecast, cat, month_start, month_end
-        )
-        operations = self._collect_attributed_operations(
-            forecast, cat, month_start, month_end, operation_links
-        )
+        index = self._get_category_detail_index(forecast, operation_links)
+        planned_sources = index.planned_sources(cat, month_start, month_end)
+        operations = index.attributed_operations(cat, month_start, month_end)
 
         total_planned = sum(s["amount"] for s in planned_sources)
         total_actual = sum(op["amount"] for op in operations)
@@ -664,71 +1324,17 @@ class ForecastService:  # pylint: disable=too-many-public-methods
             is_income=ref > 0,
         )
 
-    def _collect_planned_sources(
-        self,
-        forecast: Forecast,
-        category: Category,
-        month_start: date,
-        month_end: date,
-    ) -> tuple[PlannedSourceDetail, ...]:
-        """Collect planned operation and budget sources for a category/month."""
-        op_sources = _collect_operation_sources(
-            forecast.operations, category, month_start, month_end
-        )
-        budget_sources = _collect_budget_sources(
-            forecast.budgets, category, month_start, month_end
-        )
-        sources = sorted(
-            (*op_sources, *budget_sources),
-            key=lambda s: (s["iteration_day"], s["description"]),
-        )
-        return tuple(sources)
-
-    def _collect_attributed_operations(
-        self,
-        forecast: Forecast,
-        category: Category,
-        month_start: date,
-        month_end: date,
-        operation_links: tuple[OperationLink, ...],
-    ) -> tuple[AttributedOperationDetail, ...]:
-        """Collect operations attributed to a category/month (link-aware)."""
-        op_to_link = _build_link_index(operation_links)
-        target_names = _build_target_name_index(forecast)
-
-        operations: list[AttributedOperationDetail] = []
-        for op in self._account_provider.account.operations:
-            if op.category != category:
-                continue
-
-            link_entry = op_to_link.get(op.unique_id)
-            linked_month = link_entry[0] if link_entry is not None else None
-
-            if linked_month is not None and linked_month != month_start:
-                continue
-            if linked_month is None and not (
-                month_start <= op.operation_date <= month_end
-            ):
-                continue
-
-            annotation = (
-                _cross_month_annotation(op.operation_date, month_start, month_end)
-                if linked_month is not None
-                else ""
+    def _get_category_detail_index(
+        self, forecast: Forecast, operation_links: tuple[OperationLink, ...]
+    ) -> _CategoryDetailIndex:
+        """Get the drill-down index, rebuilding it if one of its inputs changed."""
+        operations = self._account_provider.account.operations
+        if self._category_detail_index is None or (
+            not self._category_detail_index.is_built_from(
+                self._report, forecast, operations, operation_links
             )
-            link_type, link_target_name = _resolve_link_info(link_entry, target_names)
-
-            operations.append(
-                AttributedOperationDetail(
-                    operation_id=op.unique_id,
-                    operation_date=op.operation_date,
-                    description=op.description,
-                    amount=op.amount,
-                    cross_month_annotation=annotation,
-                    link_type=link_type,
-                    link_target_name=link_target_name,
-                )
+        ):
+            self._category_detail_index = _CategoryDetailIndex(
+                self._report, forecast, operations, operation_links
             )
-
-        operations.sort(key=lambda o: (o["operation_date"], o["description"]))
-        return tuple(operations)
+        return self._category_detail_index
@@ -0,0 +1,199 @@
+"""Module to project the balance of each account of an aggregated account."""
+import logging
+from datetime import date
+from typing import Mapping, NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+from budget_forecaster.core.parallel import map_in_processes
+from budget_forecaster.core.types import BalanceResolution, LinkType, MatcherKey
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.services.account.balance_index import BalanceIndex
+from budget_forecaster.services.account.balance_projection import (
+    build_balance_projection,
+    project_daily_balances,
+    reduce_to_buckets,
+)
+from budget_forecaster.services.forecast.forecast_actualizer import ForecastActualizer
+
+logger = logging.getLogger(__name__)
+
+
+def split_forecast(
+    forecast: Forecast,
+    account_names: Sequence[str],
+    target_accounts: Mapping[MatcherKey, str],
+) -> dict[str, Forecast]:
+    """Split a forecast between accounts.
+
+    Each target goes to the account it is assigned to. Targets that are not
+    assigned, or assigned to an unknown account, go to the first account.
+    Actualized targets keep the ID of their stored target, so an actualized
+    forecast is split like the stored one.
+
+    Args:
+        forecast: The forecast to split, stored or actualized.
+        account_names: Names of the accounts, the default one first.
+        target_accounts: The account name of each assigned target.
+
+    Returns:
+        The forecast of each account, in the order of account_names.
+    """
+    operations: dict[str, list[PlannedOperation]] = {name: [] for name in account_names}
+    budgets: dict[str, list[Budget]] = {name: [] for name in account_names}
+
+    def account_of(link_type: LinkType, target_id: int | None) -> str:
+        if target_id is None:
+            return account_names[0]
+        name = target_accounts.get(MatcherKey(link_type, target_id))
+        return name if name in operations else account_names[0]
+
+    for operation in forecast.operations:
+        operations[account_of(LinkType.PLANNED_OPERATION, operation.id)].append(
+            operation
+        )
+    for budget in forecast.budgets:
+        budgets[account_of(LinkType.BUDGET, budget.id)].append(budget)
+    return {
+        name: Forecast(tuple(operations[name]), tuple(budgets[name]))
+        for name in account_names
+    }
+
+
+class PerAccountBalances(NamedTuple):
+    """Balance evolutions of each account and of their aggregate, side by side.
+
+    Both frames have one column per account followed by the aggregated
+    account, and one row per bucket of the resolution, indexed by its last
+    day. Balances are taken on that day; lowest balances are the lowest over
+    the days of the bucket, so both are the same at the daily resolution.
+    """
+
+    balances: pd.DataFrame
+    lowest_balances: pd.DataFrame
+
+
+class PerAccountEvaluator:  # pylint: disable=too-few-public-methods
+    """Project the balance of each account from its share of the forecast.
+
+    The forecast is actualized once for the aggregated account and split
+    between the accounts; each share is flattened into arrays, and the daily
+    balances of the accounts are then projected independently, optionally in
+    a process pool. The aggregated balances are the sum of the daily balances
+    of the accounts.
+
+    All accounts are projected from the balance date of the aggregated
+    account, whose balance is the sum of their balances, so the aggregated
+    balances are those of AccountAnalyzer on the aggregated account.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        aggregated_account: Account,
+        accounts: Sequence[Account],
+        forecast: Forecast,
+        target_accounts: Mapping[MatcherKey, str],
+        actualizer: ForecastActualizer | None = None,
+        balance_indexes: Mapping[str, BalanceIndex] | None = None,
+    ) -> None:
+        """Initialize the evaluator.
+
+        Args:
+            aggregated_account: The aggregation of the accounts.
+            accounts: The accounts to project, the default one first.
+            forecast: The forecast, as loaded from the database.
+            target_accounts: The account name of each assigned target; the
+                other targets belong to the first account.
+            actualizer: An actualizer already synchronized with the
+                aggregated account and its links. One without links is built
+                when omitted.
+            balance_indexes: Balance indexes per account name, already
+                synchronized with the accounts moved to the balance date of
+                the aggregated account. Missing ones are built.
+
+        Raises:
+            ValueError: If there is no account.
+        """
+        if not accounts:
+            raise ValueError("At least one account is needed")
+        balance_date = aggregated_account.balance_date
+        self._aggregated_account = aggregated_account
+        self._accounts = tuple(
+            account._replace(balance_date=balance_date) for account in accounts
+        )
+        self._forecast = forecast
+        self._target_accounts = target_accounts
+        self._actualizer = actualizer or ForecastActualizer(aggregated_account)
+        self._balance_indexes = dict(balance_indexes or {})
+
+    def _get_balance_index(self, account: Account) -> BalanceIndex:
+        if (balance_index := self._balance_indexes.get(account.name)) is None:
+            balance_index = self._balance_indexes[account.name] = BalanceIndex(account)
+        return balance_index
+
+    def __call__(
+        self,
+        start_date: date,
+        end_date: date,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        max_workers: int | None = 1,
+    ) -> PerAccountBalances:
+        """Project the balances of the accounts between two dates.
+
+        Args:
+            start_date: First date of the balance evolutions.
+            end_date: Last date of the balance evolutions.
+            resolution: The resolution of the rows.
+            max_workers: Number of worker processes, None for one per CPU.
+                Accounts are projected in the current process with 1, the
+                default, as spawning workers costs more than projecting a
+                few accounts.
+
+        Returns:
+            The balance evolutions of the accounts and of their aggregate.
+
+        Raises:
+            ValueError: If start_date is after end_date.
+        """
+        # Targets are actualized in the current process, as they cannot be
+        # pickled; only the flattened arrays are sent to the workers. The
+        # whole forecast goes through the shared actualizer, so its memoized
+        # results stay those of the report.
+        forecasts = split_forecast(
+            self._actualizer(self._forecast),
+            [account.name for account in self._accounts],
+            self._target_accounts,
+        )
+        projections = [
+            build_balance_projection(
+                account,
+                forecasts[account.name],
+                start_date,
+                end_date,
+                self._get_balance_index(account),
+            )
+            for account in self._accounts
+        ]
+        daily_balances = np.column_stack(
+            map_in_processes(project_daily_balances, projections, max_workers)
+        )
+        daily_balances = np.column_stack((daily_balances, daily_balances.sum(axis=1)))
+        logger.debug(
+            "Projected %d accounts over %d days",
+            len(self._accounts),
+            len(daily_balances),
+        )
+
+        buckets = reduce_to_buckets(daily_balances, start_date, resolution)
+        columns = [
+            *(account.name for account in self._accounts),
+            self._aggregated_account.name,
+        ]
+        return PerAccountBalances(
+            pd.DataFrame(buckets.balances, index=buckets.dates, columns=columns),
+            pd.DataFrame(buckets.lowest_balances, index=buckets.dates, columns=columns),
+        )
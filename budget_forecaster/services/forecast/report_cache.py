@@ -0,0 +1,142 @@
+"""Module to persist computed forecast reports next to the database."""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Mapping
+
+from budget_forecaster.core.types import BalanceResolution, MatcherKey
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.operation_link import OperationLink
+from budget_forecaster.services.account.account_analysis_report import (
+    AccountAnalysisReport,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the report layout or key changes, so older cache files are ignored
+_CACHE_FORMAT = 3
+
+
+def report_cache_key(
+    account: Account,
+    forecast: Forecast,
+    definition_versions: Mapping[MatcherKey, int],
+    operation_links: tuple[OperationLink, ...],
+    resolution: BalanceResolution,
+) -> str:
+    """Hash the data a forecast report is computed from.
+
+    The dates of the report are left out, as they follow the current day:
+    a report of an earlier day with the same data is still worth showing
+    until it is computed again.
+
+    Args:
+        account: The account of the report, with its balance date.
+        forecast: The forecast, as loaded from the database.
+        definition_versions: The definition version counters of the targets.
+        operation_links: The operation links used for actualization.
+        resolution: Resolution of the balance evolution.
+
+    Returns:
+        The hexadecimal SHA-256 digest of the inputs.
+    """
+    digest = hashlib.sha256()
+
+    def add(value: object) -> None:
+        digest.update(repr(value).encode())
+        digest.update(b"\n")
+
+    add((_CACHE_FORMAT, resolution))
+    add((account.name, account.balance, account.currency, account.balance_date))
+    for historic_operation in account.operations:
+        add(historic_operation)
+    # Target representations do not include their ID
+    for operation in forecast.operations:
+        add(("planned_operation", operation.id, operation))
+    for budget in forecast.budgets:
+        add(("budget", budget.id, budget))
+    for key, version in sorted(definition_versions.items()):
+        add((key, version))
+    for link in operation_links:
+        add(link)
+    return digest.hexdigest()
+
+
+class ReportCache:
+    """A file holding the last computed forecast report and its key.
+
+    The key is written before the report, so a stale cache is detected
+    without reading the report. The file is written by the application
+    itself and is trusted like the database next to it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Path of the cache file.
+        """
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        """Path of the cache file."""
+        return self._path
+
+    def load(self, key: str) -> AccountAnalysisReport | None:
+        """Load the cached report if it was computed from the same inputs.
+
+        Args:
+            key: The key of the inputs, from report_cache_key.
+
+        Returns:
+            The cached report, or None if the cache is missing, stale or
+            unreadable.
+        """
+        try:
+            with self._path.open("rb") as file:
+                if pickle.load(file) != key:
+                    logger.debug("Report cache %s is stale", self._path)
+                    return None
+                report = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Ignoring unreadable report cache %s", self._path)
+            return None
+
+        if not isinstance(report, AccountAnalysisReport):
+            logger.warning("Ignoring unexpected report cache %s", self._path)
+            return None
+        logger.info("Loaded report cache %s", self._path)
+        return report
+
+    def save(self, key: str, report: AccountAnalysisReport) -> None:
+        """Save a report, replacing the cached one.
+
+        The report is written to a temporary file first, so an interrupted
+        write never leaves a truncated cache. Failures are logged, as the
+        report can always be computed again.
+
+        Args:
+            key: The key of the inputs, from report_cache_key.
+            report: The report computed from these inputs.
+        """
+        temp_path: Path | None = None
+        try:
+            handle, name = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.name}."
+            )
+            temp_path = Path(name)
+            with os.fdopen(handle, "wb") as file:
+                pickle.dump(key, file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(report, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path)
+        except OSError:
+            logger.warning("Could not write report cache %s", self._path, exc_info=True)
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
@@ -0,0 +1,157 @@
+"""Module to compare what-if scenarios of a forecast."""
+import functools
+import logging
+from datetime import date
+from typing import NamedTuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from budget_forecaster.core.cancellation import CancellationToken, raise_if_cancelled
+from budget_forecaster.core.parallel import map_in_processes
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario
+from budget_forecaster.services.account.forecast_iterations import (
+    ForecastIterations,
+    flatten_forecast,
+    project_daily_amounts,
+)
+from budget_forecaster.services.forecast.forecast_actualizer import ForecastActualizer
+
+logger = logging.getLogger(__name__)
+
+BASELINE_SCENARIO = "Baseline"
+
+
+class ScenarioComparison(NamedTuple):
+    """Balance curves and margins of scenarios, side by side.
+
+    Both frames have one column per scenario, the baseline first. Balances
+    are indexed by day, from the balance date to the end date. Margins are
+    indexed by month start: the lowest balance from the start of the month
+    (or the balance date) onward, minus the margin threshold.
+    """
+
+    balances: pd.DataFrame
+    margins: pd.DataFrame
+
+    @property
+    def month_end_balances(self) -> pd.DataFrame:
+        """Balance at the end of each month, per scenario."""
+        return self.balances.resample("MS").last().rename_axis("Month")
+
+
+class _ScenarioInputs(NamedTuple):
+    """Read-only inputs shared by all the scenarios."""
+
+    balance: float
+    balance_day: int
+    end_day: int
+
+
+def _project_balances(
+    inputs: _ScenarioInputs, iterations: ForecastIterations
+) -> npt.NDArray[np.float64]:
+    """Project the balance of each day from the balance date to the end date."""
+    balance, balance_day, end_day = inputs
+    return balance + np.cumsum(project_daily_amounts(iterations, balance_day, end_day))
+
+
+def _margins(balances: pd.DataFrame, threshold: float) -> pd.DataFrame:
+    """Compute the margin of each month, from the lowest balance onward."""
+    lowest_onward = balances.iloc[::-1].cummin().iloc[::-1]
+    return lowest_onward.resample("MS").first().rename_axis("Month") - threshold
+
+
+class ScenarioEvaluator:  # pylint: disable=too-few-public-methods
+    """Project the balance of an account under several scenarios of a forecast.
+
+    Each scenario is applied to the forecast, actualized and flattened into
+    arrays of iterations once; the balance curves are then projected from
+    these arrays independently. A process pool is opt-in: each worker gets
+    the arrays of its scenarios, and projecting a curve takes far less time
+    than spawning a worker, so the application compares scenarios in process.
+    """
+
+    def __init__(
+        self,
+        account: Account,
+        forecast: Forecast,
+        actualizer: ForecastActualizer | None = None,
+    ) -> None:
+        """Initialize the evaluator.
+
+        Args:
+            account: The account to project.
+            forecast: The forecast the scenarios apply to, as loaded from the
+                database.
+            actualizer: An actualizer already synchronized with the account
+                and its links. One without links is built when omitted.
+        """
+        self._account = account
+        self._forecast = forecast
+        self._actualizer = actualizer or ForecastActualizer(account)
+
+    def __call__(
+        self,
+        scenarios: Sequence[Scenario],
+        end_date: date,
+        threshold: float = 0.0,
+        max_workers: int | None = 1,
+        cancellation: CancellationToken | None = None,
+    ) -> ScenarioComparison:
+        """Compare the scenarios with the baseline forecast.
+
+        Args:
+            scenarios: The scenarios to evaluate.
+            end_date: Last date of the balance curves.
+            threshold: Minimum balance floor the margins are computed against.
+            max_workers: Number of worker processes, None for one per CPU.
+                Scenarios are computed in the current process with 1.
+            cancellation: Token checked before each scenario is actualized.
+
+        Returns:
+            The balance curves and margins of the baseline and each scenario.
+
+        Raises:
+            ValueError: If end_date is before the balance date, or if the
+                scenario names are not unique.
+            ComputationCancelledError: If the comparison was cancelled.
+        """
+        balance_date = self._account.balance_date
+        if end_date < balance_date:
+            raise ValueError(
+                f"end_date must be >= balance_date, got {end_date} < {balance_date}"
+            )
+        names = [BASELINE_SCENARIO, *(scenario.name for scenario in scenarios)]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Scenario names must be unique, got {names[1:]}")
+
+        # The baseline is actualized last, so the results memoized by a shared
+        # actualizer are those of the stored targets again
+        forecasts = [scenario.apply(self._forecast) for scenario in scenarios]
+        forecasts.append(self._forecast)
+        iterations = []
+        for forecast in forecasts:
+            raise_if_cancelled(cancellation)
+            iterations.append(
+                flatten_forecast(self._actualizer(forecast), balance_date, end_date)
+            )
+        iterations.insert(0, iterations.pop())
+
+        inputs = _ScenarioInputs(
+            self._account.balance, balance_date.toordinal(), end_date.toordinal()
+        )
+        curves = map_in_processes(
+            functools.partial(_project_balances, inputs), iterations, max_workers
+        )
+        logger.info("Evaluated %d scenarios until %s", len(scenarios), end_date)
+
+        balances = pd.DataFrame(
+            np.column_stack(curves),
+            index=pd.date_range(balance_date, end_date, freq="D", name="Date"),
+            columns=pd.Index(names, name="Scenario"),
+        )
+        return ScenarioComparison(balances, _margins(balances, threshold))
@@ -8,9 +8,13 @@ import logging
 import shutil
 from datetime import date
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
-from budget_forecaster.core.types import ImportProgressCallback, ImportStats
+from budget_forecaster.core.types import (
+    ImportProgressCallback,
+    ImportStats,
+    OperationId,
+)
 from budget_forecaster.domain.account.account import AccountParameters
 from budget_forecaster.exceptions import UnsupportedExportError
 from budget_forecaster.infrastructure.bank_adapters.bank_adapter_factory import (
@@ -34,6 +38,8 @@ class ImportResult(NamedTuple):
     stats: ImportStats | None
     """Import statistics (None if import failed)."""
     error_message: str | None = None
+    new_operation_ids: tuple[OperationId, ...] = ()
+    """Unique ids of the operations inserted by this import."""
 
 
 class ImportSummary(NamedTuple):
@@ -45,6 +51,8 @@ class ImportSummary(NamedTuple):
     total_new_operations: int
     total_duplicates_skipped: int
     results: tuple[ImportResult, ...]
+    new_operation_ids: tuple[OperationId, ...] = ()
+    """Unique ids of the operations inserted by all imports."""
 
 
 class ImportService:
@@ -58,7 +66,7 @@ class ImportService:
     def __init__(
         self,
         persistent_account: PersistentAccount,
-        inbox_path: Path,
+        inbox_path: Path | Callable[[], Path],
         exclude_patterns: list[str] | None = None,
         include_patterns: list[str] | None = None,
     ) -> None:
@@ -66,13 +74,14 @@ class ImportService:
 
         Args:
             persistent_account: The persistent account to import to.
-            inbox_path: Path to the inbox folder.
+            inbox_path: Path to the inbox folder, or a function returning it,
+                called when the inbox is first used.
             exclude_patterns: List of glob patterns to exclude from inbox.
             include_patterns: List of glob patterns to include in inbox.
                 If specified, only files matching at least one pattern are included.
         """
         self._persistent_account = persistent_account
-        self._inbox_path = inbox_path
+        self._inbox_path: Path | Callable[[], Path] = inbox_path
         self._exclude_patterns = exclude_patterns or []
         self._include_patterns = include_patterns or []
         self._bank_adapter_factory = BankAdapterFactory()
@@ -130,11 +139,11 @@ class ImportService:
         Returns:
             List of paths to supported export files/folders.
         """
-        if not self._inbox_path.exists():
+        if not self.inbox_path.exists():
             return []
 
         exports: list[Path] = []
-        for item in sorted(self._inbox_path.iterdir()):
+        for item in sorted(self.inbox_path.iterdir()):
             if item.name == "processed":
                 continue
             if not self.should_include(item):
@@ -174,6 +183,10 @@ class ImportService:
             ImportResult with the outcome and import statistics.
         """
         operation_factory = self._create_operation_factory()
+        known_ids = {
+            operation.unique_id
+            for operation in self._persistent_account.account.operations
+        }
 
         try:
             bank_adapter = self._bank_adapter_factory.create_bank_adapter(path)
@@ -200,6 +213,11 @@ class ImportService:
                 path=path,
                 success=True,
                 stats=stats,
+                new_operation_ids=tuple(
+                    operation.unique_id
+                    for operation in self._persistent_account.account.operations
+                    if operation.unique_id not in known_ids
+                ),
             )
 
         except Exception as e:  # pylint: disable=broad-except
@@ -213,7 +231,7 @@ class ImportService:
 
     def _move_to_processed(self, path: Path) -> None:
         """Move a file/folder to the processed directory."""
-        processed_path = self._inbox_path / "processed"
+        processed_path = self.inbox_path / "processed"
         processed_path.mkdir(exist_ok=True)
         dest = processed_path / path.name
         shutil.move(str(path), str(dest))
@@ -232,8 +250,8 @@ class ImportService:
             ImportSummary with the results of all imports.
         """
         # Ensure inbox exists
-        if not self._inbox_path.exists():
-            self._inbox_path.mkdir(parents=True)
+        if not self.inbox_path.exists():
+            self.inbox_path.mkdir(parents=True)
 
         if not (exports := self.get_supported_exports_in_inbox()):
             return ImportSummary(
@@ -269,11 +287,18 @@ class ImportService:
             total_new_operations=total_new_operations,
             total_duplicates_skipped=total_duplicates_skipped,
             results=tuple(results),
+            new_operation_ids=tuple(
+                operation_id
+                for result in results
+                for operation_id in result.new_operation_ids
+            ),
         )
 
     @property
     def inbox_path(self) -> Path:
         """Get the inbox path."""
+        if callable(self._inbox_path):
+            self._inbox_path = self._inbox_path()
         return self._inbox_path
 
     @property
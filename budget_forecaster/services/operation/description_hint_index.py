@@ -0,0 +1,124 @@
+"""Multi-pattern index of description hints across matchers.
+
+All description hints of all targets are compiled into a single Aho-Corasick
+automaton, so one pass over an operation description finds every target whose
+hints are all present, instead of testing each target's hints in turn.
+"""
+from collections import deque
+from typing import Generic, Hashable, Iterable, Mapping, TypeVar
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+
+
+class DescriptionHintIndex(
+    Generic[_KeyT]
+):  # pylint: disable=too-many-instance-attributes
+    """Find the keys whose description hints are all contained in a description.
+
+    Matching follows OperationMatcher.match_description: a hint matches when it
+    is a substring of the description (case-sensitive).
+    """
+
+    def __init__(self, hints_by_key: Mapping[_KeyT, Iterable[str]]) -> None:
+        """Compile the automaton.
+
+        Args:
+            hints_by_key: Description hints of each key (e.g. each MatcherKey).
+        """
+        # Trie of all distinct hints: transitions, failure links and the
+        # hints ending at each state (including those reached via failure links)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[list[int]] = [[]]
+
+        hint_ids: dict[str, int] = {}
+        # Keys waiting for each hint, and number of distinct hints per key
+        self._keys_by_hint: list[list[_KeyT]] = []
+        self._required_hints: dict[_KeyT, int] = {}
+        self._keys = frozenset(hints_by_key)
+        keys_without_hints: set[_KeyT] = set()
+        always_matching: set[_KeyT] = set()
+
+        for key, hints in hints_by_key.items():
+            if not (distinct_hints := set(hints)):
+                keys_without_hints.add(key)
+                continue
+            # An empty hint is contained in every description
+            if not (distinct_hints := distinct_hints - {""}):
+                always_matching.add(key)
+                continue
+            self._required_hints[key] = len(distinct_hints)
+            for hint in distinct_hints:
+                if (hint_id := hint_ids.get(hint)) is None:
+                    hint_id = hint_ids[hint] = len(self._keys_by_hint)
+                    self._keys_by_hint.append([])
+                    self._add_to_trie(hint, hint_id)
+                self._keys_by_hint[hint_id].append(key)
+
+        self._keys_without_hints = frozenset(keys_without_hints)
+        self._always_matching = frozenset(always_matching)
+        self._build_failure_links()
+
+    def _add_to_trie(self, hint: str, hint_id: int) -> None:
+        state = 0
+        for char in hint:
+            if (next_state := self._goto[state].get(char)) is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append(hint_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    @property
+    def keys(self) -> frozenset[_KeyT]:
+        """All indexed keys."""
+        return self._keys
+
+    @property
+    def keys_without_hints(self) -> frozenset[_KeyT]:
+        """Keys that have no description hint at all."""
+        return self._keys_without_hints
+
+    def matching_keys(self, description: str) -> set[_KeyT]:
+        """Return the keys having hints, all of which appear in the description.
+
+        Args:
+            description: The operation description to scan.
+
+        Returns:
+            The matching keys (keys without hints are never included).
+        """
+        found_hints: set[int] = set()
+        state = 0
+        for char in description:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found_hints.update(self._outputs[state])
+
+        found_count: dict[_KeyT, int] = {}
+        for hint_id in found_hints:
+            for key in self._keys_by_hint[hint_id]:
+                found_count[key] = found_count.get(key, 0) + 1
+
+        matching = {
+            key
+            for key, count in found_count.items()
+            if count == self._required_hints[key]
+        }
+        matching.update(self._always_matching)
+        return matching
@@ -0,0 +1,165 @@
+"""Globally optimal assignment of operations to target iterations.
+
+Heuristic linking picks the best target for each operation independently, so
+two operations close to the same planned iteration may both claim it. This
+module solves the assignment as a maximum-weight bipartite matching between
+operations and iteration slots: the candidate graph is split into connected
+blocks and each block is solved with the Hungarian algorithm.
+"""
+from typing import Generic, Hashable, Iterable, NamedTuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+_SlotT = TypeVar("_SlotT", bound=Hashable)
+
+
+class AssignmentEdge(NamedTuple, Generic[_SlotT]):
+    """A candidate pairing of an operation with a slot."""
+
+    operation: int
+    """Position of the operation."""
+    slot: _SlotT
+    weight: float
+    """Gain of the pairing; only positive weights are worth assigning."""
+
+
+def max_weight_matching(
+    weights: npt.NDArray[np.float64],
+) -> list[tuple[int, int]]:
+    """Find the maximum-weight matching of a dense bipartite weight matrix.
+
+    Rows may stay unmatched: a pairing is only kept when its weight is
+    positive.
+
+    Args:
+        weights: Weight of each (row, column) pairing, shape (n, m).
+
+    Returns:
+        The matched (row, column) pairs, sorted by row.
+    """
+    n_rows, n_columns = weights.shape
+    if not n_rows or not n_columns:
+        return []
+
+    # Minimize the negated weights; one zero-cost dummy column per row lets
+    # every row stay unmatched, which also makes the matrix wide enough
+    cost = np.zeros((n_rows, n_columns + n_rows))
+    cost[:, :n_columns] = -np.maximum(weights, 0.0)
+    column_rows = _hungarian(cost)
+
+    return sorted(
+        (row, column)
+        for column, row in enumerate(column_rows[:n_columns])
+        if row >= 0 and weights[row, column] > 0
+    )
+
+
+def _hungarian(  # pylint: disable=too-many-locals
+    cost: npt.NDArray[np.float64],
+) -> npt.NDArray[np.int64]:
+    """Solve a rectangular minimum-cost assignment (rows <= columns).
+
+    Shortest augmenting path variant with row and column potentials,
+    O(n² m), with the inner loop over columns vectorized.
+
+    Returns:
+        The row assigned to each column (-1 when the column is free).
+    """
+    n_rows, n_columns = cost.shape
+    # Index 0 is a virtual column used as the root of each augmenting path
+    row_potential = np.zeros(n_rows + 1)
+    column_potential = np.zeros(n_columns + 1)
+    column_row = np.zeros(n_columns + 1, dtype=np.int64)
+    previous_column = np.zeros(n_columns + 1, dtype=np.int64)
+
+    for row in range(1, n_rows + 1):
+        column_row[0] = row
+        current_column = 0
+        min_slack = np.full(n_columns + 1, np.inf)
+        visited = np.zeros(n_columns + 1, dtype=bool)
+        while column_row[current_column]:
+            visited[current_column] = True
+            current_row = column_row[current_column]
+            slack = (
+                cost[current_row - 1]
+                - row_potential[current_row]
+                - column_potential[1:]
+            )
+            improved = ~visited[1:] & (slack < min_slack[1:])
+            min_slack[1:][improved] = slack[improved]
+            previous_column[1:][improved] = current_column
+
+            candidate_slack = np.where(visited[1:], np.inf, min_slack[1:])
+            next_column = int(np.argmin(candidate_slack)) + 1
+            delta = candidate_slack[next_column - 1]
+
+            row_potential[column_row[visited]] += delta
+            column_potential[visited] -= delta
+            min_slack[1:][~visited[1:]] -= delta
+            current_column = next_column
+
+        # Flip the augmenting path back to the root
+        while current_column:
+            parent = previous_column[current_column]
+            column_row[current_column] = column_row[parent]
+            current_column = parent
+
+    return column_row[1:] - 1
+
+
+def solve_assignment(
+    edges: Iterable[AssignmentEdge[_SlotT]],
+) -> dict[int, _SlotT]:
+    """Assign operations to slots, each slot taking at most one operation.
+
+    The candidate graph is split into connected blocks, each solved
+    independently with a dense matching of its own size.
+
+    Args:
+        edges: Candidate pairings; non-positive weights are ignored.
+
+    Returns:
+        The slot assigned to each matched operation position.
+    """
+    edges = [edge for edge in edges if edge.weight > 0]
+
+    # Union-find over operations (even ids) and slots (odd ids)
+    slot_ids: dict[_SlotT, int] = {}
+    parent: dict[int, int] = {}
+
+    def find(node: int) -> int:
+        root = node
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    for edge in edges:
+        slot_id = slot_ids.setdefault(edge.slot, 2 * len(slot_ids) + 1)
+        parent[find(2 * edge.operation)] = find(slot_id)
+
+    blocks: dict[int, list[AssignmentEdge[_SlotT]]] = {}
+    for edge in edges:
+        blocks.setdefault(find(2 * edge.operation), []).append(edge)
+
+    assignment: dict[int, _SlotT] = {}
+    for block in blocks.values():
+        assignment.update(_solve_block(block))
+    return assignment
+
+
+def _solve_block(block: list[AssignmentEdge[_SlotT]]) -> dict[int, _SlotT]:
+    """Solve one connected block with a dense weight matrix."""
+    operations = sorted({edge.operation for edge in block})
+    slots = list(dict.fromkeys(edge.slot for edge in block))
+    row_by_operation = {operation: row for row, operation in enumerate(operations)}
+    column_by_slot = {slot: column for column, slot in enumerate(slots)}
+    weights = np.zeros((len(operations), len(slots)))
+    for edge in block:
+        row, column = row_by_operation[edge.operation], column_by_slot[edge.slot]
+        weights[row, column] = max(weights[row, column], edge.weight)
+    return {
+        operations[row]: slots[column] for row, column in max_weight_matching(weights)
+    }
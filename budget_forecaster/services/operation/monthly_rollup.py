@@ -0,0 +1,52 @@
+"""Monthly rollup of operation amounts per category."""
+from datetime import date
+from typing import Iterable
+
+import pandas as pd
+
+from budget_forecaster.core.types import Category
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+
+
+def compute_monthly_rollup(
+    operations: Iterable[HistoricOperation], start_date: date, end_date: date
+) -> pd.DataFrame:
+    """Sum operation amounts per category and month.
+
+    Operations are aggregated in a single grouped sum over their columns, then
+    reindexed once to the full month grid, so months without any operation
+    count as zero.
+
+    Args:
+        operations: The operations to aggregate.
+        start_date: Operations before this date are ignored.
+        end_date: Operations after this date are ignored.
+
+    Returns:
+        A DataFrame indexed by category (in order of first appearance), with
+        one column per month start from the month of start_date to the month
+        of end_date.
+    """
+    months = pd.date_range(start_date.replace(day=1), end_date, freq="MS")
+    categories: list[Category] = []
+    operation_months: list[date] = []
+    amounts: list[float] = []
+    for operation in operations:
+        if start_date <= operation.operation_date <= end_date:
+            categories.append(operation.category)
+            operation_months.append(operation.operation_date.replace(day=1))
+            amounts.append(operation.amount)
+
+    columns = pd.DataFrame(
+        {
+            "Category": categories,
+            "Month": pd.to_datetime(operation_months),
+            "Amount": pd.Series(amounts, dtype=float),
+        }
+    )
+    rollup = columns.groupby(["Category", "Month"])["Amount"].sum().unstack("Month")
+    return rollup.reindex(
+        index=pd.Index(pd.unique(pd.Series(categories, dtype=object)), name="Category"),
+        columns=months,
+        fill_value=0.0,
+    ).fillna(0.0)
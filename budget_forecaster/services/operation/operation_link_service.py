@@ -6,7 +6,10 @@ the OperationMatcher (uses links in memory) and the OperationLinkRepository
 """
 
 from datetime import date, timedelta
-from typing import NamedTuple
+from typing import Iterator, NamedTuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 from budget_forecaster.core.types import (
     LinkType,
@@ -22,6 +25,13 @@ from budget_forecaster.domain.operation.planned_operation import PlannedOperatio
 from budget_forecaster.infrastructure.persistence.repository_interface import (
     OperationLinkRepositoryInterface,
 )
+from budget_forecaster.services.operation.description_hint_index import (
+    DescriptionHintIndex,
+)
+from budget_forecaster.services.operation.link_assignment import (
+    AssignmentEdge,
+    solve_assignment,
+)
 from budget_forecaster.services.operation.operation_matcher import OperationMatcher
 
 
@@ -32,6 +42,162 @@ class _MatchCandidate(NamedTuple):
     score: float
 
 
+class _CandidateTargets:  # pylint: disable=too-few-public-methods
+    """Select the targets worth trying for an operation during heuristic linking.
+
+    Without a hint index every target is tried. With one, only the targets
+    whose description hints are satisfied (or that have no hint) are tried,
+    and their description is not checked again. Candidates keep the order of
+    matchers_by_target so that ties are resolved as without the index.
+    """
+
+    def __init__(
+        self,
+        matchers_by_target: dict[MatcherKey, OperationMatcher],
+        hint_index: DescriptionHintIndex[MatcherKey] | None,
+    ) -> None:
+        self._matchers_by_target = matchers_by_target
+        self._hint_index = hint_index
+        self._order = {key: i for i, key in enumerate(matchers_by_target)}
+        # Targets unknown to the index must still be tried with all criteria
+        self._unindexed: frozenset[MatcherKey] = frozenset()
+        self._always_tried: frozenset[MatcherKey] = frozenset()
+        if hint_index is not None:
+            self._unindexed = frozenset(matchers_by_target.keys() - hint_index.keys)
+            self._always_tried = self._unindexed | (
+                hint_index.keys_without_hints & matchers_by_target.keys()
+            )
+
+    def __call__(
+        self, operation: HistoricOperation
+    ) -> Iterator[tuple[MatcherKey, OperationMatcher, bool]]:
+        """Yield (target key, matcher, description already checked) tuples."""
+        if self._hint_index is None:
+            for key, matcher in self._matchers_by_target.items():
+                yield key, matcher, False
+            return
+
+        candidates = (
+            self._hint_index.matching_keys(operation.description)
+            & self._matchers_by_target.keys()
+        ) | self._always_tried
+        for key in sorted(candidates, key=self._order.__getitem__):
+            yield key, self._matchers_by_target[key], key not in self._unindexed
+
+
+def match_score_matrix(  # pylint: disable=too-many-arguments
+    operation_amounts: npt.ArrayLike,
+    operation_days: npt.ArrayLike,
+    category_matches: npt.ArrayLike,
+    description_matches: npt.ArrayLike,
+    iteration_days: npt.ArrayLike,
+    *,
+    planned_amount: float | None,
+    approximation_amount_ratio: float = 0.05,
+    approximation_days: int = 5,
+) -> npt.NDArray[np.float64]:
+    """Compute match scores (0-100) of n operations against m iterations at once.
+
+    Array version of compute_match_score, with the same weighting:
+    - Amount: 40% of score (skipped when planned_amount is None, i.e. for budgets)
+    - Date: 30% of score
+    - Category: 20% of score
+    - Description: 10% of score
+
+    Args:
+        operation_amounts: Amounts of the operations, shape (n,).
+        operation_days: Dates of the operations as ordinals, shape (n,).
+        category_matches: Whether each operation has the target category, shape (n,).
+        description_matches: Whether each operation satisfies the target's
+            description hints (always False if the target has no hints), shape (n,).
+        iteration_days: Start dates of the iterations as ordinals, shape (m,).
+        planned_amount: Amount of the target, None to skip amount scoring.
+        approximation_amount_ratio: Tolerance ratio for amount matching.
+        approximation_days: Tolerance in days for date matching.
+
+    Returns:
+        The score matrix, shape (n, m).
+    """
+    amounts = np.asarray(operation_amounts, dtype=np.float64)
+
+    # Amount score (40%), per operation
+    amount_score = np.zeros_like(amounts)
+    if planned_amount is not None and (planned := abs(planned_amount)) > 0:
+        amount_diff = np.abs(np.abs(amounts) - planned) / planned
+        amount_score = np.where(
+            amount_diff <= approximation_amount_ratio,
+            40.0,  # Full score if within tolerance
+            # Gradual decrease beyond tolerance
+            np.maximum(0.0, 40.0 * (1 - (amount_diff - approximation_amount_ratio))),
+        )
+
+    # Date score (30%), per (operation, iteration) pair
+    days_diff = np.abs(
+        np.asarray(operation_days, dtype=np.int64)[:, np.newaxis]
+        - np.asarray(iteration_days, dtype=np.int64)[np.newaxis, :]
+    )
+    date_score = np.where(
+        days_diff <= approximation_days,
+        30.0,  # Full score if within tolerance
+        # Gradual decrease: score drops to 0 at 30 days beyond tolerance
+        np.maximum(0.0, 30.0 * (1 - (days_diff - approximation_days) / 30)),
+    )
+
+    # Summed in amount, date, category, description order (float addition order)
+    return (
+        amount_score[:, np.newaxis]
+        + date_score
+        # Category score (20%), per operation
+        + np.where(np.asarray(category_matches, dtype=bool), 20.0, 0.0)[:, np.newaxis]
+        # Description score (10%), per operation
+        + np.where(np.asarray(description_matches, dtype=bool), 10.0, 0.0)[
+            :, np.newaxis
+        ]
+    )
+
+
+def compute_match_scores(
+    operations: Sequence[HistoricOperation],
+    operation_range: OperationRange,
+    iteration_dates: Sequence[date],
+    approximation_amount_ratio: float = 0.05,
+    approximation_date_range: timedelta = timedelta(days=5),
+    description_hints: set[str] | None = None,
+) -> npt.NDArray[np.float64]:
+    """Compute match scores of operations against iterations of an operation range.
+
+    See compute_match_score for the scoring rules.
+
+    Args:
+        operations: The historic operations to score.
+        operation_range: The operation range to match against.
+        iteration_dates: The dates of the iterations.
+        approximation_amount_ratio: Tolerance ratio for amount matching.
+        approximation_date_range: Tolerance for date matching.
+        description_hints: Keywords that must appear in operation descriptions.
+
+    Returns:
+        The score matrix, shape (len(operations), len(iteration_dates)).
+    """
+    hints = description_hints or set()
+    return match_score_matrix(
+        [operation.amount for operation in operations],
+        [operation.operation_date.toordinal() for operation in operations],
+        [operation.category == operation_range.category for operation in operations],
+        [
+            bool(hints) and all(hint in operation.description for hint in hints)
+            for operation in operations
+        ],
+        [iteration_date.toordinal() for iteration_date in iteration_dates],
+        # Budget amounts represent total budget, not individual operation amounts
+        planned_amount=(
+            None if isinstance(operation_range, Budget) else operation_range.amount
+        ),
+        approximation_amount_ratio=approximation_amount_ratio,
+        approximation_days=approximation_date_range.days,
+    )
+
+
 def compute_match_score(
     operation: HistoricOperation,
     operation_range: OperationRange,
@@ -51,6 +217,10 @@ def compute_match_score(
     Note: Budgets don't use amount scoring because budget amounts represent
     total budget, not individual operation amounts. This also ensures planned
     operations are prioritized over budgets when both match on other criteria.
+    If no description hints are configured, no description points are awarded
+    (this matches the existing match_description behavior).
+
+    Prefer compute_match_scores to score many pairs at once.
 
     Args:
         operation: The historic operation to score.
@@ -63,43 +233,117 @@ def compute_match_score(
     Returns:
         A score from 0 to 100 indicating match quality.
     """
-    hints = description_hints or set()
-    approx_date_days = approximation_date_range.days
-
-    score = 0.0
-
-    # Amount score (40%) - only for PlannedOperation, not Budget
-    # Budget amounts represent total budget, not individual operation amounts
-    is_budget = isinstance(operation_range, Budget)
-    if not is_budget and (planned_amount := abs(operation_range.amount)) > 0:
-        amount_diff = abs(abs(operation.amount) - planned_amount) / planned_amount
-        if amount_diff <= approximation_amount_ratio:
-            score += 40.0  # Full score if within tolerance
-        else:
-            # Gradual decrease beyond tolerance
-            score += max(0.0, 40.0 * (1 - (amount_diff - approximation_amount_ratio)))
-
-    # Date score (30%) - distance to specific iteration
-    if (
-        days_diff := abs((operation.operation_date - iteration_date).days)
-    ) <= approx_date_days:
-        score += 30.0  # Full score if within tolerance
-    else:
-        # Gradual decrease: score drops to 0 at 30 days beyond tolerance
-        score += max(0.0, 30.0 * (1 - (days_diff - approx_date_days) / 30))
+    return float(
+        compute_match_scores(
+            (operation,),
+            operation_range,
+            (iteration_date,),
+            approximation_amount_ratio,
+            approximation_date_range,
+            description_hints,
+        )[0, 0]
+    )
+
+
+def _find_candidate_iterations(
+    operations: Sequence[HistoricOperation],
+    matchers_by_target: dict[MatcherKey, OperationMatcher],
+    hint_index: DescriptionHintIndex[MatcherKey] | None,
+) -> list[list[tuple[MatcherKey, date]]]:
+    """Find, for each operation, the matching targets and their current iteration.
+
+    Returns:
+        Per operation position, the (target, iteration date) candidates in
+        target order.
+    """
+    candidate_targets = _CandidateTargets(matchers_by_target, hint_index)
+    candidates: list[list[tuple[MatcherKey, date]]] = []
+    for operation in operations:
+        operation_candidates: list[tuple[MatcherKey, date]] = []
+        for key, matcher, description_checked in candidate_targets(operation):
+            # Check if operation matches this target using the matcher's logic
+            if not matcher.match(operation, skip_description=description_checked):
+                continue
+
+            # Find the iteration using the matcher's date tolerance
+            if (
+                current_iteration := matcher.operation_range.date_range.current_date_range(
+                    operation.operation_date,
+                    approx_before=matcher.approximation_date_range,
+                    approx_after=matcher.approximation_date_range,
+                )
+            ) is not None:
+                operation_candidates.append((key, current_iteration.start_date))
+        candidates.append(operation_candidates)
+    return candidates
+
 
-    # Category score (20%)
-    if operation.category == operation_range.category:
-        score += 20.0
+def _score_candidates(
+    operations: Sequence[HistoricOperation],
+    candidates: list[list[tuple[MatcherKey, date]]],
+    matchers_by_target: dict[MatcherKey, OperationMatcher],
+) -> dict[tuple[int, MatcherKey], float]:
+    """Score all candidates, one batch per target.
 
-    # Description score (10%)
-    if hints:
-        if all(hint in operation.description for hint in hints):
-            score += 10.0
-    # If no hints are configured, we don't award description points
-    # (this matches the existing match_description behavior)
+    Returns:
+        The match score of each (operation position, target) candidate.
+    """
+    pairs_by_target: dict[MatcherKey, list[tuple[int, date]]] = {}
+    for position, operation_candidates in enumerate(candidates):
+        for key, iteration_date in operation_candidates:
+            pairs_by_target.setdefault(key, []).append((position, iteration_date))
+
+    scores: dict[tuple[int, MatcherKey], float] = {}
+    for key, pairs in pairs_by_target.items():
+        matcher = matchers_by_target[key]
+        iteration_dates = sorted({iteration_date for _, iteration_date in pairs})
+        column_by_date = {d: column for column, d in enumerate(iteration_dates)}
+        score_matrix = compute_match_scores(
+            [operations[position] for position, _ in pairs],
+            matcher.operation_range,
+            iteration_dates,
+            approximation_amount_ratio=matcher.approximation_amount_ratio,
+            approximation_date_range=matcher.approximation_date_range,
+            description_hints=matcher.description_hints,
+        )
+        for row, (position, iteration_date) in enumerate(pairs):
+            scores[position, key] = float(
+                score_matrix[row, column_by_date[iteration_date]]
+            )
+    return scores
+
+
+def _assign_candidates(
+    candidates: list[list[tuple[MatcherKey, date]]],
+    scores: dict[tuple[int, MatcherKey], float],
+    taken_slots: set[tuple[MatcherKey, date]],
+) -> dict[int, tuple[MatcherKey, date]]:
+    """Assign candidates globally, each planned iteration taking one operation.
+
+    Each operation falls back to its best budget iteration (first target wins
+    ties). Free planned iteration slots are weighted by their gain over that
+    fallback and assigned with a maximum-weight matching.
 
-    return score
+    Returns:
+        The (target, iteration date) assigned to each operation position.
+    """
+    fallbacks: dict[int, tuple[MatcherKey, date]] = {}
+    edges: list[AssignmentEdge[tuple[MatcherKey, date]]] = []
+    for position, operation_candidates in enumerate(candidates):
+        fallback_score = 0.0
+        for key, iteration_date in operation_candidates:
+            if key.link_type == LinkType.BUDGET and (
+                position not in fallbacks or scores[position, key] > fallback_score
+            ):
+                fallbacks[position] = (key, iteration_date)
+                fallback_score = scores[position, key]
+        edges.extend(
+            AssignmentEdge(position, slot, scores[position, slot[0]] - fallback_score)
+            for slot in operation_candidates
+            if slot[0].link_type == LinkType.PLANNED_OPERATION
+            and slot not in taken_slots
+        )
+    return fallbacks | solve_assignment(edges)
 
 
 class OperationLinkService:
@@ -108,6 +352,7 @@ class OperationLinkService:
     This service is responsible for:
     - CRUD operations on links
     - Creating heuristic links during import
+    - Creating globally optimal links for bulk relinking
     - Preserving manual links during recalculation
     """
 
@@ -205,6 +450,7 @@ class OperationLinkService:
         self,
         operations: tuple[HistoricOperation, ...],
         matchers_by_target: dict[MatcherKey, OperationMatcher],
+        hint_index: DescriptionHintIndex[MatcherKey] | None = None,
     ) -> tuple[OperationLink, ...]:
         """Create and persist heuristic links for unlinked operations.
 
@@ -215,52 +461,34 @@ class OperationLinkService:
         Args:
             operations: Operations to process.
             matchers_by_target: Dict mapping (LinkType, id) to OperationMatcher.
+            hint_index: Optional index of the matchers' description hints. When
+                given, only targets whose hints are satisfied by the operation
+                description (or without hints) are tried.
 
         Returns:
             Tuple of created OperationLinks.
         """
-        created_links: list[OperationLink] = []
+        unlinked_operations = tuple(
+            operation
+            for operation in operations
+            if not self._repository.get_link_for_operation(operation.unique_id)
+        )
+        candidates = _find_candidate_iterations(
+            unlinked_operations, matchers_by_target, hint_index
+        )
+        scores = _score_candidates(unlinked_operations, candidates, matchers_by_target)
 
-        for operation in operations:
-            # Skip if already linked
-            if self._repository.get_link_for_operation(operation.unique_id):
-                continue
-
-            # Try each matcher to find a match
+        created_links: list[OperationLink] = []
+        for position, operation in enumerate(unlinked_operations):
             best_match: _MatchCandidate | None = None
-
-            for (target_type, target_id), matcher in matchers_by_target.items():
-                # Check if operation matches this target using the matcher's logic
-                if not matcher.match(operation):
-                    continue
-
-                # Find the iteration using the matcher's date tolerance
-                current_iteration = (
-                    matcher.operation_range.date_range.current_date_range(
-                        operation.operation_date,
-                        approx_before=matcher.approximation_date_range,
-                        approx_after=matcher.approximation_date_range,
-                    )
-                )
-                if current_iteration is None:
-                    continue
-                iteration_date = current_iteration.start_date
-
-                # Compute match score for tie-breaking
-                score = compute_match_score(
-                    operation,
-                    matcher.operation_range,
-                    iteration_date,
-                    approximation_amount_ratio=matcher.approximation_amount_ratio,
-                    approximation_date_range=matcher.approximation_date_range,
-                    description_hints=matcher.description_hints,
-                )
-
+            # Candidates are in target order: the first best score wins ties
+            for key, iteration_date in candidates[position]:
+                score = scores[position, key]
                 if best_match is None or score > best_match.score:
                     link = OperationLink(
                         operation_unique_id=operation.unique_id,
-                        target_type=target_type,
-                        target_id=target_id,
+                        target_type=key.link_type,
+                        target_id=key.target_id,
                         iteration_date=iteration_date,
                         is_manual=False,
                     )
@@ -272,3 +500,61 @@ class OperationLinkService:
                 created_links.append(best_match.link)
 
         return tuple(created_links)
+
+    def create_optimal_links(
+        self,
+        operations: tuple[HistoricOperation, ...],
+        matchers_by_target: dict[MatcherKey, OperationMatcher],
+        hint_index: DescriptionHintIndex[MatcherKey] | None = None,
+    ) -> tuple[OperationLink, ...]:
+        """Create and persist globally optimal links for unlinked operations.
+
+        Unlike create_heuristic_links, operations do not pick their best
+        target independently: an iteration of a planned operation takes at
+        most one operation (including existing links), and the assignment
+        maximizing the total match score is chosen. Budget iterations accept
+        any number of operations, so each operation keeps its best budget
+        unless a planned iteration is worth more.
+
+        Args:
+            operations: Operations to process.
+            matchers_by_target: Dict mapping (LinkType, id) to OperationMatcher.
+            hint_index: Optional index of the matchers' description hints.
+
+        Returns:
+            Tuple of created OperationLinks, in operation order.
+        """
+        existing_links = self._repository.get_all_links()
+        taken_slots = {
+            (MatcherKey(link.target_type, link.target_id), link.iteration_date)
+            for link in existing_links
+            if link.target_type == LinkType.PLANNED_OPERATION
+        }
+        linked_ids = {link.operation_unique_id for link in existing_links}
+        unlinked_operations = tuple(
+            operation
+            for operation in operations
+            if operation.unique_id not in linked_ids
+        )
+        candidates = _find_candidate_iterations(
+            unlinked_operations, matchers_by_target, hint_index
+        )
+        assignment = _assign_candidates(
+            candidates,
+            _score_candidates(unlinked_operations, candidates, matchers_by_target),
+            taken_slots,
+        )
+
+        created_links: list[OperationLink] = []
+        for position, (key, iteration_date) in sorted(assignment.items()):
+            link = OperationLink(
+                operation_unique_id=unlinked_operations[position].unique_id,
+                target_type=key.link_type,
+                target_id=key.target_id,
+                iteration_date=iteration_date,
+                is_manual=False,
+            )
+            self._repository.upsert_link(link)
+            created_links.append(link)
+
+        return tuple(created_links)
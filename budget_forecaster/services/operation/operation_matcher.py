@@ -1,14 +1,33 @@
 """Match operations to operation ranges."""
+import bisect
 from datetime import date, timedelta
-from typing import Any, Iterable, Iterator
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
 from budget_forecaster.core.date_range import DateRangeInterface
-from budget_forecaster.core.types import IterationDate
+from budget_forecaster.core.types import IterationDate, OperationId
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.operation_range import OperationRange
 
 
+class _OperationDateIndex:  # pylint: disable=too-few-public-methods
+    """Operations sorted by date, queryable by date interval."""
+
+    def __init__(self, operations: Iterable[HistoricOperation]) -> None:
+        # sorted() is stable: operations of the same day keep their input order
+        self._operations = sorted(operations, key=lambda op: op.operation_date)
+        self._dates = [op.operation_date for op in self._operations]
+
+    def between(self, start: date, end: date) -> Sequence[HistoricOperation]:
+        """Return the operations dated within [start, end], in date order."""
+        return self._operations[
+            bisect.bisect_left(self._dates, start) : bisect.bisect_right(
+                self._dates, end
+            )
+        ]
+
+
 class OperationMatcher:  # pylint: disable=too-many-public-methods
     """Check if an operation matches an operation range."""
 
@@ -36,9 +55,16 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
         self._approximation_amount_ratio = approximation_amount_ratio
         self._operation_links = operation_links
 
-        # Validate operation links
+        # Validate operation links and index them by operation for O(1) lookups
+        iteration_by_operation: dict[OperationId, IterationDate] = {}
         for link in operation_links:
             self._validate_iteration_date(link.iteration_date)
+            iteration_by_operation.setdefault(
+                link.operation_unique_id, link.iteration_date
+            )
+        self._iteration_by_operation: Mapping[
+            OperationId, IterationDate
+        ] = MappingProxyType(iteration_by_operation)
 
     @property
     def operation_range(self) -> OperationRange:
@@ -90,10 +116,7 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
         Returns:
             True if the operation has a link, False otherwise.
         """
-        return any(
-            link.operation_unique_id == operation.unique_id
-            for link in self._operation_links
-        )
+        return operation.unique_id in self._iteration_by_operation
 
     def get_iteration_for_operation(
         self, operation: HistoricOperation
@@ -109,10 +132,7 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
         Returns:
             The iteration date if linked, None otherwise.
         """
-        for link in self._operation_links:
-            if link.operation_unique_id == operation.unique_id:
-                return link.iteration_date
-        return None
+        return self._iteration_by_operation.get(operation.unique_id)
 
     def update_params(
         self,
@@ -120,7 +140,10 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
         approximation_date_range: timedelta = timedelta(days=5),
         approximation_amount_ratio: float = 0.05,
     ) -> "OperationMatcher":
-        """Update the params of the matcher."""
+        """Update the params of the matcher.
+
+        Operation links and their index are kept as is.
+        """
         self._description_hints = description_hints or self.description_hints
         self._approximation_date_range = approximation_date_range
         self._approximation_amount_ratio = approximation_amount_ratio
@@ -161,7 +184,9 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
             approx_after=self.approximation_date_range,
         )
 
-    def _match_heuristic(self, operation: HistoricOperation) -> bool:
+    def _match_heuristic(
+        self, operation: HistoricOperation, skip_description: bool = False
+    ) -> bool:
         """Check if the operation matches using heuristic rules only.
 
         This method applies the original matching logic without considering
@@ -169,19 +194,26 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
 
         Args:
             operation: The historic operation to check.
+            skip_description: Don't check the description hints.
 
         Returns:
             True if the operation matches heuristically, False otherwise.
         """
         return (
             not self._out_of_range(operation)
-            and (not self.description_hints or self.match_description(operation))
+            and (
+                skip_description
+                or not self.description_hints
+                or self.match_description(operation)
+            )
             and self.match_amount(operation)
             and self.match_category(operation)
             and self.match_date_range(operation)
         )
 
-    def match(self, operation: HistoricOperation) -> bool:
+    def match(
+        self, operation: HistoricOperation, *, skip_description: bool = False
+    ) -> bool:
         """Check if the operation matches the planned operation.
 
         Operation links take priority over heuristic matching. If an operation
@@ -190,6 +222,8 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
 
         Args:
             operation: The historic operation to check.
+            skip_description: Don't check the description hints, e.g. because
+                they were already checked through a DescriptionHintIndex.
 
         Returns:
             True if the operation matches (via link or heuristically).
@@ -199,7 +233,7 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
             return True
 
         # Fall back to heuristic matching
-        return self._match_heuristic(operation)
+        return self._match_heuristic(operation, skip_description)
 
     def matches(
         self, operations: Iterable[HistoricOperation]
@@ -212,68 +246,97 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
     def latest_matching_operations(
         self, current_date: date, operations: Iterable[HistoricOperation]
     ) -> Iterator[HistoricOperation]:
-        """Returns the operations matching the last time range and close to current date."""
-        for operation in self.matches(operations):
-            if operation.date_range.is_within(
-                current_date, approx_after=self.approximation_date_range
-            ):
-                yield operation
+        """Returns the operations matching the last time range and close to current date.
+
+        Operations are yielded in date order.
+        """
+        candidates = _OperationDateIndex(operations).between(
+            current_date - self.approximation_date_range, current_date
+        )
+        return self.matches(candidates)
 
     def late_date_ranges(
         self, current_date: date, operations: Iterable[HistoricOperation]
     ) -> Iterator[DateRangeInterface]:
-        """Returns the date ranges which are late and close to current date."""
-        not_assigned_operations = {
-            op.unique_id: op for op in operations if self.match(op)
-        }
+        """Returns the date ranges which are late and close to current date.
+
+        Iterations and matching operations are swept together in date order:
+        each iteration is executed by the earliest matching operation not yet
+        assigned within its approximation window.
+        """
+        approximation = self.approximation_date_range
+        date_ranges: list[DateRangeInterface] = []
         for dr in self.operation_range.date_range.iterate_over_date_ranges(
-            current_date - self.approximation_date_range
+            current_date - approximation
         ):
             if dr.is_future(current_date):
-                return
-            if not dr.is_within(
-                current_date, approx_after=self.approximation_date_range
+                break
+            if dr.is_within(current_date, approx_after=approximation):
+                date_ranges.append(dr)
+        if not date_ranges:
+            return
+
+        candidates = tuple(
+            self.matches(
+                _OperationDateIndex(operations).between(
+                    date_ranges[0].start_date - approximation,
+                    max(dr.last_date for dr in date_ranges) + approximation,
+                )
+            )
+        )
+        next_candidate = 0
+        for dr in date_ranges:
+            # Operations before this window can't execute any later iteration
+            while (
+                next_candidate < len(candidates)
+                and candidates[next_candidate].operation_date
+                < dr.start_date - approximation
             ):
-                continue
-            for operation in not_assigned_operations.values():
-                if dr.is_within(
-                    operation.operation_date,
-                    approx_before=self.approximation_date_range,
-                    approx_after=self.approximation_date_range,
-                ):
-                    # the date range was executed
-                    not_assigned_operations.pop(operation.unique_id)
-                    break
+                next_candidate += 1
+            if (
+                next_candidate < len(candidates)
+                and candidates[next_candidate].operation_date
+                <= dr.last_date + approximation
+            ):
+                # the date range was executed
+                next_candidate += 1
             else:
                 yield dr
 
     def anticipated_date_ranges(
         self, current_date: date, operations: Iterable[HistoricOperation]
     ) -> Iterator[tuple[DateRangeInterface, HistoricOperation]]:
-        """Returns the date ranges which are anticipated and close to current date."""
-        not_assigned_operations = {
-            op.unique_id: op
-            for op in self.latest_matching_operations(current_date, operations)
-        }
+        """Returns the date ranges which are anticipated and close to current date.
+
+        Iterations and the latest matching operations are swept together in date
+        order: each iteration is paired with the earliest operation not yet
+        assigned within its anticipation window.
+        """
+        approximation = self.approximation_date_range
+        candidates = tuple(self.latest_matching_operations(current_date, operations))
+        next_candidate = 0
         for dr in self.operation_range.date_range.iterate_over_date_ranges(
-            current_date - self.approximation_date_range
+            current_date - approximation
         ):
             if not dr.is_future(current_date):
                 continue
-            if not dr.is_within(
-                current_date, approx_before=self.approximation_date_range
-            ):
+            if not dr.is_within(current_date, approx_before=approximation):
                 # the date range is too far in the future
                 return
-            for operation in not_assigned_operations.values():
-                if dr.is_within(
-                    operation.operation_date,
-                    approx_before=self.approximation_date_range,
-                ):
-                    # the date range was executed with anticipation
-                    not_assigned_operations.pop(operation.unique_id)
-                    yield dr, operation
-                    break
+            # Operations before this window can't anticipate any later iteration
+            while (
+                next_candidate < len(candidates)
+                and candidates[next_candidate].operation_date
+                < dr.start_date - approximation
+            ):
+                next_candidate += 1
+            if (
+                next_candidate < len(candidates)
+                and candidates[next_candidate].operation_date <= dr.last_date
+            ):
+                # the date range was executed with anticipation
+                yield dr, candidates[next_candidate]
+                next_candidate += 1
 
     def replace(self, **kwargs: Any) -> "OperationMatcher":
         """Return a new instance of the operation matcher with the given parameters replaced.
@@ -287,13 +350,16 @@ class OperationMatcher:  # pylint: disable=too-many-public-methods
                 f"operation_range must be OperationRange, got {type(new_operation_range)}"
             )
 
-        # Clear links if operation_range changes (links are tied to specific iterations)
-        preserve_links = new_operation_range is self.operation_range
-
-        return OperationMatcher(
+        new_matcher = OperationMatcher(
             operation_range=new_operation_range,
             description_hints=self.description_hints,
             approximation_date_range=self.approximation_date_range,
             approximation_amount_ratio=self.approximation_amount_ratio,
-            operation_links=self._operation_links if preserve_links else (),
         )
+        # Clear links if operation_range changes (links are tied to specific iterations),
+        # otherwise share the already validated links and their index
+        if new_operation_range is self.operation_range:
+            # pylint: disable=protected-access
+            new_matcher._operation_links = self._operation_links
+            new_matcher._iteration_by_operation = self._iteration_by_operation
+        return new_matcher
@@ -8,11 +8,14 @@ from dataclasses import dataclass
 from datetime import date
 from typing import Any, Callable, NamedTuple
 
+import pandas as pd
+
 from budget_forecaster.core.types import Category
 from budget_forecaster.domain.account.account_interface import AccountInterface
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.exceptions import OperationNotFoundError
+from budget_forecaster.services.operation.monthly_rollup import compute_monthly_rollup
 
 
 class OperationCategoryUpdate(NamedTuple):
@@ -302,6 +305,27 @@ class OperationService:
 
         return totals
 
+    def get_monthly_category_totals(
+        self,
+        date_from: date,
+        date_to: date,
+        filter_criteria: OperationFilter | None = None,
+    ) -> pd.DataFrame:
+        """Get total amounts per category and month.
+
+        Args:
+            date_from: First day of the period.
+            date_to: Last day of the period.
+            filter_criteria: Optional filter to apply before aggregating.
+
+        Returns:
+            A DataFrame indexed by category with one column per month start
+            of the period, months without operations counting as zero.
+        """
+        return compute_monthly_rollup(
+            self.get_operations(filter_criteria), date_from, date_to
+        )
+
     @property
     def balance(self) -> float:
         """Get the current account balance."""
@@ -1,8 +1,182 @@
 """Module to categorize operations from a given forecast."""
-from typing import Iterable
+import bisect
+import logging
+from datetime import date, timedelta
+from typing import Iterable, NamedTuple
 
+from budget_forecaster.core.types import OperationId
 from budget_forecaster.domain.forecast.forecast import Forecast
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.services.operation.description_hint_index import (
+    DescriptionHintIndex,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _PlannedState(NamedTuple):
+    """Inputs of a planned operation the categorization depends on."""
+
+    planned_operation: PlannedOperation
+    description_hints: frozenset[str]
+    approximation_date_range: timedelta
+    approximation_amount_ratio: float
+
+
+class _CategorizedOperation(NamedTuple):
+    """Memoized categorization of an operation."""
+
+    source: HistoricOperation
+    categorized: HistoricOperation
+
+
+def _planned_state(planned_operation: PlannedOperation) -> _PlannedState:
+    matcher = planned_operation.matcher
+    return _PlannedState(
+        planned_operation,
+        frozenset(matcher.description_hints),
+        matcher.approximation_date_range,
+        matcher.approximation_amount_ratio,
+    )
+
+
+def _matches(planned_operation: PlannedOperation, operation: HistoricOperation) -> bool:
+    """Check amount and date, description hints being checked by the caller."""
+    matcher = planned_operation.matcher
+    return matcher.match_amount(operation) and matcher.match_date_range(operation)
+
+
+class OperationsCategorizer:  # pylint: disable=too-few-public-methods
+    """Categorize operations from the planned operations of a forecast.
+
+    The categorizer is meant to be long-lived: the category of each operation
+    is memoized, and on each call only the operations that changed, or that
+    are candidates of a planned operation added, edited or removed since the
+    previous call, are categorized again. Candidates of a planned operation
+    are found through a date index of the operations, then filtered on
+    amount and description hints.
+    """
+
+    def __init__(self) -> None:
+        self._states: tuple[_PlannedState, ...] = ()
+        self._planned_operations: tuple[PlannedOperation, ...] = ()
+        self._hint_index: DescriptionHintIndex[int] = DescriptionHintIndex({})
+        self._results: dict[OperationId, _CategorizedOperation] = {}
+
+    def __call__(
+        self, operations: Iterable[HistoricOperation], forecast: Forecast
+    ) -> tuple[HistoricOperation, ...]:
+        """Categorize operations based on planned operations in the forecast.
+
+        Args:
+            operations: The historic operations to categorize.
+            forecast: The forecast containing planned operations to match against.
+
+        Returns:
+            The operations with updated categories where matches were found.
+        """
+        operations_by_id = {op.unique_id: op for op in operations}
+        to_categorize = {
+            operation_id
+            for operation_id, operation in operations_by_id.items()
+            if (result := self._results.get(operation_id)) is None
+            or result.source != operation
+        }
+        for operation_id in self._results.keys() - operations_by_id.keys():
+            del self._results[operation_id]
+
+        if (
+            states := tuple(_planned_state(op) for op in forecast.operations)
+        ) != self._states:
+            if (changed_states := self._update_planned_operations(states)) is None:
+                to_categorize = set(operations_by_id)
+            elif len(to_categorize) < len(operations_by_id):
+                to_categorize |= _candidates(changed_states, operations_by_id.values())
+
+        for operation_id in to_categorize:
+            operation = operations_by_id[operation_id]
+            self._results[operation_id] = _CategorizedOperation(
+                operation, self._categorize(operation)
+            )
+        if to_categorize:
+            logger.debug(
+                "Categorized %d of %d operations",
+                len(to_categorize),
+                len(operations_by_id),
+            )
+        return tuple(
+            self._results[operation_id].categorized for operation_id in operations_by_id
+        )
+
+    def _update_planned_operations(
+        self, states: tuple[_PlannedState, ...]
+    ) -> set[_PlannedState] | None:
+        """Replace the planned operations.
+
+        Returns:
+            The added, edited or removed planned operations, or None if the
+            priorities of the unchanged ones changed.
+        """
+        old_states = self._states
+        self._states = states
+        self._planned_operations = tuple(state.planned_operation for state in states)
+        # Planned operations are indexed by position to keep the forecast order
+        self._hint_index = DescriptionHintIndex(
+            {
+                position: set(state.description_hints)
+                for position, state in enumerate(states)
+            }
+        )
+
+        common = set(old_states) & set(states)
+        if [state for state in old_states if state in common] != [
+            state for state in states if state in common
+        ]:
+            return None
+        return set(old_states) ^ set(states)
+
+    def _categorize(self, operation: HistoricOperation) -> HistoricOperation:
+        """Return the operation with the category of the first matching planned one."""
+        for position in sorted(self._hint_index.matching_keys(operation.description)):
+            planned_operation = self._planned_operations[position]
+            if _matches(planned_operation, operation):
+                return operation.replace(category=planned_operation.category)
+        return operation
+
+
+def _candidates(
+    states: Iterable[_PlannedState], operations: Iterable[HistoricOperation]
+) -> set[OperationId]:
+    """Find the operations matched by any of the given planned operations.
+
+    Operations are sorted by date once, so each planned operation only
+    checks the operations within its date window.
+    """
+    date_index = sorted(operations, key=lambda op: op.operation_date)
+    dates = [op.operation_date for op in date_index]
+    candidates: set[OperationId] = set()
+    for state in states:
+        if not state.description_hints:
+            # Planned operations without hints never categorize operations
+            continue
+        date_range = state.planned_operation.date_range
+        approximation = state.approximation_date_range
+        last_date = date_range.last_date
+        window = date_index[
+            bisect.bisect_left(dates, date_range.start_date - approximation) : (
+                len(dates)
+                if last_date == date.max
+                else bisect.bisect_right(dates, last_date + approximation)
+            )
+        ]
+        candidates.update(
+            operation.unique_id
+            for operation in window
+            if all(hint in operation.description for hint in state.description_hints)
+            and _matches(state.planned_operation, operation)
+        )
+    return candidates
 
 
 def categorize_operations(
@@ -12,7 +186,8 @@ def categorize_operations(
 
     For each operation, checks planned operations in order. The first planned
     operation whose matcher matches on description, amount, and date range
-    assigns its category to the operation.
+    assigns its category to the operation. Descriptions are matched in a single
+    pass against the hints of all planned operations.
 
     Args:
         operations: The historic operations to categorize.
@@ -21,19 +196,4 @@ def categorize_operations(
     Returns:
         The operations with updated categories where matches were found.
     """
-    categorized_operations: dict[int, HistoricOperation] = {
-        op.unique_id: op for op in operations
-    }
-    for operation in categorized_operations.values():
-        for planned_operation in forecast.operations:
-            matcher = planned_operation.matcher
-            if (
-                matcher.match_description(operation)
-                and matcher.match_amount(operation)
-                and matcher.match_date_range(operation)
-            ):
-                categorized_operations[operation.unique_id] = operation.replace(
-                    category=planned_operation.category
-                )
-                break
-    return tuple(categorized_operations.values())
+    return OperationsCategorizer()(operations, forecast)
@@ -12,6 +12,7 @@ from budget_forecaster.services.use_cases.manage_links_use_case import (
 )
 from budget_forecaster.services.use_cases.manage_targets_use_case import (
     ManageTargetsUseCase,
+    RelinkResult,
 )
 from budget_forecaster.services.use_cases.matcher_cache import MatcherCache
 
@@ -22,4 +23,5 @@ __all__ = [
     "ManageLinksUseCase",
     "ManageTargetsUseCase",
     "MatcherCache",
+    "RelinkResult",
 ]
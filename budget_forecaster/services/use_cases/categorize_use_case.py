@@ -69,7 +69,9 @@ class CategorizeUseCase:  # pylint: disable=too-few-public-methods
         created_links: dict[OperationId, OperationLink] = {}
         if changed_operations and (matchers := self._matcher_cache.get_matchers()):
             for link in self._operation_link_service.create_heuristic_links(
-                tuple(changed_operations), matchers
+                tuple(changed_operations),
+                matchers,
+                self._matcher_cache.get_hint_index(),
             ):
                 created_links[link.operation_unique_id] = link
 
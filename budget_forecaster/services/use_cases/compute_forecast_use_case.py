@@ -1,17 +1,25 @@
 """Use case for computing forecast reports."""
 
 from datetime import date
+from typing import Sequence
 
+from budget_forecaster.core.cancellation import CancellationToken
+from budget_forecaster.core.types import BalanceResolution
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.services.account.account_analysis_report import (
     AccountAnalysisReport,
 )
 from budget_forecaster.services.forecast.forecast_service import ForecastService
+from budget_forecaster.services.forecast.per_account_evaluator import (
+    PerAccountBalances,
+)
+from budget_forecaster.services.forecast.scenario_evaluator import ScenarioComparison
 from budget_forecaster.services.operation.operation_link_service import (
     OperationLinkService,
 )
 
 
-class ComputeForecastUseCase:  # pylint: disable=too-few-public-methods
+class ComputeForecastUseCase:
     """Compute forecast reports by combining links and forecast data."""
 
     def __init__(
@@ -26,15 +34,88 @@ class ComputeForecastUseCase:  # pylint: disable=too-few-public-methods
         self,
         start_date: date | None = None,
         end_date: date | None = None,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        cancellation: CancellationToken | None = None,
     ) -> AccountAnalysisReport:
         """Compute the forecast report.
 
         Args:
             start_date: Start date for the report (default: today).
             end_date: End date for the report (default: 1 year from start).
+            resolution: Resolution of the balance evolution.
+            cancellation: Token checked between the steps of the computation.
 
         Returns:
             The computed analysis report.
+
+        Raises:
+            ComputationCancelledError: If the computation was cancelled.
+        """
+        links = self._operation_link_service.get_all_links()
+        return self._forecast_service.compute_report(
+            start_date, end_date, links, resolution, cancellation
+        )
+
+    def load_cached_report(
+        self, resolution: BalanceResolution = BalanceResolution.DAILY
+    ) -> AccountAnalysisReport | None:
+        """Load the persisted forecast report if its data are still up to date.
+
+        Args:
+            resolution: Resolution of the balance evolution.
+
+        Returns:
+            The cached report, possibly of other dates, or None if it must be
+            computed.
+        """
+        links = self._operation_link_service.get_all_links()
+        return self._forecast_service.load_cached_report(links, resolution)
+
+    def compare_scenarios(
+        self,
+        scenarios: Sequence[Scenario],
+        end_date: date | None = None,
+        max_workers: int | None = 1,
+        cancellation: CancellationToken | None = None,
+    ) -> ScenarioComparison:
+        """Compare what-if scenarios with the stored forecast.
+
+        Args:
+            scenarios: The scenarios to evaluate.
+            end_date: Last date of the balance curves (default: 1 year from now).
+            max_workers: Number of worker processes, None for one per CPU.
+            cancellation: Token checked between the steps of the comparison.
+
+        Returns:
+            The balance curves and margins of the baseline and each scenario.
+
+        Raises:
+            ComputationCancelledError: If the comparison was cancelled.
+        """
+        links = self._operation_link_service.get_all_links()
+        return self._forecast_service.compare_scenarios(
+            scenarios, end_date, links, max_workers, cancellation
+        )
+
+    def compute_account_balances(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        resolution: BalanceResolution = BalanceResolution.DAILY,
+        max_workers: int | None = 1,
+    ) -> PerAccountBalances:
+        """Project the balance of each account from its share of the forecast.
+
+        Args:
+            start_date: First date of the balances (default: 4 months ago).
+            end_date: Last date of the balances (default: 1 year from now).
+            resolution: Resolution of the balance evolutions.
+            max_workers: Number of worker processes, None for one per CPU.
+
+        Returns:
+            The balance evolutions of each account and of the aggregated account.
         """
         links = self._operation_link_service.get_all_links()
-        return self._forecast_service.compute_report(start_date, end_date, links)
+        return self._forecast_service.compute_account_balances(
+            start_date, end_date, links, resolution, max_workers
+        )
@@ -1,9 +1,11 @@
 """Use case for importing bank export files."""
 
 import logging
+from datetime import timedelta
 from pathlib import Path
 
-from budget_forecaster.core.types import ImportProgressCallback
+from budget_forecaster.core.types import ImportProgressCallback, OperationId
+from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.infrastructure.persistence.persistent_account import (
     PersistentAccount,
 )
@@ -21,7 +23,11 @@ logger = logging.getLogger(__name__)
 
 
 class ImportUseCase:
-    """Import bank export files and create heuristic links."""
+    """Import bank export files and create heuristic links.
+
+    Only the operations inserted by the import are linked: the rest of the
+    history was already processed by previous imports.
+    """
 
     def __init__(
         self,
@@ -29,11 +35,59 @@ class ImportUseCase:
         persistent_account: PersistentAccount,
         operation_link_service: OperationLinkService,
         matcher_cache: MatcherCache,
+        link_lookback: timedelta | None = None,
     ) -> None:
+        """Initialize the use case.
+
+        Args:
+            import_service: Service importing the bank exports.
+            persistent_account: The persistent account holding the operations.
+            operation_link_service: Service creating the heuristic links.
+            matcher_cache: Shared cache of target matchers.
+            link_lookback: If set, unlinked operations dated up to this long
+                before the earliest imported operation are linked again, for
+                target iterations straddling the import boundary.
+        """
         self._import_service = import_service
         self._persistent_account = persistent_account
         self._operation_link_service = operation_link_service
         self._matcher_cache = matcher_cache
+        self._link_lookback = link_lookback
+
+    def _link_new_operations(
+        self, new_operation_ids: tuple[OperationId, ...]
+    ) -> tuple[OperationLink, ...]:
+        """Create heuristic links for the imported operations.
+
+        Args:
+            new_operation_ids: Unique ids of the imported operations.
+
+        Returns:
+            The created links.
+        """
+        if not new_operation_ids or not (
+            matchers := self._matcher_cache.get_matchers()
+        ):
+            return ()
+
+        new_ids = set(new_operation_ids)
+        operations = self._persistent_account.account.operations
+        new_operations = [op for op in operations if op.unique_id in new_ids]
+        if self._link_lookback is not None and new_operations:
+            since = (
+                min(op.operation_date for op in new_operations) - self._link_lookback
+            )
+            operations_to_link = tuple(
+                op
+                for op in operations
+                if op.unique_id in new_ids or op.operation_date >= since
+            )
+        else:
+            operations_to_link = tuple(new_operations)
+
+        return self._operation_link_service.create_heuristic_links(
+            operations_to_link, matchers, self._matcher_cache.get_hint_index()
+        )
 
     def import_file(self, path: Path, move_to_processed: bool = False) -> ImportResult:
         """Import a bank export file and create heuristic links.
@@ -48,14 +102,8 @@ class ImportUseCase:
         result = self._import_service.import_file(path, move_to_processed)
 
         if result.success:
-            operations = self._persistent_account.account.operations
-            if matchers := self._matcher_cache.get_matchers():
-                created_links = self._operation_link_service.create_heuristic_links(
-                    operations, matchers
-                )
-                logger.info(
-                    "Created %d heuristic links after import", len(created_links)
-                )
+            created_links = self._link_new_operations(result.new_operation_ids)
+            logger.info("Created %d heuristic links after import", len(created_links))
 
         return result
 
@@ -74,14 +122,9 @@ class ImportUseCase:
         summary = self._import_service.import_from_inbox(on_progress)
 
         if summary.successful_imports > 0:
-            operations = self._persistent_account.account.operations
-            if matchers := self._matcher_cache.get_matchers():
-                created_links = self._operation_link_service.create_heuristic_links(
-                    operations, matchers
-                )
-                logger.info(
-                    "Created %d heuristic links after inbox import",
-                    len(created_links),
-                )
+            created_links = self._link_new_operations(summary.new_operation_ids)
+            logger.info(
+                "Created %d heuristic links after inbox import", len(created_links)
+            )
 
         return summary
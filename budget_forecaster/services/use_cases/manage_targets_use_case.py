@@ -2,6 +2,7 @@
 
 import logging
 from datetime import date
+from typing import NamedTuple
 
 from dateutil.relativedelta import relativedelta
 
@@ -31,6 +32,23 @@ from budget_forecaster.services.use_cases.matcher_cache import MatcherCache
 logger = logging.getLogger(__name__)
 
 
+class RelinkResult(NamedTuple):
+    """Result of relinking all targets.
+
+    Attributes:
+        links: The created links.
+        operation_ids: IDs of the operations whose automatic link was
+            created, moved or deleted.
+    """
+
+    links: tuple[OperationLink, ...]
+    operation_ids: frozenset[OperationId]
+
+
+def _link_target(link: OperationLink) -> tuple[LinkType, TargetId, IterationDate]:
+    return link.target_type, link.target_id, link.iteration_date
+
+
 class ManageTargetsUseCase:
     """CRUD and split operations for planned operations and budgets."""
 
@@ -200,6 +218,52 @@ class ManageTargetsUseCase:
 
         self._forecast_service.delete_budget(budget_id)
 
+    # -------------------------------------------------------------------------
+    # Bulk relinking
+    # -------------------------------------------------------------------------
+
+    def relink_all_targets(self) -> RelinkResult:
+        """Recompute all automatic links with a globally optimal assignment.
+
+        Automatic links of every target are deleted, then all unlinked
+        operations are assigned at once so that no planned iteration is
+        claimed by two operations. Manual links are preserved.
+
+        Returns:
+            The created links, and the operations whose link changed.
+        """
+        matchers = self._matcher_cache.get_matchers()
+        previous_targets = {
+            link.operation_unique_id: _link_target(link)
+            for link in self._operation_link_service.get_all_links()
+            if not link.is_manual
+            and MatcherKey(link.target_type, link.target_id) in matchers
+        }
+        for key in matchers:
+            self._operation_link_service.delete_automatic_links_for_target(
+                key.link_type, key.target_id
+            )
+
+        created_links = self._operation_link_service.create_optimal_links(
+            self._persistent_account.account.operations,
+            matchers,
+            self._matcher_cache.get_hint_index(),
+        )
+        targets = {
+            link.operation_unique_id: _link_target(link) for link in created_links
+        }
+        operation_ids = frozenset(
+            operation_id
+            for operation_id in previous_targets.keys() | targets.keys()
+            if previous_targets.get(operation_id) != targets.get(operation_id)
+        )
+        logger.info(
+            "Relinked %d operations across all targets, %d links changed",
+            len(created_links),
+            len(operation_ids),
+        )
+        return RelinkResult(created_links, operation_ids)
+
     # -------------------------------------------------------------------------
     # Split operations
     # -------------------------------------------------------------------------
@@ -1,70 +1,134 @@
-"""Lazy-loaded cache of operation matchers for heuristic link creation."""
+"""Versioned cache of operation matchers for heuristic link creation."""
 
 import logging
+from typing import NamedTuple
 
 from budget_forecaster.core.types import LinkType, MatcherKey
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.forecast.forecast_service import ForecastService
+from budget_forecaster.services.operation.description_hint_index import (
+    DescriptionHintIndex,
+)
 from budget_forecaster.services.operation.operation_matcher import OperationMatcher
 
 logger = logging.getLogger(__name__)
 
 
+class _MatcherEntry(NamedTuple):
+    """Cached state of a target."""
+
+    version: int | None
+    """Definition version the entry was built for (None when unknown)."""
+    matcher: OperationMatcher
+
+
+def _target_key(target: PlannedOperation | Budget) -> MatcherKey | None:
+    if target.id is None:
+        return None
+    if isinstance(target, PlannedOperation):
+        return MatcherKey(LinkType.PLANNED_OPERATION, target.id)
+    return MatcherKey(LinkType.BUDGET, target.id)
+
+
 class MatcherCache:
-    """Lazy-loaded cache mapping targets to their operation matchers.
+    """Versioned cache mapping targets to their operation matchers.
 
     This cache is shared across use cases that need to create heuristic
-    links (import, categorize, target CRUD). It is built lazily on first
-    access and updated incrementally when targets are added or removed.
+    links (import, categorize, target CRUD). Targets are read from the
+    ForecastService forecast, so both caches load targets once per change.
+    Each entry is keyed by the definition version of its target, kept in
+    memory by the ForecastService: on access, only the targets changed since
+    the entry was built are refreshed, and the hint index is only recompiled
+    when description hints or the set of targets changed.
     """
 
     def __init__(self, forecast_service: ForecastService) -> None:
-        self._forecast_service = forecast_service
-        self._matchers: dict[MatcherKey, OperationMatcher] | None = None
+        """Initialize the cache.
 
-    def _build_matchers(self) -> dict[MatcherKey, OperationMatcher]:
-        """Build matchers for all planned operations and budgets."""
-        matchers: dict[MatcherKey, OperationMatcher] = {}
-
-        for planned_op in self._forecast_service.get_all_planned_operations():
-            if planned_op.id is not None:
-                key = MatcherKey(LinkType.PLANNED_OPERATION, planned_op.id)
-                matchers[key] = planned_op.matcher
+        Args:
+            forecast_service: Service providing the targets and their versions.
+        """
+        self._forecast_service = forecast_service
+        self._entries: dict[MatcherKey, _MatcherEntry] = {}
+        # Versions seen on the last refresh (None forces a refresh)
+        self._versions: dict[MatcherKey, int] | None = None
+        self._matchers: dict[MatcherKey, OperationMatcher] = {}
+        self._hint_index: DescriptionHintIndex[MatcherKey] | None = None
+
+    def _refresh(self) -> None:
+        """Rebuild the entries of the targets changed since the last refresh."""
+        if (
+            versions := self._forecast_service.get_definition_versions()
+        ) == self._versions:
+            return
 
-        for budget in self._forecast_service.get_all_budgets():
-            if budget.id is not None:
-                key = MatcherKey(LinkType.BUDGET, budget.id)
-                matchers[key] = budget.matcher
+        forecast = self._forecast_service.get_forecast()
+        all_targets: tuple[PlannedOperation | Budget, ...] = (
+            *forecast.operations,
+            *forecast.budgets,
+        )
+        targets: dict[MatcherKey, PlannedOperation | Budget] = {
+            key: target
+            for target in all_targets
+            if (key := _target_key(target)) is not None
+        }
+        stale = [
+            key
+            for key in targets
+            if (entry := self._entries.get(key)) is None
+            or entry.version != versions.get(key)
+        ]
+
+        hints_changed = self._entries.keys() != targets.keys()
+        for key in stale:
+            matcher = targets[key].matcher
+            if (entry := self._entries.get(key)) is None or (
+                entry.matcher.description_hints != matcher.description_hints
+            ):
+                hints_changed = True
+            self._entries[key] = _MatcherEntry(versions.get(key), matcher)
+        for key in self._entries.keys() - targets.keys():
+            del self._entries[key]
+
+        # Keep the forecast order: the first target wins ties during linking
+        self._matchers = {key: self._entries[key].matcher for key in targets}
+        if hints_changed:
+            self._hint_index = None
+        self._versions = versions
 
         logger.debug(
-            "Built %d matchers (%d planned operations, %d budgets)",
-            len(matchers),
-            sum(1 for k in matchers if k.link_type == LinkType.PLANNED_OPERATION),
-            sum(1 for k in matchers if k.link_type == LinkType.BUDGET),
+            "Refreshed %d of %d matchers (%d planned operations, %d budgets)",
+            len(stale),
+            len(targets),
+            sum(1 for k in targets if k.link_type == LinkType.PLANNED_OPERATION),
+            sum(1 for k in targets if k.link_type == LinkType.BUDGET),
         )
 
-        return matchers
-
     def get_matchers(self) -> dict[MatcherKey, OperationMatcher]:
-        """Get the matcher cache, building it if necessary."""
-        if self._matchers is None:
-            self._matchers = self._build_matchers()
+        """Get the up-to-date matchers, refreshing changed targets if necessary."""
+        self._refresh()
         return self._matchers
 
+    def get_hint_index(self) -> DescriptionHintIndex[MatcherKey]:
+        """Get the description hint index of all matchers, building it if necessary."""
+        matchers = self.get_matchers()
+        if self._hint_index is None:
+            self._hint_index = DescriptionHintIndex(
+                {key: matcher.description_hints for key, matcher in matchers.items()}
+            )
+        return self._hint_index
+
     def add_matcher(self, target: PlannedOperation | Budget) -> None:
-        """Add or update a matcher for a target."""
-        if target.id is None:
-            return
+        """Invalidate the matcher of an added or updated target.
 
-        matchers = self.get_matchers()
-        if isinstance(target, PlannedOperation):
-            key = MatcherKey(LinkType.PLANNED_OPERATION, target.id)
-        else:
-            key = MatcherKey(LinkType.BUDGET, target.id)
-        matchers[key] = target.matcher
+        The entry is rebuilt from the forecast on next access.
+        """
+        if (key := _target_key(target)) is not None:
+            self.remove_matcher(key)
 
     def remove_matcher(self, key: MatcherKey) -> None:
-        """Remove a matcher from the cache."""
-        matchers = self.get_matchers()
-        matchers.pop(key, None)
+        """Invalidate the matcher of a target (e.g. a deleted one)."""
+        if self._entries.pop(key, None) is not None:
+            self._hint_index = None
+        self._versions = None
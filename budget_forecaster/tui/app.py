@@ -3,7 +3,8 @@
 # pylint: disable=too-many-lines
 
 import logging
-from datetime import date
+from collections.abc import Collection
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -11,12 +12,14 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.css.query import NoMatches
 from textual.widgets import Footer, Header, TabbedContent, TabPane
+from textual.worker import Worker, WorkerState
 
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.date_range import SingleDay
 from budget_forecaster.core.types import (
     Category,
     LinkType,
+    MatcherKey,
     OperationId,
 )
 from budget_forecaster.domain.operation.budget import Budget
@@ -26,6 +29,7 @@ from budget_forecaster.exceptions import (
     AccountNotLoadedError,
     BackupError,
     BudgetForecasterError,
+    ComputationCancelledError,
 )
 from budget_forecaster.i18n import _, setup_i18n
 from budget_forecaster.infrastructure.backup import BackupService
@@ -38,12 +42,13 @@ from budget_forecaster.infrastructure.persistence.sqlite_repository import (
 )
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.services.forecast.forecast_service import ForecastService
+from budget_forecaster.services.forecast.report_cache import ReportCache
 from budget_forecaster.services.import_service import ImportService
 from budget_forecaster.services.operation.operation_link_service import (
     OperationLinkService,
 )
 from budget_forecaster.services.operation.operation_service import OperationService
-from budget_forecaster.tui.messages import DataRefreshRequested, SaveRequested
+from budget_forecaster.tui.messages import DataChanged, SaveRequested
 from budget_forecaster.tui.modals import (
     BudgetEditModal,
     CategoryModal,
@@ -55,6 +60,11 @@ from budget_forecaster.tui.modals import (
     SplitOperationModal,
     SplitResult,
 )
+from budget_forecaster.tui.report_worker import (
+    REPORT_WORKER_GROUP,
+    cancel_report_workers,
+    start_report_worker,
+)
 from budget_forecaster.tui.screens.analytics import AnalyticsWidget
 from budget_forecaster.tui.screens.budgets import BudgetsWidget
 from budget_forecaster.tui.screens.dashboard import DashboardScreen
@@ -67,6 +77,22 @@ from budget_forecaster.tui.widgets import OperationTable
 # Logger instance (configured via Config.setup_logging)
 logger = logging.getLogger("budget_forecaster")
 
+# Seconds the cached report is shown before it is computed again
+REPORT_REVALIDATION_DELAY = 1.0
+
+# Tabs showing data derived from operations and targets
+DATA_TABS = ("dashboard", "analytics", "review")
+
+# Tab most likely shown after the active one, updated in advance while idle
+LIKELY_NEXT_TABS = {
+    "review": "analytics",
+    "analytics": "review",
+    "operations": "dashboard",
+}
+
+# Seconds between two checks for a likely next tab to update
+TAB_PREWARM_INTERVAL = 0.5
+
 
 class BudgetApp(
     App[None]
@@ -151,10 +177,12 @@ class BudgetApp(
         self._categorizing_operation_ids: tuple[OperationId, ...] = ()
         self._linking_operations: tuple[HistoricOperation, ...] = ()
         self._planning_source_operation: HistoricOperation | None = None
+        # Tabs whose content changed since they were last updated
+        self._stale_tabs: set[str] = set()
 
     def _load_config(self) -> None:
         """Load configuration and account."""
-        self._config = Config()
+        self._config = config = Config()
         self._config.parse(self._config_path)
 
         # Setup logging from config
@@ -192,13 +220,15 @@ class BudgetApp(
         )
         import_service = ImportService(
             self._persistent_account,
-            self._config.inbox_path,
+            lambda: config.inbox_path,
             self._config.inbox_exclude_patterns,
             self._config.inbox_include_patterns,
         )
+        database_path = self._config.database_path
         forecast_service = ForecastService(
             self._persistent_account,
             self._persistent_account.repository,
+            ReportCache(database_path.with_name(f"{database_path.name}.report-cache")),
         )
 
         # Create the application service as central orchestrator
@@ -208,6 +238,11 @@ class BudgetApp(
             operation_service=operation_service,
             forecast_service=forecast_service,
             operation_link_service=operation_link_service,
+            link_lookback=(
+                timedelta(days=self._config.link_lookback_days)
+                if self._config.link_lookback_days
+                else None
+            ),
         )
 
     @property
@@ -248,25 +283,58 @@ class BudgetApp(
         """Initialize the application on mount."""
         try:
             self._load_config()
+            # The report of the last launch is shown until it is computed
+            # again, which is only needed if it was computed on another day
+            if (
+                self.app_service.load_cached_report() is not None
+                and not self.app_service.is_report_window_current()
+            ):
+                self.set_timer(REPORT_REVALIDATION_DELAY, self._revalidate_report)
             # Use call_after_refresh to ensure screens are mounted
             self.call_after_refresh(self._refresh_screens)
+            self.set_interval(TAB_PREWARM_INTERVAL, self._prewarm_likely_tab)
         except AccountNotLoadedError as e:
             self.notify(_("Error: {}").format(e), severity="error")
             self.exit()
 
+    def on_unmount(self) -> None:
+        """Persist the last computed report for the next launch."""
+        if self._app_service is not None:
+            self._app_service.save_report_cache()
+
+    def _revalidate_report(self) -> None:
+        """Compute again in the background the report loaded from the cache."""
+        start_report_worker(self, self.app_service, recompute=True)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Show the revalidated report once computed."""
+        if event.worker.group != REPORT_WORKER_GROUP:
+            return
+        if event.state == WorkerState.SUCCESS:
+            self._refresh_forecast_widgets()
+        elif event.state == WorkerState.ERROR and not isinstance(
+            event.worker.error, ComputationCancelledError
+        ):
+            logger.error(
+                "Error revalidating the cached report", exc_info=event.worker.error
+            )
+
     def _refresh_screens(self) -> None:  # pylint: disable=too-many-locals
         """Refresh all screens with current data."""
         # Dashboard
         dashboard = self.query_one("#dashboard-screen", DashboardScreen)
         dashboard.set_app_service(self.app_service)
+        self._stale_tabs.discard("dashboard")
 
         # Operations screen
         operations_screen = self.query_one("#operations-screen", OperationsScreen)
         operations_screen.set_app_service(self.app_service)
 
-        # Import widget
+        # Import widget, whose inbox is only scanned while its tab is shown
         import_widget = self.query_one("#import-widget", ImportWidget)
         import_widget.set_app_service(self.app_service)
+        if self.query_one(TabbedContent).active == "import":
+            import_widget.refresh_view()
 
         # Analytics and review widgets
         analytics_widget = self.query_one("#analytics-widget", AnalyticsWidget)
@@ -290,18 +358,99 @@ class BudgetApp(
     def on_tabbed_content_tab_activated(
         self, event: TabbedContent.TabActivated
     ) -> None:
-        """Auto-compute forecast when Analytics or Review tab becomes active."""
-        tab_id = event.pane.id
+        """Compute the forecast or scan the inbox when their tab becomes active."""
+        if event.pane.id == "import":
+            self.query_one("#import-widget", ImportWidget).refresh_view()
+        elif event.pane.id is not None:
+            self._update_tab(event.pane.id)
+
+    def _update_tab(self, tab_id: str) -> None:
+        """Compute the forecast or refresh the dashboard of a stale tab.
+
+        Tabs whose data did not change since their last update are kept as is.
+        """
+        if tab_id not in self._stale_tabs:
+            return
+        self._stale_tabs.discard(tab_id)
         if tab_id == "analytics":
             self.query_one("#analytics-widget", AnalyticsWidget).compute_and_display()
         elif tab_id == "review":
             self.query_one("#review-widget", ReviewWidget).compute_and_display()
+        elif tab_id == "dashboard":
+            self.query_one("#dashboard-screen", DashboardScreen).refresh_data()
+
+    def _mark_stale(self, *tab_ids: str) -> None:
+        """Mark tabs stale, and update the active one right away."""
+        self._stale_tabs.update(tab_ids)
+        self._update_tab(self.query_one(TabbedContent).active)
+
+    def _prewarm_likely_tab(self) -> None:
+        """Update the tab most likely shown next, while the app is idle.
+
+        The forecast is computed in the background, so the tab is only
+        updated once no computation is running; switching to it then shows
+        its data at once.
+        """
+        # The timer may still fire while the widgets are removed on exit
+        if not self.is_running:
+            return
+        active_tab = self.query_one(TabbedContent).active
+        tab_id = LIKELY_NEXT_TABS.get(active_tab)
+        if tab_id is None or tab_id not in self._stale_tabs:
+            return
+        if any(
+            worker.group == REPORT_WORKER_GROUP and not worker.is_finished
+            for worker in self.workers
+        ):
+            return
+        logger.debug("Updating tab %s in advance", tab_id)
+        self._update_tab(tab_id)
+
+    def _apply_data_change(
+        self,
+        operation_ids: Collection[OperationId] = (),
+        target_keys: Collection[MatcherKey] = (),
+    ) -> None:
+        """Update the displays depending on changed operations or targets.
+
+        The changed rows of the operations table are updated in place, and
+        target lists are only reloaded when one of their targets changed.
+        The dashboard and the forecast are marked stale, and only computed
+        again if their tab is shown or likely to be shown next.
+
+        Args:
+            operation_ids: IDs of the operations whose fields or link changed.
+            target_keys: Keys of the created, modified or deleted targets.
+        """
+        link_types = {key.link_type for key in target_keys}
+        if LinkType.BUDGET in link_types:
+            self.query_one("#budgets-widget", BudgetsWidget).refresh_data()
+        if LinkType.PLANNED_OPERATION in link_types:
+            self.query_one(
+                "#planned-ops-widget", PlannedOperationsWidget
+            ).refresh_data()
+        # Changing a target may also change the links of any operation
+        self.query_one("#operations-screen", OperationsScreen).update_operations(
+            operation_ids
+        )
+
+        cancel_report_workers(self)
+        self.app_service.invalidate_report(operation_ids)
+        self._mark_stale(*DATA_TABS)
 
     def action_refresh_data(self) -> None:
         """Refresh data from the database."""
+        if self._persistent_account is not None:
+            self._reload_data()
+
+    def _reload_data(self) -> None:
+        """Reload the accounts and targets from the database and refresh all screens."""
         if self._persistent_account is not None:
             self._persistent_account.reload()
-            self._refresh_screens()
+        # Any operation may have changed: the balance indexes compare them all
+        cancel_report_workers(self)
+        self.app_service.reload_forecast()
+        self._refresh_screens()
 
     def save_changes(self) -> None:
         """Save changes to the database."""
@@ -309,10 +458,10 @@ class BudgetApp(
             self._persistent_account.save()
             self.notify(_("Changes saved"))
 
-    def on_data_refresh_requested(self, event: DataRefreshRequested) -> None:
-        """Handle data refresh request from child components."""
+    def on_data_changed(self, event: DataChanged) -> None:
+        """Handle data changes from child components."""
         event.stop()
-        self.action_refresh_data()
+        self._apply_data_change(event.operation_ids, event.target_keys)
 
     def on_save_requested(self, event: SaveRequested) -> None:
         """Handle save request from child components."""
@@ -336,10 +485,7 @@ class BudgetApp(
         """Handle import completion from import widget."""
         event.stop()
         if event.success:
-            # Reload data from database and refresh all screens
-            if self._persistent_account:
-                self._persistent_account.reload()
-            self._refresh_screens()
+            self._reload_data()
 
     def _on_file_selected(self, path: Path | None) -> None:
         """Handle file selection from browser."""
@@ -386,11 +532,9 @@ class BudgetApp(
             self.notify(_("No operation found"), severity="error")
             return
 
+        # The account in memory is already up to date
         self.save_changes()
-        # Reload data from database and refresh all screens
-        if self._persistent_account:
-            self._persistent_account.reload()
-        self._refresh_screens()
+        self._apply_data_change(self._categorizing_operation_ids)
 
         # Clear selection
         try:
@@ -464,7 +608,7 @@ class BudgetApp(
                 self.notify(_("{} link(s) removed").format(count))
             else:
                 self.notify(_("No links to remove"), severity="warning")
-            self._refresh_screens()
+            self._apply_data_change([op.unique_id for op in self._linking_operations])
             self._linking_operations = ()
             return
 
@@ -501,7 +645,7 @@ class BudgetApp(
                 _("{} operations linked to '{}'").format(count, target.description)
             )
 
-        self._refresh_screens()
+        self._apply_data_change([op.unique_id for op in self._linking_operations])
         self._linking_operations = ()
 
     # Plan operation from historic operation
@@ -559,14 +703,15 @@ class BudgetApp(
             self.notify(_("Operation '{}' created").format(saved_op.description))
 
             # Create automatic link
+            operation_ids: tuple[OperationId, ...] = ()
             if source is not None and saved_op.id is not None:
                 self.app_service.create_manual_link(
                     source, saved_op, source.operation_date
                 )
                 self.notify(_("Link created with source operation"))
+                operation_ids = (source.unique_id,)
 
-            self._refresh_planned_operations()
-            self._refresh_screens()
+            self._refresh_planned_operations(saved_op, operation_ids=operation_ids)
         except BudgetForecasterError as e:
             logger.error("Error creating planned operation: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -616,14 +761,14 @@ class BudgetApp(
             case Budget() as budget:
                 try:
                     if budget.id is None:
-                        self.app_service.add_budget(budget)
+                        saved = self.app_service.add_budget(budget)
                         self.notify(_("Budget '{}' created").format(budget.description))
                     else:
-                        self.app_service.update_budget(budget)
+                        saved = self.app_service.update_budget(budget)
                         self.notify(
                             _("Budget '{}' modified").format(budget.description)
                         )
-                    self._refresh_budgets()
+                    self._refresh_budgets(saved)
                 except BudgetForecasterError as e:
                     logger.error("Error saving budget: %s", e)
                     self.notify(_("Error: {}").format(e), severity="error")
@@ -636,9 +781,9 @@ class BudgetApp(
         if result is None or isinstance(result, EditAction):
             return
         try:
-            self.app_service.add_budget(result)
+            saved = self.app_service.add_budget(result)
             self.notify(_("Budget '{}' created").format(result.description))
-            self._refresh_budgets()
+            self._refresh_budgets(saved)
         except BudgetForecasterError as e:
             logger.error("Error saving budget: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -667,7 +812,7 @@ class BudgetApp(
         try:
             self.app_service.delete_budget(budget.id)
             self.notify(_("Budget '{}' deleted").format(budget.description))
-            self._refresh_budgets()
+            self._refresh_budgets(budget)
         except BudgetForecasterError as e:
             logger.error("Error deleting budget: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -675,11 +820,15 @@ class BudgetApp(
             logger.exception("Unexpected error deleting budget")
             self.notify(_("An unexpected error occurred"), severity="error")
 
-    def _refresh_budgets(self) -> None:
-        """Refresh budgets and forecast widgets."""
-        budgets_widget = self.query_one("#budgets-widget", BudgetsWidget)
-        budgets_widget.refresh_data()
-        self._refresh_forecast_widgets()
+    def _refresh_budgets(self, *budgets: Budget) -> None:
+        """Refresh the displays depending on changed budgets."""
+        self._apply_data_change(
+            target_keys=[
+                MatcherKey(LinkType.BUDGET, budget.id)
+                for budget in budgets
+                if budget.id is not None
+            ]
+        )
 
     # Planned operation event handlers
 
@@ -733,7 +882,7 @@ class BudgetApp(
                     operation.description, new_op.id
                 )
             )
-            self._refresh_planned_operations()
+            self._refresh_planned_operations(operation, new_op)
         except (ValueError, BudgetForecasterError) as e:
             logger.error("Error splitting planned operation: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -766,7 +915,7 @@ class BudgetApp(
                     budget.description, new_budget.id
                 )
             )
-            self._refresh_budgets()
+            self._refresh_budgets(budget, new_budget)
         except (ValueError, BudgetForecasterError) as e:
             logger.error("Error splitting budget: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -790,16 +939,16 @@ class BudgetApp(
             case PlannedOperation() as operation:
                 try:
                     if operation.id is None:
-                        self.app_service.add_planned_operation(operation)
+                        saved = self.app_service.add_planned_operation(operation)
                         self.notify(
                             _("Operation '{}' created").format(operation.description)
                         )
                     else:
-                        self.app_service.update_planned_operation(operation)
+                        saved = self.app_service.update_planned_operation(operation)
                         self.notify(
                             _("Operation '{}' modified").format(operation.description)
                         )
-                    self._refresh_planned_operations()
+                    self._refresh_planned_operations(saved)
                 except BudgetForecasterError as e:
                     logger.error("Error saving planned operation: %s", e)
                     self.notify(_("Error: {}").format(e), severity="error")
@@ -814,9 +963,9 @@ class BudgetApp(
         if result is None or isinstance(result, EditAction):
             return
         try:
-            self.app_service.add_planned_operation(result)
+            saved = self.app_service.add_planned_operation(result)
             self.notify(_("Operation '{}' created").format(result.description))
-            self._refresh_planned_operations()
+            self._refresh_planned_operations(saved)
         except BudgetForecasterError as e:
             logger.error("Error saving planned operation: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -845,7 +994,7 @@ class BudgetApp(
         try:
             self.app_service.delete_planned_operation(operation.id)
             self.notify(_("Operation '{}' deleted").format(operation.description))
-            self._refresh_planned_operations()
+            self._refresh_planned_operations(operation)
         except BudgetForecasterError as e:
             logger.error("Error deleting planned operation: %s", e)
             self.notify(_("Error: {}").format(e), severity="error")
@@ -853,26 +1002,31 @@ class BudgetApp(
             logger.exception("Unexpected error deleting planned operation")
             self.notify(_("An unexpected error occurred"), severity="error")
 
-    def _refresh_planned_operations(self) -> None:
-        """Refresh planned operations and forecast widgets."""
-        planned_ops_widget = self.query_one(
-            "#planned-ops-widget", PlannedOperationsWidget
+    def _refresh_planned_operations(
+        self,
+        *operations: PlannedOperation,
+        operation_ids: Collection[OperationId] = (),
+    ) -> None:
+        """Refresh the displays depending on changed planned operations.
+
+        Args:
+            *operations: The changed planned operations.
+            operation_ids: IDs of the historic operations whose link changed.
+        """
+        self._apply_data_change(
+            operation_ids,
+            [
+                MatcherKey(LinkType.PLANNED_OPERATION, operation.id)
+                for operation in operations
+                if operation.id is not None
+            ],
         )
-        planned_ops_widget.refresh_data()
-        self._refresh_forecast_widgets()
 
     def _refresh_forecast_widgets(self) -> None:
-        """Refresh analytics and review widgets (invalidate cache + recompute)."""
+        """Refresh analytics and review widgets, and recompute the active one."""
         self.query_one("#analytics-widget", AnalyticsWidget).refresh_data()
         self.query_one("#review-widget", ReviewWidget).refresh_data()
-
-        # Recompute the active tab immediately
-        tabbed = self.query_one(TabbedContent)
-        active_tab = tabbed.active
-        if active_tab == "analytics":
-            self.query_one("#analytics-widget", AnalyticsWidget).compute_and_display()
-        elif active_tab == "review":
-            self.query_one("#review-widget", ReviewWidget).compute_and_display()
+        self._mark_stale("analytics", "review")
 
 
 def run_app(config_path: Path) -> None:
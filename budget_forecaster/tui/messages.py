@@ -1,10 +1,33 @@
 """Shared messages for TUI components."""
 
+from collections.abc import Iterable
+
 from textual.message import Message
 
+from budget_forecaster.core.types import MatcherKey, OperationId
+
+
+class DataChanged(Message):
+    """Notify the app that some operations, links or targets changed.
+
+    Only the displays depending on them are updated, instead of all of them.
+    """
+
+    def __init__(
+        self,
+        operation_ids: Iterable[OperationId] = (),
+        target_keys: Iterable[MatcherKey] = (),
+    ) -> None:
+        """Initialize the message.
 
-class DataRefreshRequested(Message):
-    """Request the app to refresh all data displays."""
+        Args:
+            operation_ids: IDs of the operations whose fields or link changed.
+            target_keys: Keys of the planned operations and budgets that were
+                created, modified or deleted.
+        """
+        self.operation_ids = frozenset(operation_ids)
+        self.target_keys = frozenset(target_keys)
+        super().__init__()
 
 
 class SaveRequested(Message):
@@ -16,7 +16,7 @@ from budget_forecaster.domain.operation.historic_operation import HistoricOperat
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.i18n import _
 from budget_forecaster.services.operation.operation_link_service import (
-    compute_match_score,
+    compute_match_scores,
 )
 from budget_forecaster.tui.symbols import DisplaySymbol
 
@@ -196,7 +196,7 @@ class LinkIterationModal(ModalScreen[date | None]):
         options = []
 
         # Collect iterations within window
-        iterations_with_scores: list[tuple[DateRangeInterface, float]] = []
+        iterations: list[DateRangeInterface] = []
 
         for iteration in self._target.date_range.iterate_over_date_ranges(
             self._window_start - timedelta(days=31)  # Start a bit earlier
@@ -211,12 +211,16 @@ class LinkIterationModal(ModalScreen[date | None]):
             if iteration_date > self._window_end:
                 break
 
-            score = compute_match_score(
-                self._operation,
-                self._target,
-                iteration_date,
-            )
-            iterations_with_scores.append((iteration, score))
+            iterations.append(iteration)
+
+        scores = compute_match_scores(
+            (self._operation,),
+            self._target,
+            [iteration.start_date for iteration in iterations],
+        )[0]
+        iterations_with_scores = [
+            (iteration, float(score)) for iteration, score in zip(iterations, scores)
+        ]
 
         # Sort by score descending to highlight best match
         iterations_with_scores.sort(key=lambda x: x[1], reverse=True)
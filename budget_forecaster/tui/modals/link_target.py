@@ -1,6 +1,6 @@
 """Modal for selecting a link target (planned operation or budget)."""
 
-from datetime import timedelta
+from datetime import date, timedelta
 from typing import Any, Literal
 
 from rich.text import Text  # type: ignore[import]
@@ -17,7 +17,7 @@ from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.i18n import _
 from budget_forecaster.services.operation.operation_link_service import (
-    compute_match_score,
+    compute_match_scores,
 )
 from budget_forecaster.tui.symbols import DisplaySymbol
 
@@ -213,24 +213,20 @@ class LinkTargetModal(
         if not self._operations:
             return 0.0
 
-        best_score = 0.0
         first_op = self._operations[0]
 
         # Get iterations within a reasonable window around the operation date
         from_date = first_op.operation_date - timedelta(days=60)
+        iteration_dates: list[date] = []
         for iteration in target.date_range.iterate_over_date_ranges(from_date):
             # Stop if iteration is too far in the future
             if iteration.start_date > first_op.operation_date + timedelta(days=60):
                 break
+            iteration_dates.append(iteration.start_date)
 
-            score = compute_match_score(
-                first_op,
-                target,
-                iteration.start_date,
-            )
-            best_score = max(best_score, score)
-
-        return best_score
+        if not iteration_dates:
+            return 0.0
+        return float(compute_match_scores((first_op,), target, iteration_dates).max())
 
     def _get_current_link_name(self) -> str:
         """Get the name of the currently linked target."""
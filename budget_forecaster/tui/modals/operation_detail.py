@@ -11,13 +11,13 @@ from textual.widgets import Button, Static
 
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.date_range import SingleDay
-from budget_forecaster.core.types import LinkType
+from budget_forecaster.core.types import LinkType, MatcherKey
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.exceptions import BudgetForecasterError
 from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
-from budget_forecaster.tui.messages import DataRefreshRequested, SaveRequested
+from budget_forecaster.tui.messages import DataChanged, SaveRequested
 from budget_forecaster.tui.modals.category import CategoryModal
 from budget_forecaster.tui.modals.edit_actions import EditAction
 from budget_forecaster.tui.modals.link_iteration import LinkIterationModal
@@ -234,6 +234,7 @@ class OperationDetailModal(ModalScreen[bool]):
         """Handle category change result."""
         if result is not None:
             self._app_service.categorize_operations((self._operation_id,), result)
+            self.post_message(DataChanged((self._operation_id,)))
             self.post_message(SaveRequested())
             self._modified = True
 
@@ -271,14 +272,16 @@ class OperationDetailModal(ModalScreen[bool]):
 
             # Create automatic link between historic and planned operation
             operation = self._app_service.get_operation_by_id(self._operation_id)
+            target_keys: tuple[MatcherKey, ...] = ()
             if saved_op.id is not None:
                 self._app_service.create_manual_link(
                     operation, saved_op, operation.operation_date
                 )
                 self.app.notify(_("Link created with source operation"))
+                target_keys = (MatcherKey(LinkType.PLANNED_OPERATION, saved_op.id),)
 
             self._modified = True
-            self.post_message(DataRefreshRequested())
+            self.post_message(DataChanged((self._operation_id,), target_keys))
             self.post_message(SaveRequested())
 
             # Refresh displayed link
@@ -368,5 +371,5 @@ class OperationDetailModal(ModalScreen[bool]):
         self._modified = True
         self.query_one("#detail-link", Static).update(self._resolve_link_label())
         self.query_one("#btn-link", Button).label = self._link_button_label()
-        self.post_message(DataRefreshRequested())
+        self.post_message(DataChanged((self._operation_id,)))
         self.post_message(SaveRequested())
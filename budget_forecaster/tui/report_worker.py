@@ -0,0 +1,90 @@
+"""Computation of the forecast report in thread workers.
+
+Computing the report, or comparing scenarios, takes long enough to freeze
+the interface, so it runs in a thread worker. The worker is the cancellation
+token of the computation: starting another computation from the same widget,
+or changing the data, cancels it.
+"""
+
+from typing import Any
+
+from textual.app import App
+from textual.dom import DOMNode
+from textual.worker import Worker, get_current_worker
+
+from budget_forecaster.services.application_service import ApplicationService
+from budget_forecaster.services.forecast.scenario_evaluator import ScenarioComparison
+
+# Worker group of the report computations
+REPORT_WORKER_GROUP = "report"
+
+
+def start_report_worker(
+    node: DOMNode, app_service: ApplicationService, *, recompute: bool = False
+) -> Worker[None]:
+    """Compute the report in a thread worker, unless it is already computed.
+
+    The node receives a Worker.StateChanged message when the computation
+    completes, fails or is cancelled. A computation made stale by a data
+    change fails with ComputationCancelledError.
+
+    Args:
+        node: The node displaying the report.
+        app_service: The application service computing the report.
+        recompute: Whether to compute the report even if one is available,
+            e.g. loaded from the report cache.
+
+    Returns:
+        The worker of the computation.
+    """
+
+    def compute() -> None:
+        # Another widget may have computed the report meanwhile
+        if recompute or app_service.report is None:
+            app_service.compute_report(cancellation=get_current_worker())
+
+    return node.run_worker(
+        compute,
+        name="compute_report",
+        group=REPORT_WORKER_GROUP,
+        exclusive=True,
+        thread=True,
+        exit_on_error=False,
+    )
+
+
+def start_comparison_worker(
+    node: DOMNode, app_service: ApplicationService
+) -> Worker[ScenarioComparison]:
+    """Compare the what-if scenarios in a thread worker.
+
+    The node receives a Worker.StateChanged message when the comparison
+    completes, fails or is cancelled; the comparison is the result of the
+    worker.
+
+    Args:
+        node: The node displaying the comparison.
+        app_service: The application service comparing the scenarios.
+
+    Returns:
+        The worker of the comparison.
+    """
+    return node.run_worker(
+        lambda: app_service.compare_scenarios(cancellation=get_current_worker()),
+        name="compare_scenarios",
+        group=REPORT_WORKER_GROUP,
+        exclusive=True,
+        thread=True,
+        exit_on_error=False,
+    )
+
+
+def cancel_report_workers(app: App[Any]) -> None:
+    """Cancel the report computations and comparisons of all widgets.
+
+    Args:
+        app: The application running the computations.
+    """
+    for worker in app.workers:
+        if worker.group == REPORT_WORKER_GROUP:
+            worker.cancel()
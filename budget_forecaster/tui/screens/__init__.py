@@ -9,6 +9,7 @@ from budget_forecaster.tui.screens.imports import ImportWidget
 from budget_forecaster.tui.screens.operations import OperationsScreen
 from budget_forecaster.tui.screens.planned_operations import PlannedOperationsWidget
 from budget_forecaster.tui.screens.review import ReviewWidget
+from budget_forecaster.tui.screens.scenarios import ScenariosWidget
 
 __all__ = [
     "AnalyticsWidget",
@@ -20,4 +21,5 @@ __all__ = [
     "OperationsScreen",
     "PlannedOperationsWidget",
     "ReviewWidget",
+    "ScenariosWidget",
 ]
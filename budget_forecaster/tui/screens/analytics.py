@@ -1,4 +1,4 @@
-"""Analytics tab — balance evolution + expense breakdown."""
+"""Analytics tab — balance evolution + expense breakdown + scenarios."""
 
 from typing import Any
 
@@ -11,10 +11,11 @@ from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.tui.screens.balance import BalanceWidget
 from budget_forecaster.tui.screens.expense_breakdown import ExpenseBreakdownWidget
+from budget_forecaster.tui.screens.scenarios import ScenariosWidget
 
 
 class AnalyticsWidget(Vertical):
-    """Analytics tab with sub-views: balance evolution and expense breakdown."""
+    """Analytics tab with sub-views: balance evolution, expense breakdown, scenarios."""
 
     BINDINGS = [
         Binding("e", "edit_threshold", _("Edit threshold")),
@@ -52,15 +53,18 @@ class AnalyticsWidget(Vertical):
                     _("Balance evolution"), value=True, id="radio-balance"
                 )
                 yield RadioButton(_("Expense breakdown"), id="radio-breakdown")
+                yield RadioButton(_("Scenarios"), id="radio-scenarios")
         with ContentSwitcher(id="analytics-content", initial="balance"):
             yield BalanceWidget(id="balance")
             yield ExpenseBreakdownWidget(id="breakdown")
+            yield ScenariosWidget(id="scenarios")
 
     def set_app_service(self, service: ApplicationService) -> None:
-        """Set the application service on both sub-widgets."""
+        """Set the application service on all sub-widgets."""
         self._app_service = service
         self.query_one("#balance", BalanceWidget).set_app_service(service)
         self.query_one("#breakdown", ExpenseBreakdownWidget).set_app_service(service)
+        self.query_one("#scenarios", ScenariosWidget).set_app_service(service)
 
     def refresh_data(self) -> None:
         """Refresh data for the active sub-view."""
@@ -70,8 +74,10 @@ class AnalyticsWidget(Vertical):
         """Compute and display the active sub-view."""
         if self._active_view == "balance":
             self.query_one("#balance", BalanceWidget).compute_and_display()
-        else:
+        elif self._active_view == "breakdown":
             self.query_one("#breakdown", ExpenseBreakdownWidget).compute_and_display()
+        else:
+            self.query_one("#scenarios", ScenariosWidget).compute_and_display()
 
     def action_edit_threshold(self) -> None:
         """Delegate threshold edit to the breakdown widget."""
@@ -89,3 +95,7 @@ class AnalyticsWidget(Vertical):
             switcher.current = "breakdown"
             self._active_view = "breakdown"
             self.query_one("#breakdown", ExpenseBreakdownWidget).compute_and_display()
+        elif event.pressed.id == "radio-scenarios":
+            switcher.current = "scenarios"
+            self._active_view = "scenarios"
+            self.query_one("#scenarios", ScenariosWidget).compute_and_display()
@@ -7,11 +7,20 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.containers import Center, Horizontal, Vertical
 from textual.widgets import Button, Static
+from textual.worker import Worker, WorkerState
 
-from budget_forecaster.exceptions import AccountNotLoadedError, BudgetForecasterError
+from budget_forecaster.exceptions import (
+    AccountNotLoadedError,
+    BudgetForecasterError,
+    ComputationCancelledError,
+)
 from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.tui.modals.export_forecast import ExportForecastModal
+from budget_forecaster.tui.report_worker import (
+    REPORT_WORKER_GROUP,
+    start_report_worker,
+)
 from budget_forecaster.tui.symbols import DisplaySymbol
 
 logger = logging.getLogger(__name__)
@@ -60,6 +69,10 @@ class BalanceWidget(Vertical):
     BalanceWidget .computing {
         color: $warning;
     }
+
+    BalanceWidget #balance-chart.outdated {
+        color: $text-muted;
+    }
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -97,35 +110,42 @@ class BalanceWidget(Vertical):
             self._refresh_display()
             return
 
-        # Show computing state
+        # Show computing state, the previous chart stays visible meanwhile
         status = self.query_one("#balance-status", Static)
         status.update(_("Computing..."))
         status.add_class("computing")
+        self.query_one("#balance-chart", Static).add_class("outdated")
         self.query_one("#btn-export", Button).disabled = True
 
-        self.call_after_refresh(self._do_compute)
+        start_report_worker(self, self._app_service)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Display the report once computed in the background."""
+        if event.worker.group != REPORT_WORKER_GROUP or not event.worker.is_finished:
+            return
+        # A cancelled computation was replaced by another one
+        if event.state == WorkerState.CANCELLED:
+            return
 
-    def _do_compute(self) -> None:
-        """Perform the computation after UI refresh."""
         status = self.query_one("#balance-status", Static)
+        status.remove_class("computing")
+        status.update("")
+        self.query_one("#balance-chart", Static).remove_class("outdated")
 
-        try:
-            if self._app_service is not None:
-                self._app_service.compute_report()
+        if (e := event.worker.error) is None:
             self._refresh_display()
-        except AccountNotLoadedError as e:
+        elif isinstance(e, ComputationCancelledError):
+            logger.debug("Forecast computation made stale by a data change")
+        elif isinstance(e, AccountNotLoadedError):
             logger.error("No account loaded: %s", e)
             self.app.notify(f"{e}", severity="error")
-        except BudgetForecasterError as e:
+        elif isinstance(e, BudgetForecasterError):
             logger.error("Error computing forecast: %s", e)
             self.app.notify(_("Error: {}").format(e), severity="error")
-        except Exception:  # pylint: disable=broad-except
-            logger.exception("Unexpected error computing forecast")
+        else:
+            logger.error("Unexpected error computing forecast", exc_info=e)
             self.app.notify(_("An unexpected error occurred"), severity="error")
-        finally:
-            status.remove_class("computing")
-            status.update("")
-            self._update_export_button()
+        self._update_export_button()
 
     def _refresh_display(self) -> None:
         """Refresh chart and status after computation."""
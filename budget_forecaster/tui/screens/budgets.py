@@ -4,15 +4,18 @@ import logging
 from datetime import date
 
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.widgets import Button, DataTable, Static
 
 from budget_forecaster.core.date_range import RecurringDateRange
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
+from budget_forecaster.tui.messages import DataChanged
 from budget_forecaster.tui.widgets.filter_bar import FilterBar, StatusFilter
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,11 @@ logger = logging.getLogger(__name__)
 class BudgetsWidget(Vertical):
     """Widget for managing budgets."""
 
+    BINDINGS = [
+        Binding("w", "compare_without", _("What-if without")),
+        Binding("L", "relink_all", _("Relink all")),
+    ]
+
     DEFAULT_CSS = """
     BudgetsWidget {
         height: 1fr;
@@ -284,3 +292,22 @@ class BudgetsWidget(Vertical):
         """Handle button presses."""
         if event.button.id == "btn-add-budget":
             self.post_message(self.BudgetEditRequested(None))
+
+    def action_relink_all(self) -> None:
+        """Recompute the automatic links of all targets at once."""
+        if self._app_service is None:
+            return
+        result = self._app_service.relink_all_targets()
+        self.post_message(DataChanged(result.operation_ids))
+        self.app.notify(_("Links changed: {}").format(len(result.operation_ids)))
+
+    def action_compare_without(self) -> None:
+        """Add a what-if scenario without the selected budget."""
+        budget = self._selected_budget
+        if self._app_service is None or budget is None or budget.id is None:
+            return
+        name = _("Without {}").format(budget.description)
+        self._app_service.add_scenario(
+            Scenario(name, removed=frozenset({MatcherKey(LinkType.BUDGET, budget.id)}))
+        )
+        self.app.notify(_("Scenario added: {}").format(name))
@@ -254,9 +254,9 @@ class DashboardScreen(Vertical):
     def set_app_service(self, service: ApplicationService) -> None:
         """Set the application service and refresh all sections."""
         self._app_service = service
-        self._refresh()
+        self.refresh_data()
 
-    def _refresh(self) -> None:
+    def refresh_data(self) -> None:
         """Refresh all dashboard sections."""
         if not self._app_service:
             return
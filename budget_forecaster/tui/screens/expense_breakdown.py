@@ -164,9 +164,13 @@ class ExpenseBreakdownWidget(Vertical):
             months=self._period_months
         )
 
-        category_totals = self._app_service.get_category_totals(
-            OperationFilter(date_from=date_from, date_to=date_to, max_amount=0)
+        monthly_totals = self._app_service.get_monthly_category_totals(
+            date_from, date_to, OperationFilter(max_amount=0)
         )
+        category_totals = {
+            Category(str(category)): float(total)
+            for category, total in monthly_totals.sum(axis=1).items()
+        }
 
         if not category_totals:
             chart.update(_("No expense data for this period"))
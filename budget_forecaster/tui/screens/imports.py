@@ -188,9 +188,12 @@ class ImportWidget(Vertical):
         table.cursor_type = "row"
 
     def set_app_service(self, service: ApplicationService) -> None:
-        """Set the application service."""
+        """Set the application service.
+
+        The view is refreshed when the tab is shown, so the inbox is not
+        scanned at startup.
+        """
         self._app_service = service
-        self.refresh_view()
 
     def refresh_view(self) -> None:
         """Refresh the view with current data."""
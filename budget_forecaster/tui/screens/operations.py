@@ -1,5 +1,6 @@
 """Operations screen for viewing and filtering operations."""
 
+from collections.abc import Collection
 from typing import Any
 
 from textual.app import ComposeResult
@@ -107,6 +108,34 @@ class OperationsScreen(Vertical):
         filter_bar = self.query_one("#operations-filter-bar", FilterBar)
         filter_bar.update_status(filtered_count, self._total_count)
 
+    def update_operations(self, operation_ids: Collection[OperationId]) -> None:
+        """Update changed operations and links without reloading the table.
+
+        The table is only reloaded when a changed operation enters or leaves
+        the current filter.
+
+        Args:
+            operation_ids: IDs of the operations whose fields or link changed.
+        """
+        if not self._app_service:
+            return
+
+        table = self.query_one("#operations-table", OperationTable)
+        changed_operations = (
+            [op for op in self._app_service.operations if op.unique_id in operation_ids]
+            if operation_ids
+            else []
+        )
+        if any(
+            self._current_filter.matches(op) != table.has_operation(op.unique_id)
+            for op in changed_operations
+        ):
+            self._apply_filter()
+            return
+
+        links, targets = self._build_lookups()
+        table.update_operations(changed_operations, links, targets)
+
     def on_filter_bar_filter_changed(self, event: FilterBar.FilterChanged) -> None:
         """Handle filter changes from the filter bar."""
         event.stop()
@@ -132,12 +161,7 @@ class OperationsScreen(Vertical):
         """Open operation detail modal when an operation is selected."""
         event.stop()
         if self._app_service:
+            # Changes made in the modal are notified to the app with DataChanged
             self.app.push_screen(
-                OperationDetailModal(event.operation.unique_id, self._app_service),
-                self._on_detail_modal_closed,
+                OperationDetailModal(event.operation.unique_id, self._app_service)
             )
-
-    def _on_detail_modal_closed(self, modified: bool | None) -> None:
-        """Refresh operations table if data was modified."""
-        if modified:
-            self._apply_filter()
@@ -4,15 +4,18 @@ import logging
 from datetime import date
 
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.widgets import Button, DataTable, Static
 
 from budget_forecaster.core.date_range import RecurringDay
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
+from budget_forecaster.tui.messages import DataChanged
 from budget_forecaster.tui.widgets.filter_bar import FilterBar, StatusFilter
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,11 @@ logger = logging.getLogger(__name__)
 class PlannedOperationsWidget(Vertical):
     """Widget for managing planned operations."""
 
+    BINDINGS = [
+        Binding("w", "compare_without", _("What-if without")),
+        Binding("L", "relink_all", _("Relink all")),
+    ]
+
     DEFAULT_CSS = """
     PlannedOperationsWidget {
         height: 1fr;
@@ -277,3 +285,27 @@ class PlannedOperationsWidget(Vertical):
         """Handle button presses."""
         if event.button.id == "btn-add-op":
             self.post_message(self.OperationEditRequested(None))
+
+    def action_relink_all(self) -> None:
+        """Recompute the automatic links of all targets at once."""
+        if self._app_service is None:
+            return
+        result = self._app_service.relink_all_targets()
+        self.post_message(DataChanged(result.operation_ids))
+        self.app.notify(_("Links changed: {}").format(len(result.operation_ids)))
+
+    def action_compare_without(self) -> None:
+        """Add a what-if scenario without the selected planned operation."""
+        operation = self._selected_operation
+        if self._app_service is None or operation is None or operation.id is None:
+            return
+        name = _("Without {}").format(operation.description)
+        self._app_service.add_scenario(
+            Scenario(
+                name,
+                removed=frozenset(
+                    {MatcherKey(LinkType.PLANNED_OPERATION, operation.id)}
+                ),
+            )
+        )
+        self.app.notify(_("Scenario added: {}").format(name))
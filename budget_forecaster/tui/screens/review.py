@@ -11,9 +11,13 @@ from textual.binding import Binding
 from textual.containers import Center, Horizontal, Vertical
 from textual.widgets import Button, DataTable, Static
 from textual.widgets.data_table import RowKey
+from textual.worker import Worker, WorkerState
 
 from budget_forecaster.core.types import Category
-from budget_forecaster.exceptions import BudgetForecasterError
+from budget_forecaster.exceptions import (
+    BudgetForecasterError,
+    ComputationCancelledError,
+)
 from budget_forecaster.i18n import _
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.services.forecast.forecast_service import (
@@ -23,6 +27,10 @@ from budget_forecaster.services.forecast.forecast_service import (
 )
 from budget_forecaster.tui.modals.category_detail import CategoryDetailModal
 from budget_forecaster.tui.modals.threshold_edit import ThresholdEditModal
+from budget_forecaster.tui.report_worker import (
+    REPORT_WORKER_GROUP,
+    start_report_worker,
+)
 from budget_forecaster.tui.symbols import DisplaySymbol
 
 logger = logging.getLogger(__name__)
@@ -162,6 +170,10 @@ class ReviewWidget(Vertical):
         color: $warning;
     }
 
+    ReviewWidget #review-content.outdated {
+        opacity: 60%;
+    }
+
     ReviewWidget #margin-section {
         width: 55;
         height: auto;
@@ -283,28 +295,37 @@ class ReviewWidget(Vertical):
             self._load_summaries_and_display()
             return
 
+        # Show computing state, the previous month stays visible meanwhile
         status = self.query_one("#review-status", Static)
         status.update(_("Computing..."))
         status.add_class("computing")
+        self.query_one("#review-content").add_class("outdated")
 
-        self.call_after_refresh(self._do_compute)
+        start_report_worker(self, self._app_service)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Display the review once the report is computed in the background."""
+        if event.worker.group != REPORT_WORKER_GROUP or not event.worker.is_finished:
+            return
+        # A cancelled computation was replaced by another one
+        if event.state == WorkerState.CANCELLED:
+            return
 
-    def _do_compute(self) -> None:
-        """Perform the computation after UI refresh."""
         status = self.query_one("#review-status", Static)
-        try:
-            if self._app_service is not None:
-                self._app_service.compute_report()
+        status.remove_class("computing")
+        status.update("")
+        self.query_one("#review-content").remove_class("outdated")
+
+        if (e := event.worker.error) is None:
             self._load_summaries_and_display()
-        except BudgetForecasterError as e:
+        elif isinstance(e, ComputationCancelledError):
+            logger.debug("Forecast computation made stale by a data change")
+        elif isinstance(e, BudgetForecasterError):
             logger.error("Error computing forecast: %s", e)
             self.app.notify(_("Error: {}").format(e), severity="error")
-        except Exception:  # pylint: disable=broad-except
-            logger.exception("Unexpected error computing forecast")
+        else:
+            logger.error("Unexpected error computing forecast", exc_info=e)
             self.app.notify(_("An unexpected error occurred"), severity="error")
-        finally:
-            status.remove_class("computing")
-            status.update("")
 
     def _load_summaries_and_display(self) -> None:
         """Load summaries from cached report and display current month."""
@@ -356,6 +377,24 @@ class ReviewWidget(Vertical):
         # Update margin section
         self._update_margin(month_date)
 
+        # The adjacent months are the most likely shown next
+        self.call_after_refresh(self._prewarm_adjacent_months)
+
+    def _prewarm_adjacent_months(self) -> None:
+        """Compute the margins of the previous and next months in advance."""
+        if self._app_service is None:
+            return
+
+        current_month = date.today().replace(day=1)
+        for index in (self._current_index - 1, self._current_index + 1):
+            if not 0 <= index < len(self._summaries):
+                continue
+            month = self._summaries[index]["month"]
+            month_date = month.date() if hasattr(month, "date") else month
+            # The margin of past months is not shown
+            if (month_first := month_date.replace(day=1)) >= current_month:
+                self._app_service.get_available_margin(month_first)
+
     def _build_review_table(self, categories: dict[str, CategoryBudget]) -> None:
         """Build the review DataTable from category data."""
         table = self.query_one("#review-table", DataTable)
@@ -0,0 +1,177 @@
+"""Scenarios view — what-if scenarios side by side with the baseline."""
+
+import logging
+from typing import Any, cast
+
+import pandas as pd
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.widgets import DataTable, Static
+from textual.worker import Worker, WorkerState
+
+from budget_forecaster.exceptions import (
+    AccountNotLoadedError,
+    BudgetForecasterError,
+    ComputationCancelledError,
+)
+from budget_forecaster.i18n import _
+from budget_forecaster.services.application_service import ApplicationService
+from budget_forecaster.services.forecast.scenario_evaluator import (
+    BASELINE_SCENARIO,
+    ScenarioComparison,
+)
+from budget_forecaster.tui.report_worker import (
+    REPORT_WORKER_GROUP,
+    start_comparison_worker,
+)
+from budget_forecaster.tui.symbols import DisplaySymbol
+
+logger = logging.getLogger(__name__)
+
+
+def _fill_table(table: DataTable, values: pd.DataFrame) -> None:
+    """Fill a table with one row per month and one column per scenario."""
+    table.clear(columns=True)
+    table.add_column(_("Month"))
+    for name in values.columns:
+        label = _("Baseline") if name == BASELINE_SCENARIO else name
+        table.add_column(label, key=name)
+    for month, row in zip(cast(pd.DatetimeIndex, values.index), values.to_numpy()):
+        table.add_row(
+            month.strftime("%m/%Y"),
+            *(
+                Text(
+                    f"{value:,.0f} {DisplaySymbol.EURO}",
+                    justify="right",
+                    style="red" if value < 0 else "",
+                )
+                for value in row
+            ),
+        )
+
+
+class ScenariosWidget(Vertical):
+    """Scenarios view: balance and margin of each what-if scenario, per month."""
+
+    BINDINGS = [
+        Binding("x", "remove_scenario", _("Remove scenario")),
+    ]
+
+    DEFAULT_CSS = """
+    ScenariosWidget {
+        height: 1fr;
+    }
+
+    ScenariosWidget .scenarios-title {
+        text-style: bold;
+        padding: 0 1;
+    }
+
+    ScenariosWidget DataTable {
+        height: 1fr;
+    }
+
+    ScenariosWidget #scenarios-status {
+        dock: bottom;
+        height: 1;
+        color: $text-muted;
+    }
+
+    ScenariosWidget .computing {
+        color: $warning;
+    }
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._app_service: ApplicationService | None = None
+
+    def compose(self) -> ComposeResult:
+        yield Static(_("End-of-month balance"), classes="scenarios-title")
+        yield DataTable(id="scenarios-balances")
+        yield Static(_("Available margin"), classes="scenarios-title")
+        yield DataTable(id="scenarios-margins")
+        yield Static("", id="scenarios-status")
+
+    def on_mount(self) -> None:
+        """Select scenarios by column."""
+        for table in self.query(DataTable):
+            table.cursor_type = "column"
+            table.zebra_stripes = True
+
+    def set_app_service(self, service: ApplicationService) -> None:
+        """Set the application service."""
+        self._app_service = service
+
+    def compute_and_display(self) -> None:
+        """Compare the scenarios of the session in the background."""
+        if self._app_service is None:
+            return
+
+        status = self.query_one("#scenarios-status", Static)
+        status.update(_("Computing..."))
+        status.add_class("computing")
+        start_comparison_worker(self, self._app_service)
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Display the comparison once computed in the background."""
+        if event.worker.group != REPORT_WORKER_GROUP or not event.worker.is_finished:
+            return
+        # A cancelled comparison was replaced by another one
+        if event.state == WorkerState.CANCELLED:
+            return
+
+        status = self.query_one("#scenarios-status", Static)
+        status.remove_class("computing")
+        status.update("")
+
+        if (e := event.worker.error) is None:
+            self._display(cast(ScenarioComparison, event.worker.result))
+        elif isinstance(e, ComputationCancelledError):
+            logger.debug("Scenario comparison made stale by a data change")
+        elif isinstance(e, AccountNotLoadedError):
+            logger.error("No account loaded: %s", e)
+            self.app.notify(f"{e}", severity="error")
+        elif isinstance(e, BudgetForecasterError):
+            logger.error("Error comparing scenarios: %s", e)
+            self.app.notify(_("Error: {}").format(e), severity="error")
+        else:
+            logger.error("Unexpected error comparing scenarios", exc_info=e)
+            self.app.notify(_("An unexpected error occurred"), severity="error")
+
+    def _display(self, comparison: ScenarioComparison) -> None:
+        """Display the balances and margins of the scenarios."""
+        _fill_table(
+            self.query_one("#scenarios-balances", DataTable),
+            comparison.month_end_balances,
+        )
+        _fill_table(self.query_one("#scenarios-margins", DataTable), comparison.margins)
+        status = self.query_one("#scenarios-status", Static)
+        if len(comparison.balances.columns) == 1:
+            status.update(
+                _(
+                    "No scenario: press w on a planned operation or a budget "
+                    "to compare without it"
+                )
+            )
+        else:
+            status.update(
+                _("{} scenario(s) — x to remove the selected one").format(
+                    len(comparison.balances.columns) - 1
+                )
+            )
+
+    def action_remove_scenario(self) -> None:
+        """Remove the scenario of the selected column."""
+        if self._app_service is None:
+            return
+        table = self.query_one("#scenarios-margins", DataTable)
+        if isinstance(self.screen.focused, DataTable):
+            table = self.screen.focused
+        # The first columns are the months and the baseline
+        if 1 < table.cursor_column < len(table.columns):
+            name = table.ordered_columns[table.cursor_column].key.value
+            self._app_service.remove_scenario(str(name))
+            self.compute_and_display()
@@ -1,6 +1,6 @@
 """Widget for displaying operations in a table."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from textual.binding import Binding
@@ -15,6 +15,12 @@ from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.i18n import _
 from budget_forecaster.tui.symbols import DisplaySymbol
 
+# Rows kept in the table above and below a page of visible rows. Moving the
+# window measures all its rows again, so a small one keeps each move short.
+WINDOW_BUFFER = 100
+# Page height used before the table is laid out
+_DEFAULT_PAGE_HEIGHT = 50
+
 
 def get_row_key_at_cursor(table: DataTable) -> RowKey | None:  # type: ignore[type-arg]
     """Get the RowKey at the current cursor position.
@@ -37,8 +43,16 @@ def get_row_key_at_cursor(table: DataTable) -> RowKey | None:  # type: ignore[ty
         return None
 
 
-class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attributes
-    """A table widget for displaying operations with multi-selection support."""
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
+class OperationTable(DataTable[str]):
+    """A table widget for displaying operations with multi-selection support.
+
+    The operations are kept in a list in display order, and the table only
+    holds the rows of a window around the visible ones. The window moves when
+    the visible rows get close to its edges, so loading, filtering and
+    scrolling do not depend on the number of operations. Row indexes of the
+    table are relative to the window; selections are kept by operation ID.
+    """
 
     BINDINGS = [
         Binding("enter", "open_detail", _("Detail"), show=True),
@@ -73,13 +87,23 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the operation table."""
         super().__init__(**kwargs)
-        self._operations: dict[str, HistoricOperation] = {}
+        self._operations: list[HistoricOperation] = []
+        # Position of each operation in the display order
+        self._positions: dict[OperationId, int] = {}
+        # Positions of the first operation in the table, and of the one after
+        # the last
+        self._window_start = 0
+        self._window_end = 0
+        self._moving_window = False
+        self._window_shift_pending = False
         self._selected_ids: set[OperationId] = set()
         self._columns_added = False
+        self._column_keys: list[ColumnKey] = []
         self._date_column_key: ColumnKey | None = None
         self._links: dict[OperationId, OperationLink] = {}
         self._targets: dict[MatcherKey, TargetName] = {}
-        self._anchor_row: int | None = None
+        # Position of the operation where the current selection started
+        self._anchor_position: int | None = None
         self.cursor_type = "row"
         self.zebra_stripes = True
 
@@ -90,10 +114,10 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
     def _ensure_columns(self) -> None:
         """Ensure table columns exist (only once)."""
         if not self._columns_added:
-            column_keys = self.add_columns(
+            self._column_keys = self.add_columns(
                 _("Date"), _("Description"), _("Amount"), _("Category"), _("Link")
             )
-            self._date_column_key = column_keys[0]
+            self._date_column_key = self._column_keys[0]
             self._columns_added = True
 
     def load_operations(
@@ -104,26 +128,135 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
     ) -> None:
         """Load operations into the table.
 
+        Selected operations that are still displayed stay selected, and the
+        cursor stays on the highlighted operation if it is still displayed.
+
         Args:
-            operations: Operations to display.
+            operations: Operations to display, in display order.
             links: Mapping of operation_unique_id to OperationLink (optional).
             targets: Mapping of (type, id) to target name for display (optional).
         """
         self._ensure_columns()
-        self.clear()
-        self._operations.clear()
-        self._selected_ids.clear()
-
+        highlighted = self.get_highlighted_operation()
+
+        self._operations = list(operations)
+        self._positions = {
+            op.unique_id: position for position, op in enumerate(self._operations)
+        }
+        self._selected_ids.intersection_update(self._positions)
+        self._anchor_position = None
         self._links = links or {}
         self._targets = targets or {}
 
+        cursor = 0
+        if highlighted is not None:
+            cursor = self._positions.get(highlighted.unique_id, 0)
+        self._move_window(cursor, cursor)
+
+    def _page_height(self) -> int:
+        """Get the number of visible rows."""
+        return self.scrollable_content_region.height or _DEFAULT_PAGE_HEIGHT
+
+    def _move_window(self, center: int, cursor: int, top: int | None = None) -> None:
+        """Fill the table with the operations around a position.
+
+        Args:
+            center: Position of the operation the window is centered on.
+            cursor: Position of the operation to put the cursor on; it is
+                moved to the closest row of the window if outside.
+            top: Position of the operation to show on the first visible row.
+                The cursor is scrolled into view when omitted.
+        """
+        reach = WINDOW_BUFFER + self._page_height()
+        start = max(0, min(center - reach, len(self._operations) - 2 * reach))
+        end = min(len(self._operations), start + 2 * reach)
+
+        self._moving_window = True
+        try:
+            self.clear()
+            self._window_start, self._window_end = start, end
+            for op in self._operations[start:end]:
+                self._add_operation_row(op)
+            if start < end:
+                cursor = min(max(cursor, start), end - 1)
+                self.move_cursor(row=cursor - start, scroll=top is None)
+            if top is not None:
+                # Scroll before the next refresh, so the rows are only rendered
+                # once, at their place
+                self.scroll_to(y=top - start, animate=False, immediate=True)
+        finally:
+            self._moving_window = False
+
+        if top is not None:
+            # The scrolling above is limited by the size of the previous
+            # window, which is only updated on the next refresh
+            self.call_after_refresh(self.scroll_to, y=top - start, animate=False)
+
+    def _needs_window_shift(self) -> bool:
+        """Check whether the visible rows are close to an edge of the window."""
+        first_visible = round(self.scroll_y)
+        last_visible = first_visible + self._page_height()
+        margin = self._page_height()
+        return (self._window_start > 0 and first_visible < margin) or (
+            self._window_end < len(self._operations)
+            and self._window_end - self._window_start - last_visible < margin
+        )
+
+    def _shift_window(self) -> None:
+        """Center the window on the visible rows, which stay in place."""
+        self._window_shift_pending = False
+        if not self._needs_window_shift():
+            return
+        top = self._window_start + round(self.scroll_y)
+        self._move_window(top + self._page_height() // 2, self.cursor_position, top)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """Move the window once the visible rows get close to its edges."""
+        super().watch_scroll_y(old_value, new_value)
+        if (
+            self._moving_window
+            or self._window_shift_pending
+            or not self._needs_window_shift()
+        ):
+            return
+        # Dimensions of the table are only updated after a refresh
+        self._window_shift_pending = True
+        self.call_after_refresh(self._shift_window)
+
+    def update_operations(
+        self,
+        operations: Iterable[HistoricOperation],
+        links: Mapping[OperationId, OperationLink],
+        targets: Mapping[MatcherKey, TargetName],
+    ) -> None:
+        """Update operations in place, keeping their position in the table.
+
+        Only the cells that changed are redrawn, in the rows of the window;
+        the other rows are drawn from the new data when the window moves.
+        Operations that are not displayed are ignored.
+
+        Args:
+            operations: The changed operations.
+            links: Mapping of operation_unique_id to OperationLink, for all
+                operations.
+            targets: Mapping of (type, id) to target name, for all targets.
+        """
         for op in operations:
-            row_key = str(op.unique_id)
-            self._operations[row_key] = op
-            self._add_operation_row(op, row_key)
+            if (position := self._positions.get(op.unique_id)) is not None:
+                self._operations[position] = op
+        self._links = dict(links)
+        self._targets = dict(targets)
 
-    def _add_operation_row(self, op: HistoricOperation, row_key: str) -> None:
-        """Add a single operation row to the table."""
+        for op in self._operations[self._window_start : self._window_end]:
+            row_key = str(op.unique_id)
+            for column_key, displayed, value in zip(
+                self._column_keys, self.get_row(row_key), self._row_cells(op)
+            ):
+                if value != displayed:
+                    self.update_cell(row_key, column_key, value)
+
+    def _row_cells(self, op: HistoricOperation) -> tuple[str, ...]:
+        """Format the cells of an operation row."""
         # Format date with selection marker
         date_str = op.operation_date.strftime("%d/%m/%Y")
         if op.unique_id in self._selected_ids:
@@ -141,15 +274,18 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
             else:
                 link_str = "🔗"
 
-        self.add_row(
+        return (
             date_str,
             self._truncate(op.description, 70),
             amount_str,
             op.category.display_name,
             link_str,
-            key=row_key,
         )
 
+    def _add_operation_row(self, op: HistoricOperation) -> None:
+        """Add a single operation row to the table."""
+        self.add_row(*self._row_cells(op), key=str(op.unique_id))
+
     def _truncate(self, text: str, max_length: int) -> str:
         """Truncate text to max length with ellipsis."""
         if len(text) <= max_length:
@@ -158,23 +294,27 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
 
     def _update_row_style(self, op_id: OperationId) -> None:
         """Update the visual style for a selected/deselected row."""
-        if (row_key := str(op_id)) not in self._operations:
-            return
         if self._date_column_key is None:
             return
+        position = self._positions.get(op_id)
+        if position is None or not self._window_start <= position < self._window_end:
+            return
 
-        op = self._operations[row_key]
+        op = self._operations[position]
         date_str = op.operation_date.strftime("%d/%m/%Y")
         if op_id in self._selected_ids:
             date_str = f"{DisplaySymbol.PLAY} {date_str}"
 
-        self.update_cell(row_key, self._date_column_key, date_str)
+        self.update_cell(str(op_id), self._date_column_key, date_str)
+
+    @property
+    def cursor_position(self) -> int:
+        """Get the position of the highlighted operation among all operations."""
+        return self._window_start + self.cursor_row
 
     def get_highlighted_operation(self) -> HistoricOperation | None:
         """Get the currently highlighted operation."""
-        if (row_key := get_row_key_at_cursor(self)) is None:
-            return None
-        return self._operations.get(str(row_key.value))
+        return self.get_operation_by_row(self.cursor_row)
 
     def get_selected_operation(self) -> HistoricOperation | None:
         """Get the currently highlighted operation (for backward compatibility)."""
@@ -189,9 +329,7 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
         """
         if self._selected_ids:
             return tuple(
-                op
-                for op in self._operations.values()
-                if op.unique_id in self._selected_ids
+                op for op in self._operations if op.unique_id in self._selected_ids
             )
         # If no selection, return the highlighted operation
         if highlighted := self.get_highlighted_operation():
@@ -226,9 +364,20 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlight."""
-        if event.row_key is not None:
-            if operation := self._operations.get(str(event.row_key.value)):
-                self.post_message(self.OperationHighlighted(operation))
+        # Highlights of rows that left the table with the window are outdated
+        if event.row_key is None or event.row_key != get_row_key_at_cursor(self):
+            return
+        if operation := self.get_highlighted_operation():
+            self.post_message(self.OperationHighlighted(operation))
+
+    def action_scroll_top(self) -> None:
+        """Move the cursor to the first operation."""
+        self._move_window(0, 0)
+
+    def action_scroll_bottom(self) -> None:
+        """Move the cursor to the last operation."""
+        last = len(self._operations) - 1
+        self._move_window(last, last)
 
     def on_click(self, event: Click) -> None:
         """Handle clicks - clear selection on regular click, toggle on Ctrl+click."""
@@ -241,11 +390,10 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
         if row_index is None or row_index < 0 or row_index >= self.row_count:
             return
 
+        position = self._window_start + row_index
         if event.ctrl:
             # Ctrl+click: toggle individual selection
-            if (operation := self.get_operation_by_row(row_index)) is None:
-                return
-            self._toggle_selection(operation.unique_id, row_index)
+            self._toggle_selection(position)
             self.post_message(self.SelectionChanged(len(self._selected_ids)))
             event.stop()
             event.prevent_default()
@@ -253,85 +401,73 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
             # Regular click with existing selection: clear selection
             self.clear_selection()
             # Update anchor to clicked row
-            self._anchor_row = row_index
+            self._anchor_position = position
 
     def action_toggle_selection(self) -> None:
         """Toggle selection of the current row (Space key)."""
-        if self.cursor_row is None:
-            return
-        if (operation := self.get_highlighted_operation()) is None:
+        if not self._operations:
             return
 
-        self._toggle_selection(operation.unique_id, self.cursor_row)
+        self._toggle_selection(self.cursor_position)
         self.post_message(self.SelectionChanged(len(self._selected_ids)))
 
     def action_extend_selection_up(self) -> None:
         """Extend selection upward (Shift+Up)."""
-        if self.cursor_row is None or self.cursor_row <= 0:
-            return
-
-        # Set anchor if not set, and also select the anchor row
-        if self._anchor_row is None:
-            self._anchor_row = self.cursor_row
-            if anchor_op := self.get_operation_by_row(self._anchor_row):
-                self._selected_ids.add(anchor_op.unique_id)
-                self._update_row_style(anchor_op.unique_id)
-
-        # Move cursor up
-        new_row = self.cursor_row - 1
-        self.move_cursor(row=new_row)
-
-        # Select the new row
-        if operation := self.get_operation_by_row(new_row):
-            if operation.unique_id not in self._selected_ids:
-                self._selected_ids.add(operation.unique_id)
-                self._update_row_style(operation.unique_id)
-        self.post_message(self.SelectionChanged(len(self._selected_ids)))
+        self._extend_selection(-1)
 
     def action_extend_selection_down(self) -> None:
         """Extend selection downward (Shift+Down)."""
-        if self.cursor_row is None or self.cursor_row >= self.row_count - 1:
+        self._extend_selection(1)
+
+    def _extend_selection(self, step: int) -> None:
+        """Move the cursor by one row and select the rows it went through."""
+        position = self.cursor_position
+        if not 0 <= (new_position := position + step) < len(self._operations):
             return
 
         # Set anchor if not set, and also select the anchor row
-        if self._anchor_row is None:
-            self._anchor_row = self.cursor_row
-            if anchor_op := self.get_operation_by_row(self._anchor_row):
-                self._selected_ids.add(anchor_op.unique_id)
-                self._update_row_style(anchor_op.unique_id)
-
-        # Move cursor down
-        new_row = self.cursor_row + 1
-        self.move_cursor(row=new_row)
-
-        # Select the new row
-        if operation := self.get_operation_by_row(new_row):
-            if operation.unique_id not in self._selected_ids:
-                self._selected_ids.add(operation.unique_id)
-                self._update_row_style(operation.unique_id)
+        if self._anchor_position is None:
+            self._anchor_position = position
+            self._select(position)
+
+        # The window follows the cursor as it scrolls into view
+        if self._window_start <= new_position < self._window_end:
+            self.move_cursor(row=new_position - self._window_start)
+        else:
+            self._move_window(new_position, new_position)
+        self._select(new_position)
         self.post_message(self.SelectionChanged(len(self._selected_ids)))
 
     def action_select_all(self) -> None:
         """Select all operations (Ctrl+A)."""
-        for op in self._operations.values():
-            if op.unique_id not in self._selected_ids:
-                self._selected_ids.add(op.unique_id)
-                self._update_row_style(op.unique_id)
+        self._selected_ids.update(self._positions)
+        for op in self._operations[self._window_start : self._window_end]:
+            self._update_row_style(op.unique_id)
         self.post_message(self.SelectionChanged(len(self._selected_ids)))
 
-    def _toggle_selection(self, op_id: OperationId, row_index: int) -> None:
-        """Toggle selection for a single operation."""
-        if op_id in self._selected_ids:
+    def _select(self, position: int) -> None:
+        """Select the operation at a position."""
+        if (op_id := self._operations[position].unique_id) not in self._selected_ids:
+            self._selected_ids.add(op_id)
+            self._update_row_style(op_id)
+
+    def _toggle_selection(self, position: int) -> None:
+        """Toggle selection for the operation at a position."""
+        if (op_id := self._operations[position].unique_id) in self._selected_ids:
             self._selected_ids.remove(op_id)
         else:
             self._selected_ids.add(op_id)
-        self._anchor_row = row_index
+        self._anchor_position = position
         self._update_row_style(op_id)
 
     @property
     def operations(self) -> tuple[HistoricOperation, ...]:
         """Get the operations currently displayed in the table."""
-        return tuple(self._operations.values())
+        return tuple(self._operations)
+
+    def has_operation(self, operation_id: OperationId) -> bool:
+        """Check whether an operation is displayed in the table."""
+        return operation_id in self._positions
 
     @property
     def operation_count(self) -> int:
@@ -339,13 +475,7 @@ class OperationTable(DataTable[str]):  # pylint: disable=too-many-instance-attri
         return len(self._operations)
 
     def get_operation_by_row(self, row_index: int) -> HistoricOperation | None:
-        """Get operation at a specific row index."""
+        """Get operation at a specific row index of the table."""
         if row_index < 0 or row_index >= self.row_count:
             return None
-        try:
-            # pylint: disable=protected-access
-            if (row_key := self._row_locations.get_key(row_index)) is None:
-                return None
-            return self._operations.get(str(row_key.value))
-        except (KeyError, IndexError, AttributeError):
-            return None
+        return self._operations[self._window_start + row_index]
@@ -0,0 +1,82 @@
+"""Startup import budget of the TUI.
+
+Imports the TUI in a fresh interpreter with ``python -X importtime`` and checks
+that features not needed to show the first screen are imported on first use.
+
+Run locally:
+    pytest tests/benchmarks/test_startup_benchmark.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Total import time of the TUI, in microseconds. Generous so that slow CI
+# runners pass; the deferred modules below are the precise check.
+STARTUP_IMPORT_BUDGET_US = 3_000_000
+
+# Modules that must only be imported when their feature is first used
+DEFERRED_MODULES = (
+    # Charts of the Excel export
+    "matplotlib",
+    # Excel export
+    "xlsxwriter",
+    # Import of bank exports
+    "budget_forecaster.infrastructure.bank_adapters.bnp_paribas.bnp_paribas_bank_adapter",
+    "budget_forecaster.infrastructure.bank_adapters.swile.swile_bank_adapter",
+)
+
+
+@pytest.fixture(name="import_times", scope="module")
+def import_times_fixture() -> dict[str, int]:
+    """Import the TUI in a fresh interpreter.
+
+    Returns:
+        The cumulative import time of each imported module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import budget_forecaster.tui.app"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.mark.parametrize("module", DEFERRED_MODULES)
+def test_deferred_module_not_imported(
+    import_times: dict[str, int], module: str
+) -> None:
+    """Heavy features are not imported before they are used."""
+    assert module not in import_times
+
+
+def test_startup_import_budget(import_times: dict[str, int]) -> None:
+    """Importing the TUI stays within the startup budget."""
+    assert import_times["budget_forecaster.tui.app"] < STARTUP_IMPORT_BUDGET_US
+
+
+def test_main_does_not_import_tui() -> None:
+    """The entry point only imports the TUI once the configuration exists."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, budget_forecaster.main; "
+            "print('budget_forecaster.tui.app' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,110 @@
+"""Module to test the Scenario class."""
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import DateRange, RecurringDay
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario, scale_amount
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+
+
+@pytest.fixture(name="rent")
+def rent_fixture() -> PlannedOperation:
+    """Create a monthly rent."""
+    return PlannedOperation(
+        record_id=1,
+        description="Rent",
+        amount=Amount(-800.0),
+        category=Category.RENT,
+        date_range=RecurringDay(date(2025, 1, 5), relativedelta(months=1)),
+    )
+
+
+@pytest.fixture(name="groceries")
+def groceries_fixture() -> Budget:
+    """Create a groceries budget with the same ID as the rent."""
+    return Budget(
+        record_id=1,
+        description="Groceries",
+        amount=Amount(-300.0),
+        category=Category.GROCERIES,
+        date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+    )
+
+
+@pytest.fixture(name="forecast")
+def forecast_fixture(rent: PlannedOperation, groceries: Budget) -> Forecast:
+    """Create a forecast with a rent and a groceries budget."""
+    return Forecast((rent,), (groceries,))
+
+
+class TestScenario:
+    """Tests for Scenario.apply."""
+
+    def test_empty_scenario(self, forecast: Forecast) -> None:
+        """A scenario without changes keeps the forecast."""
+        assert Scenario("Same").apply(forecast) == forecast
+
+    def test_remove(self, forecast: Forecast, groceries: Budget) -> None:
+        """Removed targets are matched on their type and ID."""
+        scenario = Scenario(
+            "No rent", removed=frozenset({MatcherKey(LinkType.PLANNED_OPERATION, 1)})
+        )
+
+        assert scenario.apply(forecast) == Forecast((), (groceries,))
+
+    def test_modify(
+        self, forecast: Forecast, rent: PlannedOperation, groceries: Budget
+    ) -> None:
+        """Modified targets replace the target with the same type and ID."""
+        moved_rent = rent.replace(
+            date_range=RecurringDay(date(2025, 1, 10), relativedelta(months=1))
+        )
+        scenario = Scenario("Moved rent", modified=(moved_rent,))
+
+        assert scenario.apply(forecast) == Forecast((moved_rent,), (groceries,))
+
+    def test_add(self, forecast: Forecast, rent: PlannedOperation) -> None:
+        """Added targets are appended to the forecast, by type."""
+        gym = Budget(
+            record_id=None,
+            description="Gym",
+            amount=Amount(-30.0),
+            category=Category.OTHER,
+            date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+        )
+        scenario = Scenario("Gym", added=(gym,))
+
+        assert scenario.apply(forecast).operations == (rent,)
+        assert scenario.apply(forecast).budgets[-1] == gym
+
+    def test_modified_target_without_id(self, forecast: Forecast) -> None:
+        """A modified target must have an ID."""
+        scenario = Scenario(
+            "Invalid",
+            modified=(
+                PlannedOperation(
+                    record_id=None,
+                    description="New",
+                    amount=Amount(-10.0),
+                    category=Category.OTHER,
+                    date_range=RecurringDay(date(2025, 1, 1), relativedelta(months=1)),
+                ),
+            ),
+        )
+
+        with pytest.raises(ValueError):
+            scenario.apply(forecast)
+
+
+def test_scale_amount(groceries: Budget) -> None:
+    """scale_amount multiplies the amount and keeps the ID."""
+    raised = scale_amount(groceries, 1.1)
+
+    assert raised.id == groceries.id
+    assert raised.amount == pytest.approx(-330.0)
@@ -0,0 +1,91 @@
+"""Tests for SQLite target accounts (V9 migration)."""
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import DateRange, SingleDay
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(tmp_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(tmp_path / "test.db") as repo:
+        yield repo
+
+
+def _budget() -> Budget:
+    return Budget(
+        record_id=None,
+        description="Lunches",
+        amount=Amount(-150.0, "EUR"),
+        category=Category.GROCERIES,
+        date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+    )
+
+
+def _planned_operation() -> PlannedOperation:
+    return PlannedOperation(
+        record_id=None,
+        description="Meal vouchers",
+        amount=Amount(150.0, "EUR"),
+        category=Category.SALARY,
+        date_range=SingleDay(date(2025, 1, 25)),
+    )
+
+
+class TestTargetAccounts:
+    """Tests for the account assignment of targets."""
+
+    def test_set_and_get(self, repository: RepositoryInterface) -> None:
+        """Targets are assigned by type and ID, and can be reassigned."""
+        budget = MatcherKey(LinkType.BUDGET, repository.upsert_budget(_budget()))
+        operation = MatcherKey(
+            LinkType.PLANNED_OPERATION,
+            repository.upsert_planned_operation(_planned_operation()),
+        )
+
+        repository.set_target_account(budget, "Current")
+        repository.set_target_account(operation, "Current")
+        repository.set_target_account(budget, "Wallet")
+
+        assert repository.get_target_accounts() == {
+            budget: "Wallet",
+            operation: "Current",
+        }
+
+    def test_remove_assignment(self, repository: RepositoryInterface) -> None:
+        """Assigning None removes the assignment."""
+        budget = MatcherKey(LinkType.BUDGET, repository.upsert_budget(_budget()))
+        repository.set_target_account(budget, "Wallet")
+
+        repository.set_target_account(budget, None)
+
+        assert not repository.get_target_accounts()
+
+    def test_deleted_with_target(self, repository: RepositoryInterface) -> None:
+        """Deleting a target removes its assignment."""
+        budget_id = repository.upsert_budget(_budget())
+        op_id = repository.upsert_planned_operation(_planned_operation())
+        repository.set_target_account(MatcherKey(LinkType.BUDGET, budget_id), "Wallet")
+        repository.set_target_account(
+            MatcherKey(LinkType.PLANNED_OPERATION, op_id), "Wallet"
+        )
+
+        repository.delete_budget(budget_id)
+        repository.delete_planned_operation(op_id)
+
+        assert not repository.get_target_accounts()
@@ -0,0 +1,161 @@
+"""Tests for SQLite target version counters (V8 migration)."""
+
+# pylint: disable=too-few-public-methods
+
+import sqlite3
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import DateRange, SingleDay
+from budget_forecaster.core.types import (
+    Category,
+    LinkType,
+    MatcherKey,
+    TargetVersion,
+)
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.operation_link import OperationLink
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+def _budget(record_id: int | None = None, amount: float = -100.0) -> Budget:
+    return Budget(
+        record_id=record_id,
+        description="Groceries",
+        amount=Amount(amount, "EUR"),
+        category=Category.GROCERIES,
+        date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+    )
+
+
+def _planned_operation(record_id: int | None = None) -> PlannedOperation:
+    return PlannedOperation(
+        record_id=record_id,
+        description="Salary",
+        amount=Amount(2000.0, "EUR"),
+        category=Category.SALARY,
+        date_range=SingleDay(date(2025, 1, 25)),
+    )
+
+
+def _link(operation_id: int, target_type: LinkType, target_id: int) -> OperationLink:
+    return OperationLink(
+        operation_unique_id=operation_id,
+        target_type=target_type,
+        target_id=target_id,
+        iteration_date=date(2025, 1, 1),
+    )
+
+
+class TestTargetDefinitionVersions:
+    """Tests for the versions bumped by target changes."""
+
+    def test_new_targets_start_at_version_one(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """Inserted targets get a version without links."""
+        budget_id = repository.upsert_budget(_budget())
+        op_id = repository.upsert_planned_operation(_planned_operation())
+
+        assert repository.get_target_versions() == {
+            MatcherKey(LinkType.BUDGET, budget_id): TargetVersion(1, 0),
+            MatcherKey(LinkType.PLANNED_OPERATION, op_id): TargetVersion(1, 0),
+        }
+
+    def test_update_bumps_definition_version(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """Only the updated target's definition version changes."""
+        budget_id = repository.upsert_budget(_budget())
+        other_id = repository.upsert_budget(_budget())
+
+        repository.upsert_budget(_budget(budget_id, amount=-200.0))
+
+        versions = repository.get_target_versions()
+        assert versions[MatcherKey(LinkType.BUDGET, budget_id)] == TargetVersion(2, 0)
+        assert versions[MatcherKey(LinkType.BUDGET, other_id)] == TargetVersion(1, 0)
+
+    def test_delete_removes_versions(self, repository: RepositoryInterface) -> None:
+        """Deleted targets have no version anymore."""
+        op_id = repository.upsert_planned_operation(_planned_operation())
+
+        repository.delete_planned_operation(op_id)
+
+        assert not repository.get_target_versions()
+
+
+class TestTargetLinksVersions:
+    """Tests for the versions bumped by link changes."""
+
+    def test_link_changes_bump_links_version(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """Creating, moving and deleting links bump the involved targets."""
+        first = MatcherKey(LinkType.BUDGET, repository.upsert_budget(_budget()))
+        second = MatcherKey(LinkType.BUDGET, repository.upsert_budget(_budget()))
+
+        repository.upsert_link(_link(1, LinkType.BUDGET, first.target_id))
+        assert repository.get_target_versions()[first] == TargetVersion(1, 1)
+
+        # Moving the link bumps both the old and the new target
+        repository.upsert_link(_link(1, LinkType.BUDGET, second.target_id))
+        versions = repository.get_target_versions()
+        assert versions[first] == TargetVersion(1, 2)
+        assert versions[second] == TargetVersion(1, 1)
+
+        repository.delete_link(1)
+        assert repository.get_target_versions()[second] == TargetVersion(1, 2)
+
+    def test_links_to_unknown_targets_are_ignored(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """Links to missing targets don't create versions."""
+        repository.upsert_link(_link(1, LinkType.PLANNED_OPERATION, 99))
+
+        assert not repository.get_target_versions()
+
+
+class TestMigrationV8:
+    """Tests for the migration of an existing database."""
+
+    def test_existing_targets_get_versions(self, temp_db_path: Path) -> None:
+        """Targets created before the migration start at version one."""
+        with SqliteRepository(temp_db_path) as repository:
+            budget_id = repository.upsert_budget(_budget())
+
+        conn = sqlite3.connect(temp_db_path)
+        conn.executescript(
+            """DROP TABLE target_versions;
+               DROP TRIGGER budgets_inserted;
+               UPDATE schema_version SET version = 7;"""
+        )
+        conn.close()
+
+        with SqliteRepository(temp_db_path) as repository:
+            assert repository.get_target_versions() == {
+                MatcherKey(LinkType.BUDGET, budget_id): TargetVersion(1, 0)
+            }
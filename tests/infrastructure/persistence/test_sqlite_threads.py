@@ -0,0 +1,81 @@
+"""Tests for the use of the SQLite repository from worker threads."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(tmp_path: Path) -> Iterator[SqliteRepository]:
+    """Create an initialized repository."""
+    with SqliteRepository(tmp_path / "test.db") as repo:
+        yield repo
+
+
+def _run_in_thread(function: object) -> None:
+    assert callable(function)
+    thread = threading.Thread(target=function)
+    thread.start()
+    thread.join()
+
+
+class TestThreadConnections:
+    """Tests for the connection of each thread."""
+
+    def test_read_from_worker_thread(self, repository: SqliteRepository) -> None:
+        """A worker thread reads the data written by the main thread."""
+        repository.set_setting("margin_threshold", "500")
+        values: list[str | None] = []
+
+        _run_in_thread(
+            lambda: values.append(repository.get_setting("margin_threshold"))
+        )
+
+        assert values == ["500"]
+
+    def test_finished_thread_connection_closed(
+        self, repository: SqliteRepository
+    ) -> None:
+        """The connection of a finished thread is closed by the next thread."""
+        connections: list[sqlite3.Connection] = []
+
+        _run_in_thread(
+            lambda: connections.append(
+                repository._get_connection()  # pylint: disable=protected-access
+            )
+        )
+        _run_in_thread(lambda: repository.get_setting("margin_threshold"))
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+
+    def test_close_closes_all_connections(self, tmp_path: Path) -> None:
+        """Closing the repository closes the connections of worker threads."""
+        repository = SqliteRepository(tmp_path / "test.db")
+        repository.initialize()
+        connections: list[sqlite3.Connection] = []
+        release = threading.Event()
+
+        def worker() -> None:
+            # pylint: disable-next=protected-access
+            connections.append(repository._get_connection())
+            release.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while not connections:
+            release.wait(0.01)
+
+        repository.close()
+        release.set()
+        thread.join()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
@@ -46,6 +46,24 @@ class TestConfigDefaults:
         assert config.inbox_exclude_patterns == []
         assert config.inbox_include_patterns == []
 
+    def test_default_link_lookback(self) -> None:
+        """Test that a week before an import is linked again by default."""
+        config = Config()
+        assert config.link_lookback_days == 7
+
+    def test_default_inbox_path_looked_up_on_first_use(self) -> None:
+        """Test that the download directory is only looked up when needed."""
+        with patch(
+            "budget_forecaster.infrastructure.config._get_user_download_dir",
+            return_value=Path("/downloads"),
+        ) as mock_lookup:
+            config = Config()
+            mock_lookup.assert_not_called()
+
+            assert config.inbox_path == Path("/downloads")
+            assert config.inbox_path == Path("/downloads")
+            mock_lookup.assert_called_once()
+
     def test_default_logging_config(self) -> None:
         """Test that default logging config is None."""
         config = Config()
@@ -86,6 +104,7 @@ class TestConfigParseYaml:
         assert config.inbox_path == Path("inbox")
         assert config.inbox_exclude_patterns == ["*.tmp", "*.bak"]
         assert config.inbox_include_patterns == ["*.xls", "*.csv"]
+        assert config.link_lookback_days == 14
         assert config.backup == BackupConfig(
             enabled=False, max_backups=10, directory=Path("backups")
         )
@@ -6,7 +6,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.types import BalanceResolution, Category
 from budget_forecaster.services.account.account_analysis_renderer import (
     AccountAnalysisRendererExcel,
 )
@@ -169,6 +169,30 @@ class TestAccountAnalysisRendererExcel:
         assert "Min. Balance" in balance_df.columns
         assert "Margin" in balance_df.columns
 
+    def test_balance_evolution_sheet_weekly(
+        self, sample_report: AccountAnalysisReport, tmp_path: Path
+    ) -> None:
+        """Weekly balances keep the lowest balance of each week."""
+        daily = sample_report.balance_evolution_per_day["Balance"]
+        weekly = pd.DataFrame(
+            {
+                "Balance": daily.resample("W-SUN").last(),
+                "Min. Balance": daily.resample("W-SUN").min() - 100.0,
+            }
+        )
+        report = sample_report._replace(
+            balance_evolution_per_day=weekly, resolution=BalanceResolution.WEEKLY
+        )
+        output_path = tmp_path / "report.xlsx"
+        with AccountAnalysisRendererExcel(output_path) as renderer:
+            renderer(report)
+
+        balance_df = pd.read_excel(
+            output_path, sheet_name="Balance evolution", index_col=0
+        )
+        assert list(balance_df.columns) == ["Balance", "Margin", "Min. Balance"]
+        assert balance_df["Min. Balance"].iloc[0] == pytest.approx(daily.min() - 100.0)
+
     def test_budget_statistics_sheet_data(
         self, sample_report: AccountAnalysisReport, tmp_path: Path
     ) -> None:
@@ -2,6 +2,7 @@
 # pylint: disable=too-few-public-methods
 from datetime import date
 
+import pandas as pd
 import pytest
 from dateutil.relativedelta import relativedelta
 
@@ -12,7 +13,7 @@ from budget_forecaster.core.date_range import (
     RecurringDay,
     SingleDay,
 )
-from budget_forecaster.core.types import Category, LinkType
+from budget_forecaster.core.types import BalanceResolution, Category, LinkType
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.forecast.forecast import Forecast
 from budget_forecaster.domain.operation.budget import Budget
@@ -20,6 +21,7 @@ from budget_forecaster.domain.operation.historic_operation import HistoricOperat
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.account.account_analyzer import AccountAnalyzer
+from budget_forecaster.services.account.balance_index import BalanceIndex
 
 
 @pytest.fixture
@@ -203,6 +205,91 @@ class TestComputeBalanceEvolution:
                 expected_balance
             ), f"Date: {date_str}"
 
+    def test_initial_balance_from_balance_index(self, account: Account) -> None:
+        """A given balance index provides the balance before the balance date."""
+        balance_index = BalanceIndex(account._replace(balance=500.0))
+        analyzer = AccountAnalyzer(
+            account, Forecast((), ()), balance_index=balance_index
+        )
+        df = analyzer.compute_balance_evolution_per_day(
+            date(2023, 1, 1), date(2023, 3, 1)
+        )
+        assert df.loc["2023-01-01"]["Balance"] == 580.0
+        assert df.loc["2023-03-01"]["Balance"] == 500.0
+
+
+class TestComputeBalanceEvolutionResolution:
+    """Tests for compute_balance_evolution at weekly and monthly resolutions."""
+
+    @pytest.mark.parametrize(
+        "resolution,freq",
+        [(BalanceResolution.WEEKLY, "W-SUN"), (BalanceResolution.MONTHLY, "ME")],
+    )
+    @pytest.mark.parametrize(
+        "start_date,end_date",
+        [
+            (date(2023, 1, 10), date(2023, 8, 17)),
+            (date(2023, 3, 1), date(2023, 7, 31)),
+            (date(2023, 3, 20), date(2023, 6, 4)),
+        ],
+    )
+    def test_matches_daily_balances(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        account: Account,
+        planned_operations: tuple[PlannedOperation, ...],
+        budgets: tuple[Budget, ...],
+        resolution: BalanceResolution,
+        freq: str,
+        start_date: date,
+        end_date: date,
+    ) -> None:
+        """Each bucket has the last and lowest daily balance of its days."""
+        analyzer = AccountAnalyzer(account, Forecast(planned_operations, budgets))
+        daily = analyzer.compute_balance_evolution_per_day(start_date, end_date)
+        buckets = daily["Balance"].groupby(pd.Grouper(freq=freq))
+
+        df = analyzer.compute_balance_evolution(start_date, end_date, resolution)
+
+        assert df.index[-1].date() == end_date
+        assert df["Balance"].tolist() == pytest.approx(buckets.last().tolist())
+        assert df["Min. Balance"].tolist() == pytest.approx(buckets.min().tolist())
+
+    def test_monthly_buckets(
+        self, account: Account, budgets: tuple[Budget, ...]
+    ) -> None:
+        """Monthly rows end on the last day of each month, clipped to end_date."""
+        analyzer = AccountAnalyzer(account, Forecast((), budgets))
+        df = analyzer.compute_balance_evolution(
+            date(2023, 3, 1), date(2023, 5, 15), BalanceResolution.MONTHLY
+        )
+
+        assert [ts.date() for ts in df.index] == [
+            date(2023, 3, 31),
+            date(2023, 4, 30),
+            date(2023, 5, 15),
+        ]
+        assert df.loc["2023-03-31"]["Balance"] == pytest.approx(700.0)
+        assert df.loc["2023-04-30"]["Min. Balance"] == pytest.approx(150.0)
+
+    def test_daily_resolution(self, account: Account) -> None:
+        """The daily resolution is the balance evolution per day."""
+        analyzer = AccountAnalyzer(account, Forecast((), ()))
+        df = analyzer.compute_balance_evolution(date(2023, 1, 1), date(2023, 3, 1))
+
+        assert df.equals(
+            analyzer.compute_balance_evolution_per_day(
+                date(2023, 1, 1), date(2023, 3, 1)
+            )
+        )
+
+    def test_start_date_after_end_date_raises(self, account: Account) -> None:
+        """start_date > end_date raises ValueError."""
+        analyzer = AccountAnalyzer(account, Forecast((), ()))
+        with pytest.raises(ValueError, match="start_date must be <= end_date"):
+            analyzer.compute_balance_evolution(
+                date(2023, 3, 1), date(2023, 1, 1), BalanceResolution.WEEKLY
+            )
+
 
 class TestComputeOperations:
     """Tests for compute_operations."""
@@ -471,6 +558,43 @@ class TestComputeBudgetForecast:
         # Forecast = Actual (-100) + not-yet-realized (-200) = -300
         assert march["Forecast"] == -300.0
 
+    def test_layout_sorted_with_total_row(
+        self,
+        account: Account,
+        planned_operations: tuple[PlannedOperation, ...],
+        budgets: tuple[Budget, ...],
+    ) -> None:
+        """Rows are sorted categories plus Total, columns are (month, column)."""
+        analyzer = AccountAnalyzer(account, Forecast(planned_operations, budgets))
+        df = analyzer.compute_budget_forecast(date(2023, 1, 1), date(2023, 5, 1))
+
+        assert list(df.index) == sorted(df.index[:-1]) + ["Total"]
+        assert list(df.columns.get_level_values(0).unique()) == list(
+            pd.date_range("2023-01-01", "2023-05-01", freq="MS")
+        )
+        assert list(df.columns.get_level_values(1)[:5]) == sorted(
+            df.columns.get_level_values(1)[:5]
+        )
+        assert (df.loc["Total"] == df.iloc[:-1].sum()).all()
+        assert all(pd.api.types.is_integer_dtype(dtype) for dtype in df.dtypes)
+
+    def test_nothing_to_report(self) -> None:
+        """Without operations nor forecast, only an empty Total row is returned."""
+        empty_account = Account(
+            name="Empty",
+            balance=0.0,
+            currency="EUR",
+            balance_date=date(2023, 3, 1),
+            operations=(),
+        )
+
+        df = AccountAnalyzer(empty_account, Forecast((), ())).compute_budget_forecast(
+            date(2023, 1, 1), date(2023, 5, 1)
+        )
+
+        assert list(df.index) == ["Total"]
+        assert df.columns.empty
+
 
 class TestComputeBudgetStatistics:
     """Tests for compute_budget_statistics."""
@@ -711,3 +835,13 @@ class TestComputeReport:
         # Budget statistics has expected columns
         assert "Total" in report.budget_statistics.columns
         assert "Monthly average" in report.budget_statistics.columns
+
+    def test_report_resolution(self, account: Account) -> None:
+        """The resolution of the report applies to its balance evolution."""
+        analyzer = AccountAnalyzer(account, Forecast((), ()))
+        report = analyzer.compute_report(
+            date(2023, 1, 1), date(2023, 6, 30), BalanceResolution.MONTHLY
+        )
+
+        assert report.resolution == BalanceResolution.MONTHLY
+        assert len(report.balance_evolution_per_day) == 6
@@ -0,0 +1,224 @@
+"""Module to test the BalanceIndex class."""
+from datetime import date
+
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.types import Category
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.services.account.account_forecaster import AccountForecaster
+from budget_forecaster.services.account.balance_index import BalanceIndex
+
+
+@pytest.fixture(name="account")
+def account_fixture() -> Account:
+    """Create an account with unsorted operations, one after the balance date."""
+    operations = tuple(
+        HistoricOperation(
+            unique_id=unique_id,
+            description=f"Operation {unique_id}",
+            amount=Amount(amount),
+            category=Category.GROCERIES,
+            operation_date=operation_date,
+        )
+        for unique_id, amount, operation_date in (
+            (1, -30.0, date(2023, 2, 15)),
+            (2, -50.0, date(2023, 1, 15)),
+            (3, 200.0, date(2023, 2, 15)),
+            (4, -10.0, date(2023, 3, 5)),
+        )
+    )
+    return Account(
+        name="Test Account",
+        balance=1000.0,
+        currency="EUR",
+        balance_date=date(2023, 2, 28),
+        operations=operations,
+    )
+
+
+class TestBalanceIndex:
+    """Test the BalanceIndex class."""
+
+    @pytest.mark.parametrize(
+        "target_date,expected",
+        [
+            (date(2023, 2, 28), 1000.0),
+            (date(2023, 2, 15), 1000.0),
+            (date(2023, 2, 14), 830.0),
+            (date(2023, 1, 15), 830.0),
+            (date(2023, 1, 14), 880.0),
+            (date(2022, 1, 1), 880.0),
+        ],
+    )
+    def test_balance_at(
+        self, account: Account, target_date: date, expected: float
+    ) -> None:
+        """Operations after the target date are subtracted from the balance."""
+        assert BalanceIndex(account).balance_at(target_date) == expected
+
+    def test_matches_account_forecaster(self, account: Account) -> None:
+        """The balance is the one of the past state of AccountForecaster."""
+        balance_index = BalanceIndex(account)
+        account_forecaster = AccountForecaster(account, Forecast((), ()))
+
+        for day in range(1, 29):
+            target_date = date(2023, 2, day)
+            assert balance_index.balance_at(target_date) == (
+                account_forecaster(target_date).balance
+            )
+
+    def test_empty_account(self, account: Account) -> None:
+        """Without operations, the balance never changes."""
+        balance_index = BalanceIndex(account._replace(operations=()))
+
+        assert balance_index.balance_at(date(2020, 1, 1)) == 1000.0
+
+    def test_future_date_rejected(self, account: Account) -> None:
+        """Dates after the balance date are not in the past."""
+        with pytest.raises(ValueError):
+            BalanceIndex(account).balance_at(date(2023, 3, 1))
+
+
+class TestUpdate:
+    """Test the incremental update of the BalanceIndex."""
+
+    @staticmethod
+    def _operation(
+        unique_id: int, amount: float, operation_date: date
+    ) -> HistoricOperation:
+        return HistoricOperation(
+            unique_id=unique_id,
+            description=f"Operation {unique_id}",
+            amount=Amount(amount),
+            category=Category.GROCERIES,
+            operation_date=operation_date,
+        )
+
+    def test_imported_operations(self, account: Account) -> None:
+        """Imported operations and the new balance are taken into account."""
+        balance_index = BalanceIndex(account)
+        imported = account._replace(
+            balance=900.0,
+            balance_date=date(2023, 3, 31),
+            operations=(
+                *account.operations,
+                self._operation(5, -100.0, date(2023, 3, 20)),
+                self._operation(6, 20.0, date(2023, 1, 20)),
+            ),
+        )
+
+        balance_index.update(imported)
+
+        for day in (1, 19, 20, 31):
+            target_date = date(2023, 3, day)
+            assert balance_index.balance_at(target_date) == (
+                BalanceIndex(imported).balance_at(target_date)
+            )
+        assert balance_index.balance_at(date(2023, 1, 19)) == 820.0
+
+    def test_edited_and_removed_operations(self, account: Account) -> None:
+        """Edited operations are moved, removed ones no longer count."""
+        balance_index = BalanceIndex(account)
+        edited = account._replace(
+            operations=(
+                self._operation(1, -30.0, date(2023, 1, 10)),
+                *account.operations[2:],
+            )
+        )
+
+        balance_index.update(edited)
+
+        # Operation 2 was removed, operation 1 moved before January 15th
+        assert balance_index.balance_at(date(2023, 1, 12)) == 800.0
+        assert balance_index.balance_at(date(2023, 1, 9)) == 830.0
+        assert balance_index.balance_at(date(2023, 1, 9)) == (
+            BalanceIndex(edited).balance_at(date(2023, 1, 9))
+        )
+
+    def test_reported_changes(self, account: Account) -> None:
+        """Only the reported operations are compared."""
+        balance_index = BalanceIndex(account)
+        edited = account._replace(
+            operations=(
+                account.operations[0],
+                self._operation(2, -50.0, date(2023, 2, 20)),
+                self._operation(3, 100.0, date(2023, 2, 15)),
+                account.operations[3],
+            )
+        )
+
+        balance_index.report_changes([2])
+        balance_index.update(edited)
+
+        # Operation 2 moved after February 15th, the unreported edit of
+        # operation 3 is ignored
+        assert balance_index.balance_at(date(2023, 2, 14)) == 880.0
+        assert balance_index.balance_at(date(2023, 2, 19)) == 1050.0
+
+    def test_reported_changes_with_imported_operations(self, account: Account) -> None:
+        """All operations are compared when some were added meanwhile."""
+        balance_index = BalanceIndex(account)
+        imported = account._replace(
+            operations=(
+                *account.operations,
+                self._operation(5, 20.0, date(2023, 1, 20)),
+            )
+        )
+
+        balance_index.report_changes([1])
+        balance_index.update(imported)
+
+        assert balance_index.balance_at(date(2023, 1, 19)) == 810.0
+
+    def test_duplicate_entries_removed_once(self, account: Account) -> None:
+        """Removing one of two identical operations keeps the other."""
+        duplicated = account._replace(
+            operations=(
+                *account.operations,
+                self._operation(5, -30.0, date(2023, 2, 15)),
+            )
+        )
+        balance_index = BalanceIndex(duplicated)
+
+        balance_index.update(duplicated._replace(operations=duplicated.operations[1:]))
+
+        # 860.0 with both operations, 800.0 without any
+        assert balance_index.balance_at(date(2023, 2, 14)) == 830.0
+
+    def test_empty_report_then_edited_reload(self, account: Account) -> None:
+        """Reporting no operation does not hide the edits of a later reload."""
+        balance_index = BalanceIndex(account)
+        edited = account._replace(
+            operations=(
+                account.operations[0],
+                self._operation(2, -500.0, date(2023, 1, 15)),
+                *account.operations[2:],
+            )
+        )
+
+        balance_index.report_changes(())
+        balance_index.update(edited)
+
+        assert balance_index.balance_at(date(2023, 1, 14)) == (
+            BalanceIndex(edited).balance_at(date(2023, 1, 14))
+        )
+
+    def test_forgotten_changes(self, account: Account) -> None:
+        """After forget_changes, unreported edits are compared again."""
+        balance_index = BalanceIndex(account)
+        edited = account._replace(
+            operations=(
+                self._operation(1, -30.0, date(2023, 1, 10)),
+                self._operation(2, -500.0, date(2023, 1, 15)),
+                *account.operations[2:],
+            )
+        )
+
+        balance_index.report_changes([1])
+        balance_index.forget_changes()
+        balance_index.update(edited)
+
+        assert balance_index.balance_at(date(2023, 1, 14)) == 1300.0
@@ -0,0 +1,160 @@
+"""Module to test the ForecastBacktester class."""
+# pylint: disable=too-few-public-methods
+import math
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import (
+    DateRange,
+    RecurringDateRange,
+    RecurringDay,
+)
+from budget_forecaster.core.types import Category
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.services.account.account_forecaster import AccountForecaster
+from budget_forecaster.services.account.forecast_backtester import (
+    ForecastBacktester,
+    monthly_origins,
+)
+
+
+@pytest.fixture(name="forecast")
+def forecast_fixture() -> Forecast:
+    """Create a forecast with a salary, a rent and a groceries budget."""
+    return Forecast(
+        (
+            PlannedOperation(
+                record_id=1,
+                description="Salary",
+                amount=Amount(2000.0),
+                category=Category.SALARY,
+                date_range=RecurringDay(date(2022, 1, 1), relativedelta(months=1)),
+            ),
+            PlannedOperation(
+                record_id=2,
+                description="Rent",
+                amount=Amount(-800.0),
+                category=Category.RENT,
+                date_range=RecurringDay(date(2022, 1, 5), relativedelta(months=1)),
+            ),
+        ),
+        (
+            Budget(
+                record_id=1,
+                description="Groceries",
+                amount=Amount(-310.0),
+                category=Category.GROCERIES,
+                date_range=RecurringDateRange(
+                    DateRange(date(2022, 1, 1), relativedelta(months=1)),
+                    relativedelta(months=1),
+                ),
+            ),
+        ),
+    )
+
+
+@pytest.fixture(name="account")
+def account_fixture() -> Account:
+    """Create an account following the forecast, with extra spending in March."""
+    operations: list[HistoricOperation] = []
+    for month in range(1, 7):
+        operations.append(
+            HistoricOperation(
+                unique_id=len(operations) + 1,
+                description="SALARY",
+                amount=Amount(2000.0),
+                category=Category.SALARY,
+                operation_date=date(2023, month, 1),
+            )
+        )
+        operations.append(
+            HistoricOperation(
+                unique_id=len(operations) + 1,
+                description="RENT",
+                amount=Amount(-800.0 if month != 3 else -1300.0),
+                category=Category.RENT,
+                operation_date=date(2023, month, 5),
+            )
+        )
+    return Account(
+        name="Test Account",
+        balance=10000.0,
+        currency="EUR",
+        balance_date=date(2023, 6, 30),
+        operations=tuple(operations),
+    )
+
+
+class TestMonthlyOrigins:
+    """Test the monthly_origins function."""
+
+    def test_first_day_of_past_months(self) -> None:
+        """Origins are the first day of the months before the balance date."""
+        assert monthly_origins(date(2023, 3, 15), 3) == (
+            date(2022, 12, 1),
+            date(2023, 1, 1),
+            date(2023, 2, 1),
+        )
+
+
+class TestForecastBacktester:
+    """Test the ForecastBacktester class."""
+
+    def test_forecast_matches_account_forecaster(
+        self, account: Account, forecast: Forecast
+    ) -> None:
+        """Forecasts replay AccountForecaster from the past state of each origin."""
+        origins = monthly_origins(account.balance_date, 5)
+
+        report = ForecastBacktester(account, forecast)(origins, (1, 2))
+
+        for origin in origins:
+            past_state = AccountForecaster(account, forecast)(origin)
+            for horizon in (1, 2):
+                expected = AccountForecaster(past_state, forecast)(
+                    origin + relativedelta(months=horizon)
+                ).balance
+                assert report.forecast_balances.loc[origin, horizon] == pytest.approx(
+                    expected
+                )
+
+    def test_errors_per_horizon(self, account: Account, forecast: Forecast) -> None:
+        """Errors compare forecasts to the actual balance, when it is known."""
+        planned_only = Forecast(forecast.operations, ())
+        origins = (date(2023, 2, 28), date(2023, 4, 30), date(2023, 6, 1))
+
+        report = ForecastBacktester(account, planned_only)(origins, (1,))
+
+        errors = report.errors[1]
+        # Rent was 500 higher than planned in March
+        assert errors[date(2023, 2, 28)] == pytest.approx(500.0)
+        assert errors[date(2023, 4, 30)] == pytest.approx(0.0)
+        assert math.isnan(errors[date(2023, 6, 1)])
+        assert report.mean_absolute_errors[1] == pytest.approx(250.0)
+
+    def test_process_pool_gives_same_report(
+        self, account: Account, forecast: Forecast
+    ) -> None:
+        """Origins computed in worker processes give the same balances."""
+        backtester = ForecastBacktester(account, forecast)
+        origins = monthly_origins(account.balance_date, 4)
+
+        in_process = backtester(origins, (1, 3))
+        pooled = backtester(origins, (1, 3), max_workers=2)
+
+        assert pooled.forecast_balances.equals(in_process.forecast_balances)
+        assert pooled.actual_balances.equals(in_process.actual_balances)
+
+    def test_no_origins(self, account: Account, forecast: Forecast) -> None:
+        """Without origins, the report is empty."""
+        report = ForecastBacktester(account, forecast)((), (1, 3))
+
+        assert report.forecast_balances.empty
+        assert list(report.mean_absolute_errors.index) == [1, 3]
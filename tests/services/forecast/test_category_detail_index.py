@@ -0,0 +1,126 @@
+"""Tests for the cached drill-down index behind ForecastService.get_category_detail."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.types import Category, LinkType
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.operation_link import OperationLink
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the current account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(tmp_path: Path) -> Iterator[RepositoryInterface]:
+    """Create a fresh SQLite repository for each test."""
+    with SqliteRepository(tmp_path / "test.db") as repo:
+        yield repo
+
+
+class TestCategoryDetailIndex:
+    """Tests for the cached drill-down index behind get_category_detail."""
+
+    @staticmethod
+    def _operation(unique_id: int, operation_date: date) -> HistoricOperation:
+        return HistoricOperation(
+            unique_id=unique_id,
+            description="VIREMENT LOYER",
+            amount=Amount(-800.0, "EUR"),
+            category=Category.RENT,
+            operation_date=operation_date,
+        )
+
+    @staticmethod
+    def _account(*operations: HistoricOperation) -> Account:
+        return Account(
+            name="Test",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=operations,
+        )
+
+    def test_rows_reused_across_drill_downs(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """A second drill-down into the same cell reuses the built rows."""
+        account = self._account(self._operation(1, date(2025, 2, 3)))
+        service = ForecastService(
+            account_provider=_AccountStub(account), repository=repository
+        )
+
+        first = service.get_category_detail("rent", date(2025, 2, 1))
+        second = service.get_category_detail("rent", date(2025, 2, 1))
+
+        assert len(first["operations"]) == 1
+        assert second["operations"] is first["operations"]
+        assert second["planned_sources"] is first["planned_sources"]
+
+    def test_rebuilt_when_links_change(self, repository: RepositoryInterface) -> None:
+        """New links move operations to the month of their linked iteration."""
+        account = self._account(self._operation(1, date(2025, 2, 28)))
+        service = ForecastService(
+            account_provider=_AccountStub(account), repository=repository
+        )
+        link = OperationLink(
+            operation_unique_id=1,
+            target_type=LinkType.PLANNED_OPERATION,
+            target_id=1,
+            iteration_date=date(2025, 3, 1),
+        )
+
+        assert service.get_category_detail("rent", date(2025, 2, 1))["operations"]
+        assert not service.get_category_detail(
+            "rent", date(2025, 2, 1), operation_links=(link,)
+        )["operations"]
+        assert service.get_category_detail(
+            "rent", date(2025, 3, 1), operation_links=(link,)
+        )["operations"]
+
+    def test_rebuilt_when_account_changes(
+        self, repository: RepositoryInterface
+    ) -> None:
+        """Imported operations show up in the next drill-down."""
+        stub = _AccountStub(self._account(self._operation(1, date(2025, 2, 3))))
+        service = ForecastService(account_provider=stub, repository=repository)
+        assert (
+            len(service.get_category_detail("rent", date(2025, 2, 1))["operations"])
+            == 1
+        )
+
+        stub.account = self._account(
+            self._operation(1, date(2025, 2, 3)), self._operation(2, date(2025, 2, 10))
+        )
+
+        assert (
+            len(service.get_category_detail("rent", date(2025, 2, 1))["operations"])
+            == 2
+        )
@@ -748,3 +748,145 @@ class TestForecastActualizerGaps:
         assert len(actualized_forecast.operations) == 1
         op = actualized_forecast.operations[0]
         assert op.date_range.start_date == date(2023, 2, 1)
+
+
+class TestForecastActualizerIncremental:
+    """Tests for the incremental updates and memoization of ForecastActualizer."""
+
+    @pytest.fixture(name="account_with_ops")
+    def account_with_ops_fixture(self, account: Account) -> Account:
+        """Account with two operations in the current budget period."""
+        return account._replace(
+            operations=(
+                HistoricOperation(
+                    unique_id=1,
+                    description="First Expense",
+                    amount=Amount(-30.0, "EUR"),
+                    category=Category.GROCERIES,
+                    operation_date=date(2023, 1, 1),
+                ),
+                HistoricOperation(
+                    unique_id=2,
+                    description="Second Expense",
+                    amount=Amount(-40.0, "EUR"),
+                    category=Category.GROCERIES,
+                    operation_date=date(2023, 1, 1),
+                ),
+            )
+        )
+
+    @pytest.fixture(name="forecast")
+    def forecast_fixture(self) -> Forecast:
+        """Forecast with one budget and one monthly planned operation."""
+        return Forecast(
+            operations=(
+                PlannedOperation(
+                    record_id=1,
+                    description="Salary",
+                    amount=Amount(2000.0, "EUR"),
+                    category=Category.SALARY,
+                    date_range=RecurringDay(date(2023, 1, 15), relativedelta(months=1)),
+                ),
+            ),
+            budgets=(
+                Budget(
+                    record_id=1,
+                    description="Groceries Budget",
+                    amount=Amount(-100.0, "EUR"),
+                    category=Category.GROCERIES,
+                    date_range=DateRange(date(2023, 1, 1), relativedelta(months=1)),
+                ),
+            ),
+        )
+
+    @staticmethod
+    def _budget_link(operation_id: int) -> OperationLink:
+        return OperationLink(
+            operation_unique_id=operation_id,
+            target_type=LinkType.BUDGET,
+            target_id=1,
+            iteration_date=date(2023, 1, 1),
+            is_manual=False,
+        )
+
+    def test_unchanged_targets_are_memoized(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """Calling the actualizer twice reuses the previous results."""
+        actualizer = ForecastActualizer(account_with_ops, (self._budget_link(1),))
+        first = actualizer(forecast)
+        second = actualizer(forecast)
+
+        assert second == first
+        assert second.budgets[0] is first.budgets[0]
+        assert second.operations[0] is first.operations[0]
+
+    def test_upsert_links_reactualizes_only_the_linked_target(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """A new link re-actualizes its target and keeps the others memoized."""
+        actualizer = ForecastActualizer(account_with_ops, (self._budget_link(1),))
+        first = actualizer(forecast)
+        assert first.budgets[0].amount == -70.0
+
+        actualizer.upsert_links((self._budget_link(2),))
+        second = actualizer(forecast)
+
+        assert second.budgets[0].amount == -30.0
+        assert second.operations[0] is first.operations[0]
+
+    def test_delete_links_restores_the_budget(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """Removing a link gives back the consumed amount."""
+        actualizer = ForecastActualizer(
+            account_with_ops, (self._budget_link(1), self._budget_link(2))
+        )
+        assert actualizer(forecast).budgets[0].amount == -30.0
+
+        actualizer.delete_links((2,))
+
+        assert actualizer(forecast).budgets[0].amount == -70.0
+
+    def test_sync_links_matches_a_fresh_actualizer(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """Synchronizing links gives the same result as rebuilding."""
+        actualizer = ForecastActualizer(account_with_ops, (self._budget_link(1),))
+        actualizer(forecast)
+
+        new_links = (self._budget_link(2),)
+        actualizer.sync_links(new_links)
+
+        assert actualizer(forecast) == ForecastActualizer(account_with_ops, new_links)(
+            forecast
+        )
+
+    def test_update_account_reactualizes_when_linked_operation_changes(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """Changing the amount of a linked operation invalidates its target."""
+        actualizer = ForecastActualizer(account_with_ops, (self._budget_link(1),))
+        assert actualizer(forecast).budgets[0].amount == -70.0
+
+        first_op, second_op = account_with_ops.operations
+        actualizer.update_account(
+            account_with_ops._replace(
+                operations=(first_op.replace(amount=Amount(-60.0, "EUR")), second_op)
+            )
+        )
+
+        assert actualizer(forecast).budgets[0].amount == -40.0
+
+    def test_update_account_reactualizes_when_balance_date_changes(
+        self, account_with_ops: Account, forecast: Forecast
+    ) -> None:
+        """Moving the balance date re-actualizes every target."""
+        actualizer = ForecastActualizer(account_with_ops)
+        first = actualizer(forecast)
+
+        new_account = account_with_ops._replace(balance_date=date(2023, 1, 20))
+        actualizer.update_account(new_account)
+
+        assert actualizer(forecast) == ForecastActualizer(new_account)(forecast)
+        assert actualizer(forecast) != first
@@ -13,10 +13,16 @@ from dateutil.relativedelta import relativedelta
 
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.date_range import DateRange, SingleDay
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.types import (
+    BalanceResolution,
+    Category,
+    LinkType,
+    MatcherKey,
+)
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.exceptions import (
     BudgetNotFoundError,
@@ -53,6 +59,11 @@ class _AccountStub:
     def account(self, value: Account) -> None:
         self._account = value
 
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
 
 @pytest.fixture(name="mock_account")
 def mock_account_fixture() -> Account:
@@ -205,6 +216,95 @@ class TestReloadForecast:
         assert len(forecast.budgets) == 1
 
 
+class TestGetForecast:
+    """Tests for get_forecast method."""
+
+    def test_reuses_cached_forecast(self, service: ForecastService) -> None:
+        """The forecast is not reloaded while targets are unchanged."""
+        assert service.get_forecast() is service.get_forecast()
+
+    def test_cached_forecast_read_without_database(
+        self,
+        service: ForecastService,
+        repository: RepositoryInterface,
+    ) -> None:
+        """The loaded forecast and its versions are read from memory."""
+        forecast = service.get_forecast()
+
+        with patch.object(repository, "get_target_versions") as mock_versions:
+            assert service.get_forecast() is forecast
+            assert not service.get_definition_versions()
+
+        mock_versions.assert_not_called()
+
+    def test_reloads_after_target_changed(self, service: ForecastService) -> None:
+        """A target changed through the service invalidates the cache."""
+        service.get_forecast()
+        budget = service.add_budget(
+            Budget(
+                record_id=None,
+                description="New Budget",
+                amount=Amount(-100.0, "EUR"),
+                category=Category.OTHER,
+                date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+            )
+        )
+
+        assert budget.id is not None
+        assert service.get_forecast().budgets == (budget,)
+        assert service.get_definition_versions() == {
+            MatcherKey(LinkType.BUDGET, budget.id): 1
+        }
+
+    def test_reload_forecast_reads_database(
+        self,
+        service: ForecastService,
+        repository: RepositoryInterface,
+    ) -> None:
+        """A target written behind the service's back is read on reload."""
+        service.get_forecast()
+        repository.upsert_budget(
+            Budget(
+                record_id=None,
+                description="New Budget",
+                amount=Amount(-100.0, "EUR"),
+                category=Category.OTHER,
+                date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+            )
+        )
+
+        assert not service.get_forecast().budgets
+        assert len(service.reload_forecast().budgets) == 1
+
+    def test_link_changes_keep_cached_forecast(
+        self,
+        service: ForecastService,
+        repository: RepositoryInterface,
+    ) -> None:
+        """Only target definitions invalidate the forecast, not their links."""
+        budget_id = repository.upsert_budget(
+            Budget(
+                record_id=None,
+                description="Groceries",
+                amount=Amount(-100.0, "EUR"),
+                category=Category.GROCERIES,
+                date_range=DateRange(date(2025, 1, 1), relativedelta(months=1)),
+            )
+        )
+        forecast = service.get_forecast()
+
+        repository.upsert_link(
+            OperationLink(
+                operation_unique_id=1,
+                target_type=LinkType.BUDGET,
+                target_id=budget_id,
+                iteration_date=date(2025, 1, 1),
+            )
+        )
+
+        assert service.get_forecast() is forecast
+
+
 class TestBudgetCrud:
     """Tests for budget CRUD methods."""
 
@@ -418,6 +518,22 @@ class TestComputeReport:
         assert call_args[0][0] == start
         assert call_args[0][1] == end
 
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_passes_resolution(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """compute_report computes the balance evolution at the given resolution."""
+        mock_analyzer = MagicMock()
+        mock_analyzer_class.return_value = mock_analyzer
+
+        service.compute_report(resolution=BalanceResolution.MONTHLY)
+
+        assert mock_analyzer.compute_report.call_args[0][2] == (
+            BalanceResolution.MONTHLY
+        )
+
     @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
     def test_uses_current_account_not_stale_snapshot(
         self,
@@ -497,6 +613,33 @@ class TestGetBalanceEvolutionSummary:
         assert all(isinstance(item[0], date) for item in result)
         assert all(isinstance(item[1], float) for item in result)
 
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_built_once_per_report(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """The summary is only sampled again for a new report."""
+        dates = pd.date_range("2025-01-01", periods=10, freq="D")
+        mock_analyzer = MagicMock()
+        mock_analyzer.compute_report.return_value.balance_evolution_per_day = (
+            pd.DataFrame({"Balance": [1000.0] * 10}, index=dates)
+        )
+        mock_analyzer_class.return_value = mock_analyzer
+
+        service.compute_report()
+        summary = service.get_balance_evolution_summary()
+        assert service.get_balance_evolution_summary() is summary
+
+        mock_analyzer.compute_report.return_value = MagicMock(
+            balance_evolution_per_day=pd.DataFrame(
+                {"Balance": [500.0] * 10}, index=dates
+            )
+        )
+        service.compute_report()
+
+        assert service.get_balance_evolution_summary()[0][1] == 500.0
+
 
 class TestGetMonthlySummary:
     """Tests for get_monthly_summary method."""
@@ -549,6 +692,49 @@ class TestGetMonthlySummary:
                 assert "forecast" in cat_budget
                 assert "is_income" in cat_budget
 
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_values_and_caching(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """Zero cells are skipped, and the summary is cached per report."""
+        january, february = pd.Timestamp("2025-01-01"), pd.Timestamp("2025-02-01")
+        columns = pd.MultiIndex.from_product(
+            [[january, february], ["Actual", "Forecast", "TotalPlanned"]]
+        )
+        df = pd.DataFrame(
+            [
+                [-100, -120, -150, 0, 0, 0],
+                [0, 2000, 2000, 2000, 2000, 2000],
+                [-100, 1880, 1850, 2000, 2000, 2000],
+            ],
+            index=["groceries", "salary", "Total"],
+            columns=columns,
+        )
+        mock_analyzer_class.return_value.compute_report.side_effect = [
+            MagicMock(budget_forecast=df),
+            MagicMock(budget_forecast=df),
+        ]
+
+        service.compute_report()
+        result = service.get_monthly_summary()
+
+        assert [summary["month"] for summary in result] == [january, february]
+        assert result[0]["categories"] == {
+            "groceries": CategoryBudget(
+                planned=-150.0, actual=-100.0, forecast=-120.0, is_income=False
+            ),
+            "salary": CategoryBudget(
+                planned=2000.0, actual=0.0, forecast=2000.0, is_income=True
+            ),
+        }
+        assert list(result[1]["categories"]) == ["salary"]
+        assert service.get_monthly_summary() is result
+
+        service.compute_report()
+        assert service.get_monthly_summary() is not result
+
 
 class TestGetCategoryStatistics:
     """Tests for get_category_statistics method."""
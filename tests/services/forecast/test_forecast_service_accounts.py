@@ -0,0 +1,228 @@
+"""Tests for the per-account balances of the ForecastService."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import SingleDay
+from budget_forecaster.core.types import (
+    BalanceResolution,
+    Category,
+    LinkType,
+    MatcherKey,
+)
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.account.aggregated_account import AggregatedAccount
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.exceptions import AccountNotFoundError
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
+
+@pytest.fixture(name="account_provider")
+def account_provider_fixture() -> _AccountStub:
+    """Create an AccountInterface stub wrapping an account without operations."""
+    return _AccountStub(
+        Account(
+            name="Test Account",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(),
+        )
+    )
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+@pytest.fixture(name="service")
+def service_fixture(
+    account_provider: _AccountStub,
+    repository: RepositoryInterface,
+) -> ForecastService:
+    """Create a ForecastService over an account without operations."""
+    return ForecastService(
+        account_provider=account_provider,
+        repository=repository,
+    )
+
+
+class TestComputeAccountBalances:
+    """Tests for the per-account balances and target accounts."""
+
+    @pytest.fixture(name="wallet_service")
+    def wallet_service_fixture(
+        self, repository: RepositoryInterface
+    ) -> ForecastService:
+        """Create a ForecastService over a current account and a wallet."""
+        accounts = (
+            Account(
+                name="Current",
+                balance=1000.0,
+                currency="EUR",
+                balance_date=date(2025, 1, 20),
+                operations=(),
+            ),
+            Account(
+                name="Wallet",
+                balance=50.0,
+                currency="EUR",
+                balance_date=date(2025, 1, 20),
+                operations=(),
+            ),
+        )
+        return ForecastService(
+            account_provider=AggregatedAccount("Total", accounts),
+            repository=repository,
+        )
+
+    def test_assigned_target_moves_its_account(
+        self, wallet_service: ForecastService
+    ) -> None:
+        """A target assigned to the wallet only changes the wallet balance."""
+        vouchers = wallet_service.add_planned_operation(
+            PlannedOperation(
+                record_id=None,
+                description="Meal vouchers",
+                amount=Amount(150.0, "EUR"),
+                category=Category.SALARY,
+                date_range=SingleDay(date(2025, 2, 5)),
+            )
+        )
+        assert vouchers.id is not None
+        key = MatcherKey(LinkType.PLANNED_OPERATION, vouchers.id)
+
+        wallet_service.set_target_account(key, "Wallet")
+        balances = wallet_service.compute_account_balances(
+            date(2025, 1, 20), date(2025, 2, 28), resolution=BalanceResolution.MONTHLY
+        )
+
+        assert wallet_service.get_target_accounts() == {key: "Wallet"}
+        assert balances.balances.loc["2025-02-28"].tolist() == [1000.0, 200.0, 1200.0]
+
+    def test_unknown_account(self, wallet_service: ForecastService) -> None:
+        """Targets can only be assigned to existing accounts."""
+        with pytest.raises(AccountNotFoundError):
+            wallet_service.set_target_account(MatcherKey(LinkType.BUDGET, 1), "Closed")
+
+
+class TestGetBalanceAt:
+    """Tests for get_balance_at method."""
+
+    def test_follows_account_updates(
+        self, service: ForecastService, account_provider: _AccountStub
+    ) -> None:
+        """Past balances reflect the operations imported since the last call."""
+        assert service.get_balance_at(date(2025, 1, 1)) == 1000.0
+
+        account_provider.account = account_provider.account._replace(
+            operations=(
+                HistoricOperation(
+                    unique_id=1,
+                    description="GROCERIES",
+                    amount=Amount(-40.0, "EUR"),
+                    category=Category.GROCERIES,
+                    operation_date=date(2025, 1, 10),
+                ),
+            )
+        )
+
+        assert service.get_balance_at(date(2025, 1, 1)) == 1040.0
+        assert service.get_balance_at(date(2025, 1, 1), "Test Account") == 1040.0
+
+    def test_follows_reported_changes(
+        self, service: ForecastService, account_provider: _AccountStub
+    ) -> None:
+        """Operations reported to invalidate_report are moved in the indexes."""
+        operation = HistoricOperation(
+            unique_id=1,
+            description="GROCERIES",
+            amount=Amount(-40.0, "EUR"),
+            category=Category.GROCERIES,
+            operation_date=date(2025, 1, 10),
+        )
+        account_provider.account = account_provider.account._replace(
+            operations=(operation,)
+        )
+        assert service.get_balance_at(date(2025, 1, 1), "Test Account") == 1040.0
+        assert service.get_balance_at(date(2025, 1, 1)) == 1040.0
+
+        account_provider.account = account_provider.account._replace(
+            operations=(operation.replace(operation_date=date(2024, 12, 20)),)
+        )
+        service.invalidate_report([operation.unique_id])
+
+        assert service.get_balance_at(date(2025, 1, 1)) == 1000.0
+        assert service.get_balance_at(date(2025, 1, 1), "Test Account") == 1000.0
+
+    def test_reload_after_target_change(
+        self, service: ForecastService, account_provider: _AccountStub
+    ) -> None:
+        """A reload compares all operations, even after a change of targets."""
+        operation = HistoricOperation(
+            unique_id=1,
+            description="GROCERIES",
+            amount=Amount(-40.0, "EUR"),
+            category=Category.GROCERIES,
+            operation_date=date(2025, 1, 10),
+        )
+        account_provider.account = account_provider.account._replace(
+            operations=(operation,)
+        )
+        assert service.get_balance_at(date(2025, 1, 1)) == 1040.0
+
+        service.invalidate_report(())
+        account_provider.account = account_provider.account._replace(
+            operations=(operation.replace(amount=Amount(-400.0, "EUR")),)
+        )
+        service.invalidate_report()
+
+        assert service.get_balance_at(date(2025, 1, 1)) == 1400.0
+
+    def test_unknown_account(self, service: ForecastService) -> None:
+        """An unknown account name raises AccountNotFoundError."""
+        with pytest.raises(AccountNotFoundError):
+            service.get_balance_at(date(2025, 1, 1), "Unknown")
@@ -0,0 +1,94 @@
+"""Tests for the backtest of the forecast by the ForecastService."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
+
+@pytest.fixture(name="account_provider")
+def account_provider_fixture() -> _AccountStub:
+    """Create an AccountInterface stub wrapping an account without operations."""
+    return _AccountStub(
+        Account(
+            name="Test Account",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(),
+        )
+    )
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+@pytest.fixture(name="service")
+def service_fixture(
+    account_provider: _AccountStub,
+    repository: RepositoryInterface,
+) -> ForecastService:
+    """Create a ForecastService over an account without operations."""
+    return ForecastService(
+        account_provider=account_provider,
+        repository=repository,
+    )
+
+
+class TestComputeBacktest:
+    """Tests for compute_backtest method."""
+
+    def test_backtests_past_months(self, service: ForecastService) -> None:
+        """The forecast is backtested from the first day of each past month."""
+        report = service.compute_backtest(months=3, horizons=(1,))
+
+        assert list(report.forecast_balances.index) == [
+            date(2024, 10, 1),
+            date(2024, 11, 1),
+            date(2024, 12, 1),
+        ]
+        # No operations and no forecast: the balance never changes
+        assert report.errors[1].tolist() == [0.0, 0.0, 0.0]
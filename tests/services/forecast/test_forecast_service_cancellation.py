@@ -0,0 +1,155 @@
+"""Tests for the cancellation of report computations by the ForecastService."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.exceptions import ComputationCancelledError
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
+
+@pytest.fixture(name="account_provider")
+def account_provider_fixture() -> _AccountStub:
+    """Create an AccountInterface stub wrapping an account without operations."""
+    return _AccountStub(
+        Account(
+            name="Test Account",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(),
+        )
+    )
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+@pytest.fixture(name="service")
+def service_fixture(
+    account_provider: _AccountStub,
+    repository: RepositoryInterface,
+) -> ForecastService:
+    """Create a ForecastService over an account without operations."""
+    return ForecastService(
+        account_provider=account_provider,
+        repository=repository,
+    )
+
+
+class TestReportCancellation:
+    """Tests for the invalidation and cancellation of report computations."""
+
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_invalidate_report_keeps_forecast(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """invalidate_report discards the report but not the loaded forecast."""
+        mock_analyzer_class.return_value = MagicMock()
+        service.compute_report()
+        forecast = service.get_forecast()
+
+        service.invalidate_report()
+
+        assert service.report is None
+        assert service.get_forecast() is forecast
+
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_cancelled_report_not_published(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """A cancelled computation keeps the previous report."""
+        mock_analyzer_class.return_value = MagicMock()
+        report = service.compute_report()
+
+        with pytest.raises(ComputationCancelledError):
+            service.compute_report(cancellation=MagicMock(is_cancelled=True))
+
+        assert service.report is report
+
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_report_invalidated_during_computation_discarded(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """A report computed from data changed meanwhile is not published."""
+        mock_analyzer = MagicMock()
+        mock_analyzer.compute_report.side_effect = (
+            lambda *_args: service.invalidate_report() or MagicMock()
+        )
+        mock_analyzer_class.return_value = mock_analyzer
+
+        with pytest.raises(ComputationCancelledError):
+            service.compute_report()
+
+        assert service.report is None
+
+
+class TestForecastPublication:
+    """Tests for the forecast shared with worker threads."""
+
+    def test_forecast_invalidated_while_loaded_not_published(
+        self, service: ForecastService
+    ) -> None:
+        """A forecast loaded while a target changes is loaded again on next use."""
+        # pylint: disable-next=protected-access
+        definition_versions = service._definition_versions
+
+        def invalidate_then_read() -> dict[object, int]:
+            service._invalidate_cache()  # pylint: disable=protected-access
+            return dict(definition_versions())
+
+        with patch.object(
+            service, "_definition_versions", side_effect=invalidate_then_read
+        ):
+            forecast = service.get_forecast()
+
+        assert service.get_forecast() is not forecast
@@ -0,0 +1,180 @@
+"""Tests for the report persisted by the ForecastService across launches."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import SingleDay
+from budget_forecaster.core.types import Category
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+from budget_forecaster.services.forecast.report_cache import ReportCache
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
+
+@pytest.fixture(name="account_provider")
+def account_provider_fixture() -> _AccountStub:
+    """Create an AccountInterface stub wrapping an account without operations."""
+    return _AccountStub(
+        Account(
+            name="Test Account",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(),
+        )
+    )
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+@pytest.fixture(name="service")
+def service_fixture(
+    account_provider: _AccountStub,
+    repository: RepositoryInterface,
+) -> ForecastService:
+    """Create a ForecastService over an account without operations."""
+    return ForecastService(
+        account_provider=account_provider,
+        repository=repository,
+    )
+
+
+class TestReportCache:
+    """Tests for the report persisted across launches."""
+
+    @pytest.fixture(name="cache")
+    def cache_fixture(self, temp_db_path: Path) -> ReportCache:
+        """Create a report cache next to the database."""
+        return ReportCache(temp_db_path.with_name("test.db.report-cache"))
+
+    def test_cached_report_loaded_on_next_launch(
+        self,
+        account_provider: _AccountStub,
+        repository: RepositoryInterface,
+        cache: ReportCache,
+    ) -> None:
+        """A computed report is available to a new service without computing."""
+        start, end = date(2025, 1, 1), date(2025, 6, 30)
+        previous = ForecastService(account_provider, repository, cache)
+        computed = previous.compute_report(start, end)
+        previous.save_report_cache()
+
+        service = ForecastService(account_provider, repository, cache)
+        loaded = service.load_cached_report()
+
+        assert loaded is not None
+        assert service.report is loaded
+        assert service.is_report_window_current(start, end)
+        assert loaded.balance_evolution_per_day.equals(
+            computed.balance_evolution_per_day
+        )
+
+    def test_report_of_other_dates_loaded(
+        self,
+        account_provider: _AccountStub,
+        repository: RepositoryInterface,
+        cache: ReportCache,
+    ) -> None:
+        """A report of an earlier day is loaded, but its dates are not current."""
+        previous = ForecastService(account_provider, repository, cache)
+        previous.compute_report(date(2025, 1, 1), date(2025, 6, 30))
+        previous.save_report_cache()
+
+        service = ForecastService(account_provider, repository, cache)
+
+        assert service.load_cached_report() is not None
+        assert not service.is_report_window_current(date(2025, 1, 2), date(2025, 7, 1))
+
+    def test_saved_on_demand(
+        self,
+        account_provider: _AccountStub,
+        repository: RepositoryInterface,
+        cache: ReportCache,
+    ) -> None:
+        """Computing a report does not write the cache, saving it does once."""
+        service = ForecastService(account_provider, repository, cache)
+        service.compute_report(date(2025, 1, 1), date(2025, 6, 30))
+        assert not cache.path.exists()
+
+        service.save_report_cache()
+        saved_at = cache.path.stat().st_mtime_ns
+        service.save_report_cache()
+
+        assert cache.path.stat().st_mtime_ns == saved_at
+
+    def test_changed_data_invalidates_cache(
+        self,
+        account_provider: _AccountStub,
+        repository: RepositoryInterface,
+        cache: ReportCache,
+    ) -> None:
+        """The cache is ignored once a target changes."""
+        service = ForecastService(account_provider, repository, cache)
+        service.compute_report(date(2025, 1, 1), date(2025, 6, 30))
+        service.save_report_cache()
+
+        service.add_planned_operation(
+            PlannedOperation(
+                record_id=None,
+                description="Rent",
+                amount=Amount(-800.0, "EUR"),
+                category=Category.RENT,
+                date_range=SingleDay(date(2025, 2, 5)),
+            )
+        )
+
+        assert (
+            ForecastService(account_provider, repository, cache).load_cached_report()
+            is None
+        )
+
+    def test_no_cache(self, service: ForecastService) -> None:
+        """Without a cache, there is never a cached report."""
+        service.compute_report(date(2025, 1, 1), date(2025, 6, 30))
+        service.save_report_cache()
+
+        assert service.load_cached_report() is None
@@ -0,0 +1,112 @@
+"""Tests for the scenario comparison of the ForecastService."""
+
+# pylint: disable=too-few-public-methods
+
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import SingleDay
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.scenario import Scenario
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.infrastructure.persistence.repository_interface import (
+    RepositoryInterface,
+)
+from budget_forecaster.infrastructure.persistence.sqlite_repository import (
+    SqliteRepository,
+)
+from budget_forecaster.services.forecast.forecast_service import ForecastService
+
+
+class _AccountStub:
+    """Mutable AccountInterface stub for unit tests."""
+
+    def __init__(self, account: Account) -> None:
+        self._account = account
+
+    @property
+    def account(self) -> Account:
+        """Return the account."""
+        return self._account
+
+    @account.setter
+    def account(self, value: Account) -> None:
+        self._account = value
+
+    @property
+    def accounts(self) -> tuple[Account, ...]:
+        """Return the account as the only individual account."""
+        return (self._account,)
+
+
+@pytest.fixture(name="account_provider")
+def account_provider_fixture() -> _AccountStub:
+    """Create an AccountInterface stub wrapping an account without operations."""
+    return _AccountStub(
+        Account(
+            name="Test Account",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(),
+        )
+    )
+
+
+@pytest.fixture(name="temp_db_path")
+def temp_db_path_fixture(tmp_path: Path) -> Path:
+    """Create a temporary database path."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture(name="repository")
+def repository_fixture(temp_db_path: Path) -> Iterator[RepositoryInterface]:
+    """Create an initialized repository."""
+    with SqliteRepository(temp_db_path) as repo:
+        yield repo
+
+
+@pytest.fixture(name="service")
+def service_fixture(
+    account_provider: _AccountStub,
+    repository: RepositoryInterface,
+) -> ForecastService:
+    """Create a ForecastService over an account without operations."""
+    return ForecastService(
+        account_provider=account_provider,
+        repository=repository,
+    )
+
+
+class TestCompareScenarios:
+    """Tests for compare_scenarios method."""
+
+    def test_scenario_leaves_database_untouched(self, service: ForecastService) -> None:
+        """A scenario removing a planned operation only changes its own curve."""
+        subscription = service.add_planned_operation(
+            PlannedOperation(
+                record_id=None,
+                description="Subscription",
+                amount=Amount(-15.0, "EUR"),
+                category=Category.OTHER,
+                date_range=SingleDay(date(2025, 2, 5)),
+            )
+        )
+        assert subscription.id is not None
+        scenario = Scenario(
+            "Without subscription",
+            removed=frozenset(
+                {MatcherKey(LinkType.PLANNED_OPERATION, subscription.id)}
+            ),
+        )
+
+        comparison = service.compare_scenarios([scenario], date(2025, 3, 31))
+
+        assert comparison.balances.loc["2025-03-31"].tolist() == [985.0, 1000.0]
+        assert comparison.margins.loc["2025-01-01"].tolist() == [985.0, 1000.0]
+        assert service.get_all_planned_operations() == (subscription,)
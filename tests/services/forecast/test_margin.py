@@ -10,6 +10,7 @@ import pandas as pd
 import pytest
 from freezegun import freeze_time
 
+from budget_forecaster.core.types import BalanceResolution
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.infrastructure.persistence.repository_interface import (
     RepositoryInterface,
@@ -76,10 +77,12 @@ def _compute_with_balance(
     service: ForecastService,
     mock_analyzer_class: MagicMock,
     balance_df: pd.DataFrame,
+    resolution: BalanceResolution = BalanceResolution.DAILY,
 ) -> None:
     """Set up mock analyzer to return a report with given balance, then compute."""
     mock_report = MagicMock(spec=AccountAnalysisReport)
     mock_report.balance_evolution_per_day = balance_df
+    mock_report.resolution = resolution
 
     mock_analyzer = MagicMock()
     mock_analyzer.compute_report.return_value = mock_report
@@ -241,6 +244,48 @@ class TestGetAvailableMargin:
         result = service.get_available_margin(date(2026, 6, 1), threshold=0)
         assert result is None
 
+    @freeze_time("2026-03-10")
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_returns_none_for_coarse_report(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """Monthly rows cannot tell the balance of each day: no margin."""
+        balance_df = _build_balance_df({"2026-03-31": 3000, "2026-04-30": 2000})
+        _compute_with_balance(
+            service, mock_analyzer_class, balance_df, BalanceResolution.MONTHLY
+        )
+
+        assert service.get_available_margin(date(2026, 3, 1), threshold=0) is None
+
+    @freeze_time("2026-03-10")
+    @patch("budget_forecaster.services.forecast.forecast_service.AccountAnalyzer")
+    def test_computed_once_per_report(
+        self,
+        mock_analyzer_class: MagicMock,
+        service: ForecastService,
+    ) -> None:
+        """A margin is computed once per report, and again for a new report."""
+        _compute_with_balance(
+            service,
+            mock_analyzer_class,
+            _build_balance_df({"2026-03-01": 3000, "2026-04-01": 2000}),
+        )
+        margin = service.get_available_margin(date(2026, 3, 1), threshold=0)
+
+        assert service.get_available_margin(date(2026, 3, 1), threshold=0) is margin
+
+        _compute_with_balance(
+            service,
+            mock_analyzer_class,
+            _build_balance_df({"2026-03-01": 3000, "2026-04-01": 1000}),
+        )
+        result = service.get_available_margin(date(2026, 3, 1), threshold=0)
+
+        assert result is not None
+        assert result["available_margin"] == 1000
+
 
 class TestMarginThreshold:
     """Tests for threshold persistence via ForecastService."""
@@ -0,0 +1,225 @@
+"""Module to test the PerAccountEvaluator class."""
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import (
+    DateRange,
+    RecurringDateRange,
+    RecurringDay,
+)
+from budget_forecaster.core.types import (
+    BalanceResolution,
+    Category,
+    LinkType,
+    MatcherKey,
+)
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.account.aggregated_account import AggregatedAccount
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.services.account.account_analyzer import AccountAnalyzer
+from budget_forecaster.services.forecast.forecast_actualizer import ForecastActualizer
+from budget_forecaster.services.forecast.per_account_evaluator import (
+    PerAccountEvaluator,
+    split_forecast,
+)
+
+
+@pytest.fixture(name="forecast")
+def forecast_fixture() -> Forecast:
+    """Create a forecast with a salary, meal vouchers and a lunches budget."""
+    return Forecast(
+        (
+            PlannedOperation(
+                record_id=1,
+                description="Salary",
+                amount=Amount(2000.0),
+                category=Category.SALARY,
+                date_range=RecurringDay(date(2025, 1, 1), relativedelta(months=1)),
+            ),
+            PlannedOperation(
+                record_id=2,
+                description="Meal vouchers",
+                amount=Amount(150.0),
+                category=Category.SALARY,
+                date_range=RecurringDay(date(2025, 1, 5), relativedelta(months=1)),
+            ),
+        ),
+        (
+            Budget(
+                record_id=1,
+                description="Lunches",
+                amount=Amount(-155.0),
+                category=Category.GROCERIES,
+                date_range=RecurringDateRange(
+                    DateRange(date(2025, 1, 1), relativedelta(months=1)),
+                    relativedelta(months=1),
+                ),
+            ),
+        ),
+    )
+
+
+@pytest.fixture(name="accounts")
+def accounts_fixture() -> tuple[Account, ...]:
+    """Create a current account and a meal-voucher wallet."""
+    return (
+        Account(
+            name="Current",
+            balance=1000.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 20),
+            operations=(
+                HistoricOperation(
+                    unique_id=1,
+                    description="Rent",
+                    amount=Amount(-800.0),
+                    category=Category.RENT,
+                    operation_date=date(2025, 1, 10),
+                ),
+            ),
+        ),
+        Account(
+            name="Wallet",
+            balance=50.0,
+            currency="EUR",
+            balance_date=date(2025, 1, 15),
+            operations=(
+                HistoricOperation(
+                    unique_id=2,
+                    description="Restaurant",
+                    amount=Amount(-12.0),
+                    category=Category.GROCERIES,
+                    operation_date=date(2025, 1, 8),
+                ),
+            ),
+        ),
+    )
+
+
+@pytest.fixture(name="target_accounts")
+def target_accounts_fixture() -> dict[MatcherKey, str]:
+    """Assign the meal vouchers and the lunches budget to the wallet."""
+    return {
+        MatcherKey(LinkType.PLANNED_OPERATION, 2): "Wallet",
+        MatcherKey(LinkType.BUDGET, 1): "Wallet",
+    }
+
+
+def test_split_forecast(
+    forecast: Forecast, target_accounts: dict[MatcherKey, str]
+) -> None:
+    """Unassigned targets, or assigned to unknown accounts, go to the first one."""
+    target_accounts[MatcherKey(LinkType.BUDGET, 1)] = "Closed"
+
+    forecasts = split_forecast(forecast, ["Current", "Wallet"], target_accounts)
+
+    assert forecasts["Current"] == Forecast((forecast.operations[0],), forecast.budgets)
+    assert forecasts["Wallet"] == Forecast((forecast.operations[1],), ())
+
+
+class TestPerAccountEvaluator:
+    """Tests for PerAccountEvaluator."""
+
+    @pytest.mark.parametrize("resolution", list(BalanceResolution))
+    def test_aggregate_matches_account_analyzer(
+        self,
+        accounts: tuple[Account, ...],
+        forecast: Forecast,
+        target_accounts: dict[MatcherKey, str],
+        resolution: BalanceResolution,
+    ) -> None:
+        """The aggregated column is the balance evolution of the aggregation."""
+        aggregated = AggregatedAccount("Total", accounts).account
+        start_date, end_date = date(2025, 1, 1), date(2025, 6, 30)
+
+        balances = PerAccountEvaluator(aggregated, accounts, forecast, target_accounts)(
+            start_date, end_date, resolution
+        )
+
+        expected = AccountAnalyzer(aggregated, forecast).compute_balance_evolution(
+            start_date, end_date, resolution
+        )
+        assert list(balances.balances.columns) == ["Current", "Wallet", "Total"]
+        assert balances.balances["Total"].tolist() == pytest.approx(
+            expected["Balance"].tolist()
+        )
+        if resolution != BalanceResolution.DAILY:
+            assert balances.lowest_balances["Total"].tolist() == pytest.approx(
+                expected["Min. Balance"].tolist()
+            )
+
+    def test_accounts_get_their_targets(
+        self,
+        accounts: tuple[Account, ...],
+        forecast: Forecast,
+        target_accounts: dict[MatcherKey, str],
+    ) -> None:
+        """Each account only moves with its own operations and targets."""
+        aggregated = AggregatedAccount("Total", accounts).account
+
+        balances = PerAccountEvaluator(aggregated, accounts, forecast, target_accounts)(
+            date(2025, 1, 1), date(2025, 3, 31), BalanceResolution.MONTHLY
+        )
+
+        # The unconsumed lunches budget of January is spent by the end of the
+        # month, then meal vouchers and lunches almost balance each other
+        assert balances.balances["Wallet"].tolist() == pytest.approx(
+            [50.0 - 155.0, 50.0 - 155.0 - 5.0, 50.0 - 155.0 - 10.0]
+        )
+        # The salary comes on the first day of each month, the rent of
+        # January 10th is the only expense of the current account
+        assert balances.lowest_balances["Current"].tolist() == pytest.approx(
+            [1000.0, 3000.0, 5000.0]
+        )
+        assert balances.balances["Current"].tolist() == pytest.approx(
+            [1000.0, 3000.0, 5000.0]
+        )
+
+    def test_process_pool(
+        self,
+        accounts: tuple[Account, ...],
+        forecast: Forecast,
+        target_accounts: dict[MatcherKey, str],
+    ) -> None:
+        """Accounts projected in worker processes give the same balances."""
+        evaluator = PerAccountEvaluator(
+            AggregatedAccount("Total", accounts).account,
+            accounts,
+            forecast,
+            target_accounts,
+        )
+        start_date, end_date = date(2025, 1, 1), date(2025, 6, 30)
+
+        in_pool = evaluator(start_date, end_date, max_workers=2)
+
+        assert in_pool.balances.equals(evaluator(start_date, end_date).balances)
+
+    def test_forecast_actualized_once(
+        self,
+        accounts: tuple[Account, ...],
+        forecast: Forecast,
+        target_accounts: dict[MatcherKey, str],
+    ) -> None:
+        """The whole forecast is actualized once, not one share per account."""
+        aggregated = AggregatedAccount("Total", accounts).account
+        actualizer = MagicMock(wraps=ForecastActualizer(aggregated))
+
+        PerAccountEvaluator(
+            aggregated, accounts, forecast, target_accounts, actualizer
+        )(date(2025, 1, 1), date(2025, 3, 31))
+
+        actualizer.assert_called_once_with(forecast)
+
+    def test_no_account(self, forecast: Forecast) -> None:
+        """At least one account is needed."""
+        aggregated = AggregatedAccount("Total", ()).account
+
+        with pytest.raises(ValueError):
+            PerAccountEvaluator(aggregated, (), forecast, {})
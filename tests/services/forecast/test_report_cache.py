@@ -0,0 +1,156 @@
+"""Module to test the report cache."""
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import SingleDay
+from budget_forecaster.core.types import (
+    BalanceResolution,
+    Category,
+    LinkType,
+    MatcherKey,
+)
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.services.account.account_analysis_report import (
+    AccountAnalysisReport,
+)
+from budget_forecaster.services.forecast.report_cache import (
+    ReportCache,
+    report_cache_key,
+)
+
+
+@pytest.fixture(name="account")
+def account_fixture() -> Account:
+    """Create an account without operations."""
+    return Account(
+        name="Main",
+        balance=1000.0,
+        currency="EUR",
+        balance_date=date(2025, 1, 20),
+        operations=(),
+    )
+
+
+@pytest.fixture(name="forecast")
+def forecast_fixture() -> Forecast:
+    """Create a forecast with a single rent."""
+    return Forecast(
+        (
+            PlannedOperation(
+                record_id=1,
+                description="Rent",
+                amount=Amount(-800.0),
+                category=Category.RENT,
+                date_range=SingleDay(date(2025, 2, 5)),
+            ),
+        ),
+        (),
+    )
+
+
+@pytest.fixture(name="report")
+def report_fixture() -> AccountAnalysisReport:
+    """Create a small report."""
+    balances = pd.DataFrame(
+        {"Balance": [1000.0, 200.0]},
+        index=pd.DatetimeIndex(["2025-01-20", "2025-02-05"], name="Date"),
+    )
+    return AccountAnalysisReport(
+        balance_date=date(2025, 1, 20),
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 2, 28),
+        operations=pd.DataFrame(),
+        forecast=pd.DataFrame(),
+        balance_evolution_per_day=balances,
+        budget_forecast=pd.DataFrame(),
+        budget_statistics=pd.DataFrame(),
+    )
+
+
+def _key(
+    account: Account,
+    forecast: Forecast,
+    versions: dict[MatcherKey, int] | None = None,
+    resolution: BalanceResolution = BalanceResolution.DAILY,
+) -> str:
+    return report_cache_key(account, forecast, versions or {}, (), resolution)
+
+
+class TestReportCacheKey:
+    """Tests for report_cache_key."""
+
+    def test_same_inputs_same_key(self, account: Account, forecast: Forecast) -> None:
+        """The key only depends on the inputs of the report."""
+        assert _key(account, forecast) == _key(account, forecast)
+
+    def test_changed_inputs_change_key(
+        self, account: Account, forecast: Forecast
+    ) -> None:
+        """Any input of the report gives another key."""
+        key = _key(account, forecast)
+        rent = forecast.operations[0]
+
+        assert _key(account._replace(balance=900.0), forecast) != key
+        assert _key(account._replace(balance_date=date(2025, 1, 21)), forecast) != key
+        assert (
+            _key(
+                account,
+                Forecast((rent.replace(amount=Amount(-850.0)),), ()),
+            )
+            != key
+        )
+        assert _key(account, Forecast((rent.replace(record_id=2),), ())) != key
+        assert (
+            _key(
+                account,
+                forecast,
+                {MatcherKey(LinkType.PLANNED_OPERATION, 1): 2},
+            )
+            != key
+        )
+        assert _key(account, forecast, resolution=BalanceResolution.MONTHLY) != key
+
+
+class TestReportCache:
+    """Tests for ReportCache."""
+
+    def test_round_trip(self, tmp_path: Path, report: AccountAnalysisReport) -> None:
+        """A saved report is loaded back with the same key."""
+        cache = ReportCache(tmp_path / "budget.db.report-cache")
+        cache.save("key", report)
+
+        loaded = ReportCache(cache.path).load("key")
+
+        assert loaded is not None
+        assert loaded.end_date == report.end_date
+        assert loaded.balance_evolution_per_day.equals(report.balance_evolution_per_day)
+        assert [path.name for path in tmp_path.iterdir()] == [cache.path.name]
+
+    def test_stale_key(self, tmp_path: Path, report: AccountAnalysisReport) -> None:
+        """A report saved with another key is ignored."""
+        cache = ReportCache(tmp_path / "budget.db.report-cache")
+        cache.save("old", report)
+
+        assert cache.load("new") is None
+
+    def test_missing_or_unreadable(self, tmp_path: Path) -> None:
+        """A missing or corrupted cache file is ignored."""
+        cache = ReportCache(tmp_path / "budget.db.report-cache")
+        assert cache.load("key") is None
+
+        cache.path.write_bytes(b"not a report")
+        assert cache.load("key") is None
+
+    def test_unwritable(self, tmp_path: Path, report: AccountAnalysisReport) -> None:
+        """Failing to write the cache is not an error."""
+        cache = ReportCache(tmp_path / "missing" / "budget.db.report-cache")
+
+        cache.save("key", report)
+
+        assert cache.load("key") is None
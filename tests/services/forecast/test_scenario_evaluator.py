@@ -0,0 +1,171 @@
+"""Module to test the ScenarioEvaluator class."""
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.date_range import (
+    DateRange,
+    RecurringDateRange,
+    RecurringDay,
+)
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.account.account import Account
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario, scale_amount
+from budget_forecaster.domain.operation.budget import Budget
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
+from budget_forecaster.exceptions import ComputationCancelledError
+from budget_forecaster.services.account.account_analyzer import AccountAnalyzer
+from budget_forecaster.services.forecast.scenario_evaluator import (
+    BASELINE_SCENARIO,
+    ScenarioEvaluator,
+)
+
+
+@pytest.fixture(name="forecast")
+def forecast_fixture() -> Forecast:
+    """Create a forecast with a salary, a rent and a groceries budget."""
+    return Forecast(
+        (
+            PlannedOperation(
+                record_id=1,
+                description="Salary",
+                amount=Amount(2000.0),
+                category=Category.SALARY,
+                date_range=RecurringDay(date(2025, 1, 1), relativedelta(months=1)),
+            ),
+            PlannedOperation(
+                record_id=2,
+                description="Rent",
+                amount=Amount(-800.0),
+                category=Category.RENT,
+                date_range=RecurringDay(date(2025, 1, 5), relativedelta(months=1)),
+            ),
+        ),
+        (
+            Budget(
+                record_id=1,
+                description="Groceries",
+                amount=Amount(-310.0),
+                category=Category.GROCERIES,
+                date_range=RecurringDateRange(
+                    DateRange(date(2025, 1, 1), relativedelta(months=1)),
+                    relativedelta(months=1),
+                ),
+            ),
+        ),
+    )
+
+
+@pytest.fixture(name="account")
+def account_fixture() -> Account:
+    """Create an account with its balance on January 20th."""
+    return Account(
+        name="Main",
+        balance=1000.0,
+        currency="EUR",
+        balance_date=date(2025, 1, 20),
+        operations=(),
+    )
+
+
+@pytest.fixture(name="scenarios")
+def scenarios_fixture(forecast: Forecast) -> list[Scenario]:
+    """Create scenarios removing the rent and raising the groceries budget."""
+    return [
+        Scenario(
+            "No rent",
+            removed=frozenset({MatcherKey(LinkType.PLANNED_OPERATION, 2)}),
+        ),
+        Scenario("More groceries", modified=(scale_amount(forecast.budgets[0], 1.1),)),
+    ]
+
+
+class TestScenarioEvaluator:
+    """Tests for ScenarioEvaluator."""
+
+    def test_balances_match_account_analyzer(
+        self, account: Account, forecast: Forecast, scenarios: list[Scenario]
+    ) -> None:
+        """Each curve is the balance evolution of the scenario's forecast."""
+        end_date = date(2025, 6, 30)
+        comparison = ScenarioEvaluator(account, forecast)(scenarios, end_date)
+
+        assert list(comparison.balances.columns) == [
+            BASELINE_SCENARIO,
+            "No rent",
+            "More groceries",
+        ]
+        for name, scenario_forecast in (
+            (BASELINE_SCENARIO, forecast),
+            *((scenario.name, scenario.apply(forecast)) for scenario in scenarios),
+        ):
+            expected = AccountAnalyzer(
+                account, scenario_forecast
+            ).compute_balance_evolution_per_day(account.balance_date, end_date)
+            assert comparison.balances[name].tolist() == pytest.approx(
+                expected["Balance"].tolist()
+            )
+
+    def test_margins(
+        self, account: Account, forecast: Forecast, scenarios: list[Scenario]
+    ) -> None:
+        """Margins are the lowest balance from each month onward, minus threshold."""
+        comparison = ScenarioEvaluator(account, forecast)(
+            scenarios, date(2025, 6, 30), threshold=100.0
+        )
+
+        balances = comparison.balances["No rent"]
+        margins = comparison.margins["No rent"]
+        assert margins["2025-01-01"] == pytest.approx(balances.min() - 100.0)
+        assert margins["2025-03-01"] == pytest.approx(
+            balances["2025-03-01":].min() - 100.0
+        )
+        month_end = comparison.month_end_balances["No rent"]
+        assert month_end["2025-02-01"] == pytest.approx(balances["2025-02-28"])
+
+    def test_process_pool(
+        self, account: Account, forecast: Forecast, scenarios: list[Scenario]
+    ) -> None:
+        """Scenarios computed in worker processes give the same curves."""
+        evaluator = ScenarioEvaluator(account, forecast)
+        end_date = date(2025, 6, 30)
+
+        in_pool = evaluator(scenarios, end_date, max_workers=2)
+
+        assert in_pool.balances.equals(evaluator(scenarios, end_date).balances)
+
+    def test_duplicate_names(self, account: Account, forecast: Forecast) -> None:
+        """Scenario names must be unique and differ from the baseline."""
+        evaluator = ScenarioEvaluator(account, forecast)
+
+        with pytest.raises(ValueError):
+            evaluator([Scenario(BASELINE_SCENARIO)], date(2025, 6, 30))
+        with pytest.raises(ValueError):
+            evaluator([Scenario("Same"), Scenario("Same")], date(2025, 6, 30))
+
+    def test_end_date_before_balance_date(
+        self, account: Account, forecast: Forecast
+    ) -> None:
+        """The curves cannot end before the balance date."""
+        with pytest.raises(ValueError):
+            ScenarioEvaluator(account, forecast)([], date(2025, 1, 1))
+
+    def test_cancelled(
+        self, account: Account, forecast: Forecast, scenarios: list[Scenario]
+    ) -> None:
+        """A cancelled comparison stops before actualizing the scenarios."""
+        actualizer = MagicMock()
+        evaluator = ScenarioEvaluator(account, forecast, actualizer)
+
+        with pytest.raises(ComputationCancelledError):
+            evaluator(
+                scenarios,
+                date(2025, 6, 30),
+                cancellation=MagicMock(is_cancelled=True),
+            )
+
+        actualizer.assert_not_called()
@@ -1,16 +1,20 @@
 """Tests for the operation link service."""
 
-from datetime import date
+from datetime import date, timedelta
 
+import numpy as np
 from dateutil.relativedelta import relativedelta
 
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.date_range import DateRange
 from budget_forecaster.core.types import Category
+from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.operation_range import OperationRange
 from budget_forecaster.services.operation.operation_link_service import (
     compute_match_score,
+    compute_match_scores,
+    match_score_matrix,
 )
 
 
@@ -208,3 +212,118 @@ class TestComputeMatchScore:
 
         assert score_relaxed > score_default
         assert score_relaxed == 90.0  # Full score with relaxed tolerance
+
+
+class TestComputeMatchScores:
+    """Tests for the batch compute_match_scores function."""
+
+    def test_matrix_matches_pairwise_scores(self) -> None:
+        """Each cell equals the score of the corresponding pair."""
+        op_range = OperationRange(
+            "Test Operation",
+            Amount(-100, "EUR"),
+            Category.GROCERIES,
+            DateRange(date(2023, 1, 1), relativedelta(months=1)),
+        )
+        operations = [
+            HistoricOperation(
+                unique_id=i,
+                description=description,
+                amount=Amount(amount),
+                category=category,
+                operation_date=date(2023, 1, 1) + timedelta(days=offset),
+            )
+            for i, (description, amount, category, offset) in enumerate(
+                (
+                    ("CARREFOUR", -100.0, Category.GROCERIES, 0),
+                    ("CARREFOUR CITY", -130.0, Category.GROCERIES, 12),
+                    ("LIDL", -40.0, Category.OTHER, -20),
+                    ("CARREFOUR", -300.0, Category.GROCERIES, 45),
+                )
+            )
+        ]
+        iteration_dates = [date(2022, 12, 1), date(2023, 1, 1), date(2023, 2, 1)]
+
+        scores = compute_match_scores(
+            operations,
+            op_range,
+            iteration_dates,
+            approximation_amount_ratio=0.1,
+            approximation_date_range=timedelta(days=3),
+            description_hints={"CARREFOUR"},
+        )
+
+        assert scores.shape == (4, 3)
+        for row, operation in enumerate(operations):
+            for column, iteration_date in enumerate(iteration_dates):
+                assert scores[row, column] == compute_match_score(
+                    operation,
+                    op_range,
+                    iteration_date,
+                    approximation_amount_ratio=0.1,
+                    approximation_date_range=timedelta(days=3),
+                    description_hints={"CARREFOUR"},
+                )
+
+    def test_budget_skips_amount_score(self) -> None:
+        """Budgets don't get amount points, whatever the operation amount."""
+        budget = Budget(
+            record_id=1,
+            description="Groceries",
+            amount=Amount(-300, "EUR"),
+            category=Category.GROCERIES,
+            date_range=DateRange(date(2023, 1, 1), relativedelta(months=1)),
+        )
+        operation = HistoricOperation(
+            unique_id=1,
+            description="CARREFOUR",
+            amount=Amount(-300.0),
+            category=Category.GROCERIES,
+            operation_date=date(2023, 1, 1),
+        )
+
+        scores = compute_match_scores([operation], budget, [date(2023, 1, 1)])
+
+        np.testing.assert_array_equal(scores, [[50.0]])
+
+    def test_empty_inputs(self) -> None:
+        """Empty operations or iterations give an empty matrix."""
+        op_range = OperationRange(
+            "Test Operation",
+            Amount(100, "EUR"),
+            Category.GROCERIES,
+            DateRange(date(2023, 1, 1), relativedelta(months=1)),
+        )
+
+        assert compute_match_scores([], op_range, [date(2023, 1, 1)]).shape == (0, 1)
+        assert compute_match_scores(
+            [
+                HistoricOperation(
+                    unique_id=1,
+                    description="Test",
+                    amount=Amount(100.0),
+                    category=Category.GROCERIES,
+                    operation_date=date(2023, 1, 1),
+                )
+            ],
+            op_range,
+            [],
+        ).shape == (1, 0)
+
+    def test_match_score_matrix_from_arrays(self) -> None:
+        """The array kernel applies the 40/30/20/10 weighting."""
+        day = date(2023, 1, 1).toordinal()
+
+        scores = match_score_matrix(
+            operation_amounts=np.array([100.0, 150.0]),
+            operation_days=np.array([day, day + 40]),
+            category_matches=np.array([True, False]),
+            description_matches=np.array([True, False]),
+            iteration_days=np.array([day]),
+            planned_amount=100.0,
+            approximation_amount_ratio=0.05,
+            approximation_days=5,
+        )
+
+        # 40 + 30 + 20 + 10, then 40 * (1 - 0.45) + 30 * (1 - 35 / 30 -> 0)
+        np.testing.assert_allclose(scores, [[100.0], [22.0]])
@@ -0,0 +1,71 @@
+"""Tests for the DescriptionHintIndex class."""
+import random
+
+import pytest
+
+from budget_forecaster.services.operation.description_hint_index import (
+    DescriptionHintIndex,
+)
+
+
+class TestDescriptionHintIndex:
+    """Tests for multi-pattern description hint matching."""
+
+    def test_all_hints_must_be_present(self) -> None:
+        """A key matches only when every one of its hints is found."""
+        index = DescriptionHintIndex({"edf": {"PRLV", "EDF"}, "engie": {"ENGIE"}})
+
+        assert index.matching_keys("PRLV SEPA EDF CLIENTS") == {"edf"}
+        assert index.matching_keys("PRLV SEPA ENGIE") == {"engie"}
+        assert not index.matching_keys("CB EDF")
+
+    def test_overlapping_and_nested_hints(self) -> None:
+        """Hints sharing prefixes or contained in each other are all found."""
+        index = DescriptionHintIndex(
+            {"he": {"he"}, "she": {"she"}, "hers": {"hers"}, "his": {"his"}}
+        )
+
+        assert index.matching_keys("ushers") == {"he", "she", "hers"}
+        assert index.matching_keys("this") == {"his"}
+
+    def test_matching_is_case_sensitive(self) -> None:
+        """Matching follows the substring semantic of match_description."""
+        index = DescriptionHintIndex({"rent": {"RENT"}})
+
+        assert not index.matching_keys("rent transfer")
+
+    def test_keys_without_hints(self) -> None:
+        """Keys without hints are reported separately and never matched."""
+        index = DescriptionHintIndex({"none": set(), "rent": {"RENT"}})
+
+        assert index.keys == frozenset({"none", "rent"})
+        assert index.keys_without_hints == frozenset({"none"})
+        assert index.matching_keys("RENT") == {"rent"}
+
+    def test_empty_hint_always_matches(self) -> None:
+        """An empty hint is contained in any description."""
+        index = DescriptionHintIndex({"empty": {""}})
+
+        assert index.matching_keys("anything") == {"empty"}
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_result_as_substring_checks(self, seed: int) -> None:
+        """The automaton agrees with testing every hint of every key."""
+        rng = random.Random(seed)
+        alphabet = "abc"
+        hints_by_key = {
+            key: {
+                "".join(rng.choices(alphabet, k=rng.randint(1, 3)))
+                for _ in range(rng.randint(1, 3))
+            }
+            for key in range(20)
+        }
+        index = DescriptionHintIndex(hints_by_key)
+
+        for _ in range(50):
+            description = "".join(rng.choices(alphabet, k=rng.randint(0, 12)))
+            assert index.matching_keys(description) == {
+                key
+                for key, hints in hints_by_key.items()
+                if all(hint in description for hint in hints)
+            }
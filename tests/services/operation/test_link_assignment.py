@@ -0,0 +1,84 @@
+"""Tests for the link assignment solver."""
+
+# pylint: disable=too-few-public-methods
+
+import itertools
+
+import numpy as np
+
+from budget_forecaster.services.operation.link_assignment import (
+    AssignmentEdge,
+    max_weight_matching,
+    solve_assignment,
+)
+
+
+def _best_total_weight(weights: np.ndarray) -> float:
+    """Brute-force the best matching weight of a small matrix."""
+    n_rows, n_columns = weights.shape
+    best = 0.0
+    for columns in itertools.product(range(-1, n_columns), repeat=n_rows):
+        assigned = [column for column in columns if column >= 0]
+        if len(assigned) != len(set(assigned)):
+            continue
+        total = sum(
+            max(weights[row, column], 0.0)
+            for row, column in enumerate(columns)
+            if column >= 0
+        )
+        best = max(best, total)
+    return best
+
+
+class TestMaxWeightMatching:
+    """Tests for max_weight_matching."""
+
+    def test_prefers_global_optimum_over_greedy(self) -> None:
+        """The greedy best pair is dropped when two other pairs are worth more."""
+        weights = np.array([[10.0, 9.0], [8.0, 0.0]])
+
+        assert max_weight_matching(weights) == [(0, 1), (1, 0)]
+
+    def test_rows_may_stay_unmatched(self) -> None:
+        """More rows than columns, and non-positive weights are never kept."""
+        weights = np.array([[5.0], [7.0], [-1.0]])
+
+        assert max_weight_matching(weights) == [(1, 0)]
+
+    def test_empty_matrix(self) -> None:
+        """An empty matrix has no matching."""
+        assert not max_weight_matching(np.zeros((0, 3)))
+
+    def test_matches_brute_force(self) -> None:
+        """Random small matrices reach the brute-force optimum."""
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            shape = tuple(rng.integers(1, 5, size=2))
+            weights = rng.integers(-3, 10, size=shape) * (rng.random(shape) < 0.7)
+            weights = weights.astype(np.float64)
+
+            matching = max_weight_matching(weights)
+
+            assert len({column for _, column in matching}) == len(matching)
+            total = sum(weights[row, column] for row, column in matching)
+            assert total == _best_total_weight(weights)
+
+
+class TestSolveAssignment:
+    """Tests for solve_assignment."""
+
+    def test_each_slot_takes_one_operation(self) -> None:
+        """Competing operations are spread over slots, across blocks."""
+        edges = [
+            AssignmentEdge(0, "january", 5.0),
+            AssignmentEdge(1, "january", 6.0),
+            AssignmentEdge(0, "february", 4.0),
+            AssignmentEdge(2, "march", 1.0),
+            AssignmentEdge(3, "march", -1.0),
+        ]
+
+        assert solve_assignment(edges) == {0: "february", 1: "january", 2: "march"}
+
+    def test_no_edges(self) -> None:
+        """Nothing is assigned without candidates."""
+        assert not solve_assignment([])
@@ -0,0 +1,71 @@
+"""Tests for the monthly rollup of operations."""
+from datetime import date
+
+import pandas as pd
+
+from budget_forecaster.core.amount import Amount
+from budget_forecaster.core.types import Category
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.services.operation.monthly_rollup import compute_monthly_rollup
+
+
+def _make_operation(
+    unique_id: int, category: Category, amount: float, operation_date: date
+) -> HistoricOperation:
+    return HistoricOperation(
+        unique_id=unique_id,
+        description=f"Operation {unique_id}",
+        amount=Amount(amount),
+        category=category,
+        operation_date=operation_date,
+    )
+
+
+class TestComputeMonthlyRollup:
+    """Tests for compute_monthly_rollup."""
+
+    def test_sums_per_category_and_month(self) -> None:
+        """Amounts of the same category and month are summed."""
+        operations = (
+            _make_operation(1, Category.GROCERIES, -50.0, date(2025, 1, 5)),
+            _make_operation(2, Category.GROCERIES, -30.0, date(2025, 1, 20)),
+            _make_operation(3, Category.RENT, -800.0, date(2025, 2, 1)),
+            _make_operation(4, Category.GROCERIES, -40.0, date(2025, 2, 10)),
+        )
+
+        rollup = compute_monthly_rollup(operations, date(2025, 1, 1), date(2025, 2, 28))
+
+        assert list(rollup.index) == [Category.GROCERIES, Category.RENT]
+        assert rollup.loc[Category.GROCERIES].tolist() == [-80.0, -40.0]
+        assert rollup.loc[Category.RENT].tolist() == [0.0, -800.0]
+
+    def test_full_month_grid(self) -> None:
+        """Months without operations are present with zero amounts."""
+        operations = (_make_operation(1, Category.RENT, -800.0, date(2025, 1, 1)),)
+
+        rollup = compute_monthly_rollup(operations, date(2025, 1, 1), date(2025, 3, 31))
+
+        assert list(rollup.columns) == list(
+            pd.date_range("2025-01-01", "2025-03-01", freq="MS")
+        )
+        assert rollup.loc[Category.RENT].tolist() == [-800.0, 0.0, 0.0]
+
+    def test_operations_outside_period_ignored(self) -> None:
+        """Operations outside [start_date, end_date] are not aggregated."""
+        operations = (
+            _make_operation(1, Category.RENT, -800.0, date(2024, 12, 31)),
+            _make_operation(2, Category.OTHER, -10.0, date(2025, 1, 15)),
+            _make_operation(3, Category.RENT, -800.0, date(2025, 2, 1)),
+        )
+
+        rollup = compute_monthly_rollup(operations, date(2025, 1, 1), date(2025, 1, 31))
+
+        assert list(rollup.index) == [Category.OTHER]
+        assert rollup.loc[Category.OTHER].tolist() == [-10.0]
+
+    def test_no_operations(self) -> None:
+        """Without operations, the rollup has no rows but keeps the month grid."""
+        rollup = compute_monthly_rollup((), date(2025, 1, 1), date(2025, 2, 28))
+
+        assert rollup.empty
+        assert len(rollup.columns) == 2
@@ -35,6 +35,9 @@ from budget_forecaster.infrastructure.persistence.sqlite_repository import (
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.services.forecast.forecast_service import ForecastService
 from budget_forecaster.services.import_service import ImportService
+from budget_forecaster.services.operation.description_hint_index import (
+    DescriptionHintIndex,
+)
 from budget_forecaster.services.operation.operation_link_service import (
     OperationLinkService,
     compute_match_score,
@@ -310,6 +313,156 @@ class TestCreateHeuristicLinks:
 
         assert len(created_links) == 0
 
+    def test_hint_index_selects_candidate_targets(
+        self,
+        link_service: OperationLinkService,
+        monthly_rent_range: OperationRange,
+        sample_operations: tuple[HistoricOperation, ...],
+    ) -> None:
+        """Only targets whose hints are found in the description are tried."""
+        rent_key = MatcherKey(LinkType.PLANNED_OPERATION, 1)
+        other_key = MatcherKey(LinkType.PLANNED_OPERATION, 2)
+        matchers = {
+            # Same rent range, but with hints absent from the descriptions
+            other_key: OperationMatcher(
+                operation_range=monthly_rent_range, description_hints={"LOYER"}
+            ),
+            rent_key: OperationMatcher(
+                operation_range=monthly_rent_range, description_hints={"RENT"}
+            ),
+        }
+        hint_index = DescriptionHintIndex(
+            {key: matcher.description_hints for key, matcher in matchers.items()}
+        )
+
+        created_links = link_service.create_heuristic_links(
+            sample_operations, matchers, hint_index
+        )
+
+        assert {link.operation_unique_id for link in created_links} == {1, 2}
+        assert all(link.target_id == rent_key.target_id for link in created_links)
+
+    def test_hint_index_missing_target_is_still_tried(
+        self,
+        link_service: OperationLinkService,
+        monthly_rent_matcher: OperationMatcher,
+        sample_operations: tuple[HistoricOperation, ...],
+    ) -> None:
+        """Targets unknown to the hint index are tried with all criteria."""
+        matchers = {MatcherKey(LinkType.PLANNED_OPERATION, 1): monthly_rent_matcher}
+
+        created_links = link_service.create_heuristic_links(
+            sample_operations, matchers, DescriptionHintIndex({})
+        )
+
+        assert {link.operation_unique_id for link in created_links} == {1, 2}
+
+
+class TestCreateOptimalLinks:
+    """Tests for create_optimal_links method."""
+
+    @pytest.fixture(name="competing_operations")
+    def competing_operations_fixture(self) -> tuple[HistoricOperation, ...]:
+        """Two rent operations around the same January iteration."""
+        return (
+            HistoricOperation(
+                unique_id=1,
+                description="RENT TRANSFER",
+                amount=Amount(-800.0, "EUR"),
+                category=Category.RENT,
+                operation_date=date(2024, 1, 4),
+            ),
+            HistoricOperation(
+                unique_id=2,
+                description="RENT TRANSFER",
+                amount=Amount(-800.0, "EUR"),
+                category=Category.RENT,
+                operation_date=date(2024, 1, 1),
+            ),
+        )
+
+    def test_planned_iteration_takes_one_operation(
+        self,
+        link_service: OperationLinkService,
+        monthly_rent_planned_op: PlannedOperation,
+        competing_operations: tuple[HistoricOperation, ...],
+    ) -> None:
+        """Only the best operation is linked to a planned iteration."""
+        matchers = {
+            MatcherKey(LinkType.PLANNED_OPERATION, 1): monthly_rent_planned_op.matcher
+        }
+
+        created_links = link_service.create_optimal_links(
+            competing_operations, matchers
+        )
+
+        # Heuristic linking would give the same iteration to both operations
+        assert len(created_links) == 1
+        assert created_links[0].iteration_date == date(2024, 1, 1)
+        assert created_links[0].is_manual is False
+
+    def test_unassigned_operation_falls_back_to_budget(
+        self,
+        link_service: OperationLinkService,
+        repository: SqliteRepository,
+        monthly_rent_planned_op: PlannedOperation,
+        monthly_rent_range: OperationRange,
+        competing_operations: tuple[HistoricOperation, ...],
+    ) -> None:
+        """The planned iteration goes to the operation without another target.
+
+        Picking the best target per operation would link both operations to
+        the planned iteration.
+        """
+        operations = (
+            competing_operations[0],
+            competing_operations[1].replace(description="RENT"),
+        )
+        matchers = {
+            # Only matches the first operation
+            MatcherKey(LinkType.BUDGET, 7): OperationMatcher(
+                operation_range=monthly_rent_range, description_hints={"TRANSFER"}
+            ),
+            MatcherKey(LinkType.PLANNED_OPERATION, 1): monthly_rent_planned_op.matcher,
+        }
+
+        created_links = link_service.create_optimal_links(operations, matchers)
+
+        assert [
+            (link.operation_unique_id, link.target_type) for link in created_links
+        ] == [(1, LinkType.BUDGET), (2, LinkType.PLANNED_OPERATION)]
+        persisted = repository.get_link_for_operation(1)
+        assert persisted is not None
+        assert persisted.target_type == LinkType.BUDGET
+
+    def test_existing_link_occupies_iteration(
+        self,
+        link_service: OperationLinkService,
+        repository: SqliteRepository,
+        monthly_rent_planned_op: PlannedOperation,
+        competing_operations: tuple[HistoricOperation, ...],
+    ) -> None:
+        """A planned iteration already linked manually is not reassigned."""
+        repository.upsert_link(
+            OperationLink(
+                operation_unique_id=2,
+                target_type=LinkType.PLANNED_OPERATION,
+                target_id=1,
+                iteration_date=date(2024, 1, 1),
+                is_manual=True,
+            )
+        )
+        matchers = {
+            MatcherKey(LinkType.PLANNED_OPERATION, 1): monthly_rent_planned_op.matcher
+        }
+
+        created_links = link_service.create_optimal_links(
+            competing_operations, matchers
+        )
+
+        assert not created_links
+        assert repository.get_link_for_operation(1) is None
+
 
 class TestDeleteLinksForTarget:
     """Tests for delete_links_for_target and delete_automatic_links_for_target."""
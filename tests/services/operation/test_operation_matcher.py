@@ -641,6 +641,26 @@ class TestOperationMatcherPeriodicTimeRange:
             == set()
         )
 
+    def test_late_time_ranges_ignore_operations_order(
+        self,
+        periodic_operation_range: OperationRange,
+        historic_operations: list[HistoricOperation],
+    ) -> None:
+        """Iterations are swept in date order whatever the order of operations."""
+        matcher = OperationMatcher(
+            periodic_operation_range, approximation_date_range=timedelta(days=5)
+        )
+        for current_date in (date(2023, 1, 6), date(2023, 2, 3), date(2023, 3, 4)):
+            assert list(
+                matcher.late_date_ranges(current_date, historic_operations)
+            ) == list(
+                matcher.late_date_ranges(current_date, reversed(historic_operations))
+            )
+        # Only the March iteration has no matching operation
+        assert list(
+            matcher.late_date_ranges(date(2023, 3, 4), historic_operations)
+        ) == [DateRange(date(2023, 3, 1), relativedelta(months=1))]
+
 
 class TestOperationMatcherOperationLinks:
     """Tests for operation link functionality in OperationMatcher."""
@@ -767,6 +787,36 @@ class TestOperationMatcherOperationLinks:
         # Operation links should be cleared because they referenced the old range
         assert not new_matcher.operation_links
 
+    def test_link_lookups_survive_replace_and_update_params(
+        self, operation_range: OperationRange
+    ) -> None:
+        """Link lookups keep working after replace() and update_params()."""
+        operation = HistoricOperation(
+            unique_id=100,
+            description="Linked operation",
+            amount=Amount(500.0),
+            category=Category.OTHER,
+            operation_date=date(2023, 6, 15),
+        )
+        link = OperationLink(
+            operation_unique_id=100,
+            target_type=LinkType.PLANNED_OPERATION,
+            target_id=1,
+            iteration_date=date(2023, 1, 1),
+        )
+        matcher = OperationMatcher(operation_range, operation_links=(link,))
+
+        for updated in (
+            matcher.replace(),
+            matcher.update_params(approximation_date_range=timedelta(days=1)),
+        ):
+            assert updated.is_linked(operation)
+            assert updated.get_iteration_for_operation(operation) == date(2023, 1, 1)
+
+        cleared = matcher.replace(operation_range=operation_range.replace())
+        assert not cleared.is_linked(operation)
+        assert cleared.get_iteration_for_operation(operation) is None
+
     def test_operation_links_property_returns_tuple(
         self, operation_range: OperationRange
     ) -> None:
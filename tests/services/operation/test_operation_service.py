@@ -3,6 +3,7 @@
 from datetime import date
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
 from budget_forecaster.core.amount import Amount
@@ -239,6 +240,18 @@ class TestOperationService:
         expected = -50.0 + 2500.0 - 99.99 - 35.50 - 80.0
         assert abs(totals["2025-01"] - expected) < 0.01
 
+    def test_get_monthly_category_totals(self, service: OperationService) -> None:
+        """get_monthly_category_totals returns a zero-filled category x month grid."""
+        totals = service.get_monthly_category_totals(
+            date(2025, 1, 1), date(2025, 2, 28), OperationFilter(max_amount=0)
+        )
+
+        assert list(totals.columns) == list(
+            pd.to_datetime([date(2025, 1, 1), date(2025, 2, 1)])
+        )
+        assert Category.SALARY not in totals.index
+        assert totals.loc[Category.GROCERIES].tolist() == [-85.50, 0.0]
+
     def test_balance_property(self, service: OperationService) -> None:
         """balance property returns account balance."""
         assert service.balance == 1000.0
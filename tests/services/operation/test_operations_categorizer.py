@@ -10,6 +10,7 @@ from budget_forecaster.domain.forecast.forecast import Forecast
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.operation.operations_categorizer import (
+    OperationsCategorizer,
     categorize_operations,
 )
 
@@ -303,3 +304,110 @@ class TestCategorizeOperations:
         result = categorize_operations(ops, forecast)
 
         assert tuple(op.unique_id for op in result) == (1, 2, 3, 4, 5)
+
+
+class TestOperationsCategorizer:
+    """Tests for the incremental OperationsCategorizer."""
+
+    def test_unchanged_inputs_are_not_recategorized(self) -> None:
+        """A second call with the same inputs reuses the memoized results."""
+        operation = _make_operation(description="SUPERMARKET CARREFOUR")
+        forecast = Forecast(
+            operations=(_make_planned(hints={"CARREFOUR"}),), budgets=()
+        )
+        categorizer = OperationsCategorizer()
+
+        first = categorizer([operation], forecast)
+        second = categorizer([operation], forecast)
+
+        assert second[0] is first[0]
+        assert second[0].category == Category.GROCERIES
+
+    def test_only_affected_operations_are_recategorized(self) -> None:
+        """Adding a planned operation only recategorizes its candidates."""
+        carrefour = _make_operation(unique_id=1, description="SUPERMARKET CARREFOUR")
+        edf = _make_operation(unique_id=2, description="PRLV EDF", amount=-60.0)
+        categorizer = OperationsCategorizer()
+        first = categorizer(
+            [carrefour, edf],
+            Forecast(operations=(_make_planned(hints={"CARREFOUR"}),), budgets=()),
+        )
+
+        electricity = _make_planned(
+            record_id=2, amount=-60.0, category=Category.ELECTRICITY, hints={"EDF"}
+        )
+        second = categorizer(
+            [carrefour, edf],
+            Forecast(
+                operations=(_make_planned(hints={"CARREFOUR"}), electricity),
+                budgets=(),
+            ),
+        )
+
+        assert second[0] is first[0]
+        assert second[1].category == Category.ELECTRICITY
+
+    def test_removed_planned_operation_uncategorizes(self) -> None:
+        """Operations categorized by a removed planned operation are reset."""
+        operation = _make_operation(description="SUPERMARKET CARREFOUR")
+        categorizer = OperationsCategorizer()
+        categorizer(
+            [operation],
+            Forecast(operations=(_make_planned(hints={"CARREFOUR"}),), budgets=()),
+        )
+
+        result = categorizer([operation], Forecast(operations=(), budgets=()))
+
+        assert result[0].category == Category.UNCATEGORIZED
+
+    def test_edited_planned_operation_recategorizes(self) -> None:
+        """Editing the category of a planned operation updates its operations."""
+        operation = _make_operation(description="SUPERMARKET CARREFOUR")
+        categorizer = OperationsCategorizer()
+        categorizer(
+            [operation],
+            Forecast(operations=(_make_planned(hints={"CARREFOUR"}),), budgets=()),
+        )
+
+        result = categorizer(
+            [operation],
+            Forecast(
+                operations=(
+                    _make_planned(category=Category.OTHER, hints={"CARREFOUR"}),
+                ),
+                budgets=(),
+            ),
+        )
+
+        assert result[0].category == Category.OTHER
+
+    def test_reordered_planned_operations_change_priority(self) -> None:
+        """When planned operations are reordered, the new first match wins."""
+        operation = _make_operation(description="CARREFOUR MARKET", amount=-50.0)
+        groceries = _make_planned(record_id=1, amount=-50.0, hints={"CARREFOUR"})
+        other = _make_planned(
+            record_id=2, amount=-50.0, category=Category.OTHER, hints={"CARREFOUR"}
+        )
+        categorizer = OperationsCategorizer()
+        categorizer([operation], Forecast(operations=(groceries, other), budgets=()))
+
+        result = categorizer(
+            [operation], Forecast(operations=(other, groceries), budgets=())
+        )
+
+        assert result[0].category == Category.OTHER
+
+    def test_changed_operation_is_recategorized(self) -> None:
+        """An operation whose amount changed is categorized again."""
+        forecast = Forecast(
+            operations=(_make_planned(hints={"CARREFOUR"}),), budgets=()
+        )
+        categorizer = OperationsCategorizer()
+        categorizer([_make_operation(description="SUPERMARKET CARREFOUR")], forecast)
+
+        result = categorizer(
+            [_make_operation(description="SUPERMARKET CARREFOUR", amount=-500.0)],
+            forecast,
+        )
+
+        assert result[0].category == Category.UNCATEGORIZED
@@ -2,7 +2,7 @@
 
 # pylint: disable=too-few-public-methods,too-many-lines
 
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -16,7 +16,9 @@ from budget_forecaster.core.date_range import (
     RecurringDay,
     SingleDay,
 )
-from budget_forecaster.core.types import Category, ImportStats, LinkType
+from budget_forecaster.core.types import Category, ImportStats, LinkType, MatcherKey
+from budget_forecaster.domain.forecast.forecast import Forecast
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
@@ -27,6 +29,7 @@ from budget_forecaster.exceptions import (
 )
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.services.forecast.forecast_service import ForecastService
+from budget_forecaster.services.forecast.scenario_evaluator import BASELINE_SCENARIO
 from budget_forecaster.services.import_service import ImportResult, ImportService
 from budget_forecaster.services.operation.operation_link_service import (
     OperationLinkService,
@@ -61,6 +64,11 @@ def mock_forecast_service_fixture() -> MagicMock:
     mock = MagicMock(spec=ForecastService)
     mock.get_all_planned_operations.return_value = []
     mock.get_all_budgets.return_value = []
+    mock.get_definition_versions.return_value = {}
+    # The matcher cache reads targets from the shared forecast
+    mock.get_forecast.side_effect = lambda: Forecast(
+        tuple(mock.get_all_planned_operations()), tuple(mock.get_all_budgets())
+    )
     return mock
 
 
@@ -125,12 +133,13 @@ class TestImportFile:
         mock_result = ImportResult(
             path=Path("/test.xlsx"),
             success=True,
-            stats=ImportStats(total_in_file=5, new_operations=5, duplicates_skipped=0),
+            stats=ImportStats(total_in_file=1, new_operations=1, duplicates_skipped=0),
+            new_operation_ids=(1,),
         )
         mock_import_service.import_file.return_value = mock_result
 
         # Setup operations
-        operations = (MagicMock(),)
+        operations = (MagicMock(unique_id=1),)
         mock_persistent_account.account.operations = operations
 
         # Setup matchers
@@ -144,6 +153,45 @@ class TestImportFile:
 
         mock_operation_link_service.create_heuristic_links.assert_called_once()
 
+    def test_link_lookback(
+        self,
+        mock_persistent_account: MagicMock,
+        mock_import_service: MagicMock,
+        mock_operation_service: MagicMock,
+        mock_forecast_service: MagicMock,
+        mock_operation_link_service: MagicMock,
+    ) -> None:
+        """Operations dated within the lookback before an import are linked too."""
+        app_service = ApplicationService(
+            persistent_account=mock_persistent_account,
+            import_service=mock_import_service,
+            operation_service=mock_operation_service,
+            forecast_service=mock_forecast_service,
+            operation_link_service=mock_operation_link_service,
+            link_lookback=timedelta(days=7),
+        )
+        mock_import_service.import_file.return_value = ImportResult(
+            path=Path("/test.xlsx"),
+            success=True,
+            stats=ImportStats(total_in_file=1, new_operations=1, duplicates_skipped=0),
+            new_operation_ids=(3,),
+        )
+        operations = (
+            MagicMock(unique_id=1, operation_date=date(2025, 1, 1)),
+            MagicMock(unique_id=2, operation_date=date(2025, 1, 5)),
+            MagicMock(unique_id=3, operation_date=date(2025, 1, 10)),
+        )
+        mock_persistent_account.account.operations = operations
+        planned_op = MagicMock()
+        planned_op.id = 1
+        planned_op.matcher = MagicMock(spec=OperationMatcher)
+        mock_forecast_service.get_all_planned_operations.return_value = [planned_op]
+
+        app_service.import_file(Path("/test.xlsx"))
+
+        linked = mock_operation_link_service.create_heuristic_links.call_args.args[0]
+        assert linked == operations[1:]
+
     def test_no_links_created_on_failure(
         self,
         app_service: ApplicationService,
@@ -531,6 +579,57 @@ class TestBudgetCrud:
         mock_forecast_service.delete_budget.assert_called_once_with(1)
 
 
+class TestRelinkAllTargets:
+    """Tests for relink_all_targets method."""
+
+    @pytest.fixture(name="planned_link")
+    def planned_link_fixture(self, mock_forecast_service: MagicMock) -> OperationLink:
+        """Create a planned operation target with one automatic link."""
+        planned_op = MagicMock(spec=PlannedOperation)
+        planned_op.id = 1
+        planned_op.matcher = MagicMock(spec=OperationMatcher)
+        mock_forecast_service.get_all_planned_operations.return_value = [planned_op]
+        return OperationLink(
+            operation_unique_id=5,
+            target_type=LinkType.PLANNED_OPERATION,
+            target_id=1,
+            iteration_date=date(2025, 1, 1),
+            link_id=1,
+        )
+
+    def test_changed_links_invalidate_report(
+        self,
+        app_service: ApplicationService,
+        mock_forecast_service: MagicMock,
+        mock_operation_link_service: MagicMock,
+        planned_link: OperationLink,
+    ) -> None:
+        """The report is discarded with the operations whose link changed."""
+        mock_operation_link_service.get_all_links.return_value = (planned_link,)
+        mock_operation_link_service.create_optimal_links.return_value = ()
+
+        result = app_service.relink_all_targets()
+
+        assert result.operation_ids == {5}
+        mock_forecast_service.invalidate_report.assert_called_once_with(frozenset({5}))
+
+    def test_unchanged_links_keep_report(
+        self,
+        app_service: ApplicationService,
+        mock_forecast_service: MagicMock,
+        mock_operation_link_service: MagicMock,
+        planned_link: OperationLink,
+    ) -> None:
+        """Links recreated identically keep the report."""
+        mock_operation_link_service.get_all_links.return_value = (planned_link,)
+        mock_operation_link_service.create_optimal_links.return_value = (
+            planned_link._replace(link_id=None),
+        )
+
+        assert not app_service.relink_all_targets().operation_ids
+        mock_forecast_service.invalidate_report.assert_not_called()
+
+
 class TestCategorizeOperationsMultiple:
     """Tests for categorize_operations with multiple operations."""
 
@@ -1143,3 +1242,88 @@ class TestSplitOperations:
         # The method finds the first future iteration without a link
         assert result is not None
         assert result not in {date(2025, 1, 1), date(2025, 2, 1)}
+
+
+class TestGetUpcomingPlannedIterations:
+    """Tests for the cached upcoming iterations of planned operations."""
+
+    @staticmethod
+    def _rent() -> PlannedOperation:
+        return PlannedOperation(
+            record_id=1,
+            description="Rent",
+            amount=Amount(-800.0, "EUR"),
+            category=Category.RENT,
+            date_range=RecurringDay(date(2020, 1, 1), relativedelta(months=1)),
+        )
+
+    def test_cached_while_forecast_unchanged(
+        self,
+        app_service: ApplicationService,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """The iterations are only computed again when the forecast changes."""
+        forecast = Forecast((self._rent(),), ())
+        mock_forecast_service.get_forecast.side_effect = None
+        mock_forecast_service.get_forecast.return_value = forecast
+
+        first = app_service.get_upcoming_planned_iterations()
+        assert app_service.get_upcoming_planned_iterations() is first
+
+        mock_forecast_service.get_forecast.return_value = Forecast((), ())
+        assert not app_service.get_upcoming_planned_iterations()
+
+    def test_next_iterations_without_horizon(
+        self,
+        app_service: ApplicationService,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """The next N iterations are returned however far ahead they are."""
+        mock_forecast_service.get_all_planned_operations.return_value = [self._rent()]
+
+        iterations = app_service.get_next_planned_iterations(24)
+
+        assert len(iterations) == 24
+        assert iterations[0].iteration_date >= date.today()
+        assert iterations[-1].iteration_date > date.today() + relativedelta(years=1)
+
+
+class TestScenarios:
+    """Tests for the what-if scenarios of the session."""
+
+    def test_add_replace_and_remove(self, app_service: ApplicationService) -> None:
+        """Scenarios are kept by name, in order of addition."""
+        app_service.add_scenario(Scenario("First"))
+        app_service.add_scenario(Scenario("Second"))
+        updated = Scenario("First", removed=frozenset({MatcherKey(LinkType.BUDGET, 1)}))
+        app_service.add_scenario(updated)
+
+        assert app_service.scenarios == (Scenario("Second"), updated)
+
+        app_service.remove_scenario("Second")
+        assert app_service.scenarios == (updated,)
+
+    def test_baseline_name_is_reserved(self, app_service: ApplicationService) -> None:
+        """A scenario cannot be named like the baseline."""
+        with pytest.raises(ValueError):
+            app_service.add_scenario(Scenario(BASELINE_SCENARIO))
+
+    def test_compare_scenarios(
+        self,
+        app_service: ApplicationService,
+        mock_forecast_service: MagicMock,
+        mock_operation_link_service: MagicMock,
+    ) -> None:
+        """The scenarios of the session are compared with the current links."""
+        scenario = Scenario("First")
+        app_service.add_scenario(scenario)
+
+        app_service.compare_scenarios(date(2025, 12, 31))
+
+        mock_forecast_service.compare_scenarios.assert_called_once_with(
+            (scenario,),
+            date(2025, 12, 31),
+            mock_operation_link_service.get_all_links.return_value,
+            1,
+            None,
+        )
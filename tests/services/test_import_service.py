@@ -288,6 +288,34 @@ class TestImportFile:
         mock_persistent_account.upsert_account.assert_called_once()
         mock_persistent_account.save.assert_called_once()
 
+    @patch("budget_forecaster.services.import_service.BankAdapterFactory")
+    def test_import_reports_new_operation_ids(
+        self,
+        mock_factory_class: MagicMock,
+        mock_persistent_account: MagicMock,
+        temp_inbox: Path,
+    ) -> None:
+        """import_file reports the ids of the operations it inserted."""
+        existing, inserted = MagicMock(unique_id=1), MagicMock(unique_id=2)
+        mock_persistent_account.account.operations = (existing,)
+
+        def upsert(*_: object) -> ImportStats:
+            mock_persistent_account.account.operations = (existing, inserted)
+            return ImportStats(total_in_file=2, new_operations=1, duplicates_skipped=1)
+
+        mock_persistent_account.upsert_account.side_effect = upsert
+        mock_factory_class.return_value.create_bank_adapter.return_value = MagicMock(
+            export_date=None
+        )
+        test_file = temp_inbox / "bank.xlsx"
+        test_file.write_bytes(b"fake xlsx")
+
+        result = ImportService(mock_persistent_account, temp_inbox).import_file(
+            test_file
+        )
+
+        assert result.new_operation_ids == (2,)
+
     @patch("budget_forecaster.services.import_service.BankAdapterFactory")
     def test_import_moves_to_processed(
         self,
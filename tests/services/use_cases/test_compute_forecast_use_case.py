@@ -13,7 +13,7 @@ from budget_forecaster.core.date_range import (
     RecurringDateRange,
     RecurringDay,
 )
-from budget_forecaster.core.types import Category, LinkType
+from budget_forecaster.core.types import BalanceResolution, Category, LinkType
 from budget_forecaster.domain.account.account import Account
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
@@ -78,7 +78,9 @@ class TestComputeReport:
         use_case.compute_report()
 
         mock_operation_link_service.get_all_links.assert_called_once()
-        mock_forecast_service.compute_report.assert_called_once_with(None, None, links)
+        mock_forecast_service.compute_report.assert_called_once_with(
+            None, None, links, BalanceResolution.DAILY, None
+        )
 
     def test_passes_date_range(
         self,
@@ -86,15 +88,17 @@ class TestComputeReport:
         mock_forecast_service: MagicMock,
         mock_operation_link_service: MagicMock,
     ) -> None:
-        """Date parameters are forwarded to forecast service."""
+        """Date and resolution parameters are forwarded to forecast service."""
         mock_operation_link_service.get_all_links.return_value = ()
         mock_forecast_service.compute_report.return_value = MagicMock()
 
         start = date(2025, 1, 1)
         end = date(2025, 12, 31)
-        use_case.compute_report(start, end)
+        use_case.compute_report(start, end, BalanceResolution.MONTHLY)
 
-        mock_forecast_service.compute_report.assert_called_once_with(start, end, ())
+        mock_forecast_service.compute_report.assert_called_once_with(
+            start, end, (), BalanceResolution.MONTHLY, None
+        )
 
 
 class TestComputeReportIntegration:
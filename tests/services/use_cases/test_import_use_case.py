@@ -1,11 +1,12 @@
 """Tests for the ImportUseCase."""
 
-
+from datetime import date, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
+from budget_forecaster.domain.operation.historic_operation import HistoricOperation
 from budget_forecaster.services.import_service import (
     ImportResult,
     ImportService,
@@ -24,11 +25,30 @@ def mock_import_service_fixture() -> MagicMock:
     return MagicMock(spec=ImportService)
 
 
+def _make_operation(unique_id: int, operation_date: date) -> MagicMock:
+    """Create a mock historic operation."""
+    operation = MagicMock(spec=HistoricOperation)
+    operation.unique_id = unique_id
+    operation.operation_date = operation_date
+    return operation
+
+
+@pytest.fixture(name="operations")
+def operations_fixture() -> tuple[MagicMock, ...]:
+    """Create two existing operations and two imported ones."""
+    return (
+        _make_operation(1, date(2024, 1, 5)),
+        _make_operation(2, date(2024, 1, 25)),
+        _make_operation(3, date(2024, 2, 1)),
+        _make_operation(4, date(2024, 2, 3)),
+    )
+
+
 @pytest.fixture(name="mock_persistent_account")
-def mock_persistent_account_fixture() -> MagicMock:
+def mock_persistent_account_fixture(operations: tuple[MagicMock, ...]) -> MagicMock:
     """Create a mock persistent account."""
     mock = MagicMock()
-    mock.account.operations = ()
+    mock.account.operations = operations
     return mock
 
 
@@ -91,7 +111,10 @@ class TestImportFile:
     ) -> None:
         """Successful import triggers heuristic link creation."""
         mock_import_service.import_file.return_value = ImportResult(
-            path=Path("test.xlsx"), success=True, stats=MagicMock()
+            path=Path("test.xlsx"),
+            success=True,
+            stats=MagicMock(),
+            new_operation_ids=(3, 4),
         )
         mock_matcher_cache.get_matchers.return_value = {"key": MagicMock()}
         mock_operation_link_service.create_heuristic_links.return_value = []
@@ -100,6 +123,76 @@ class TestImportFile:
 
         mock_operation_link_service.create_heuristic_links.assert_called_once()
 
+    def test_links_only_new_operations(
+        self,
+        use_case: ImportUseCase,
+        mock_import_service: MagicMock,
+        mock_matcher_cache: MagicMock,
+        mock_operation_link_service: MagicMock,
+        operations: tuple[MagicMock, ...],
+    ) -> None:
+        """Operations already in the account before the import are not relinked."""
+        mock_import_service.import_file.return_value = ImportResult(
+            path=Path("test.xlsx"),
+            success=True,
+            stats=MagicMock(),
+            new_operation_ids=(3, 4),
+        )
+        mock_matcher_cache.get_matchers.return_value = {"key": MagicMock()}
+        mock_operation_link_service.create_heuristic_links.return_value = []
+
+        use_case.import_file(Path("test.xlsx"))
+
+        linked = mock_operation_link_service.create_heuristic_links.call_args.args[0]
+        assert linked == operations[2:]
+
+    def test_lookback_includes_recent_operations(
+        self,
+        mock_import_service: MagicMock,
+        mock_persistent_account: MagicMock,
+        mock_matcher_cache: MagicMock,
+        mock_operation_link_service: MagicMock,
+        operations: tuple[MagicMock, ...],
+    ) -> None:
+        """Operations within the look-back window of the import are relinked."""
+        use_case = ImportUseCase(
+            mock_import_service,
+            mock_persistent_account,
+            mock_operation_link_service,
+            mock_matcher_cache,
+            link_lookback=timedelta(days=10),
+        )
+        mock_import_service.import_file.return_value = ImportResult(
+            path=Path("test.xlsx"),
+            success=True,
+            stats=MagicMock(),
+            new_operation_ids=(3, 4),
+        )
+        mock_matcher_cache.get_matchers.return_value = {"key": MagicMock()}
+        mock_operation_link_service.create_heuristic_links.return_value = []
+
+        use_case.import_file(Path("test.xlsx"))
+
+        linked = mock_operation_link_service.create_heuristic_links.call_args.args[0]
+        assert linked == operations[1:]
+
+    def test_no_links_without_new_operations(
+        self,
+        use_case: ImportUseCase,
+        mock_import_service: MagicMock,
+        mock_matcher_cache: MagicMock,
+        mock_operation_link_service: MagicMock,
+    ) -> None:
+        """An import of duplicates only does not run the matching."""
+        mock_import_service.import_file.return_value = ImportResult(
+            path=Path("test.xlsx"), success=True, stats=MagicMock()
+        )
+        mock_matcher_cache.get_matchers.return_value = {"key": MagicMock()}
+
+        use_case.import_file(Path("test.xlsx"))
+
+        mock_operation_link_service.create_heuristic_links.assert_not_called()
+
     def test_no_links_on_failure(
         self,
         use_case: ImportUseCase,
@@ -131,9 +224,10 @@ class TestImportFromInbox:
             total_files=2,
             successful_imports=2,
             failed_imports=0,
-            total_new_operations=10,
+            total_new_operations=2,
             total_duplicates_skipped=0,
             results=(),
+            new_operation_ids=(3, 4),
         )
         mock_matcher_cache.get_matchers.return_value = {"key": MagicMock()}
         mock_operation_link_service.create_heuristic_links.return_value = []
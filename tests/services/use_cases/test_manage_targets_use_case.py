@@ -200,6 +200,76 @@ class TestDeleteBudget:
         mock_forecast_service.delete_budget.assert_called_once_with(3)
 
 
+class TestRelinkAllTargets:
+    """Tests for relink_all_targets."""
+
+    def test_deletes_automatic_links_and_relinks_optimally(
+        self,
+        use_case: ManageTargetsUseCase,
+        mock_matcher_cache: MagicMock,
+        mock_operation_link_service: MagicMock,
+    ) -> None:
+        """All automatic links are recomputed in a single optimal assignment."""
+        matchers = {
+            MatcherKey(LinkType.PLANNED_OPERATION, 1): MagicMock(spec=OperationMatcher),
+            MatcherKey(LinkType.BUDGET, 2): MagicMock(spec=OperationMatcher),
+        }
+        mock_matcher_cache.get_matchers.return_value = matchers
+        mock_operation_link_service.get_all_links.return_value = ()
+        mock_operation_link_service.create_optimal_links.return_value = ()
+
+        use_case.relink_all_targets()
+
+        assert (
+            mock_operation_link_service.delete_automatic_links_for_target.call_args_list
+            == [
+                ((LinkType.PLANNED_OPERATION, 1),),
+                ((LinkType.BUDGET, 2),),
+            ]
+        )
+        mock_operation_link_service.create_optimal_links.assert_called_once_with(
+            (), matchers, mock_matcher_cache.get_hint_index.return_value
+        )
+        mock_operation_link_service.create_heuristic_links.assert_not_called()
+
+    def test_reports_operations_whose_link_changed(
+        self,
+        use_case: ManageTargetsUseCase,
+        mock_matcher_cache: MagicMock,
+        mock_operation_link_service: MagicMock,
+    ) -> None:
+        """Moved, created and deleted automatic links are reported, not kept ones."""
+        key = MatcherKey(LinkType.PLANNED_OPERATION, 1)
+        mock_matcher_cache.get_matchers.return_value = {
+            key: MagicMock(spec=OperationMatcher)
+        }
+
+        def link(
+            operation_id: int, month: int, link_id: int | None = None
+        ) -> OperationLink:
+            return OperationLink(
+                operation_unique_id=operation_id,
+                target_type=LinkType.PLANNED_OPERATION,
+                target_id=1,
+                iteration_date=date(2025, month, 1),
+                link_id=link_id,
+            )
+
+        mock_operation_link_service.get_all_links.return_value = (
+            link(10, 1, link_id=1),
+            link(11, 2, link_id=2),
+            link(12, 3, link_id=3),
+            link(13, 4, link_id=4)._replace(is_manual=True),
+        )
+        created = (link(10, 1), link(11, 3), link(14, 2))
+        mock_operation_link_service.create_optimal_links.return_value = created
+
+        result = use_case.relink_all_targets()
+
+        assert result.links == created
+        assert result.operation_ids == {11, 12, 14}
+
+
 class TestSplitPlannedOperation:
     """Tests for split_planned_operation_at_date."""
 
@@ -1,11 +1,11 @@
 """Tests for the MatcherCache."""
 
-
 from unittest.mock import MagicMock
 
 import pytest
 
 from budget_forecaster.core.types import LinkType, MatcherKey
+from budget_forecaster.domain.forecast.forecast import Forecast
 from budget_forecaster.domain.operation.budget import Budget
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.forecast.forecast_service import ForecastService
@@ -13,12 +13,40 @@ from budget_forecaster.services.operation.operation_matcher import OperationMatc
 from budget_forecaster.services.use_cases.matcher_cache import MatcherCache
 
 
+def _make_target(
+    spec: type[PlannedOperation] | type[Budget],
+    target_id: int,
+    description_hints: set[str] | None = None,
+) -> MagicMock:
+    """Create a mock target with its own matcher."""
+    target = MagicMock(spec=spec)
+    target.id = target_id
+    target.matcher = MagicMock(spec=OperationMatcher)
+    target.matcher.description_hints = description_hints or set()
+    return target
+
+
+def _set_targets(
+    forecast_service: MagicMock,
+    planned_operations: tuple[MagicMock, ...] = (),
+    budgets: tuple[MagicMock, ...] = (),
+    versions: dict[MatcherKey, int] | None = None,
+) -> None:
+    """Set the forecast and target versions returned by the mock service."""
+    forecast_service.get_forecast.return_value = Forecast(planned_operations, budgets)
+    if versions is None:
+        versions = {
+            MatcherKey(LinkType.PLANNED_OPERATION, op.id): 1
+            for op in planned_operations
+        } | {MatcherKey(LinkType.BUDGET, budget.id): 1 for budget in budgets}
+    forecast_service.get_definition_versions.return_value = versions
+
+
 @pytest.fixture(name="mock_forecast_service")
 def mock_forecast_service_fixture() -> MagicMock:
     """Create a mock forecast service."""
     mock = MagicMock(spec=ForecastService)
-    mock.get_all_planned_operations.return_value = []
-    mock.get_all_budgets.return_value = []
+    _set_targets(mock)
     return mock
 
 
@@ -29,74 +57,114 @@ def matcher_cache_fixture(mock_forecast_service: MagicMock) -> MatcherCache:
 
 
 class TestGetMatchers:
-    """Tests for lazy matcher building."""
+    """Tests for versioned matcher building."""
 
-    def test_builds_matchers_lazily(
+    def test_builds_matchers_from_shared_forecast(
         self,
         matcher_cache: MatcherCache,
         mock_forecast_service: MagicMock,
     ) -> None:
-        """Matchers are built lazily on first access."""
-        planned_op = MagicMock()
-        planned_op.id = 1
-        planned_op.matcher = MagicMock(spec=OperationMatcher)
-        mock_forecast_service.get_all_planned_operations.return_value = [planned_op]
-
-        budget = MagicMock()
-        budget.id = 2
-        budget.matcher = MagicMock(spec=OperationMatcher)
-        mock_forecast_service.get_all_budgets.return_value = [budget]
+        """Matchers are built from the forecast, planned operations first."""
+        budget = _make_target(Budget, 2)
+        planned_op = _make_target(PlannedOperation, 1)
+        _set_targets(mock_forecast_service, (planned_op,), (budget,))
 
         matchers = matcher_cache.get_matchers()
 
-        assert len(matchers) == 2
-        assert MatcherKey(LinkType.PLANNED_OPERATION, 1) in matchers
-        assert MatcherKey(LinkType.BUDGET, 2) in matchers
+        assert list(matchers) == [
+            MatcherKey(LinkType.PLANNED_OPERATION, 1),
+            MatcherKey(LinkType.BUDGET, 2),
+        ]
+        assert matchers[MatcherKey(LinkType.BUDGET, 2)] is budget.matcher
+        mock_forecast_service.get_all_planned_operations.assert_not_called()
+        mock_forecast_service.get_all_budgets.assert_not_called()
 
-    def test_caches_matchers(
+    def test_caches_matchers_while_versions_unchanged(
         self,
         matcher_cache: MatcherCache,
         mock_forecast_service: MagicMock,
     ) -> None:
-        """Matchers are cached after first build."""
+        """The forecast is only read again when a target version changes."""
         matcher_cache.get_matchers()
         matcher_cache.get_matchers()
 
-        assert mock_forecast_service.get_all_planned_operations.call_count == 1
-        assert mock_forecast_service.get_all_budgets.call_count == 1
+        assert mock_forecast_service.get_forecast.call_count == 1
+
+    def test_only_changed_targets_are_refreshed(
+        self,
+        matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """Entries of targets whose version did not change are kept."""
+        kept, edited = _make_target(PlannedOperation, 1), _make_target(Budget, 2)
+        _set_targets(mock_forecast_service, (kept,), (edited,))
+        matcher_cache.get_matchers()
+
+        # Reloaded targets come with new matcher objects
+        kept_reloaded = _make_target(PlannedOperation, 1)
+        edited_reloaded = _make_target(Budget, 2)
+        _set_targets(
+            mock_forecast_service,
+            (kept_reloaded,),
+            (edited_reloaded,),
+            versions={
+                MatcherKey(LinkType.PLANNED_OPERATION, 1): 1,
+                MatcherKey(LinkType.BUDGET, 2): 2,
+            },
+        )
+        matchers = matcher_cache.get_matchers()
+
+        assert matchers[MatcherKey(LinkType.PLANNED_OPERATION, 1)] is kept.matcher
+        assert matchers[MatcherKey(LinkType.BUDGET, 2)] is edited_reloaded.matcher
+
+    def test_deleted_targets_are_dropped(
+        self,
+        matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """Targets no longer in the forecast are removed."""
+        _set_targets(mock_forecast_service, (_make_target(PlannedOperation, 1),))
+        matcher_cache.get_matchers()
+
+        _set_targets(mock_forecast_service)
+
+        assert not matcher_cache.get_matchers()
 
 
 class TestAddMatcher:
-    """Tests for adding matchers to the cache."""
+    """Tests for invalidating the matcher of an added or updated target."""
 
     def test_adds_planned_operation_matcher(
         self,
         matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
     ) -> None:
-        """Adding a planned operation registers its matcher."""
-        target = MagicMock(spec=PlannedOperation)
-        target.id = 42
-        target.matcher = MagicMock(spec=OperationMatcher)
+        """An added planned operation is picked up on next access."""
+        matcher_cache.get_matchers()
+        target = _make_target(PlannedOperation, 42)
+        _set_targets(mock_forecast_service, (target,))
 
         matcher_cache.add_matcher(target)
 
         matchers = matcher_cache.get_matchers()
-        assert MatcherKey(LinkType.PLANNED_OPERATION, 42) in matchers
         assert matchers[MatcherKey(LinkType.PLANNED_OPERATION, 42)] is target.matcher
 
-    def test_adds_budget_matcher(
+    def test_updated_target_is_rebuilt_without_version_change(
         self,
         matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
     ) -> None:
-        """Adding a budget registers its matcher."""
-        target = MagicMock(spec=Budget)
-        target.id = 7
-        target.matcher = MagicMock(spec=OperationMatcher)
+        """add_matcher forces a rebuild even if versions look unchanged."""
+        _set_targets(mock_forecast_service, budgets=(_make_target(Budget, 7),))
+        matcher_cache.get_matchers()
+        updated = _make_target(Budget, 7)
+        _set_targets(mock_forecast_service, budgets=(updated,))
 
-        matcher_cache.add_matcher(target)
+        matcher_cache.add_matcher(updated)
 
-        matchers = matcher_cache.get_matchers()
-        assert MatcherKey(LinkType.BUDGET, 7) in matchers
+        assert matcher_cache.get_matchers()[MatcherKey(LinkType.BUDGET, 7)] is (
+            updated.matcher
+        )
 
     def test_ignores_target_without_id(
         self,
@@ -115,21 +183,20 @@ class TestAddMatcher:
 class TestRemoveMatcher:
     """Tests for removing matchers from the cache."""
 
-    def test_removes_existing_matcher(
+    def test_removes_deleted_target(
         self,
         matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
     ) -> None:
-        """Removing a key deletes the matcher."""
-        target = MagicMock(spec=PlannedOperation)
-        target.id = 1
-        target.matcher = MagicMock(spec=OperationMatcher)
-        matcher_cache.add_matcher(target)
-
+        """Removing a deleted target's key drops its matcher."""
+        _set_targets(mock_forecast_service, (_make_target(PlannedOperation, 1),))
         key = MatcherKey(LinkType.PLANNED_OPERATION, 1)
+        assert key in matcher_cache.get_matchers()
+        _set_targets(mock_forecast_service)
+
         matcher_cache.remove_matcher(key)
 
-        matchers = matcher_cache.get_matchers()
-        assert key not in matchers
+        assert key not in matcher_cache.get_matchers()
 
     def test_removes_nonexistent_key_silently(
         self,
@@ -138,3 +205,65 @@ class TestRemoveMatcher:
         """Removing a non-existent key does not raise."""
         key = MatcherKey(LinkType.BUDGET, 999)
         matcher_cache.remove_matcher(key)  # Should not raise
+
+
+class TestGetHintIndex:
+    """Tests for the description hint index of the cache."""
+
+    def test_indexes_matchers_description_hints(
+        self,
+        matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """The index finds targets whose hints are all in the description."""
+        _set_targets(
+            mock_forecast_service, (_make_target(PlannedOperation, 1, {"EDF", "PRLV"}),)
+        )
+
+        hint_index = matcher_cache.get_hint_index()
+
+        key = MatcherKey(LinkType.PLANNED_OPERATION, 1)
+        assert hint_index.matching_keys("PRLV SEPA EDF") == {key}
+        assert not hint_index.matching_keys("PRLV SEPA ENGIE")
+
+    def test_index_is_cached(self, matcher_cache: MatcherCache) -> None:
+        """The index is built once while matchers don't change."""
+        assert matcher_cache.get_hint_index() is matcher_cache.get_hint_index()
+
+    def test_unchanged_hints_keep_index(
+        self,
+        matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """An edited target with the same hints does not recompile the index."""
+        key = MatcherKey(LinkType.BUDGET, 1)
+        _set_targets(
+            mock_forecast_service, budgets=(_make_target(Budget, 1, {"CARREFOUR"}),)
+        )
+        hint_index = matcher_cache.get_hint_index()
+
+        _set_targets(
+            mock_forecast_service,
+            budgets=(_make_target(Budget, 1, {"CARREFOUR"}),),
+            versions={key: 2},
+        )
+
+        assert matcher_cache.get_hint_index() is hint_index
+
+    def test_index_is_rebuilt_after_matcher_changes(
+        self,
+        matcher_cache: MatcherCache,
+        mock_forecast_service: MagicMock,
+    ) -> None:
+        """Adding or removing a target rebuilds the index."""
+        target = _make_target(Budget, 3, {"CARREFOUR"})
+        key = MatcherKey(LinkType.BUDGET, 3)
+
+        matcher_cache.get_hint_index()
+        _set_targets(mock_forecast_service, budgets=(target,))
+        matcher_cache.add_matcher(target)
+        assert matcher_cache.get_hint_index().matching_keys("CARREFOUR CITY") == {key}
+
+        _set_targets(mock_forecast_service)
+        matcher_cache.remove_matcher(key)
+        assert not matcher_cache.get_hint_index().matching_keys("CARREFOUR CITY")
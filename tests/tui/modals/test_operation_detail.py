@@ -18,7 +18,7 @@ from budget_forecaster.domain.operation.historic_operation import HistoricOperat
 from budget_forecaster.domain.operation.operation_link import OperationLink
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.application_service import ApplicationService
-from budget_forecaster.tui.messages import SaveRequested
+from budget_forecaster.tui.messages import DataChanged, SaveRequested
 from budget_forecaster.tui.modals.operation_detail import OperationDetailModal
 
 
@@ -83,6 +83,10 @@ class OperationDetailTestApp(App[None]):
         """Track SaveRequested messages."""
         self.received_messages.append(event)
 
+    def on_data_changed(self, event: DataChanged) -> None:
+        """Track DataChanged messages."""
+        self.received_messages.append(event)
+
 
 class TestOperationDetailDisplay:
     """Tests for operation detail display."""
@@ -345,7 +349,7 @@ class TestOperationDetailLinkButton:
 
     @pytest.mark.asyncio
     async def test_unlink_posts_save_and_refresh_messages(self) -> None:
-        """Unlinking posts SaveRequested and DataRefreshRequested."""
+        """Unlinking posts SaveRequested and DataChanged for the operation."""
         link = OperationLink(
             operation_unique_id=1,
             target_type=LinkType.PLANNED_OPERATION,
@@ -368,3 +372,7 @@ class TestOperationDetailLinkButton:
             await pilot.pause()
 
             assert any(isinstance(m, SaveRequested) for m in app.received_messages)
+            assert any(
+                isinstance(m, DataChanged) and m.operation_ids == {1}
+                for m in app.received_messages
+            )
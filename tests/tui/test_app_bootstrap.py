@@ -1,10 +1,19 @@
 """Tests for BudgetApp bootstrap with empty database."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from textual.widgets import TabbedContent
 
-from budget_forecaster.tui.app import BudgetApp
+from budget_forecaster.tui.app import (
+    REPORT_REVALIDATION_DELAY,
+    TAB_PREWARM_INTERVAL,
+    BudgetApp,
+)
+from budget_forecaster.tui.messages import DataChanged
+from budget_forecaster.tui.screens.analytics import AnalyticsWidget
+from budget_forecaster.tui.screens.review import ReviewWidget
 
 
 @pytest.fixture
@@ -29,3 +38,84 @@ async def test_app_starts_with_empty_database(empty_db_config: Path) -> None:
     async with app.run_test():
         service = app.app_service
         assert service.balance == 0.0
+
+
+@pytest.mark.asyncio
+async def test_app_shows_cached_report_on_next_launch(empty_db_config: Path) -> None:
+    """The report of the last launch is available as soon as the app starts."""
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test():
+        app.app_service.compute_report()
+
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test():
+        assert app.app_service.report is not None
+
+
+@pytest.mark.asyncio
+async def test_cached_report_of_same_dates_not_recomputed(
+    empty_db_config: Path,
+) -> None:
+    """A cached report of the same day is shown without being computed again."""
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test():
+        app.app_service.compute_report()
+
+    app = BudgetApp(config_path=empty_db_config)
+    with patch.object(BudgetApp, "_revalidate_report") as revalidate:
+        async with app.run_test() as pilot:
+            await pilot.pause(REPORT_REVALIDATION_DELAY + 0.2)
+            revalidate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_data_change_marks_report_stale(empty_db_config: Path) -> None:
+    """A data change discards the report instead of refreshing every screen."""
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test() as pilot:
+        app.app_service.compute_report()
+
+        app.post_message(DataChanged(operation_ids=(1,)))
+        await pilot.pause()
+
+        assert app.app_service.report is None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_tab_not_updated_again(empty_db_config: Path) -> None:
+    """Showing a tab again only updates it if its data changed meanwhile."""
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test() as pilot:
+        tabbed = app.query_one(TabbedContent)
+        tabbed.active = "review"
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        tabbed.active = "dashboard"
+        await pilot.pause()
+
+        with patch.object(ReviewWidget, "compute_and_display") as compute:
+            tabbed.active = "review"
+            await pilot.pause()
+            compute.assert_not_called()
+
+            app.post_message(DataChanged(operation_ids=(1,)))
+            await pilot.pause()
+            compute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_likely_next_tab_updated_while_idle(empty_db_config: Path) -> None:
+    """The balance is prepared while the review is shown, once idle."""
+    app = BudgetApp(config_path=empty_db_config)
+    async with app.run_test() as pilot:
+        app.query_one(TabbedContent).active = "review"
+        await pilot.pause()
+
+        with patch.object(AnalyticsWidget, "compute_and_display") as compute:
+            app.post_message(DataChanged(operation_ids=(1,)))
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause(2 * TAB_PREWARM_INTERVAL)
+
+            compute.assert_called_once()
+        assert app.query_one(TabbedContent).active == "review"
@@ -6,7 +6,9 @@ from unittest.mock import MagicMock
 import pytest
 from textual.app import App, ComposeResult
 from textual.widgets import Button
+from textual.worker import WorkerFailed
 
+from budget_forecaster.exceptions import ComputationCancelledError
 from budget_forecaster.tui.modals.export_forecast import ExportForecastModal
 from budget_forecaster.tui.screens.balance import BalanceWidget
 
@@ -88,9 +90,12 @@ async def test_compute_and_display_triggers_computation() -> None:
     async with app.run_test() as pilot:
         widget = app.query_one(BalanceWidget)
         widget.compute_and_display()
+        await app.workers.wait_for_complete()
         await pilot.pause()
 
+        # The worker is the cancellation token of the computation
         app_service.compute_report.assert_called_once()
+        assert app_service.compute_report.call_args.kwargs["cancellation"].is_finished
 
 
 @pytest.mark.asyncio
@@ -138,12 +143,35 @@ async def test_chart_updates_after_compute() -> None:
     async with app.run_test() as pilot:
         widget = app.query_one(BalanceWidget)
         widget.compute_and_display()
+        await app.workers.wait_for_complete()
         await pilot.pause()
 
         # Verify that balance evolution data was requested for the chart
         app_service.get_balance_evolution_summary.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_stale_computation_discarded_silently() -> None:
+    """A computation made stale by a data change keeps the chart, without error."""
+    app_service = _make_app_service(has_report=False)
+    app_service.compute_report.side_effect = ComputationCancelledError()
+
+    app = BalanceTestApp(app_service)
+    async with app.run_test() as pilot:
+        widget = app.query_one(BalanceWidget)
+        widget.compute_and_display()
+        assert app.query_one("#balance-chart").has_class("outdated")
+
+        with pytest.raises(WorkerFailed):
+            await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert not app.query_one("#balance-chart").has_class("outdated")
+        assert not app.query_one("#balance-status").has_class("computing")
+        assert not app._notifications  # pylint: disable=protected-access
+        app_service.get_balance_evolution_summary.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_export_button_opens_modal() -> None:
     """Clicking Export opens the ExportForecastModal."""
@@ -186,6 +186,55 @@ class TestGetUpcomingIterations:
         )
         assert any(it.iteration_date == date(2025, 3, 15) for it in result)
 
+    def test_limit_without_horizon(self) -> None:
+        """Return the next N iterations when no horizon is given."""
+        ops = (
+            _make_recurring_op(
+                1, "Yearly", -100.0, date(2025, 6, 1), relativedelta(years=1)
+            ),
+            _make_single_op(2, "One-time", -200.0, date(2030, 1, 1)),
+        )
+        result = get_upcoming_iterations(
+            ops, reference_date=date(2025, 3, 1), horizon_days=None, limit=7
+        )
+        assert [it.iteration_date for it in result] == [
+            date(2025, 6, 1),
+            date(2026, 6, 1),
+            date(2027, 6, 1),
+            date(2028, 6, 1),
+            date(2029, 6, 1),
+            date(2030, 1, 1),
+            date(2030, 6, 1),
+        ]
+
+    def test_limit_within_horizon(self) -> None:
+        """Stop at the limit even if more iterations fall within the horizon."""
+        op = _make_recurring_op(
+            1, "Daily", -5.0, date(2025, 1, 1), relativedelta(days=1)
+        )
+        result = get_upcoming_iterations(
+            (op,), reference_date=date(2025, 3, 1), horizon_days=30, limit=3
+        )
+        assert [it.iteration_date for it in result] == [
+            date(2025, 3, 1),
+            date(2025, 3, 2),
+            date(2025, 3, 3),
+        ]
+
+    def test_same_date_keeps_operation_order(self) -> None:
+        """Iterations on the same date keep the order of the planned operations."""
+        ops = (
+            _make_single_op(1, "B", -100.0, date(2025, 3, 5)),
+            _make_single_op(2, "A", -100.0, date(2025, 3, 5)),
+        )
+        result = get_upcoming_iterations(ops, reference_date=date(2025, 3, 1))
+        assert tuple(it.description for it in result) == ("B", "A")
+
+    def test_horizon_or_limit_required(self) -> None:
+        """Refuse an unbounded query."""
+        with pytest.raises(ValueError):
+            get_upcoming_iterations((), date(2025, 3, 1), horizon_days=None)
+
 
 class TestFormatPeriod:
     """Tests for format_period function."""
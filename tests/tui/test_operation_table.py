@@ -8,7 +8,10 @@ from textual.app import App, ComposeResult
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.types import Category
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
-from budget_forecaster.tui.widgets.operation_table import OperationTable
+from budget_forecaster.tui.widgets.operation_table import (
+    WINDOW_BUFFER,
+    OperationTable,
+)
 
 
 def make_operation(
@@ -245,6 +248,78 @@ class TestOperationTableIntegration:
             assert table.selected_count >= 0
 
 
+class TestOperationTableWindow:
+    """Tests for OperationTable with more operations than its window."""
+
+    @pytest.fixture
+    def many_operations(self) -> list[HistoricOperation]:
+        """Create operations spanning several windows."""
+        return [make_operation(i, f"Operation {i}") for i in range(4 * WINDOW_BUFFER)]
+
+    async def test_only_window_is_in_table(
+        self, many_operations: list[HistoricOperation]
+    ) -> None:
+        """Only the rows around the visible ones are added to the table."""
+        app = OperationTableTestApp(many_operations)
+        async with app.run_test():
+            table = app.query_one(OperationTable)
+
+            assert table.operation_count == len(many_operations)
+            assert table.row_count < len(many_operations)
+
+    async def test_navigation_reaches_all_operations(
+        self, many_operations: list[HistoricOperation]
+    ) -> None:
+        """The cursor moves through the window to the last operation and back."""
+        app = OperationTableTestApp(many_operations)
+        async with app.run_test() as pilot:
+            table = app.query_one(OperationTable)
+
+            await pilot.press("ctrl+end")
+            assert table.get_highlighted_operation() == many_operations[-1]
+
+            await pilot.press("ctrl+home")
+            while table.cursor_position < len(many_operations) - 1:
+                cursor_position = table.cursor_position
+                await pilot.press("pagedown")
+                await pilot.pause()
+                assert table.cursor_position > cursor_position
+            assert table.get_highlighted_operation() == many_operations[-1]
+
+    async def test_selection_kept_outside_window(
+        self, many_operations: list[HistoricOperation]
+    ) -> None:
+        """Operations stay selected while their rows are out of the table."""
+        app = OperationTableTestApp(many_operations)
+        async with app.run_test() as pilot:
+            table = app.query_one(OperationTable)
+
+            await pilot.press("space")
+            await pilot.press("ctrl+end")
+            await pilot.press("space")
+            await pilot.press("ctrl+home")
+
+            assert table.get_selected_operations() == (
+                many_operations[0],
+                many_operations[-1],
+            )
+
+    async def test_reload_keeps_selection_and_cursor(
+        self, many_operations: list[HistoricOperation]
+    ) -> None:
+        """Reloading keeps the cursor and the selection on the same operations."""
+        app = OperationTableTestApp(many_operations)
+        async with app.run_test() as pilot:
+            table = app.query_one(OperationTable)
+            await pilot.press("ctrl+end")
+            await pilot.press("space")
+
+            table.load_operations(many_operations[1::2])
+
+            assert table.get_highlighted_operation() == many_operations[-1]
+            assert table.get_selected_operations() == (many_operations[-1],)
+
+
 class TestOperationTableEmpty:  # pylint: disable=too-few-public-methods
     """Tests for OperationTable with no operations."""
 
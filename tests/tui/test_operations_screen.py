@@ -7,8 +7,11 @@ from textual.app import App, ComposeResult
 from textual.widgets import Input, Select, Static
 
 from budget_forecaster.core.amount import Amount
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.date_range import SingleDay
+from budget_forecaster.core.types import Category, LinkType
 from budget_forecaster.domain.operation.historic_operation import HistoricOperation
+from budget_forecaster.domain.operation.operation_link import OperationLink
+from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.application_service import ApplicationService
 from budget_forecaster.services.operation.operation_service import OperationFilter
 from budget_forecaster.tui.screens.operations import OperationsScreen
@@ -52,6 +55,7 @@ SAMPLE_OPERATIONS = (
 def _make_app_service(operations: tuple[HistoricOperation, ...]) -> Mock:
     """Create a mock ApplicationService returning given operations."""
     service = Mock(spec=ApplicationService)
+    service.operations = operations
 
     def get_operations(
         filter_: OperationFilter | None = None,
@@ -79,7 +83,7 @@ class OperationsScreenTestApp(App[None]):
     ) -> None:
         super().__init__()
         self._operations = operations
-        self._service = _make_app_service(operations)
+        self.service = _make_app_service(operations)
 
     def compose(self) -> ComposeResult:
         yield OperationsScreen(id="ops-screen")
@@ -87,7 +91,7 @@ class OperationsScreenTestApp(App[None]):
     def on_mount(self) -> None:
         """Inject the mock service."""
         screen = self.query_one(OperationsScreen)
-        screen.set_app_service(self._service)
+        screen.set_app_service(self.service)
 
 
 class TestOperationsScreenIntegration:
@@ -274,3 +278,60 @@ class TestOperationsScreenIntegration:
 
             table = app.query_one(OperationTable)
             assert table.operation_count == 5
+
+
+class TestOperationsScreenUpdate:
+    """Tests for updating changed operations without reloading the table."""
+
+    async def test_changed_rows_updated_in_place(self) -> None:
+        """Changed categories and links are shown in the rows of the table."""
+        app = OperationsScreenTestApp()
+        async with app.run_test():
+            screen = app.query_one(OperationsScreen)
+            table = app.query_one(OperationTable)
+            operations = list(SAMPLE_OPERATIONS)
+            operations[1] = operations[1].replace(category=Category.GROCERIES)
+            app.service.operations = tuple(operations)
+            app.service.get_all_links.return_value = (
+                OperationLink(
+                    operation_unique_id=5,
+                    target_type=LinkType.PLANNED_OPERATION,
+                    target_id=7,
+                    iteration_date=date(2025, 4, 1),
+                ),
+            )
+            app.service.get_all_planned_operations.return_value = (
+                PlannedOperation(
+                    record_id=7,
+                    description="Restaurant",
+                    amount=Amount(-30.0, "EUR"),
+                    category=Category.LEISURE,
+                    date_range=SingleDay(date(2025, 4, 1)),
+                ),
+            )
+            app.service.get_operations.reset_mock()
+
+            screen.update_operations({2, 5})
+
+            app.service.get_operations.assert_not_called()
+            assert table.get_row("2")[3] == Category.GROCERIES.display_name
+            assert table.get_row("5")[4] == "🔗 Restaurant"
+            assert table.operations[1].category == Category.GROCERIES
+
+    async def test_reloads_when_operation_leaves_filter(self) -> None:
+        """The table is reloaded when a changed operation no longer matches."""
+        operations = list(SAMPLE_OPERATIONS)
+        app = OperationsScreenTestApp()
+        app.service.get_operations.side_effect = lambda filter_=None: tuple(
+            op for op in operations if filter_ is None or filter_.matches(op)
+        )
+        async with app.run_test(size=(200, 24)) as pilot:
+            app.query_one("#filter-category", Select).value = Category.GROCERIES.name
+            await pilot.click("#filter-apply")
+            operations[0] = operations[0].replace(category=Category.LEISURE)
+            app.service.operations = tuple(operations)
+
+            app.query_one(OperationsScreen).update_operations({1})
+
+            table = app.query_one(OperationTable)
+            assert [op.unique_id for op in table.operations] == [3]
@@ -1,5 +1,7 @@
 """Tests for PlannedOperationsWidget with FilterBar integration."""
 
+# pylint: disable=too-few-public-methods
+
 from datetime import date
 from unittest.mock import Mock
 
@@ -9,9 +11,11 @@ from textual.widgets import DataTable, Input, Select, Static
 
 from budget_forecaster.core.amount import Amount
 from budget_forecaster.core.date_range import RecurringDay
-from budget_forecaster.core.types import Category
+from budget_forecaster.core.types import Category, LinkType, MatcherKey
+from budget_forecaster.domain.forecast.scenario import Scenario
 from budget_forecaster.domain.operation.planned_operation import PlannedOperation
 from budget_forecaster.services.application_service import ApplicationService
+from budget_forecaster.services.use_cases import RelinkResult
 from budget_forecaster.tui.screens.planned_operations import PlannedOperationsWidget
 from budget_forecaster.tui.widgets.filter_bar import FilterBar, StatusFilter
 
@@ -213,3 +217,42 @@ class TestPlannedOperationsWidgetFiltering:
             widget = app.query_one(PlannedOperationsWidget)
             descriptions = {op.description for op in widget.planned_operations}
             assert descriptions == {"Expired op"}
+
+
+class TestPlannedOperationsWidgetScenarios:
+    """Tests for the what-if scenarios created from the table."""
+
+    async def test_compare_without_selected_operation(self) -> None:
+        """w adds a scenario without the highlighted planned operation."""
+        app = PlannedOpsWidgetTestApp()
+        async with app.run_test(size=(160, 48)) as pilot:
+            table = app.query_one("#planned-ops-table", DataTable)
+            table.focus()
+            table.move_cursor(row=1)
+            await pilot.press("w")
+
+            app._service.add_scenario.assert_called_once_with(  # pylint: disable=protected-access
+                Scenario(
+                    "Without Electricite EDF",
+                    removed=frozenset({MatcherKey(LinkType.PLANNED_OPERATION, 2)}),
+                )
+            )
+
+
+class TestPlannedOperationsWidgetRelink:
+    """Tests for relinking all targets from the table."""
+
+    async def test_relink_all_reports_changed_operations(self) -> None:
+        """L relinks all targets and notifies the changed operations."""
+        app = PlannedOpsWidgetTestApp()
+        service = app._service  # pylint: disable=protected-access
+        service.relink_all_targets.return_value = RelinkResult(
+            links=(), operation_ids=frozenset({11, 12})
+        )
+        async with app.run_test(size=(160, 48)) as pilot:
+            app.query_one("#planned-ops-table", DataTable).focus()
+            await pilot.press("L")
+
+            service.relink_all_targets.assert_called_once_with()
+            notifications = app._notifications  # pylint: disable=protected-access
+            assert [n.message for n in notifications] == ["Links changed: 2"]
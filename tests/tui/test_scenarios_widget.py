@@ -0,0 +1,103 @@
+"""Tests for ScenariosWidget."""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import DataTable
+from textual.worker import Worker
+
+from budget_forecaster.services.forecast.scenario_evaluator import (
+    BASELINE_SCENARIO,
+    ScenarioComparison,
+)
+from budget_forecaster.tui.screens.scenarios import ScenariosWidget
+
+
+class ScenariosTestApp(App[None]):
+    """Test app containing a ScenariosWidget."""
+
+    def __init__(self, app_service: MagicMock) -> None:
+        super().__init__()
+        self._app_service = app_service
+
+    def compose(self) -> ComposeResult:
+        yield ScenariosWidget(id="scenarios-widget")
+
+    def on_mount(self) -> None:
+        """Inject app_service into the widget and display the scenarios."""
+        widget = self.query_one(ScenariosWidget)
+        widget.set_app_service(self._app_service)
+        widget.compute_and_display()
+
+
+def _make_app_service() -> MagicMock:
+    """Create a mock ApplicationService comparing one scenario."""
+    balances = pd.DataFrame(
+        {
+            BASELINE_SCENARIO: [1000.0, 900.0, -50.0],
+            "No rent": [1000.0, 1500.0, 1550.0],
+        },
+        index=pd.DatetimeIndex(["2025-01-31", "2025-02-01", "2025-02-28"], name="Date"),
+    )
+    margins = pd.DataFrame(
+        {BASELINE_SCENARIO: [-50.0, -50.0], "No rent": [1000.0, 1500.0]},
+        index=pd.DatetimeIndex(["2025-01-01", "2025-02-01"], name="Month"),
+    )
+    app_service = MagicMock()
+    app_service.compare_scenarios.return_value = ScenarioComparison(balances, margins)
+    return app_service
+
+
+@pytest.mark.asyncio
+async def test_scenarios_side_by_side() -> None:
+    """Each scenario has a column next to the baseline, with one row per month."""
+    app = ScenariosTestApp(_make_app_service())
+
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        table = app.query_one("#scenarios-margins", DataTable)
+        assert [str(column.label) for column in table.ordered_columns] == [
+            "Month",
+            BASELINE_SCENARIO,
+            "No rent",
+        ]
+        assert table.row_count == 2
+        balances = app.query_one("#scenarios-balances", DataTable)
+        assert str(balances.get_cell_at((1, 1))) == "-50 €"
+
+
+@pytest.mark.asyncio
+async def test_remove_selected_scenario() -> None:
+    """x removes the scenario of the selected column, never the baseline."""
+    app_service = _make_app_service()
+    app = ScenariosTestApp(app_service)
+
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        table = app.query_one("#scenarios-margins", DataTable)
+        table.focus()
+        table.move_cursor(column=1)
+        await pilot.press("x")
+        app_service.remove_scenario.assert_not_called()
+
+        table.move_cursor(column=2)
+        await pilot.press("x")
+        app_service.remove_scenario.assert_called_once_with("No rent")
+
+
+@pytest.mark.asyncio
+async def test_comparison_cancelled_by_its_worker() -> None:
+    """Scenarios are compared in a worker, which is the cancellation token."""
+    app_service = _make_app_service()
+    app = ScenariosTestApp(app_service)
+
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        cancellation = app_service.compare_scenarios.call_args.kwargs["cancellation"]
+        assert isinstance(cancellation, Worker)
+        assert cancellation.name == "compare_scenarios"
@@ -1,4 +1,4 @@
-"""Tests for TUI message communication (DataRefreshRequested, SaveRequested)."""
+"""Tests for TUI message communication."""
 
 from textual.app import App, ComposeResult
 from textual.widgets import OptionList